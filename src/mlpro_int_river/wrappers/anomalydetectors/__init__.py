@@ -0,0 +1,5 @@
+from .basics import *
+from .gaussian import *
+from .hst import *
+from .lof import *
+from .ocsvm import *
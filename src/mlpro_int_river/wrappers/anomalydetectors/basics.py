@@ -0,0 +1,222 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.anomalydetectors
+## -- Module  : basics.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -- 2026-10-18  1.0.1     DA       Bugfix: windows buffer the feature values of the instances
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.1 (2026-10-18)
+
+This module provides the wrapper root class from River to MLPro for anomaly detectors.
+
+Learn more:
+https://www.riverml.xyz/
+
+"""
+
+
+import numpy as np
+
+from mlpro.bf.exceptions import ParamError
+from mlpro.bf.streams import Instance
+from mlpro.bf.various import Log
+from mlpro.oa.streams import OAStreamTask
+from mlpro.oa.streams.tasks.changedetectors.anomalydetectors import AnomalyDetectorIB, PointAnomaly
+from mlpro_int_river.wrappers import WrapperRiver
+
+from river import base
+
+
+
+# Export list for public API
+__all__ = [ 'WrAnomalyDetectorRiver2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrAnomalyDetectorRiver2MLPro (WrapperRiver, AnomalyDetectorIB):
+    """
+    This is the base wrapper class for each River-based anomaly detector to MLPro. Each incoming
+    instance is scored by the River anomaly detector and learned afterwards, if adaptivity is
+    turned on. A point anomaly is raised for each instance with a score above the threshold. The
+    score is available in attribute score of the anomaly.
+
+    The instances can be buffered and scored in windows of p_batch_size instances (see method
+    score_many()), so that child classes can score a whole window in one vectorized step. Method
+    score_many() can also be used directly to score feature vectors outside of a stream workflow.
+    The feature values are copied when an instance is buffered, so that succeeding tasks can not
+    change them before the window is scored. Instances of an incomplete window are not scored
+    automatically at the end of a stream. Please call method flush() to score them.
+
+    Parameters
+    ----------
+    p_river_algo : base.AnomalyDetector
+        Instantiated River anomaly detector.
+    p_threshold : float
+        Score above which an instance is regarded as anomalous. Default: None (C_THRESHOLD).
+    p_batch_size : int
+        Number of instances to be buffered and scored in one window. Default: 1.
+    p_name : str
+        Name of the anomaly detector. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default: False.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_anomaly_buffer_size : int
+        Size of the internal anomaly buffer self.anomalies. Default: 100.
+    p_thrs_inst : int
+        The algorithm is only executed after this number of instances. Default: 0.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE          = 'River Anomaly Detector'
+
+    C_THRESHOLD     = 0.5
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_river_algo : base.AnomalyDetector,
+                  p_threshold : float = None,
+                  p_batch_size : int = 1,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  p_anomaly_buffer_size : int = 100,
+                  p_thrs_inst : int = 0,
+                  **p_kwargs ):
+
+        if p_batch_size < 1:
+            raise ParamError('Parameter p_batch_size must be a positive integer')
+
+        self._river_algo = p_river_algo
+        self._threshold  = self.C_THRESHOLD if p_threshold is None else p_threshold
+        self._batch_size = p_batch_size
+        self._batch      = []
+
+        AnomalyDetectorIB.__init__( self,
+                                    p_name = p_name,
+                                    p_range_max = p_range_max,
+                                    p_ada = p_ada,
+                                    p_duplicate_data = p_duplicate_data,
+                                    p_visualize = p_visualize,
+                                    p_logging = p_logging,
+                                    p_anomaly_buffer_size = p_anomaly_buffer_size,
+                                    p_thrs_inst = p_thrs_inst,
+                                    **p_kwargs )
+
+        WrapperRiver.__init__(self, p_logging=p_logging)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _detect(self, p_instance : Instance, **p_kwargs):
+        """
+        Buffers the given instance together with a copy of its feature values and scores the
+        buffered instances when the window is full.
+
+        Parameters
+        ----------
+        p_instance : Instance
+            Instance that triggered the detection.
+        **p_kwargs
+            Optional keyword arguments (originally provided to the constructor).
+        """
+
+        self._batch.append((p_instance, self.C_INPUT_CACHE.get_values(p_instance).copy()))
+        if len(self._batch) >= self._batch_size: self.flush()
+
+
+## -------------------------------------------------------------------------------------------------
+    def flush(self):
+        """
+        Scores all buffered instances and raises a point anomaly for each instance with a score
+        above the threshold. Call this method at the end of a stream to score the instances of an
+        incomplete window.
+        """
+
+        if len(self._batch) == 0: return
+
+        instances   = self._batch
+        self._batch = []
+        data        = np.stack([ values for (inst, values) in instances ])
+        scores      = self.score_many(data, p_learn=self._adaptivity)
+
+        for idx in np.flatnonzero(scores > self._threshold).tolist():
+            inst          = instances[idx][0]
+            anomaly       = PointAnomaly( p_instances = [inst],
+                                          p_visualize = self.get_visualization(),
+                                          p_raising_object = self,
+                                          p_tstamp = inst.tstamp )
+            anomaly.score = float(scores[idx])
+            self._raise_anomaly_event(p_anomaly=anomaly, p_instance=inst)
+
+
+## -------------------------------------------------------------------------------------------------
+    def score_many(self, p_data : np.ndarray, p_learn : bool = True) -> np.ndarray:
+        """
+        Scores a window of feature vectors. Each feature vector is scored before it is learned.
+        This default implementation passes the feature vectors one by one to the River anomaly
+        detector. Child classes may replace it by a vectorized implementation.
+
+        Parameters
+        ----------
+        p_data : np.ndarray
+            Feature vectors. Shape (n, d).
+        p_learn : bool
+            If True, the feature vectors are learned after scoring. Default: True.
+
+        Returns
+        -------
+        np.ndarray
+            Anomaly scores. Shape (n,).
+        """
+
+        scores = np.empty(p_data.shape[0])
+
+        for i, values in enumerate(p_data.tolist()):
+            x         = dict(enumerate(values, 1))
+            scores[i] = self._river_algo.score_one(x)
+            if p_learn: self._river_algo.learn_one(x)
+
+        return scores
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_algorithm(self) -> base.AnomalyDetector:
+        """
+        This method returns the wrapped River anomaly detector.
+
+        Returns
+        -------
+        base.AnomalyDetector
+            The wrapped River anomaly detector.
+        """
+
+        return self._river_algo
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_threshold(self) -> float:
+        return self._threshold
+
+
+## -------------------------------------------------------------------------------------------------
+    def set_threshold(self, p_threshold : float):
+        self._threshold = p_threshold
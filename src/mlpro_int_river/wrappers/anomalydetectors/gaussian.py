@@ -0,0 +1,139 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.anomalydetectors
+## -- Module  : gaussian.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module provides a wrapper class for the anomaly detector GaussianScorer by River.
+
+Learn more:
+https://www.riverml.xyz/
+
+"""
+
+
+import numpy as np
+
+from mlpro.bf.exceptions import ParamError
+from mlpro.bf.various import Log
+from mlpro.oa.streams import OAStreamTask
+from mlpro_int_river.wrappers.anomalydetectors.basics import WrAnomalyDetectorRiver2MLPro
+
+from river import anomaly
+
+
+
+# Export list for public API
+__all__ = [ 'WrRiverGaussianScorer2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrRiverGaussianScorer2MLPro (WrAnomalyDetectorRiver2MLPro):
+    """
+    This is the wrapper class for the anomaly detector GaussianScorer.
+
+    According to https://riverml.xyz/latest/api/anomaly/GaussianScorer/ :
+    Univariate Gaussian anomaly detector. This is a supervised anomaly detector. It fits a Gaussian
+    distribution to the target values. The anomaly score is then computed as 
+    2 * |CDF(y) - 0.5|, so that values far away from the mean get high scores.
+
+    Here, the target value is the feature with index p_feature of the incoming instances.
+
+    Parameters
+    ----------
+    p_feature : int
+        Index of the feature to be observed, starting with 0. Default: 0.
+    p_window_size : int
+        Optional number of most recent values the Gaussian distribution is fitted to. Default: None
+        (all values).
+    p_grace_period : int
+        Number of values before which the score is always 0. Default: 100.
+    p_threshold : float
+        Score above which an instance is regarded as anomalous. Default: None (C_THRESHOLD).
+    p_batch_size : int
+        Number of instances to be buffered and scored in one window. Default: 1.
+    p_name : str
+        Name of the anomaly detector. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default: False.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_anomaly_buffer_size : int
+        Size of the internal anomaly buffer self.anomalies. Default: 100.
+    p_thrs_inst : int
+        The algorithm is only executed after this number of instances. Default: 0.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE          = 'River Anomaly Detector GaussianScorer'
+
+    C_THRESHOLD     = 0.99
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_feature : int = 0,
+                  p_window_size : int = None,
+                  p_grace_period : int = 100,
+                  p_threshold : float = None,
+                  p_batch_size : int = 1,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  p_anomaly_buffer_size : int = 100,
+                  p_thrs_inst : int = 0,
+                  **p_kwargs ):
+
+        if p_feature < 0:
+            raise ParamError('Parameter p_feature must not be negative')
+
+        self._feature = p_feature
+
+        alg = anomaly.GaussianScorer( window_size = p_window_size,
+                                      grace_period = p_grace_period )
+
+        super().__init__( p_river_algo = alg,
+                          p_threshold = p_threshold,
+                          p_batch_size = p_batch_size,
+                          p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = p_ada,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          p_anomaly_buffer_size = p_anomaly_buffer_size,
+                          p_thrs_inst = p_thrs_inst,
+                          **p_kwargs )
+
+
+## -------------------------------------------------------------------------------------------------
+    def score_many(self, p_data : np.ndarray, p_learn : bool = True) -> np.ndarray:
+
+        scores = np.empty(p_data.shape[0])
+        x      = {}
+
+        for i, y in enumerate(p_data[:, self._feature].tolist()):
+            scores[i] = self._river_algo.score_one(x, y)
+            if p_learn: self._river_algo.learn_one(x, y)
+
+        return scores
@@ -0,0 +1,401 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.anomalydetectors
+## -- Module  : hst.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module provides a wrapper class for the anomaly detector HalfSpaceTrees by River and a
+NumPy-native implementation of it.
+
+Learn more:
+https://www.riverml.xyz/
+
+"""
+
+
+import collections
+import functools
+import random
+
+import numpy as np
+
+from mlpro.bf.exceptions import ParamError
+from mlpro.bf.various import Log
+from mlpro.oa.streams import OAStreamTask
+from mlpro_int_river.wrappers.anomalydetectors.basics import WrAnomalyDetectorRiver2MLPro
+
+from river import anomaly
+from river.tree.padded import PaddedBranch, make_padded_tree
+
+
+
+# Export list for public API
+__all__ = [ 'HalfSpaceTreesNumPy',
+            'WrRiverHalfSpaceTrees2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class HalfSpaceTreesNumPy:
+    """
+    NumPy-native implementation of River's Half-Space Trees. The trees are built exactly like in
+    River with the same random generator and are then stored as arrays in heap order, i.e. the
+    children of node i are the nodes 2i+1 and 2i+2. The masses of all nodes of all trees are kept
+    in two matrices of shape (n_trees, n_nodes).
+
+    A window of feature vectors is scored and learned in one vectorized step. The reference masses
+    only change when the mass window is complete. Therefore, the windows are split at these points
+    and the scores are the same as those of River for scoring and learning one feature vector after
+    another.
+
+    Parameters
+    ----------
+    p_n_trees : int
+        Number of trees. Default: 10.
+    p_height : int
+        Height of each tree. Default: 8.
+    p_window_size : int
+        Number of observations to use for calculating the mass at each node. Default: 250.
+    p_limits : dict
+        Range of each feature in River format, i.e. {feature index : (min, max)} with feature
+        indices starting with 1. Default: None (each feature in [0,1]).
+    p_seed : int
+        Random seed. Default: None.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_n_trees : int = 10,
+                  p_height : int = 8,
+                  p_window_size : int = 250,
+                  p_limits : dict = None,
+                  p_seed : int = None ):
+
+        self.n_trees      = p_n_trees
+        self.height       = p_height
+        self.window_size  = p_window_size
+        self.limits       = collections.defaultdict(functools.partial(tuple, (0.0, 1.0)))
+        if p_limits is not None: self.limits.update(p_limits)
+        self.seed         = p_seed
+        self._rng         = random.Random(p_seed)
+        self.counter      = 0
+        self._first_window = True
+
+        self._features    = None
+        self._thresholds  = None
+        self._l_mass      = None
+        self._r_mass      = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def _build_trees(self, p_num_dim : int):
+        """
+        Builds the trees like River does on the first observation and stores them in heap order.
+        """
+
+        num_nodes         = 2 ** (self.height + 1) - 1
+        self._features    = np.zeros((self.n_trees, num_nodes), dtype=np.int64)
+        self._thresholds  = np.zeros((self.n_trees, num_nodes))
+        self._l_mass      = np.zeros((self.n_trees, num_nodes), dtype=np.int64)
+        self._r_mass      = np.zeros((self.n_trees, num_nodes), dtype=np.int64)
+
+        for tree_id in range(self.n_trees):
+            tree  = make_padded_tree( limits = { i : self.limits[i] for i in range(1, p_num_dim + 1) },
+                                      height = self.height,
+                                      padding = 0.15,
+                                      rng = self._rng,
+                                      r_mass = 0,
+                                      l_mass = 0 )
+            nodes = [ (tree, 0) ]
+
+            while len(nodes) > 0:
+                node, node_id = nodes.pop()
+                if not isinstance(node, PaddedBranch): continue
+                self._features[tree_id, node_id]   = node.feature - 1
+                self._thresholds[tree_id, node_id] = node.threshold
+                nodes.append( (node.children[0], 2 * node_id + 1) )
+                nodes.append( (node.children[1], 2 * node_id + 2) )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_paths(self, p_data : np.ndarray) -> np.ndarray:
+        """
+        Determines the root-to-leaf paths of all feature vectors in all trees.
+
+        Returns
+        -------
+        np.ndarray
+            Node ids. Shape (n, n_trees, height + 1).
+        """
+
+        rows    = np.arange(p_data.shape[0])[:, np.newaxis]
+        trees   = np.arange(self.n_trees)[np.newaxis, :]
+        paths   = np.empty((p_data.shape[0], self.n_trees, self.height + 1), dtype=np.int64)
+        node_id = np.zeros((p_data.shape[0], self.n_trees), dtype=np.int64)
+
+        for level in range(self.height):
+            paths[:, :, level] = node_id
+            right   = p_data[rows, self._features[trees, node_id]] >= self._thresholds[trees, node_id]
+            node_id = 2 * node_id + 1 + right
+
+        paths[:, :, self.height] = node_id
+        return paths
+
+
+## -------------------------------------------------------------------------------------------------
+    def _score_paths(self, p_paths : np.ndarray) -> np.ndarray:
+        """
+        Accumulates r_mass * 2**depth along the paths and stops at the first node with a reference
+        mass below 0.1 * window_size, like River does.
+        """
+
+        r_mass    = self._r_mass[np.arange(self.n_trees)[np.newaxis, :, np.newaxis], p_paths]
+        active    = np.ones(r_mass.shape, dtype=bool)
+        active[:, :, 1:] = np.cumprod(r_mass[:, :, :-1] >= 0.1 * self.window_size, axis=2, dtype=bool)
+        score     = np.sum(r_mass * active * (1 << np.arange(self.height + 1)), axis=(1, 2))
+        max_score = self.n_trees * self.window_size * (2 ** (self.height + 1) - 1)
+        return 1 - score / max_score
+
+
+## -------------------------------------------------------------------------------------------------
+    def _learn_paths(self, p_paths : np.ndarray):
+        """
+        Increments the masses of the latest window along the paths and pivots the masses, if the
+        window is complete.
+        """
+
+        node_ids      = np.arange(self.n_trees)[np.newaxis, :, np.newaxis] * self._l_mass.shape[1] + p_paths
+        self._l_mass += np.bincount(node_ids.ravel(), minlength=self._l_mass.size).reshape(self._l_mass.shape)
+        self.counter += p_paths.shape[0]
+
+        if self.counter == self.window_size:
+            self._r_mass       = self._l_mass
+            self._l_mass       = np.zeros_like(self._r_mass)
+            self._first_window = False
+            self.counter       = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _process(self, p_data : np.ndarray, p_score : bool, p_learn : bool) -> np.ndarray:
+        """
+        Scores and/or learns the given feature vectors in chunks that end at the pivots of the
+        mass window.
+        """
+
+        scores = np.zeros(p_data.shape[0])
+        if p_learn and ( self._features is None ): self._build_trees(p_data.shape[1])
+        if self._features is None: return scores
+
+        start = 0
+        while start < p_data.shape[0]:
+            end   = start + ( self.window_size - self.counter if p_learn else p_data.shape[0] )
+            paths = self._get_paths(p_data[start:end])
+            if p_score and not self._first_window: scores[start:end] = self._score_paths(paths)
+            if p_learn: self._learn_paths(paths)
+            start = end
+
+        return scores
+
+
+## -------------------------------------------------------------------------------------------------
+    def score_many(self, p_data : np.ndarray) -> np.ndarray:
+        """
+        Scores feature vectors without learning them.
+
+        Parameters
+        ----------
+        p_data : np.ndarray
+            Feature vectors. Shape (n, d).
+
+        Returns
+        -------
+        np.ndarray
+            Anomaly scores in [0,1]. Shape (n,).
+        """
+
+        return self._process(p_data, p_score=True, p_learn=False)
+
+
+## -------------------------------------------------------------------------------------------------
+    def learn_many(self, p_data : np.ndarray):
+        """
+        Learns feature vectors.
+
+        Parameters
+        ----------
+        p_data : np.ndarray
+            Feature vectors. Shape (n, d).
+        """
+
+        self._process(p_data, p_score=False, p_learn=True)
+
+
+## -------------------------------------------------------------------------------------------------
+    def score_learn_many(self, p_data : np.ndarray) -> np.ndarray:
+        """
+        Scores each feature vector and learns it afterwards.
+
+        Parameters
+        ----------
+        p_data : np.ndarray
+            Feature vectors. Shape (n, d).
+
+        Returns
+        -------
+        np.ndarray
+            Anomaly scores in [0,1]. Shape (n,).
+        """
+
+        return self._process(p_data, p_score=True, p_learn=True)
+
+
+## -------------------------------------------------------------------------------------------------
+    def learn_one(self, x : dict):
+        """
+        Learns a single feature vector in River format.
+        """
+
+        self.learn_many(np.fromiter(x.values(), dtype=np.float64, count=len(x))[np.newaxis, :])
+
+
+## -------------------------------------------------------------------------------------------------
+    def score_one(self, x : dict) -> float:
+        """
+        Scores a single feature vector in River format.
+        """
+
+        return float(self.score_many(np.fromiter(x.values(), dtype=np.float64, count=len(x))[np.newaxis, :])[0])
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrRiverHalfSpaceTrees2MLPro (WrAnomalyDetectorRiver2MLPro):
+    """
+    This is the wrapper class for the anomaly detector HalfSpaceTrees.
+
+    According to https://riverml.xyz/latest/api/anomaly/HalfSpaceTrees/ :
+    Half-space trees are an online variant of isolation forests. They work well when anomalies are
+    spread out. However, they do not work well if anomalies are packed together in windows. By
+    default, each feature is assumed to be in [0,1].
+
+    Parameters
+    ----------
+    p_n_trees : int
+        Number of trees to use. Default: 10.
+    p_height : int
+        Height of each tree. Default: 8.
+    p_window_size : int
+        Number of observations to use for calculating the mass at each node in each tree.
+        Default: 250.
+    p_limits : dict
+        Range of each feature in River format, i.e. {feature index : (min, max)} with feature
+        indices starting with 1. Default: None (each feature in [0,1]).
+    p_seed : int
+        Random seed. Default: None.
+    p_engine : str
+        Engine to be used. See constants C_ENGINE_*. The engine C_ENGINE_NUMPY is a NumPy-native
+        re-implementation of River's HalfSpaceTrees (see class HalfSpaceTreesNumPy) that scores
+        a window of instances in one vectorized step with the same scores as River.
+        Default: C_ENGINE_RIVER.
+    p_threshold : float
+        Score above which an instance is regarded as anomalous. Default: None (C_THRESHOLD).
+    p_batch_size : int
+        Number of instances to be buffered and scored in one window. Default: 1.
+    p_name : str
+        Name of the anomaly detector. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default: False.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_anomaly_buffer_size : int
+        Size of the internal anomaly buffer self.anomalies. Default: 100.
+    p_thrs_inst : int
+        The algorithm is only executed after this number of instances. Default: 0.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE          = 'River Anomaly Detector HalfSpaceTrees'
+
+    C_THRESHOLD     = 0.9
+
+    C_ENGINE_RIVER  = 'River'
+    C_ENGINE_NUMPY  = 'NumPy'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_n_trees : int = 10,
+                  p_height : int = 8,
+                  p_window_size : int = 250,
+                  p_limits : dict = None,
+                  p_seed : int = None,
+                  p_engine : str = C_ENGINE_RIVER,
+                  p_threshold : float = None,
+                  p_batch_size : int = 1,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  p_anomaly_buffer_size : int = 100,
+                  p_thrs_inst : int = 0,
+                  **p_kwargs ):
+
+        if p_engine == self.C_ENGINE_RIVER:
+            alg = anomaly.HalfSpaceTrees( n_trees = p_n_trees,
+                                          height = p_height,
+                                          window_size = p_window_size,
+                                          limits = p_limits,
+                                          seed = p_seed )
+        elif p_engine == self.C_ENGINE_NUMPY:
+            alg = HalfSpaceTreesNumPy( p_n_trees = p_n_trees,
+                                       p_height = p_height,
+                                       p_window_size = p_window_size,
+                                       p_limits = p_limits,
+                                       p_seed = p_seed )
+        else:
+            raise ParamError('Unknown engine ' + str(p_engine))
+
+        self._engine = p_engine
+
+        super().__init__( p_river_algo = alg,
+                          p_threshold = p_threshold,
+                          p_batch_size = p_batch_size,
+                          p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = p_ada,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          p_anomaly_buffer_size = p_anomaly_buffer_size,
+                          p_thrs_inst = p_thrs_inst,
+                          **p_kwargs )
+
+
+## -------------------------------------------------------------------------------------------------
+    def score_many(self, p_data : np.ndarray, p_learn : bool = True) -> np.ndarray:
+
+        if self._engine == self.C_ENGINE_RIVER: return super().score_many(p_data, p_learn=p_learn)
+
+        if p_learn: return self._river_algo.score_learn_many(p_data)
+        return self._river_algo.score_many(p_data)
@@ -0,0 +1,113 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.anomalydetectors
+## -- Module  : lof.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module provides a wrapper class for the anomaly detector LocalOutlierFactor by River.
+
+Learn more:
+https://www.riverml.xyz/
+
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro.oa.streams import OAStreamTask
+from mlpro_int_river.wrappers.anomalydetectors.basics import WrAnomalyDetectorRiver2MLPro
+
+from river import anomaly, neighbors
+
+
+
+# Export list for public API
+__all__ = [ 'WrRiverLocalOutlierFactor2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrRiverLocalOutlierFactor2MLPro (WrAnomalyDetectorRiver2MLPro):
+    """
+    This is the wrapper class for the anomaly detector LocalOutlierFactor.
+
+    According to https://riverml.xyz/latest/api/anomaly/LocalOutlierFactor/ :
+    The LOF of a sample measures how isolated it is relative to the density of its neighbors: a
+    value around 1 means the sample lies in a region as dense as its neighborhood, while a value
+    substantially above 1 flags an outlier sitting in a comparatively sparse region. Samples are
+    stored in a fixed-size sliding window.
+
+    Parameters
+    ----------
+    p_n_neighbors : int
+        The number of nearest neighbors used to define the local neighborhood. Default: 10.
+    p_window_size : int
+        Number of most recent samples kept for the neighbor search. Default: 1000.
+    p_threshold : float
+        Score above which an instance is regarded as anomalous. Default: None (C_THRESHOLD).
+    p_batch_size : int
+        Number of instances to be buffered and scored in one window. Default: 1.
+    p_name : str
+        Name of the anomaly detector. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default: False.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_anomaly_buffer_size : int
+        Size of the internal anomaly buffer self.anomalies. Default: 100.
+    p_thrs_inst : int
+        The algorithm is only executed after this number of instances. Default: 0.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE          = 'River Anomaly Detector LocalOutlierFactor'
+
+    C_THRESHOLD     = 1.5
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_n_neighbors : int = 10,
+                  p_window_size : int = 1000,
+                  p_threshold : float = None,
+                  p_batch_size : int = 1,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  p_anomaly_buffer_size : int = 100,
+                  p_thrs_inst : int = 0,
+                  **p_kwargs ):
+
+        alg = anomaly.LocalOutlierFactor( n_neighbors = p_n_neighbors,
+                                          engine = neighbors.LazySearch(window_size = p_window_size) )
+
+        super().__init__( p_river_algo = alg,
+                          p_threshold = p_threshold,
+                          p_batch_size = p_batch_size,
+                          p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = p_ada,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          p_anomaly_buffer_size = p_anomaly_buffer_size,
+                          p_thrs_inst = p_thrs_inst,
+                          **p_kwargs )
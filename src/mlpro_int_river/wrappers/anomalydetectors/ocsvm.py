@@ -0,0 +1,137 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.anomalydetectors
+## -- Module  : ocsvm.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module provides a wrapper class for the anomaly detector OneClassSVM by River.
+
+Learn more:
+https://www.riverml.xyz/
+
+"""
+
+
+import numpy as np
+
+from mlpro.bf.various import Log
+from mlpro.oa.streams import OAStreamTask
+from mlpro_int_river.wrappers.anomalydetectors.basics import WrAnomalyDetectorRiver2MLPro
+
+from river import anomaly, optim
+
+
+
+# Export list for public API
+__all__ = [ 'WrRiverOneClassSVM2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrRiverOneClassSVM2MLPro (WrAnomalyDetectorRiver2MLPro):
+    """
+    This is the wrapper class for the anomaly detector OneClassSVM.
+
+    According to https://riverml.xyz/latest/api/anomaly/OneClassSVM/ :
+    This is a stochastic implementation of the one-class SVM algorithm, and will not exactly match
+    its batch formulation. It is encouraged to scale the data upstream.
+
+    The score of an instance is the linear function w*x of the model. A window of instances is
+    scored in one matrix-vector product with the model at the beginning of the window. Afterwards,
+    the instances of the window are learned one after another. For a batch size of 1, this is the
+    same as scoring and learning with River.
+
+    Parameters
+    ----------
+    p_nu : float
+        An upper bound on the fraction of training errors and a lower bound of the fraction of
+        support vectors. Default: 0.1.
+    p_optimizer : optim.base.Optimizer
+        The sequential optimizer used for updating the weights. Default: None (SGD with learning
+        rate 0.01).
+    p_intercept_lr : float
+        Learning rate for updating the intercept. Default: 0.01.
+    p_threshold : float
+        Score above which an instance is regarded as anomalous. Default: None (C_THRESHOLD).
+    p_batch_size : int
+        Number of instances to be buffered and scored in one window. Default: 1.
+    p_name : str
+        Name of the anomaly detector. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default: False.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_anomaly_buffer_size : int
+        Size of the internal anomaly buffer self.anomalies. Default: 100.
+    p_thrs_inst : int
+        The algorithm is only executed after this number of instances. Default: 0.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE          = 'River Anomaly Detector OneClassSVM'
+
+    C_THRESHOLD     = 1.0
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_nu : float = 0.1,
+                  p_optimizer : optim.base.Optimizer = None,
+                  p_intercept_lr : float = 0.01,
+                  p_threshold : float = None,
+                  p_batch_size : int = 1,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  p_anomaly_buffer_size : int = 100,
+                  p_thrs_inst : int = 0,
+                  **p_kwargs ):
+
+        alg = anomaly.OneClassSVM( nu = p_nu,
+                                   optimizer = p_optimizer,
+                                   intercept_lr = p_intercept_lr )
+
+        super().__init__( p_river_algo = alg,
+                          p_threshold = p_threshold,
+                          p_batch_size = p_batch_size,
+                          p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = p_ada,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          p_anomaly_buffer_size = p_anomaly_buffer_size,
+                          p_thrs_inst = p_thrs_inst,
+                          **p_kwargs )
+
+
+## -------------------------------------------------------------------------------------------------
+    def score_many(self, p_data : np.ndarray, p_learn : bool = True) -> np.ndarray:
+
+        weights = self._river_algo._weights
+        scores  = p_data @ np.array([ weights.get(i, 0.0) for i in range(1, p_data.shape[1] + 1) ])
+
+        if p_learn:
+            for values in p_data.tolist():
+                self._river_algo.learn_one(dict(enumerate(values, 1)))
+
+        return scores
@@ -29,23 +29,148 @@
 ## -- 2024-02-15  2.1.0     DA       Updated minimum version of river to 0.21.0
 ## -- 2024-04-10  2.1.1     DA       Refactoring
 ## -- 2025-07-21  2.1.2     DS       Refactoring
+## -- 2026-10-18  2.2.0     DA       New class RiverInputCache: shared per-instance input conversion
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 2.1.2 (2025-07-21)
+Ver. 2.2.0 (2026-10-18)
 
-This module contains the abstract root class for all river wrapper classes.
+This module contains the abstract root class for all river wrapper classes and a cache for the
+conversion of stream instances into the input format of River, which is shared by all wrappers.
 
 Learn more:
 https://www.riverml.xyz/
 
 """
 
+import threading
+import weakref
+
+import numpy as np
+
 from mlpro.bf.various import ScientificObject
+from mlpro.bf.streams import Instance
 from mlpro.wrappers import Wrapper
 
 # Export list for public API
-__all__ = [ 'WrapperRiver' ]
+__all__ = [ 'RiverInputCache',
+            'WrapperRiver' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class RiverInputCache:
+    """
+    Cache for the conversion of the feature data of stream instances into a flat array and into the
+    input format of River, which is a dictionary with enumerated features starting with index 1. 
+    The conversions are keyed by instance identity. If several River wrappers process the same 
+    instance, e.g. an ensemble of cluster analyzers behind the same predecessor task, the instance 
+    is converted only once.
+
+    An entry is renewed, if the feature values of the instance have been replaced (as MLPro 
+    normalizers do). Feature values that are modified in place are not detected. The cached array
+    is read-only and the cached dictionary must not be modified either. Only the most recent
+    instances are kept.
+
+    Parameters
+    ----------
+    p_max_entries : int
+        Maximum number of cached instances. Default: C_MAX_ENTRIES.
+    """
+
+    C_MAX_ENTRIES   = 64
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_max_entries : int = C_MAX_ENTRIES):
+
+        self._max_entries = p_max_entries
+        self._entries     = {}
+        self._lock        = threading.Lock()
+        self.num_hits     = 0
+        self.num_misses   = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_entry(self, p_instance : Instance) -> list:
+        """
+        Returns the cache entry [instance reference, feature values, array, dictionary] of the 
+        given instance. A new entry is created, if required.
+        """
+
+        values = p_instance.get_feature_data().get_values()
+        entry  = self._entries.get(id(p_instance))
+
+        if ( entry is not None ) and ( entry[0]() is p_instance ) and ( entry[1] is values ):
+            self.num_hits += 1
+            return entry
+
+        self.num_misses += 1
+        data = np.asarray(values, dtype=np.float64).ravel()
+        data.flags.writeable = False
+        entry = [ weakref.ref(p_instance), values, data, None ]
+
+        with self._lock:
+            self._entries.pop(id(p_instance), None)
+            self._entries[id(p_instance)] = entry
+            if len(self._entries) > self._max_entries:
+                del self._entries[next(iter(self._entries))]
+
+        return entry
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_values(self, p_instance : Instance) -> np.ndarray:
+        """
+        Returns the feature data of the given instance as a flat read-only array.
+
+        Parameters
+        ----------
+        p_instance : Instance
+            Instance to be converted.
+
+        Returns
+        -------
+        np.ndarray
+            Feature data. Shape (d,).
+        """
+
+        return self._get_entry(p_instance)[2]
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_river_input(self, p_instance : Instance) -> dict:
+        """
+        Returns the feature data of the given instance in River format.
+
+        Parameters
+        ----------
+        p_instance : Instance
+            Instance to be converted.
+
+        Returns
+        -------
+        dict
+            Feature data in River format.
+        """
+
+        entry = self._get_entry(p_instance)
+        if entry[3] is None: entry[3] = dict(enumerate(entry[2], 1))
+        return entry[3]
+
+
+## -------------------------------------------------------------------------------------------------
+    def clear(self):
+        """
+        Removes all entries and resets the statistics.
+        """
+
+        with self._lock:
+            self._entries.clear()
+            
+        self.num_hits   = 0
+        self.num_misses = 0
 
 
 
@@ -53,7 +178,8 @@ __all__ = [ 'WrapperRiver' ]
 ## -------------------------------------------------------------------------------------------------
 class WrapperRiver (Wrapper):
     """
-    Root class for all River wrapper classes.
+    Root class for all River wrapper classes. The input conversion cache C_INPUT_CACHE is shared
+    by all River wrappers.
     """
 
     C_TYPE              = 'Wrapper River'
@@ -63,3 +189,5 @@ class WrapperRiver (Wrapper):
     C_SCIREF_TYPE       = ScientificObject.C_SCIREF_TYPE_ONLINE
     C_SCIREF_AUTHOR     = 'River'
     C_SCIREF_URL        = 'riverml.xyz'
+
+    C_INPUT_CACHE       = RiverInputCache()
@@ -1,5 +1,13 @@
+from .helpers import *
+from .index import *
+from .checkpoints import *
+from .worker import *
 from .clustream import *
 from .dbstream import *
 from .denstream import *
 from .kmeans import *
-from .streamkmeans import *
\ No newline at end of file
+from .odac import *
+from .pool import *
+from .sharded import *
+from .streamkmeans import *
+from .textclust import *
\ No newline at end of file
@@ -33,10 +33,40 @@
 ## -- 2024-07-04  1.6.0     DA       Alignment with MLPro 2
 ## -- 2025-06-15  1.7.0     DA       Alignment with MLpro 2.0.2
 ## -- 2025-07-21  1.7.1     DS       Refactoring
+## -- 2026-10-18  1.8.0     DA       Class WrClusterAnalyzerRiver2MLPro: new method _get_river_input()
+## -- 2026-10-18  1.9.0     DA       Class WrClusterAnalyzerRiver2MLPro: optional k-means++ warm start
+## -- 2026-10-18  1.10.0    DA       Class WrClusterAnalyzerRiver2MLPro: new method 
+## --                                _get_renormalization_params()
+## -- 2026-10-18  1.11.0    DA       Class WrClusterAnalyzerRiver2MLPro: new method 
+## --                                _renormalize_river_data(), _renormalize_warm_start()
+## -- 2026-10-18  1.12.0    DA       Class WrClusterAnalyzerRiver2MLPro: optional fused River scaler
+## -- 2026-10-18  1.13.0    DA       Class WrClusterAnalyzerRiver2MLPro: checkpoints incl. periodic
+## --                                snapshots in a background thread
+## -- 2026-10-18  1.14.0    DA       New class ClusterSnapshot: immutable versioned snapshots of the 
+## --                                clusters, published at a configurable cadence
+## -- 2026-10-18  1.15.0    DA       Class WrClusterAnalyzerRiver2MLPro: optional worker process
+## -- 2026-10-18  1.16.0    DA       Class WrClusterAnalyzerRiver2MLPro: input conversion by the
+## --                                shared cache WrapperRiver.C_INPUT_CACHE
+## -- 2026-10-18  1.17.0    DA       Class WrClusterAnalyzerRiver2MLPro: optional centroid index for
+## --                                cluster memberships, bugfix in get_cluster_memberships()
+## -- 2026-10-18  1.17.1    DA       Class WrClusterAnalyzerRiver2MLPro: snapshots and checkpoints of
+## --                                clusters without centroid property
+## -- 2026-10-18  1.17.2    DA       Class WrClusterAnalyzerRiver2MLPro: centroid matrix and centroid
+## --                                index of clusters without centroid property
+## -- 2026-10-19  1.17.3    DA       Class WrClusterAnalyzerRiver2MLPro: new constant
+## --                                C_RIVER_INPUT_COPY; _renormalize_river_data() replaces the
+## --                                data points instead of updating them in place
+## -- 2026-10-19  1.17.4    DA       Method set_centroid_index(): centroid property is identified
+## --                                by its name
+## -- 2026-10-19  1.18.0    DA       Class ClusterSnapshot and checkpoint machinery separated to new
+## --                                module checkpoints (mixin Checkpointable), worker machinery to
+## --                                module worker (mixin Offloadable)
+## -- 2026-10-19  1.18.1    DA       Class WrClusterAnalyzerRiver2MLPro: new constant 
+## --                                C_WARM_START_SUPPORTED
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.7.1 (2025-07-21)
+Ver. 1.18.1 (2026-10-19)
 
 This module provides wrapper root classes from River to MLPro, specifically for cluster analyzers. 
 
@@ -47,8 +77,10 @@ https://www.riverml.xyz/
 
 
 from typing import List, Tuple
+import copy
 import numpy as np
 
+from mlpro.bf.exceptions import ParamError, Error
 from mlpro.bf.streams import Instance
 from mlpro_int_river.wrappers import WrapperRiver
 from mlpro.oa.streams.tasks.clusteranalyzers import ClusterAnalyzer
@@ -57,8 +89,13 @@ from mlpro.oa.streams.tasks.clusteranalyzers.clusters.properties import *
 from mlpro.bf.mt import Task as MLTask
 from mlpro.bf.various import Log
 from mlpro.bf.streams import *
+from mlpro.bf.math.normalizers import Normalizer
+from mlpro_int_river.wrappers.clusteranalyzers.helpers import kmeans_plusplus, kmeans_lloyd
+from mlpro_int_river.wrappers.clusteranalyzers.index import CentroidIndex
+from mlpro_int_river.wrappers.clusteranalyzers.worker import Offloadable
+from mlpro_int_river.wrappers.clusteranalyzers.checkpoints import Checkpointable
 
-from river import base
+from river import base, preprocessing
 
 
 
@@ -70,9 +107,11 @@ __all__ = [ 'WrClusterAnalyzerRiver2MLPro' ]
 
 ## -------------------------------------------------------------------------------------------------
 ## -------------------------------------------------------------------------------------------------
-class WrClusterAnalyzerRiver2MLPro (WrapperRiver, ClusterAnalyzer):
+class WrClusterAnalyzerRiver2MLPro (Checkpointable, Offloadable, WrapperRiver, ClusterAnalyzer):
     """
-    This is the base wrapper class for each River-based cluster analyzer to MLPro.
+    This is the base wrapper class for each River-based cluster analyzer to MLPro. Checkpoints and
+    snapshots are provided by the mixin Checkpointable, the optional worker process by the mixin
+    Offloadable.
 
     Parameters
     ----------
@@ -90,6 +129,31 @@ class WrClusterAnalyzerRiver2MLPro (WrapperRiver, ClusterAnalyzer):
         Turn on visualization. Default: False.
     p_logging :
         Set up type of logging. Default: Log.C_LOG_ALL.
+    p_warm_start_size : int
+        Optional number of initial instances to be buffered for a warm start. If greater than 0, 
+        the cluster centers are initialized by k-means++ seeding and some Lloyd iterations on the
+        buffered instances and are then injected into the River model (see method 
+        _inject_centers()). Only supported by wrappers with C_WARM_START_SUPPORTED = True.
+        Default: 0 (no warm start).
+    p_warm_start_iter : int
+        Maximum number of Lloyd iterations of the warm start. Default: 5.
+    p_river_scaler : base.Transformer
+        Optional instantiated River scaler (see C_RIVER_SCALERS) that is fused with the clusterer.
+        Each incoming instance is learned by the scaler and then transformed before it is passed
+        to the clusterer. This replaces a separate chain of boundary detector and normalizer 
+        tasks. The clusters are kept in the units of the scaler. Method get_cluster_centers() maps
+        them back to the original units on demand. Default: None.
+    p_snapshot_cadence : int
+        Optional number of instances after which an immutable snapshot of the clusters is published
+        (see method get_snapshot()). Other threads can read the latest snapshot without locking out
+        the adaptation. Default: 0 (no snapshots).
+    p_worker_batch_size : int
+        If greater than 0, the River model is run in a separate worker process. The instances are
+        shipped to the worker in batches of this size through a ring buffer in shared memory and 
+        the clusters published by the worker are taken over whenever available. See module 
+        worker and method stop_worker(). Default: 0 (River model runs in the calling thread).
+    p_worker_max_clusters : int
+        Maximum number of clusters that a worker process can publish. Default: 100.
     p_kwargs : dict
         Further optional named parameters. 
         
@@ -99,6 +163,16 @@ class WrClusterAnalyzerRiver2MLPro (WrapperRiver, ClusterAnalyzer):
 
     C_CLUSTER_PROPERTIES    = [ cprop_centroid, cprop_size ]
 
+    C_RIVER_SCALERS         = ( preprocessing.StandardScaler, 
+                                preprocessing.MinMaxScaler, 
+                                preprocessing.MaxAbsScaler )
+
+    C_RIVER_INPUT_COPY      = False
+
+    C_WARM_START_SUPPORTED  = False
+
+    C_CHECKPOINT_ATTRIBUTES = [ '_river_algo', '_river_scaler', '_warm_start_buffer' ]
+
 ## -------------------------------------------------------------------------------------------------
     def __init__( self,
                   p_cls_cluster : type,
@@ -108,9 +182,44 @@ class WrClusterAnalyzerRiver2MLPro (WrapperRiver, ClusterAnalyzer):
                   p_ada:bool = True,
                   p_visualize:bool = True,
                   p_logging = Log.C_LOG_ALL,
+                  p_warm_start_size : int = 0,
+                  p_warm_start_iter : int = 5,
+                  p_river_scaler : base.Transformer = None,
+                  p_snapshot_cadence : int = 0,
+                  p_worker_batch_size : int = 0,
+                  p_worker_max_clusters : int = 100,
                   **p_kwargs):
         
-        self._river_algo = p_river_algo
+        if ( p_river_scaler is not None ) and not isinstance(p_river_scaler, self.C_RIVER_SCALERS):
+            raise ParamError('River scaler ' + type(p_river_scaler).__name__ + ' is not supported')
+
+        self._river_algo   = p_river_algo
+        self._river_scaler = p_river_scaler
+        self._seed       = getattr(p_river_algo, 'seed', None)
+
+        if p_warm_start_size < 0: raise ParamError('Parameter p_warm_start_size must not be negative')
+
+        if p_warm_start_size > 0:
+            if not self.C_WARM_START_SUPPORTED:
+                raise ParamError(type(self).__name__ + ' does not support a warm start')
+            if p_warm_start_size < p_river_algo.n_clusters:
+                raise ParamError('Parameter p_warm_start_size must not be smaller than the number of clusters')
+            self._warm_start_buffer = []
+        else:
+            self._warm_start_buffer = None
+
+        self._warm_start_size = p_warm_start_size
+        self._warm_start_iter = p_warm_start_iter
+
+        Checkpointable.__init__(self, p_snapshot_cadence=p_snapshot_cadence)
+
+        Offloadable.__init__( self, 
+                              p_worker_batch_size = p_worker_batch_size, 
+                              p_worker_max_clusters = p_worker_max_clusters )
+
+        self._centroid_index        = None
+        self._index_refresh         = 1
+        self._index_num_adapt       = 0
 
         ClusterAnalyzer.__init__( self,
                                   p_cls_cluster = p_cls_cluster,
@@ -126,6 +235,49 @@ class WrClusterAnalyzerRiver2MLPro (WrapperRiver, ClusterAnalyzer):
         WrapperRiver.__init__(self, p_logging=p_logging)
 
 
+## -------------------------------------------------------------------------------------------------
+    def adapt(self, p_instances : InstDict) -> bool:
+        """
+        Adapts the clusters on the given instances. While periodic checkpoints are active, the
+        adaptation is mutually exclusive with taking a checkpoint. See method start_checkpointing().
+        If snapshots are turned on, a new snapshot is published after each p_snapshot_cadence 
+        instances.
+        """
+
+        if self._checkpoint_lock is None: 
+            adapted = super().adapt(p_instances=p_instances)
+        else:
+            with self._checkpoint_lock:
+                adapted = super().adapt(p_instances=p_instances)
+
+        if self._snapshot_cadence > 0:
+            self._snapshot_num_inst += len(p_instances)
+            if self._snapshot_num_inst >= self._snapshot_cadence: self.publish_snapshot()
+
+        if adapted: self._index_num_adapt += 1
+
+        return adapted
+
+
+## -------------------------------------------------------------------------------------------------
+    def renormalize_on_event(self, p_event_id: str, p_event_object):
+        """
+        Renormalizes the clusters on the event of a normalizer. While periodic checkpoints are 
+        active, the renormalization is mutually exclusive with taking a checkpoint.
+        """
+
+        if self._worker is not None: raise Error('Renormalization is not supported while a worker process is running')
+
+        if self._checkpoint_lock is None: 
+            super().renormalize_on_event(p_event_id=p_event_id, p_event_object=p_event_object)
+        else:
+            with self._checkpoint_lock:
+                super().renormalize_on_event(p_event_id=p_event_id, p_event_object=p_event_object)
+
+        if self._snapshot_cadence > 0: self.publish_snapshot()
+        if self._centroid_index is not None: self.refresh_centroid_index()
+
+
 ## -------------------------------------------------------------------------------------------------
     def _adapt(self, p_instance_new : Instance) -> bool:
         """
@@ -141,12 +293,12 @@ class WrClusterAnalyzerRiver2MLPro (WrapperRiver, ClusterAnalyzer):
         bool
             True, if something has been adapted. False otherwise.        
         """
-        
-        # extract features data from instances
-        feature_data    = np.array(p_instance_new.get_feature_data().get_values())
 
-        # transform np array to dict with enumeration
-        input_data = dict(enumerate(feature_data.flatten(), 1))
+        if self._warm_start_buffer is not None: return self._warm_start(p_instance_new)
+        if self._worker_batch_size > 0: return self._adapt_worker(p_instance_new)
+        
+        # transform features data to River input format
+        input_data = self._get_river_input(p_instance_new, p_learn=True)
 
         # update the model with a set of features
         self.log(self.C_LOG_TYPE_I, 'Cluster is adapted...')
@@ -159,6 +311,203 @@ class WrClusterAnalyzerRiver2MLPro (WrapperRiver, ClusterAnalyzer):
         return True
     
 
+## -------------------------------------------------------------------------------------------------
+    def _get_river_input(self, p_instance : Instance, p_learn : bool = False) -> dict:
+        """
+        Converts the feature data of the given instance into the input format of River, which is a
+        dictionary with enumerated features starting with index 1. The conversion is shared with
+        other River wrappers via the cache C_INPUT_CACHE. If a River scaler is fused, the feature 
+        data are scaled. River algorithms that keep the learned input dictionary (constant
+        C_RIVER_INPUT_COPY = True) get a copy of it, since the cached dictionary must not be modified.
+
+        Parameters
+        ----------
+        p_instance : Instance
+            Instance to be converted.
+        p_learn : bool
+            If True, the fused River scaler learns the instance before scaling it. Default: False.
+
+        Returns
+        -------
+        dict
+            Feature data in River format.
+        """
+
+        input_data = self.C_INPUT_CACHE.get_river_input(p_instance)
+
+        if self._river_scaler is None: 
+            if p_learn and self.C_RIVER_INPUT_COPY: return dict(input_data)
+            return input_data
+
+        if p_learn: self._river_scaler.learn_one(input_data)
+        return self._river_scaler.transform_one(input_data)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_input_values(self, p_instance : Instance, p_learn : bool = False) -> np.ndarray:
+        """
+        Returns the feature data of the given instance as a flat read-only array. If a River scaler 
+        is fused, the feature data are scaled. See method _get_river_input().
+
+        Parameters
+        ----------
+        p_instance : Instance
+            Instance to be converted.
+        p_learn : bool
+            If True, the fused River scaler learns the instance before scaling it. Default: False.
+
+        Returns
+        -------
+        np.ndarray
+            Feature data. Shape (d,).
+        """
+
+        if self._river_scaler is None:
+            return self.C_INPUT_CACHE.get_values(p_instance)
+        
+        input_data = self._get_river_input(p_instance, p_learn=p_learn)
+        return np.fromiter(input_data.values(), dtype=np.float64, count=len(input_data))
+
+
+## -------------------------------------------------------------------------------------------------
+    def _warm_start(self, p_instance : Instance) -> bool:
+        """
+        Buffers the given instance for the warm start. When the buffer is full, initial centers are
+        determined by k-means++ seeding and Lloyd iterations on the buffered instances and injected
+        into the River model. The MLPro clusters are set up accordingly.
+
+        Parameters
+        ----------
+        p_instance : Instance
+            Instance to be buffered.
+
+        Returns
+        -------
+        bool
+            True, if the centers have been injected. False otherwise.
+        """
+
+        self._warm_start_buffer.append(self._get_input_values(p_instance, p_learn=True))
+        if len(self._warm_start_buffer) < self._warm_start_size: return False
+
+        data                    = np.array(self._warm_start_buffer)
+        self._warm_start_buffer = None
+
+        self.log(self.C_LOG_TYPE_I, 'Warm start on', data.shape[0], 'instances...')
+        centers         = kmeans_plusplus( p_data = data, 
+                                           p_n_clusters = self._river_algo.n_clusters, 
+                                           p_seed = self._seed )
+        centers, labels = kmeans_lloyd( p_data = data, 
+                                        p_centers = centers, 
+                                        p_num_iter = self._warm_start_iter )
+
+        self._inject_centers(centers)
+        self._get_clusters()
+
+        for x, num_inst in enumerate(np.bincount(labels, minlength=centers.shape[0])):
+            related_cluster = self._clusters[x]
+            related_cluster.centroid.value = centers[x]
+            if num_inst > 0: related_cluster.size.value = int(num_inst)
+
+        return True
+    
+
+## -------------------------------------------------------------------------------------------------
+    def _inject_centers(self, p_centers : np.ndarray):
+        """
+        Custom method to overwrite the cluster centers of the River model. See method _warm_start().
+
+        Parameters
+        ----------
+        p_centers : np.ndarray
+            New cluster centers. Shape (k, d).
+        """
+
+        raise NotImplementedError
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_renormalization_params(self, p_normalizer : Normalizer):
+        """
+        Determines the affine transformation x_new = x_old * factors + offsets that corresponds to
+        the renormalization of the given normalizer, i.e. to the denormalization with its previous
+        parameters and the normalization with its current parameters.
+
+        Parameters
+        ----------
+        p_normalizer : Normalizer
+            Normalizer object with previous and current parameters.
+
+        Returns
+        -------
+        factors : np.ndarray
+            Factors per feature. Shape (d,). None, if the renormalization is an identity.
+        offsets : np.ndarray
+            Offsets per feature. Shape (d,). None, if the renormalization is an identity.
+        """
+
+        param_old = p_normalizer._param_old
+        param_new = p_normalizer._param_new
+        if ( param_old is None ) or ( param_new is None ) or np.array_equal(param_old, param_new): 
+            return None, None
+
+        factors = np.asarray(param_new[0], dtype=np.float64) / np.asarray(param_old[0], dtype=np.float64)
+        offsets = np.asarray(param_new[1], dtype=np.float64) - np.asarray(param_old[1], dtype=np.float64) * factors
+        return factors, offsets
+
+
+## -------------------------------------------------------------------------------------------------
+    def _renormalize_river_data( self, 
+                                 p_data : dict,
+                                 p_factors : np.ndarray,
+                                 p_offsets : np.ndarray ):
+        """
+        Applies an affine renormalization to a dictionary of data points in River format (e.g. the
+        cluster centers of a River k-means) in one vectorized step. Empty data points are skipped.
+        The renormalized data points replace the original ones, which may be shared with the input
+        cache or other River algorithms and are thus left unchanged.
+
+        Parameters
+        ----------
+        p_data : dict
+            Dictionary of data points in River format.
+        p_factors : np.ndarray
+            Factors per feature. Shape (d,).
+        p_offsets : np.ndarray
+            Offsets per feature. Shape (d,).
+        """
+
+        points = [ (key, point) for key, point in p_data.items() if len(point) != 0 ]
+        if len(points) == 0: return
+
+        keys   = list(points[0][1].keys())
+        values = np.array([ [ point[k] for k in keys ] for _, point in points ], dtype=np.float64)
+
+        for (key, point), values_new in zip(points, ( values * p_factors + p_offsets ).tolist()):
+            point_new = copy.copy(point)
+            point_new.update(zip(keys, values_new))
+            p_data[key] = point_new
+
+
+## -------------------------------------------------------------------------------------------------
+    def _renormalize_warm_start( self, 
+                                 p_factors : np.ndarray,
+                                 p_offsets : np.ndarray ):
+        """
+        Applies an affine renormalization to the instances buffered for the warm start.
+
+        Parameters
+        ----------
+        p_factors : np.ndarray
+            Factors per feature. Shape (d,).
+        p_offsets : np.ndarray
+            Offsets per feature. Shape (d,).
+        """
+
+        if not self._warm_start_buffer: return
+        self._warm_start_buffer = list( np.array(self._warm_start_buffer) * p_factors + p_offsets )
+
+
 ## -------------------------------------------------------------------------------------------------
     def _update_clusters(self, input_data):
         """
@@ -183,6 +532,193 @@ class WrClusterAnalyzerRiver2MLPro (WrapperRiver, ClusterAnalyzer):
         return self._river_algo
 
 
+## -------------------------------------------------------------------------------------------------
+    def get_scaler(self) -> base.Transformer:
+        """
+        This method returns the fused River scaler.
+
+        Returns
+        -------
+        base.Transformer
+            The fused River scaler or None.
+        """
+
+        return self._river_scaler
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_unscaling_params(self):
+        """
+        Determines the current parameters of the inverse transformation of the fused River scaler
+        x = y * factors + offsets.
+
+        Returns
+        -------
+        factors : np.ndarray
+            Factors per feature. Shape (d,).
+        offsets : np.ndarray
+            Offsets per feature. Shape (d,).
+        """
+
+        scaler = self._river_scaler
+
+        if isinstance(scaler, preprocessing.StandardScaler):
+            keys = list(scaler.means.keys())
+            if scaler.window_size is None:
+                offsets = np.array([ scaler.means[k] for k in keys ], dtype=np.float64)
+                var     = np.array([ scaler.vars[k] for k in keys ], dtype=np.float64) if scaler.with_std else None
+            else:
+                offsets = np.array([ scaler.means[k].get() for k in keys ], dtype=np.float64)
+                var     = np.array([ scaler.vars[k].get() for k in keys ], dtype=np.float64) if scaler.with_std else None
+
+            factors = np.ones_like(offsets) if var is None else np.sqrt(var)
+            
+        elif isinstance(scaler, preprocessing.MinMaxScaler):
+            keys    = list(scaler.min.keys())
+            offsets = np.array([ scaler.min[k].get() for k in keys ], dtype=np.float64)
+            factors = np.array([ scaler.max[k].get() for k in keys ], dtype=np.float64) - offsets
+
+        else:
+            keys    = list(scaler.abs_max.keys())
+            factors = np.array([ scaler.abs_max[k].get() for k in keys ], dtype=np.float64)
+            offsets = np.zeros_like(factors)
+
+        return factors, offsets
+
+
+## -------------------------------------------------------------------------------------------------
+    def unscale(self, p_data : np.ndarray) -> np.ndarray:
+        """
+        Maps data from the units of the fused River scaler back to the original units, based on 
+        the current state of the scaler.
+
+        Parameters
+        ----------
+        p_data : np.ndarray
+            Data in scaled units. Shape (n, d) or (d,).
+
+        Returns
+        -------
+        np.ndarray
+            Data in original units. Same shape as p_data.
+        """
+
+        if self._river_scaler is None: return p_data
+
+        factors, offsets = self._get_unscaling_params()
+        return np.asarray(p_data, dtype=np.float64) * factors + offsets
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_cluster_centers(self, p_original_units : bool = True):
+        """
+        Returns the centroids of all clusters as a matrix. Clusters without a centroid property 
+        are left out.
+
+        Parameters
+        ----------
+        p_original_units : bool
+            If True (default), the centroids are mapped back from the units of the fused River 
+            scaler to the original units. Without a fused scaler this parameter has no effect.
+
+        Returns
+        -------
+        ids : list
+            Cluster ids related to the rows of the centroid matrix.
+        centers : np.ndarray
+            Centroids of the clusters. Shape (k, d).
+        """
+
+        ids     = [ x for x, cluster in self._clusters.items() if hasattr(cluster, 'centroid') ]
+        if len(ids) == 0: return ids, None
+
+        centers = np.array([ self._clusters[x].centroid.value for x in ids ], dtype=np.float64)
+        if p_original_units: centers = self.unscale(centers)
+
+        return ids, centers
+
+
+## -------------------------------------------------------------------------------------------------
+    def set_centroid_index(self, p_index : CentroidIndex = None, p_refresh_interval : int = 1):
+        """
+        Sets up a nearest-neighbor index of the centroids of all clusters, which serves the queries
+        of method get_cluster_memberships() instead of the River model. An instance is then a
+        member of the cluster with the nearest centroid. The index is refreshed incrementally
+        before a query, if the clusters were adapted at least p_refresh_interval times since the
+        last refresh. With a refresh interval greater than 1, queries may refer to slightly 
+        outdated centroids. After a renormalization, the index is refreshed immediately.
+
+        Parameters
+        ----------
+        p_index : CentroidIndex
+            Nearest-neighbor index of the centroids. Default: None (index is turned off).
+        p_refresh_interval : int
+            Number of adaptations after which the index is refreshed. Default: 1.
+        """
+
+        if p_refresh_interval < 1: raise ParamError('Parameter p_refresh_interval must be a positive integer')
+
+        if ( p_index is not None ) and ( cprop_centroid[0] not in [ prop[0] for prop in self.C_CLUSTER_PROPERTIES ] ):
+            raise ParamError('A centroid index requires clusters with centroids, which ' + self.C_TYPE + ' does not provide')
+
+        self._centroid_index  = p_index
+        self._index_refresh   = p_refresh_interval
+        self._index_num_adapt = 0
+
+        if p_index is not None: self.refresh_centroid_index()
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_centroid_index(self) -> CentroidIndex:
+        return self._centroid_index
+
+
+## -------------------------------------------------------------------------------------------------
+    def refresh_centroid_index(self):
+        """
+        Refreshes the centroid index with the current centroids of all clusters. See method
+        set_centroid_index().
+        """
+
+        self._index_num_adapt = 0
+
+        ids = [ x for x, cluster in self._clusters.items() 
+                if hasattr(cluster, 'centroid') and ( cluster.centroid.value is not None ) ]
+
+        if len(ids) == 0: 
+            self._centroid_index.clear()
+        else:
+            centers = np.array([ self._clusters[x].centroid.value for x in ids ], dtype=np.float64)
+            self._centroid_index.sync( p_ids = ids, p_centers = centers )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_cluster_memberships_index( self,
+                                        p_instance : Instance,
+                                        p_scope : int ) -> List[Tuple[str, float, Cluster]]:
+        """
+        Determines the cluster memberships by the centroid index. See method set_centroid_index().
+        """
+
+        if self._index_num_adapt >= self._index_refresh: self.refresh_centroid_index()
+
+        values        = self._get_input_values(p_instance)
+        cluster_id, _ = self._centroid_index.query(values)
+
+        if ( cluster_id is not None ) and ( cluster_id not in self._clusters ):
+            # Cluster was removed since the last refresh
+            self.refresh_centroid_index()
+            cluster_id, _ = self._centroid_index.query(values)
+
+        if cluster_id is None: return []
+
+        if p_scope != ClusterAnalyzer.C_RESULT_SCOPE_ALL:
+            cluster = self._clusters[cluster_id]
+            return [ ( cluster.id, 1, cluster ) ]
+
+        return [ ( cluster.id, 1 if x == cluster_id else 0, cluster ) for x, cluster in self._clusters.items() ]
+
+
 ## -------------------------------------------------------------------------------------------------
     def get_cluster_memberships( self, 
                                  p_instance: Instance, 
@@ -196,8 +732,8 @@ class WrClusterAnalyzerRiver2MLPro (WrapperRiver, ClusterAnalyzer):
         p_instance : Instance
             Instance to be evaluated.
         p_scope : int
-            Scope of the result list. See class attributes C_MS_SCOPE_* for possible values. Default
-            value is C_MS_SCOPE_MAX.
+            Scope of the result list. See class attributes C_RESULT_SCOPE_* for possible values.
+            Default value is C_RESULT_SCOPE_MAX.
 
         Returns
         -------
@@ -206,30 +742,30 @@ class WrClusterAnalyzerRiver2MLPro (WrapperRiver, ClusterAnalyzer):
             relative membership value in percent and a reference to the cluster.
             
         """
-        
-        # extract features data from instances
-        feature_data    = p_instance.get_feature_data().get_values()
 
-        # transform np array to dict with enumeration
-        input_data = dict(enumerate(feature_data.flatten(), 1))
+        if self._centroid_index is not None: 
+            return self._get_cluster_memberships_index(p_instance=p_instance, p_scope=p_scope)
+        
+        # transform features data to River input format
+        input_data = self._get_river_input(p_instance)
 
         # predict the cluster number according to a set of features
         cluster_idx = self._river_algo.predict_one(input_data)
 
         # get the corresponding cluster
-        list_clusters = self.get_clusters().values()
+        list_clusters = list(self.clusters.values())
 
         # return the cluster membership
         memberships_rel = []
         if list_clusters is not None:
             for x in range(len(list_clusters)):
-                cluster = list_clusters[cluster_idx]
+                cluster = list_clusters[x]
                 if x == cluster_idx:
                     memberships_rel.append((cluster.id, 1, cluster))
                     self.log(self.C_LOG_TYPE_I,
                              'Actual instances belongs to cluster %s'%(cluster.id))
                 else:
-                    if p_scope == ClusterAnalyzer.C_MS_SCOPE_ALL:
+                    if p_scope == ClusterAnalyzer.C_RESULT_SCOPE_ALL:
                         memberships_rel.append((cluster.id, 0, cluster))
 
         return memberships_rel
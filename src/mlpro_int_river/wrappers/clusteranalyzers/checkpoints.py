@@ -0,0 +1,372 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.clusteranalyzers
+## -- Module  : checkpoints.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     DA       Creation
+## -- 2026-10-19  1.0.0     DA       First version release: class ClusterSnapshot and checkpoint
+## --                                machinery separated from module basics
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This module provides checkpoints and immutable snapshots of the clusters for the River cluster
+analyzer wrappers. A checkpoint is an uncompressed NumPy archive with the pickled River model and
+the MLPro cluster mapping. Checkpoints can be saved periodically in a background thread.
+
+"""
+
+
+from typing import NamedTuple
+import os
+import json
+import pickle
+import threading
+from datetime import datetime
+
+import numpy as np
+
+from mlpro.bf.exceptions import ParamError, Error
+
+
+
+# Export list for public API
+__all__ = [ 'ClusterSnapshot',
+            'Checkpointable' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class ClusterSnapshot (NamedTuple):
+    """
+    Immutable snapshot of the clusters of a River cluster analyzer. The arrays are read-only copies 
+    that are not affected by the further adaptation of the cluster analyzer.
+
+    Parameters
+    ----------
+    version : int
+        Consecutive version number of the snapshot, starting with 1.
+    ids : tuple
+        Cluster ids related to the rows of the arrays.
+    centers : np.ndarray
+        Centroids of the clusters in original units (see method 
+        WrClusterAnalyzerRiver2MLPro.get_cluster_centers()). Shape (k, d). Rows of clusters without
+        a centroid are NaN.
+    sizes : np.ndarray
+        Sizes of the clusters. Shape (k,). Clusters without a size are marked with -1.
+    """
+
+    version : int
+    ids : tuple
+    centers : np.ndarray
+    sizes : np.ndarray
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class Checkpointable:
+    """
+    Mixin for the River cluster analyzer wrappers that provides checkpoints of the River model and
+    the MLPro cluster mapping as well as immutable snapshots of the clusters. See class 
+    WrClusterAnalyzerRiver2MLPro for the attributes and methods required by the mixin.
+
+    Parameters
+    ----------
+    p_snapshot_cadence : int
+        Optional number of instances after which an immutable snapshot of the clusters is published
+        (see method get_snapshot()). Default: 0 (no snapshots).
+    """
+
+    C_CHECKPOINT_VERSION    = 1
+    C_CHECKPOINT_ATTRIBUTES = []
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_snapshot_cadence : int = 0):
+
+        self._checkpoint_lock   = None
+        self._checkpoint_stop   = None
+        self._checkpoint_thread = None
+        self._checkpoint_path   = None
+
+        if p_snapshot_cadence < 0: raise ParamError('Parameter p_snapshot_cadence must not be negative')
+        self._snapshot_cadence  = p_snapshot_cadence
+        self._snapshot_num_inst = 0
+        self._snapshot          = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_cluster_ids(self) -> dict:
+        """
+        Custom method to map the keys of the clusters of the River model to the ids of the related 
+        MLPro clusters. It is needed for checkpoints of wrappers whose cluster ids are not stable 
+        across a restart (e.g. object ids). See methods save_checkpoint() and load_checkpoint().
+
+        Returns
+        -------
+        dict
+            Cluster ids by River keys. None, if the cluster ids are the River keys (default).
+        """
+
+        return None
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_cluster_arrays(self):
+        """
+        Copies the sizes and centroids of all clusters into arrays.
+
+        Returns
+        -------
+        ids : list
+            Cluster ids related to the rows of the arrays.
+        sizes : np.ndarray
+            Sizes of the clusters. Shape (k,). Clusters without a size are marked with -1.
+        centers : np.ndarray
+            Centroids of the clusters. Shape (k, d). Rows of clusters without a centroid are NaN.
+        """
+
+        ids       = list(self._clusters.keys())
+        clusters  = list(self._clusters.values())
+        centroids = [ cluster.centroid.value if hasattr(cluster, 'centroid') else None for cluster in clusters ]
+        num_dim   = max( [ len(c) for c in centroids if c is not None ], default=0 )
+        centers   = np.full((len(clusters), num_dim), np.nan)
+        for x, c in enumerate(centroids):
+            if c is not None: centers[x] = c
+
+        sizes     = np.array([ -1 if cluster.size.value is None else cluster.size.value for cluster in clusters ], 
+                             dtype=np.int64)
+
+        return ids, sizes, centers
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_checkpoint_data(self) -> dict:
+        """
+        Collects the content of a checkpoint in memory. The River model and all further attributes 
+        listed in C_CHECKPOINT_ATTRIBUTES are serialized together, so that references between them 
+        are kept. The cluster mapping is stored as plain NumPy arrays.
+
+        Returns
+        -------
+        dict
+            NumPy arrays of the checkpoint by name.
+        """
+
+        if self._worker is not None: raise Error('Please stop the worker process before saving a checkpoint')
+
+        ids, sizes, centers = self._get_cluster_arrays()
+
+        cluster_ids = self._get_cluster_ids()
+        if cluster_ids is None:
+            keys = ids
+        else:
+            keys_by_id = { cluster_id : key for key, cluster_id in cluster_ids.items() }
+            keys       = [ keys_by_id[x] for x in ids ]
+
+        model     = pickle.dumps( { attr : getattr(self, attr) for attr in self.C_CHECKPOINT_ATTRIBUTES },
+                                  protocol = pickle.HIGHEST_PROTOCOL )
+        header    = { 'version' : self.C_CHECKPOINT_VERSION,
+                      'wrapper' : type(self).__name__,
+                      'model'   : type(self._river_algo).__name__,
+                      'created' : datetime.now().isoformat() }
+
+        return { 'header'    : np.array(json.dumps(header)),
+                 'model'     : np.frombuffer(model, dtype=np.uint8),
+                 'keys'      : np.array(keys, dtype=np.int64),
+                 'sizes'     : sizes,
+                 'centroids' : centers }
+
+
+## -------------------------------------------------------------------------------------------------
+    def save_checkpoint(self, p_path : str):
+        """
+        Saves a checkpoint of the wrapped River model together with the MLPro cluster mapping 
+        (ids, sizes, centroids) in an uncompressed NumPy archive. The River model is stored as a 
+        byte array, the cluster mapping as plain arrays and a small JSON header describes the 
+        content. The file is written to a temporary file first and then renamed, so that an 
+        existing checkpoint is replaced atomically.
+
+        Parameters
+        ----------
+        p_path : str
+            Path of the checkpoint file.
+        """
+
+        if self._checkpoint_lock is None:
+            data = self._get_checkpoint_data()
+        else:
+            with self._checkpoint_lock:
+                data = self._get_checkpoint_data()
+
+        path_tmp = p_path + '.tmp'
+        with open(path_tmp, 'wb') as file:
+            np.savez(file, **data)
+        os.replace(path_tmp, p_path)
+
+        self.log(self.C_LOG_TYPE_I, 'Checkpoint saved to', p_path)
+
+
+## -------------------------------------------------------------------------------------------------
+    def load_checkpoint(self, p_path : str):
+        """
+        Loads a checkpoint created by method save_checkpoint(). The River model and the further 
+        attributes of the wrapper are replaced and the MLPro clusters are rebuilt from the stored
+        cluster mapping. Please load checkpoints from trusted sources only, since the River model is
+        restored by unpickling.
+
+        Parameters
+        ----------
+        p_path : str
+            Path of the checkpoint file.
+        """
+
+        with np.load(p_path, allow_pickle=False) as data:
+            header    = json.loads(str(data['header']))
+            model     = data['model'].tobytes()
+            keys      = data['keys']
+            sizes     = data['sizes']
+            centroids = data['centroids']
+
+        if header['version'] != self.C_CHECKPOINT_VERSION:
+            raise Error('Checkpoint version ' + str(header['version']) + ' is not supported')
+        
+        if header['wrapper'] != type(self).__name__:
+            raise Error('Checkpoint of ' + header['wrapper'] + ' can not be loaded by ' + type(self).__name__)
+
+        # 1 Restore River model and further attributes
+        for attr, value in pickle.loads(model).items():
+            setattr(self, attr, value)
+
+        # 2 Rebuild MLPro clusters
+        for cluster in list(self._clusters.values()):
+            self._remove_cluster(cluster)
+
+        cluster_ids = self._get_cluster_ids()
+
+        for key, size, centroid in zip(keys.tolist(), sizes.tolist(), centroids):
+            cluster_id = key if cluster_ids is None else cluster_ids[key]
+            cluster    = self._cls_cluster( p_id = cluster_id, 
+                                            p_properties = self.C_CLUSTER_PROPERTIES, 
+                                            p_visualize = self.get_visualization() )
+            
+            if ( centroid.shape[0] > 0 ) and not np.isnan(centroid).any(): cluster.centroid.value = centroid
+            if size >= 0: cluster.size.value = size
+            self._add_cluster( p_cluster = cluster )
+
+        self.log(self.C_LOG_TYPE_I, 'Checkpoint loaded from', p_path, 'with', len(keys), 'clusters')
+
+        if self._snapshot_cadence > 0: self.publish_snapshot()
+
+
+## -------------------------------------------------------------------------------------------------
+    def start_checkpointing(self, p_path : str, p_interval : float):
+        """
+        Starts a background thread that saves a checkpoint periodically. Taking the in-memory 
+        snapshot is mutually exclusive with the adaptation, writing the file is not.
+
+        Parameters
+        ----------
+        p_path : str
+            Path of the checkpoint file.
+        p_interval : float
+            Interval between two checkpoints in seconds.
+        """
+
+        if p_interval <= 0: raise ParamError('Parameter p_interval must be greater than 0')
+        if self._checkpoint_thread is not None: self.stop_checkpointing(p_final=False)
+
+        if self._checkpoint_lock is None: self._checkpoint_lock = threading.Lock()
+        self._checkpoint_stop   = threading.Event()
+        self._checkpoint_thread = threading.Thread( target = self._run_checkpointing, 
+                                                    args = (p_path, p_interval, self._checkpoint_stop),
+                                                    daemon = True )
+        self._checkpoint_path   = p_path
+        self._checkpoint_thread.start()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run_checkpointing(self, p_path : str, p_interval : float, p_stop : threading.Event):
+        """
+        Main loop of the background thread of periodic checkpoints.
+        """
+
+        while not p_stop.wait(p_interval):
+            try:
+                self.save_checkpoint(p_path)
+            except Exception as e:
+                self.log(self.C_LOG_TYPE_E, 'Checkpoint could not be saved:', str(e))
+
+
+## -------------------------------------------------------------------------------------------------
+    def stop_checkpointing(self, p_final : bool = True):
+        """
+        Stops the periodic checkpoints.
+
+        Parameters
+        ----------
+        p_final : bool
+            If True (default), a final checkpoint is saved after the background thread has stopped.
+        """
+
+        if self._checkpoint_thread is None: return
+
+        self._checkpoint_stop.set()
+        self._checkpoint_thread.join()
+        self._checkpoint_thread = None
+        self._checkpoint_stop   = None
+
+        if p_final: self.save_checkpoint(self._checkpoint_path)
+
+
+## -------------------------------------------------------------------------------------------------
+    def publish_snapshot(self) -> ClusterSnapshot:
+        """
+        Creates a new immutable snapshot of the clusters and publishes it by a single reference
+        assignment. Readers of method get_snapshot() thus get either the previous or the new 
+        snapshot, but never a partially updated one. The method is called by the adaptation at the
+        cadence given by parameter p_snapshot_cadence, but it can also be called directly by the 
+        thread that adapts the clusters.
+
+        Returns
+        -------
+        ClusterSnapshot
+            The published snapshot.
+        """
+
+        ids, sizes, centers = self._get_cluster_arrays()
+        if ( self._river_scaler is not None ) and ( centers.shape[0] > 0 ): centers = self.unscale(centers)
+
+        centers.flags.writeable = False
+        sizes.flags.writeable   = False
+        version                 = 1 if self._snapshot is None else self._snapshot.version + 1
+
+        snapshot                = ClusterSnapshot( version = version, 
+                                                   ids = tuple(ids), 
+                                                   centers = centers, 
+                                                   sizes = sizes )
+        self._snapshot          = snapshot
+        self._snapshot_num_inst = 0
+        return snapshot
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_snapshot(self) -> ClusterSnapshot:
+        """
+        Returns the latest published snapshot of the clusters. This method never blocks and can be
+        called safely from other threads. See parameter p_snapshot_cadence and method 
+        publish_snapshot().
+
+        Returns
+        -------
+        ClusterSnapshot
+            Latest snapshot or None, if no snapshot has been published yet.
+        """
+
+        return self._snapshot
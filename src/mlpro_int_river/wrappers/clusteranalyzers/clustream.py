@@ -31,10 +31,25 @@
 ## -- 2024-05-25  1.4.1     SY       Introduction of size as a property
 ## -- 2025-04-24  1.5.0     DA       Alignment with MLPro 2
 ## -- 2025-07-21  1.5.1     DS       Refactoring
+## -- 2026-10-18  1.6.0     DA       New class CluStreamMicroClusters: structure-of-arrays view on the
+## --                                micro-clusters (CF vectors) of CluStream
+## -- 2026-10-18  1.7.0     DA       New class CluStreamSnapshotStore: pyramidal time frame for
+## --                                horizon-based macro clustering
+## -- 2026-10-18  1.8.0     DA       Renormalization by affine transformation of the CF vectors
+## -- 2026-10-18  1.8.1     DA       Micro-cluster view and snapshot store are part of checkpoints
+## -- 2026-10-18  1.9.0     DA       Worker process without micro-cluster view and snapshot store
+## -- 2026-10-19  1.9.1     DA       Learned input dictionaries are copied
+## -- 2026-10-19  1.10.0    DA       Class CluStreamMicroClusters: id lists of merged micro-clusters;
+## --                                class CluStreamSnapshotStore: horizons subtract the snapshots of
+## --                                all merged micro-clusters
+## -- 2026-10-19  1.11.0    DA       Class CluStreamMicroClusters: time stamps of the last sync
+## --                                replaced by the temporal CF components LST, SST
+## -- 2026-10-19  1.11.1    DA       Class CluStreamMicroClusters: time stamps of the last update
+## --                                restored in addition to LST, SST
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.5.1 (2025-07-21)
+Ver. 1.11.1 (2026-10-19)
 
 
 This module provides a wrapper class for the CluStream algorithm provided by River.
@@ -46,7 +61,14 @@ https://riverml.xyz/latest/api/cluster/CluStream/
 """
 
 
+import math
+from collections import deque
+
+import numpy as np
+
 from mlpro_int_river.wrappers.clusteranalyzers.basics import WrClusterAnalyzerRiver2MLPro
+from mlpro_int_river.wrappers.clusteranalyzers.helpers import kmeans_plusplus, kmeans_lloyd
+from mlpro.bf.exceptions import Error, ParamError
 from mlpro.bf.math.normalizers import Normalizer
 from mlpro.oa.streams.tasks.clusteranalyzers.clusters import Cluster, ClusterCentroid
 from mlpro.oa.streams.tasks.clusteranalyzers.clusters.properties import *
@@ -58,7 +80,481 @@ from river import cluster
 
 
 # Export list for public API
-__all__ = [ 'WrRiverCluStream2MLPro' ]
+__all__ = [ 'CluStreamMicroClusters',
+            'CluStreamSnapshotStore',
+            'WrRiverCluStream2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class CluStreamMicroClusters:
+    """
+    Structure-of-arrays view on the micro-clusters of a River CluStream instance. For each micro-
+    cluster the classical cluster feature vector (CF vector) is provided in NumPy buffers. Row i of
+    each buffer belongs to the River micro-cluster with key i.
+
+    River stores a micro-cluster as a set of Welford accumulators (stats.Var). The CF vector is 
+    derived from them as follows:
+
+        N  = sum of weights
+        LS = N * mean
+        SS = S + N * mean^2    (S = sum of squared deviations from the mean)
+
+    The temporal components LST and SST of the CF vector (sums of the time stamps and of their 
+    squares) are derived in the same way from the time statistics of the micro-cluster.
+
+    The view is kept in sync incrementally. On each call of method sync() only those rows are
+    recomputed whose River micro-cluster has been replaced or has changed its weight since the 
+    previous call.
+
+    As proposed by Aggarwal et al., each micro-cluster keeps the list of ids of all micro-clusters
+    merged into it. River merges a micro-cluster into another one and replaces it by a new micro-
+    cluster within the same learning step. A merge is thus detected on sync, if a replaced micro-
+    cluster is accompanied by another one whose weight has grown by the weight of the replaced one.
+    To detect all merges, method sync() needs to be called after each learning step of River.
+
+    Parameters
+    ----------
+    p_max_micro_clusters : int
+        Maximum number of micro-clusters (capacity of the buffers).
+    p_r_factor : float
+        Multiplier for the micro-cluster radius (see CluStream parameter micro_cluster_r_factor).
+
+    Attributes
+    ----------
+    num_micro_clusters : int
+        Current number of valid rows.
+    uids : np.ndarray
+        Unique ids of the micro-clusters. A new id is assigned whenever River replaces a micro-
+        cluster by a new one. Shape (max_micro_clusters,).
+    id_lists : list
+        Per row a tuple of the unique ids of the micro-cluster itself and of all micro-clusters 
+        merged into it.
+    weights : np.ndarray
+        Weights N of the micro-clusters. Shape (max_micro_clusters,).
+    ls : np.ndarray
+        Linear sums LS of the micro-clusters. Shape (max_micro_clusters, num_dim).
+    ss : np.ndarray
+        Squared sums SS of the micro-clusters. Shape (max_micro_clusters, num_dim).
+    radii : np.ndarray
+        Radii of the micro-clusters as computed by River. Shape (max_micro_clusters,).
+    lst : np.ndarray
+        Linear sums LST of the time stamps of the micro-clusters. LST/N is the mean time stamp. 
+        Shape (max_micro_clusters,).
+    sst : np.ndarray
+        Squared sums SST of the time stamps of the micro-clusters. Shape (max_micro_clusters,).
+    t_last : np.ndarray
+        Time stamps of the last update of the micro-clusters. Shape (max_micro_clusters,).
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self, 
+                  p_max_micro_clusters : int,
+                  p_r_factor : float ):
+
+        self._max_micro_clusters = p_max_micro_clusters
+        self._r_factor           = p_r_factor
+        self.num_micro_clusters  = 0
+        self.uids                = np.full(p_max_micro_clusters, -1, dtype=np.int64)
+        self.weights             = np.zeros(p_max_micro_clusters)
+        self.ls                  = None
+        self.ss                  = None
+        self.radii               = np.zeros(p_max_micro_clusters)
+        self.lst                 = np.zeros(p_max_micro_clusters)
+        self.sst                 = np.zeros(p_max_micro_clusters)
+        self.t_last              = np.full(p_max_micro_clusters, -1, dtype=np.int64)
+        self.id_lists            = [()] * p_max_micro_clusters
+        self._mc_refs            = [None] * p_max_micro_clusters
+        self._next_uid           = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _update_row(self, p_row : int, p_micro_cluster, p_tstamp : int):
+        """
+        Recomputes the CF vector of a single micro-cluster.
+        """
+
+        n      = p_micro_cluster.weight
+        ls_row = self.ls[p_row]
+        ss_row = self.ss[p_row]
+
+        for i, var in enumerate(p_micro_cluster.var_x.values()):
+            mean      = var.mean.get()
+            ls_row[i] = n * mean
+            ss_row[i] = var._S + n * mean * mean
+
+        var_time            = p_micro_cluster.var_time
+        mean                = var_time.mean.get()
+        self.weights[p_row] = n
+        self.radii[p_row]   = p_micro_cluster.radius(self._r_factor)
+        self.lst[p_row]     = n * mean
+        self.sst[p_row]     = var_time._S + n * mean * mean
+        self.t_last[p_row]  = p_tstamp
+
+        if p_micro_cluster is not self._mc_refs[p_row]:
+            self._mc_refs[p_row]  = p_micro_cluster
+            self.uids[p_row]      = self._next_uid
+            self.id_lists[p_row]  = (self._next_uid,)
+            self._next_uid       += 1
+
+
+## -------------------------------------------------------------------------------------------------
+    def sync(self, p_river_algo) -> int:
+        """
+        Synchronizes the view with the micro-clusters of the given River CluStream instance.
+
+        Parameters
+        ----------
+        p_river_algo : river.cluster.CluStream
+            River CluStream instance.
+
+        Returns
+        -------
+        int
+            Number of updated rows.
+        """
+
+        micro_clusters = p_river_algo.micro_clusters
+        if len(micro_clusters) == 0: return 0
+
+        if self.ls is None:
+            num_dim = len(next(iter(micro_clusters.values())).var_x)
+            self.ls = np.zeros((self._max_micro_clusters, num_dim))
+            self.ss = np.zeros((self._max_micro_clusters, num_dim))
+
+        tstamp      = p_river_algo._timestamp
+        num_updated = 0
+        replaced    = []
+        grown       = []
+
+        for row, mc in micro_clusters.items():
+            if mc is not self._mc_refs[row]:
+                if self._mc_refs[row] is not None: 
+                    replaced.append( ( self.weights[row], self.id_lists[row] ) )
+            elif mc.weight != self.weights[row]:
+                grown.append( ( row, mc.weight - self.weights[row] ) )
+            else:
+                continue
+
+            self._update_row( p_row = row, p_micro_cluster = mc, p_tstamp = tstamp )
+            num_updated += 1
+
+        # Merges: the target has grown by the weight of the replaced micro-cluster
+        for weight, id_list in replaced:
+            for i, ( row, weight_delta ) in enumerate(grown):
+                if math.isclose(weight_delta, weight):
+                    self.id_lists[row] = self.id_lists[row] + id_list
+                    del grown[i]
+                    break
+
+        self.num_micro_clusters = len(micro_clusters)
+        return num_updated
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_id_map(self):
+        """
+        Maps the ids of all micro-clusters merged into the valid micro-clusters to their rows. See
+        attribute id_lists.
+
+        Returns
+        -------
+        ids : np.ndarray
+            Sorted unique ids. Shape (m,).
+        rows : np.ndarray
+            Related rows of the view. Shape (m,).
+        """
+
+        id_lists = self.id_lists[:self.num_micro_clusters]
+        ids      = np.fromiter( ( x for id_list in id_lists for x in id_list ), dtype=np.int64 )
+        rows     = np.repeat( np.arange(len(id_lists)), [ len(id_list) for id_list in id_lists ] )
+        order    = np.argsort(ids)
+
+        return ids[order], rows[order]
+
+
+## -------------------------------------------------------------------------------------------------
+    def prune_id_lists(self, p_ids : np.ndarray):
+        """
+        Removes the ids of merged micro-clusters that are no longer needed from the id lists. The
+        own id of each micro-cluster is kept.
+
+        Parameters
+        ----------
+        p_ids : np.ndarray
+            Ids to be kept (e.g. all ids of a snapshot store).
+        """
+
+        for row in range(self.num_micro_clusters):
+            id_list = self.id_lists[row]
+            if len(id_list) < 2: continue
+
+            ids                = np.array(id_list[1:], dtype=np.int64)
+            self.id_lists[row] = id_list[:1] + tuple(ids[np.isin(ids, p_ids)].tolist())
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_centers(self) -> np.ndarray:
+        """
+        Returns the centers LS/N of all valid micro-clusters.
+
+        Returns
+        -------
+        np.ndarray
+            Centers of the micro-clusters. Shape (num_micro_clusters, num_dim).
+        """
+
+        if self.ls is None: return None
+        n = self.num_micro_clusters
+        return self.ls[:n] / self.weights[:n, np.newaxis]
+
+
+## -------------------------------------------------------------------------------------------------
+    def transform( self, 
+                   p_factors : np.ndarray,
+                   p_offsets : np.ndarray ):
+        """
+        Applies the affine transformation x' = x * factors + offsets to the data summarized by the
+        CF vectors of all valid micro-clusters. The CF vectors are transformed in closed form:
+
+            LS' = factors * LS + offsets * N
+            SS' = factors^2 * SS + 2 * factors * offsets * LS + offsets^2 * N
+
+        Parameters
+        ----------
+        p_factors : np.ndarray
+            Factors per feature. Shape (d,).
+        p_offsets : np.ndarray
+            Offsets per feature. Shape (d,).
+        """
+
+        if self.ls is None: return
+
+        n        = self.num_micro_clusters
+        weights  = self.weights[:n, np.newaxis]
+        ls       = self.ls[:n]
+        ss       = self.ss[:n]
+
+        # Buffers are updated in place, so SS has to be transformed first
+        ss[:]    = p_factors**2 * ss + 2 * p_factors * p_offsets * ls + p_offsets**2 * weights
+        ls[:]    = p_factors * ls + p_offsets * weights
+
+        # The radius is the mean standard deviation over all features (see River)
+        var      = np.maximum(ss - ls**2 / weights, 0) / np.maximum(weights - 1, 1)
+        radii    = self._r_factor * np.mean(np.sqrt(var), axis=1)
+        self.radii[:n] = np.where(self.weights[:n] > 1, radii, 0)
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class CluStreamSnapshotStore:
+    """
+    Bounded snapshot store for CluStream micro-clusters following the pyramidal time frame of
+    Aggarwal et al. Snapshots are taken on a discrete clock c = 1, 2, 3, ... A snapshot taken at 
+    clock c is assigned to the highest order i for which c is divisible by alpha^i. Per order only
+    the latest alpha^l + 1 snapshots are retained. Thus, the number of stored snapshots grows 
+    logarithmically with the stream length while recent history is stored with a finer granularity
+    than older history.
+
+    Each snapshot is a compact copy of the CF vectors of a CluStreamMicroClusters view. The micro-
+    clusters of a time horizon h are determined by subtracting the snapshot taken at time T-h (or
+    the closest older one) from the current CF vectors. Each current micro-cluster is reduced by 
+    the stored micro-clusters of all ids in its id list, i.e. by itself and by all micro-clusters
+    merged into it since the snapshot.
+
+    Parameters
+    ----------
+    p_alpha : int
+        Base of the pyramidal time frame. Default = 2.
+    p_l : int
+        Exponent that determines the number of snapshots per order (alpha^l + 1). Default = 2.
+
+    Attributes
+    ----------
+    C_CF_WEIGHT_MIN : float
+        Minimum weight of a micro-cluster after subtraction of a snapshot to be considered.
+    """
+
+    C_CF_WEIGHT_MIN : float = 1e-9
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self, 
+                  p_alpha : int = 2,
+                  p_l : int = 2 ):
+
+        self._alpha         = p_alpha
+        self._capacity      = p_alpha ** p_l + 1
+        self._orders        = {}
+        self._clock         = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def add_snapshot( self, 
+                      p_tstamp : int,
+                      p_micro_clusters : CluStreamMicroClusters ):
+        """
+        Takes a snapshot of the given micro-clusters.
+
+        Parameters
+        ----------
+        p_tstamp : int
+            Time stamp of the snapshot.
+        p_micro_clusters : CluStreamMicroClusters
+            View on the micro-clusters to be stored.
+        """
+
+        if p_micro_clusters.ls is None: return
+
+        self._clock += 1
+        order        = 0
+        clock        = self._clock
+        while clock % self._alpha == 0:
+            clock //= self._alpha
+            order  += 1
+
+        n        = p_micro_clusters.num_micro_clusters
+        snapshot = ( p_tstamp,
+                     p_micro_clusters.uids[:n].copy(),
+                     p_micro_clusters.weights[:n].copy(),
+                     p_micro_clusters.ls[:n].copy(),
+                     p_micro_clusters.ss[:n].copy() )
+
+        try:
+            self._orders[order].append(snapshot)
+        except KeyError:
+            self._orders[order] = deque([snapshot], maxlen=self._capacity)
+
+
+## -------------------------------------------------------------------------------------------------
+    def transform( self, 
+                   p_factors : np.ndarray,
+                   p_offsets : np.ndarray ):
+        """
+        Applies the affine transformation x' = x * factors + offsets to all stored snapshots. See
+        method CluStreamMicroClusters.transform() for further details.
+
+        Parameters
+        ----------
+        p_factors : np.ndarray
+            Factors per feature. Shape (d,).
+        p_offsets : np.ndarray
+            Offsets per feature. Shape (d,).
+        """
+
+        for snapshots in self._orders.values():
+            for i, ( tstamp, uids, weights, ls, ss ) in enumerate(snapshots):
+                w_col        = weights[:, np.newaxis]
+                snapshots[i] = ( tstamp, 
+                                 uids, 
+                                 weights,
+                                 p_factors * ls + p_offsets * w_col,
+                                 p_factors**2 * ss + 2 * p_factors * p_offsets * ls + p_offsets**2 * w_col )
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_num_snapshots(self) -> int:
+        """
+        Returns the number of currently stored snapshots.
+        """
+
+        return sum( len(snapshots) for snapshots in self._orders.values() )
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_uids(self) -> np.ndarray:
+        """
+        Returns the sorted unique ids of all micro-clusters in the stored snapshots.
+        """
+
+        uids = [ snapshot[1] for snapshots in self._orders.values() for snapshot in snapshots ]
+        if len(uids) == 0: return np.zeros(0, dtype=np.int64)
+        return np.unique(np.concatenate(uids))
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_snapshot(self, p_tstamp : int):
+        """
+        Determines the latest stored snapshot taken at or before the given time stamp.
+
+        Parameters
+        ----------
+        p_tstamp : int
+            Time stamp.
+
+        Returns
+        -------
+        tuple
+            Snapshot as tuple (tstamp, uids, weights, ls, ss) or None, if no such snapshot exists.
+        """
+
+        snapshot_best = None
+
+        for snapshots in self._orders.values():
+            for snapshot in reversed(snapshots):
+                if snapshot[0] <= p_tstamp:
+                    if ( snapshot_best is None ) or ( snapshot[0] > snapshot_best[0] ):
+                        snapshot_best = snapshot
+                    break
+
+        return snapshot_best
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_horizon( self,
+                     p_tstamp : int,
+                     p_horizon : int,
+                     p_micro_clusters : CluStreamMicroClusters ):
+        """
+        Determines the CF vectors of the micro-clusters over the last p_horizon time units by
+        subtracting the related snapshot from the current micro-clusters.
+
+        Parameters
+        ----------
+        p_tstamp : int
+            Current time stamp T.
+        p_horizon : int
+            Time horizon h.
+        p_micro_clusters : CluStreamMicroClusters
+            View on the current micro-clusters.
+
+        Returns
+        -------
+        weights : np.ndarray
+            Weights of the remaining micro-clusters. Shape (m,).
+        ls : np.ndarray
+            Linear sums of the remaining micro-clusters. Shape (m, d).
+        ss : np.ndarray
+            Squared sums of the remaining micro-clusters. Shape (m, d).
+        """
+
+        n       = p_micro_clusters.num_micro_clusters
+        weights = p_micro_clusters.weights[:n].copy()
+        ls      = p_micro_clusters.ls[:n].copy()
+        ss      = p_micro_clusters.ss[:n].copy()
+
+        snapshot = self.get_snapshot( p_tstamp = p_tstamp - p_horizon )
+
+        if snapshot is not None:
+            _, uids_old, weights_old, ls_old, ss_old = snapshot
+
+            # Stored micro-clusters are matched by the id lists of the current micro-clusters
+            ids, rows = p_micro_clusters.get_id_map()
+            pos       = np.minimum(np.searchsorted(ids, uids_old), len(ids) - 1)
+            matched   = ids[pos] == uids_old
+            rows      = rows[pos[matched]]
+
+            np.subtract.at(weights, rows, weights_old[matched])
+            np.subtract.at(ls, rows, ls_old[matched])
+            np.subtract.at(ss, rows, ss_old[matched])
+
+        valid = weights > self.C_CF_WEIGHT_MIN
+        return weights[valid], ls[valid], ss[valid]
+
 
 
 
@@ -114,6 +610,19 @@ class WrRiverCluStream2MLPro (WrClusterAnalyzerRiver2MLPro):
     p_p : int
         Power parameter for the Minkowski metric. When p=1, this corresponds to the Manhattan
         distance, while p=2 corresponds to the Euclidean distance. Default: 2.
+    p_micro_cluster_view : bool
+        If True, the micro-clusters of CluStream are additionally provided as structure-of-arrays 
+        view. See class CluStreamMicroClusters and method get_micro_clusters(). Default: False.
+    p_snapshot_store : bool
+        If True, snapshots of the micro-clusters are stored after each time gap in a pyramidal time
+        frame. This enables macro clustering over arbitrary time horizons. See class 
+        CluStreamSnapshotStore and method get_macro_clusters(). Implies p_micro_cluster_view=True.
+        Default: False.
+    p_snapshot_alpha : int
+        Base of the pyramidal time frame. Default: 2.
+    p_snapshot_l : int
+        Per order of the pyramidal time frame, p_snapshot_alpha^p_snapshot_l + 1 snapshots are
+        retained. Default: 2.
     p_kwargs : dict
         Further optional named parameters. 
         
@@ -121,6 +630,10 @@ class WrRiverCluStream2MLPro (WrClusterAnalyzerRiver2MLPro):
 
     C_TYPE          = 'River Cluster Analyzer CluStream'
 
+    C_RIVER_INPUT_COPY      = True
+
+    C_CHECKPOINT_ATTRIBUTES = WrClusterAnalyzerRiver2MLPro.C_CHECKPOINT_ATTRIBUTES + [ '_mc_view', '_snapshot_store' ]
+
 
 ## -------------------------------------------------------------------------------------------------
     def __init__(self,
@@ -139,8 +652,29 @@ class WrRiverCluStream2MLPro (WrClusterAnalyzerRiver2MLPro):
                  p_mu:float = 1,
                  p_sigma:float = 1,
                  p_p:int = 2,
+                 p_micro_cluster_view:bool = False,
+                 p_snapshot_store:bool = False,
+                 p_snapshot_alpha:int = 2,
+                 p_snapshot_l:int = 2,
                  **p_kwargs):
         
+        self._seed = p_seed
+
+        if ( p_micro_cluster_view or p_snapshot_store ) and ( p_kwargs.get('p_worker_batch_size', 0) > 0 ):
+            raise ParamError('The micro-cluster view and the snapshot store are not supported in a worker process')
+
+        if p_snapshot_store:
+            self._snapshot_store = CluStreamSnapshotStore( p_alpha = p_snapshot_alpha,
+                                                           p_l = p_snapshot_l )
+        else:
+            self._snapshot_store = None
+
+        if p_micro_cluster_view or p_snapshot_store:
+            self._mc_view = CluStreamMicroClusters( p_max_micro_clusters = p_max_micro_clusters,
+                                                    p_r_factor = p_micro_cluster_r_factor )
+        else:
+            self._mc_view = None
+
         alg = cluster.CluStream(n_macro_clusters=p_n_macro_clusters,
                                 max_micro_clusters=p_max_micro_clusters,
                                 micro_cluster_r_factor=p_micro_cluster_r_factor,
@@ -168,6 +702,14 @@ class WrRiverCluStream2MLPro (WrClusterAnalyzerRiver2MLPro):
         This method is to update the centroids of each introduced cluster.
         """
         
+        if self._mc_view is not None: 
+            self._mc_view.sync( p_river_algo = self._river_algo )
+
+            tstamp = self._river_algo._timestamp
+            if ( self._snapshot_store is not None ) and ( tstamp % self._river_algo.time_gap == self._river_algo.time_gap - 1 ):
+                self._snapshot_store.add_snapshot( p_tstamp = tstamp, p_micro_clusters = self._mc_view )
+                self._mc_view.prune_id_lists( p_ids = self._snapshot_store.get_uids() )
+
         updated_cls = self._river_algo.predict_one(input_data)
         
         for x in self._river_algo.centers.keys():
@@ -209,14 +751,152 @@ class WrRiverCluStream2MLPro (WrClusterAnalyzerRiver2MLPro):
         return self._clusters
 
 
+## -------------------------------------------------------------------------------------------------
+    def get_micro_clusters(self) -> CluStreamMicroClusters:
+        """
+        Returns the structure-of-arrays view on the current micro-clusters of CluStream.
+
+        Returns
+        -------
+        CluStreamMicroClusters
+            View on the micro-clusters or None, if parameter p_micro_cluster_view was not set.
+        """
+
+        return self._mc_view
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_snapshot_store(self) -> CluStreamSnapshotStore:
+        """
+        Returns the pyramidal snapshot store of the micro-clusters.
+
+        Returns
+        -------
+        CluStreamSnapshotStore
+            Snapshot store or None, if parameter p_snapshot_store was not set.
+        """
+
+        return self._snapshot_store
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_macro_clusters( self, 
+                            p_horizon : int,
+                            p_n_clusters : int = None,
+                            p_num_iter : int = 10 ):
+        """
+        Offline macro clustering over the last p_horizon time units. The micro-clusters of the time
+        horizon are determined by snapshot subtraction and clustered by a weighted k-means.
+
+        Parameters
+        ----------
+        p_horizon : int
+            Time horizon h.
+        p_n_clusters : int
+            Number of macro clusters. Default = None (number of macro clusters of CluStream).
+        p_num_iter : int
+            Maximum number of Lloyd iterations. Default = 10.
+
+        Returns
+        -------
+        centers : np.ndarray
+            Centers of the macro clusters. Shape (k, d).
+        weights : np.ndarray
+            Weights of the macro clusters. Shape (k,).
+        """
+
+        if self._snapshot_store is None:
+            raise Error('Macro clustering over time horizons requires parameter p_snapshot_store=True')
+
+        if self._mc_view.ls is None: return None, None
+
+        weights, ls, _ = self._snapshot_store.get_horizon( p_tstamp = self._river_algo._timestamp,
+                                                           p_horizon = p_horizon,
+                                                           p_micro_clusters = self._mc_view )
+
+        if weights.size == 0: return None, None
+
+        mc_centers   = ls / weights[:, np.newaxis]
+        n_clusters   = self._river_algo.n_macro_clusters if p_n_clusters is None else p_n_clusters
+        n_clusters   = min(n_clusters, weights.size)
+
+        centers, labels = kmeans_lloyd( p_data = mc_centers,
+                                        p_centers = kmeans_plusplus( p_data = mc_centers,
+                                                                     p_n_clusters = n_clusters,
+                                                                     p_weights = weights,
+                                                                     p_seed = self._seed ),
+                                        p_weights = weights,
+                                        p_num_iter = p_num_iter )
+
+        return centers, np.bincount(labels, weights=weights, minlength=n_clusters)
+
+
 ## -------------------------------------------------------------------------------------------------
     def _renormalize(self, p_normalizer:Normalizer):
         """
-        Internal enormalization is hard to realize here without getting strong dependencies on
-        internal implementation details. 
+        Internal renormalization of all clusters. See method OATask.renormalize_on_event() for further
+        information.
+
+        The cluster feature vectors of CluStream transform in closed form under the affine 
+        renormalization x' = x * factors + offsets. River stores them as weighted means and sums of
+        squared deviations per feature, which are collected into matrices, transformed in one 
+        step and written back:
+
+            mean' = mean * factors + offsets
+            S'    = S * factors^2
+
+        Weights and time statistics remain unchanged. The centers of the macro clusters, the 
+        optional micro-cluster view and the optional snapshot store are transformed accordingly.
+
+        Parameters
+        ----------
+        p_normalizer : Normalizer
+            Normalizer object to be applied on task-specific 
         """
 
-        raise NotImplementedError
+        factors, offsets = self._get_renormalization_params(p_normalizer)
+        if factors is None: return
+
+        algo           = self._river_algo
+        micro_clusters = list(algo.micro_clusters.values())
+
+        # 1 Micro-clusters
+        if len(micro_clusters) > 0:
+            keys  = list(micro_clusters[0].var_x.keys())
+            means = np.array([ [ mc.var_x[k].mean._mean for k in keys ] for mc in micro_clusters ], dtype=np.float64)
+            s     = np.array([ [ mc.var_x[k]._S for k in keys ] for mc in micro_clusters ], dtype=np.float64)
+            means = ( means * factors + offsets ).tolist()
+            s     = ( s * factors**2 ).tolist()
+
+            for mc, means_mc, s_mc in zip(micro_clusters, means, s):
+                for k, mean, s_k in zip(keys, means_mc, s_mc):
+                    var            = mc.var_x[k]
+                    var.mean._mean = mean
+                    var._S         = s_k
+                mc.x       = { k : mc.x[k] * factors[i] + offsets[i] for i, k in enumerate(keys) if k in mc.x }
+                mc._center = None
+
+            if len(algo._mc_centers) > 0:
+                algo._mc_centers = { i : mc.center for i, mc in algo.micro_clusters.items() }
+
+        # 2 Macro clusters
+        if len(algo.centers) > 0:
+            macro_centers = list(algo.centers.values())
+            keys          = list(macro_centers[0].keys())
+            centers       = np.array([ [ center[k] for k in keys ] for center in macro_centers ], dtype=np.float64)
+
+            for center, values in zip(macro_centers, ( centers * factors + offsets ).tolist()):
+                center.update(zip(keys, values))
+
+        # 3 Micro-cluster view and snapshots
+        if self._mc_view is not None:
+            self._mc_view.transform( p_factors = factors, p_offsets = offsets )
+
+        if self._snapshot_store is not None:
+            self._snapshot_store.transform( p_factors = factors, p_offsets = offsets )
+
+        # 4 MLPro clusters
+        super()._renormalize(p_normalizer)
 
 
 ## -------------------------------------------------------------------------------------------------
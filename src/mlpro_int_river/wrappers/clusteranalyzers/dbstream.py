@@ -31,10 +31,16 @@
 ## -- 2024-05-25  1.4.1     SY       Introduction of size as a property
 ## -- 2025-04-24  1.5.0     DA       Alignment with MLPro 2
 ## -- 2025-07-21  1.5.1     DS       Refactoring
+## -- 2026-10-18  1.6.0     DA       Renormalization of micro-clusters and shared density graph
+## -- 2026-10-18  1.7.0     DA       New method _get_cluster_ids() for checkpoints
+## -- 2026-10-18  1.7.1     DA       Worker process not supported
+## -- 2026-10-19  1.7.2     DA       Learned input dictionaries are copied
+## -- 2026-10-19  1.7.3     DA       Centroids of the MLPro clusters are the centers of the related
+## --                                micro-clusters; renormalization keeps the clustering threshold
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.5.1 (2025-07-21)
+Ver. 1.7.3 (2026-10-19)
 
 This module provides a wrapper class for the DBStream algorithm provided by River.
 
@@ -45,7 +51,10 @@ https://riverml.xyz/latest/api/cluster/DBSTREAM/
 """
 
 
+import numpy as np
+
 from mlpro_int_river.wrappers.clusteranalyzers.basics import WrClusterAnalyzerRiver2MLPro
+from mlpro_int_river.wrappers.clusteranalyzers.helpers import sq_distances
 from mlpro.bf.math.normalizers import Normalizer
 from mlpro.oa.streams.tasks.clusteranalyzers.clusters import Cluster, ClusterCentroid
 from mlpro.oa.streams.tasks.clusteranalyzers.clusters.properties import *
@@ -113,6 +122,10 @@ class WrRiverDBStream2MLPro (WrClusterAnalyzerRiver2MLPro):
 
     C_TYPE                  = 'River Cluster Analyzer DBSTREAM'
 
+    C_WORKER_SUPPORTED      = False
+
+    C_RIVER_INPUT_COPY      = True
+
 ## -------------------------------------------------------------------------------------------------
     def __init__(self,
                  p_name:str = None,
@@ -153,7 +166,7 @@ class WrRiverDBStream2MLPro (WrClusterAnalyzerRiver2MLPro):
         
         for x, (key, val) in enumerate(self._river_algo.micro_clusters.items()):
             related_cluster = self._clusters[id(val)]
-            related_cluster.centroid.value = list(self._river_algo.centers[key].values())
+            related_cluster.centroid.value = list(val.center.values())
             
             if x == updated_cls:
                 act_size = related_cluster.size.value
@@ -191,7 +204,7 @@ class WrRiverDBStream2MLPro (WrClusterAnalyzerRiver2MLPro):
                 if self.get_visualization():
                     related_cluster.init_plot(p_figure = self._figure, p_plot_settings=self._plot_settings)             
 
-                related_cluster.centroid.value = list(self._river_algo.centers[key].values())
+                related_cluster.centroid.value = list(val.center.values())
                 self._add_cluster( p_cluster = related_cluster )
         
         list_keys_mlpro = list(self._clusters.keys())
@@ -202,14 +215,79 @@ class WrRiverDBStream2MLPro (WrClusterAnalyzerRiver2MLPro):
         return self._clusters
 
 
+## -------------------------------------------------------------------------------------------------
+    def _get_cluster_ids(self) -> dict:
+        """
+        Maps the keys of the DBSTREAM micro-clusters to the ids of the related MLPro clusters, which are
+        the object ids of the micro-clusters. See method WrClusterAnalyzerRiver2MLPro.load_checkpoint().
+
+        Returns
+        -------
+        dict
+            Cluster ids by River keys.
+        """
+
+        return { key : id(val) for key, val in self._river_algo.micro_clusters.items() }
+
+
 ## -------------------------------------------------------------------------------------------------
     def _renormalize(self, p_normalizer:Normalizer):
         """
-        Internal renormalization is hard to realize here without getting strong dependencies on
-        internal implementation details. 
+        Internal renormalization of all clusters. See method OATask.renormalize_on_event() for further
+        information.
+
+        The affine renormalization is applied to the centers of all micro-clusters in one step. 
+        The clustering threshold is a radius in the normalized feature space and remains unchanged.
+        Rescaling it with the data would let it shrink with each extension of the boundaries. The 
+        weights of micro-clusters and the shared densities are counts of data points and remain 
+        unchanged. Shared density entries of micro-clusters whose neighborhoods intersected before but
+        no longer intersect after the renormalization are removed. Finally, the macro-clusters are 
+        invalidated so that River recomputes them on the next request.
+
+        Parameters
+        ----------
+        p_normalizer : Normalizer
+            Normalizer object to be applied on task-specific 
         """
-        
-        raise NotImplementedError
+
+        factors, offsets = self._get_renormalization_params(p_normalizer)
+        if factors is None: return
+
+        algo           = self._river_algo
+        micro_clusters = list(algo.micro_clusters.items())
+
+        # 1 Micro-cluster centers
+        if len(micro_clusters) > 0:
+            keys        = list(micro_clusters[0][1].center.keys())
+            centers_old = np.array([ [ mc.center[k] for k in keys ] for _, mc in micro_clusters ], dtype=np.float64)
+            centers     = centers_old * factors + offsets
+
+            for (_, mc), center in zip(micro_clusters, centers.tolist()):
+                mc.center = dict(zip(keys, center))
+
+        # 2 Shared density graph
+        if len(micro_clusters) > 1:
+            row_ids   = { mc_id : row for row, (mc_id, _) in enumerate(micro_clusters) }
+            dist_max  = ( 2 * algo.clustering_threshold ) ** 2
+            separated = ( sq_distances(centers, centers) >= dist_max ) & ( sq_distances(centers_old, centers_old) < dist_max )
+
+            for i in list(algo.s.keys()):
+                s_i   = algo.s[i]
+                s_t_i = algo.s_t[i]
+                row_i = row_ids.get(i)
+                for j in [ j for j in s_i.keys() if ( row_i is None ) or ( j not in row_ids ) 
+                                                     or separated[row_i, row_ids[j]] ]:
+                    del s_i[j]
+                    del s_t_i[j]
+
+                if len(s_i) == 0:
+                    del algo.s[i]
+                    del algo.s_t[i]
+
+        algo.clustering_is_up_to_date = False
+
+        # 3 MLPro clusters
+        super()._renormalize(p_normalizer)
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -31,10 +31,13 @@
 ## -- 2024-05-25  1.4.1     SY       Introduction of size as a property
 ## -- 2025-04-24  1.5.0     DA       Alignment with MLPro 2
 ## -- 2025-07-21  1.5.1     DS       Refactoring
+## -- 2026-10-18  1.6.0     DA       New method _get_cluster_ids() for checkpoints
+## -- 2026-10-18  1.6.1     DA       Worker process not supported
+## -- 2026-10-19  1.6.2     DA       Learned input dictionaries are copied
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.5.1 (2025-07-21)
+Ver. 1.6.2 (2026-10-19)
 
 This module provides a wrapper class for the DenStream algorithm provided by River.
 
@@ -114,6 +117,12 @@ class WrRiverDenStream2MLPro (WrClusterAnalyzerRiver2MLPro):
 
     C_TYPE          = 'River Cluster Analyzer DenStream'
 
+    C_WORKER_SUPPORTED      = False
+
+    C_RIVER_INPUT_COPY      = True
+
+    C_CHECKPOINT_ATTRIBUTES = WrClusterAnalyzerRiver2MLPro.C_CHECKPOINT_ATTRIBUTES + [ 'n_dummy_prediction' ]
+
 
 ## -------------------------------------------------------------------------------------------------
     def __init__(self,
@@ -231,6 +240,21 @@ class WrRiverDenStream2MLPro (WrClusterAnalyzerRiver2MLPro):
         return self._clusters
 
 
+## -------------------------------------------------------------------------------------------------
+    def _get_cluster_ids(self) -> dict:
+        """
+        Maps the keys of the potential micro-clusters to the ids of the related MLPro clusters, which are
+        the object ids of the micro-clusters. See method WrClusterAnalyzerRiver2MLPro.load_checkpoint().
+
+        Returns
+        -------
+        dict
+            Cluster ids by River keys.
+        """
+
+        return { key : id(val) for key, val in self._river_algo.p_micro_clusters.items() }
+
+
 ## -------------------------------------------------------------------------------------------------
     def _renormalize(self, p_normalizer:Normalizer):
         """
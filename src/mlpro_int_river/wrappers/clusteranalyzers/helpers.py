@@ -0,0 +1,156 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.clusteranalyzers
+## -- Module  : helpers.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module provides vectorized NumPy helper functions for (weighted) k-means clustering. They are
+used by the wrappers of this package for offline steps like the macro clustering of micro-clusters
+or the initialization of cluster centers.
+
+"""
+
+
+import numpy as np
+
+
+
+# Export list for public API
+__all__ = [ 'sq_distances',
+            'kmeans_plusplus',
+            'kmeans_lloyd' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def sq_distances( p_data : np.ndarray,
+                  p_centers : np.ndarray ) -> np.ndarray:
+    """
+    Computes the squared Euclidean distances between all data points and all centers.
+
+    Parameters
+    ----------
+    p_data : np.ndarray
+        Data points. Shape (n, d).
+    p_centers : np.ndarray
+        Centers. Shape (k, d).
+
+    Returns
+    -------
+    np.ndarray
+        Squared distances. Shape (n, k).
+    """
+
+    dist = np.einsum('ij,ij->i', p_data, p_data)[:, np.newaxis] \
+           - 2 * ( p_data @ p_centers.T ) \
+           + np.einsum('ij,ij->i', p_centers, p_centers)[np.newaxis, :]
+
+    np.maximum(dist, 0, out=dist)
+    return dist
+
+
+## -------------------------------------------------------------------------------------------------
+def kmeans_plusplus( p_data : np.ndarray,
+                     p_n_clusters : int,
+                     p_weights : np.ndarray = None,
+                     p_seed : int = None ) -> np.ndarray:
+    """
+    Determines initial cluster centers by k-means++ seeding.
+
+    Parameters
+    ----------
+    p_data : np.ndarray
+        Data points. Shape (n, d).
+    p_n_clusters : int
+        Number of centers k.
+    p_weights : np.ndarray
+        Optional weights of the data points. Shape (n,). Default = None.
+    p_seed : int
+        Optional random seed. Default = None.
+
+    Returns
+    -------
+    np.ndarray
+        Initial centers. Shape (k, d).
+    """
+
+    rng         = np.random.default_rng(p_seed)
+    num_points  = p_data.shape[0]
+    weights     = np.ones(num_points) if p_weights is None else np.asarray(p_weights, dtype=np.float64)
+    centers     = np.empty((p_n_clusters, p_data.shape[1]))
+
+    # 1 First center: random data point (weighted)
+    idx         = rng.choice(num_points, p = weights / weights.sum())
+    centers[0]  = p_data[idx]
+    dist_min    = sq_distances(p_data, centers[0:1])[:, 0]
+
+    # 2 Further centers: random data points with probabilities proportional to D(x)^2
+    for i in range(1, p_n_clusters):
+        prob  = weights * dist_min
+        total = prob.sum()
+
+        if total > 0:
+            idx = rng.choice(num_points, p = prob / total)
+        else:
+            idx = rng.choice(num_points, p = weights / weights.sum())
+
+        centers[i] = p_data[idx]
+        np.minimum(dist_min, sq_distances(p_data, centers[i:i+1])[:, 0], out=dist_min)
+
+    return centers
+
+
+## -------------------------------------------------------------------------------------------------
+def kmeans_lloyd( p_data : np.ndarray,
+                  p_centers : np.ndarray,
+                  p_weights : np.ndarray = None,
+                  p_num_iter : int = 10 ):
+    """
+    Refines the given cluster centers by (weighted) Lloyd iterations. Centers without assigned data
+    points keep their positions.
+
+    Parameters
+    ----------
+    p_data : np.ndarray
+        Data points. Shape (n, d).
+    p_centers : np.ndarray
+        Initial centers. Shape (k, d).
+    p_weights : np.ndarray
+        Optional weights of the data points. Shape (n,). Default = None.
+    p_num_iter : int
+        Maximum number of iterations. Default = 10.
+
+    Returns
+    -------
+    centers : np.ndarray
+        Refined centers. Shape (k, d).
+    labels : np.ndarray
+        Index of the closest center for each data point. Shape (n,).
+    """
+
+    num_clusters = p_centers.shape[0]
+    weights      = np.ones(p_data.shape[0]) if p_weights is None else np.asarray(p_weights, dtype=np.float64)
+    centers      = np.array(p_centers, dtype=np.float64)
+    labels       = np.argmin(sq_distances(p_data, centers), axis=1)
+
+    for i in range(p_num_iter):
+        sums       = np.zeros_like(centers)
+        np.add.at(sums, labels, p_data * weights[:, np.newaxis])
+        cnt        = np.bincount(labels, weights=weights, minlength=num_clusters)
+        nonempty   = cnt > 0
+        centers[nonempty] = sums[nonempty] / cnt[nonempty, np.newaxis]
+
+        labels_new = np.argmin(sq_distances(p_data, centers), axis=1)
+        if np.array_equal(labels_new, labels): break
+        labels     = labels_new
+
+    return centers, labels
@@ -0,0 +1,350 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.clusteranalyzers
+## -- Module  : index.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module provides a nearest-neighbor index for cluster centroids, which serves the cluster
+membership queries of the River cluster analyzer wrappers. The index is either based on the
+approximate nearest-neighbor graph SWINN of River or on a vectorized exhaustive search with NumPy.
+
+Learn more:
+https://www.riverml.xyz/
+
+"""
+
+
+import math
+
+import numpy as np
+
+from mlpro.bf.exceptions import ParamError
+from mlpro_int_river.wrappers.clusteranalyzers.helpers import sq_distances
+
+from river import neighbors
+
+
+
+# Export list for public API
+__all__ = [ 'CentroidIndex' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class CentroidIndex:
+    """
+    Nearest-neighbor index for cluster centroids. The centroids are kept row by row in a matrix
+    together with their cluster ids and can be refreshed incrementally:
+
+        - moved centroids overwrite their row (see methods update() and sync())
+        - new centroids are appended as new rows
+        - centroids of removed clusters are marked as dead and ignored by queries
+
+    The engine C_ENGINE_NUMPY answers a query by an exhaustive search over all rows in one
+    vectorized step. It is exact and has no build costs. The engine C_ENGINE_RIVER answers queries
+    by River's approximate nearest-neighbor graph SWINN, whose nodes are the rows of the matrix.
+    Moved centroids are updated in place without touching the graph, which is refined by new
+    centroids only. The search is approximate, i.e. it may return a centroid that is close to but
+    not the nearest one. The graph is built after p_warm_up rows; before, queries are answered
+    exhaustively as well.
+
+    Dead rows are dropped and the graph is rebuilt if the share of dead rows exceeds
+    p_max_dead_ratio.
+
+    Parameters
+    ----------
+    p_engine : str
+        Engine to be used. See constants C_ENGINE_*. Default: C_ENGINE_NUMPY.
+    p_graph_k : int
+        Number of neighbors per node of the SWINN graph. Default: 20.
+    p_warm_up : int
+        Number of rows before the SWINN graph is built. It must be greater than p_graph_k.
+        Default: 500.
+    p_epsilon : float
+        Distance bound of the SWINN search to avoid local minima. Default: 0.1.
+    p_max_dead_ratio : float
+        Maximum share of dead rows before the index is rebuilt. Default: 0.25.
+    p_seed : int
+        Seed of the SWINN graph. Default: None.
+    """
+
+    C_ENGINE_RIVER  = 'River'
+    C_ENGINE_NUMPY  = 'NumPy'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_engine : str = C_ENGINE_NUMPY,
+                  p_graph_k : int = 20,
+                  p_warm_up : int = 500,
+                  p_epsilon : float = 0.1,
+                  p_max_dead_ratio : float = 0.25,
+                  p_seed : int = None ):
+
+        if p_engine not in [ self.C_ENGINE_RIVER, self.C_ENGINE_NUMPY ]:
+            raise ParamError('Unknown engine ' + str(p_engine))
+
+        if p_warm_up <= p_graph_k:
+            raise ParamError('Parameter p_warm_up must be greater than parameter p_graph_k')
+
+        self._engine         = p_engine
+        self._graph_k        = p_graph_k
+        self._warm_up        = p_warm_up
+        self._epsilon        = p_epsilon
+        self._max_dead_ratio = p_max_dead_ratio
+        self._seed           = p_seed
+        self.clear()
+
+
+## -------------------------------------------------------------------------------------------------
+    def clear(self):
+        """
+        Removes all centroids.
+        """
+
+        self._ids       = []
+        self._rows      = {}
+        self._centers   = None
+        self._alive     = np.zeros(0, dtype=bool)
+        self._num_rows  = 0
+        self._num_dead  = 0
+        self._vectors   = []
+        self._query     = None
+        self._graph     = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def _distance(self, p_row_1 : int, p_row_2 : int) -> float:
+        """
+        Distance function of the SWINN graph, whose items are row numbers. The row number -1 refers
+        to the current query.
+        """
+
+        return math.dist( self._query if p_row_1 < 0 else self._vectors[p_row_1],
+                          self._query if p_row_2 < 0 else self._vectors[p_row_2] )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _new_graph(self):
+        return neighbors.SWINN( graph_k = self._graph_k,
+                                dist_func = self._distance,
+                                maxlen = max(2 * self._num_rows, 2 * self._warm_up, 1000),
+                                warm_up = self._warm_up,
+                                seed = self._seed )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _append_rows(self, p_ids : list, p_centers : np.ndarray):
+        """
+        Appends new centroids as new rows.
+        """
+
+        num_new = len(p_ids)
+        if num_new == 0: return
+
+        if self._centers is None:
+            capacity      = max(2 * num_new, 16)
+            self._centers = np.empty((capacity, p_centers.shape[1]))
+            self._alive   = np.zeros(capacity, dtype=bool)
+        elif self._num_rows + num_new > self._centers.shape[0]:
+            capacity      = 2 * ( self._num_rows + num_new )
+            centers       = np.empty((capacity, self._centers.shape[1]))
+            alive         = np.zeros(capacity, dtype=bool)
+            centers[:self._num_rows] = self._centers[:self._num_rows]
+            alive[:self._num_rows]   = self._alive[:self._num_rows]
+            self._centers = centers
+            self._alive   = alive
+
+        first = self._num_rows
+        self._centers[first:first + num_new] = p_centers
+        self._alive[first:first + num_new]   = True
+
+        for row, cluster_id in enumerate(p_ids, first):
+            self._ids.append(cluster_id)
+            self._rows[cluster_id] = row
+
+        self._num_rows += num_new
+
+        if self._engine == self.C_ENGINE_NUMPY: return
+
+        self._vectors.extend(p_centers.tolist())
+        if self._graph is None: self._graph = self._new_graph()
+
+        if self._num_rows > self._graph.maxlen:
+            self.rebuild()
+        else:
+            for row in range(first, self._num_rows): self._graph.append(row)
+
+
+## -------------------------------------------------------------------------------------------------
+    def update(self, p_id, p_center : np.ndarray):
+        """
+        Inserts or moves the centroid of a cluster.
+
+        Parameters
+        ----------
+        p_id
+            Cluster id.
+        p_center : np.ndarray
+            Centroid. Shape (d,).
+        """
+
+        self.sync( p_ids = [p_id], p_centers = np.asarray(p_center, dtype=np.float64).reshape(1, -1), p_remove = False )
+
+
+## -------------------------------------------------------------------------------------------------
+    def remove(self, p_id):
+        """
+        Removes the centroid of a cluster.
+
+        Parameters
+        ----------
+        p_id
+            Cluster id.
+        """
+
+        row = self._rows.pop(p_id, None)
+        if row is None: return
+
+        self._alive[row] = False
+        self._num_dead  += 1
+        if self._num_dead > self._max_dead_ratio * self._num_rows: self.rebuild()
+
+
+## -------------------------------------------------------------------------------------------------
+    def sync(self, p_ids : list, p_centers : np.ndarray, p_remove : bool = True):
+        """
+        Refreshes the index incrementally with the current centroids. Rows of known clusters are
+        overwritten in one step, new clusters are appended and, optionally, clusters that are not
+        listed any more are removed.
+
+        Parameters
+        ----------
+        p_ids : list
+            Cluster ids.
+        p_centers : np.ndarray
+            Centroids related to the cluster ids. Shape (k, d).
+        p_remove : bool
+            If True, all clusters that are not listed in p_ids are removed. Default: True.
+        """
+
+        if p_remove and ( len(self._rows) > 0 ):
+            listed = set(p_ids)
+            for cluster_id in [ x for x in self._rows if x not in listed ]: self.remove(cluster_id)
+
+        rows  = self._rows
+        known = [ ( i, rows[x] ) for i, x in enumerate(p_ids) if x in rows ]
+        new   = [ i for i, x in enumerate(p_ids) if x not in rows ]
+
+        if len(known) > 0:
+            src, dst = np.array(known, dtype=np.int64).T
+            self._centers[dst] = p_centers[src]
+
+            if self._engine == self.C_ENGINE_RIVER:
+                for row, center in zip(dst.tolist(), p_centers[src].tolist()): self._vectors[row] = center
+
+        if len(new) > 0:
+            self._append_rows([ p_ids[i] for i in new ], p_centers[new])
+
+
+## -------------------------------------------------------------------------------------------------
+    def rebuild(self):
+        """
+        Drops all dead rows and rebuilds the index from the living centroids.
+        """
+
+        if self._num_rows == 0: return
+
+        alive   = self._alive[:self._num_rows]
+        ids     = [ x for x, a in zip(self._ids, alive.tolist()) if a ]
+        centers = self._centers[:self._num_rows][alive].copy()
+
+        self.clear()
+        self._append_rows(ids, centers)
+
+
+## -------------------------------------------------------------------------------------------------
+    def query(self, p_values : np.ndarray):
+        """
+        Determines the nearest centroid of a feature vector.
+
+        Parameters
+        ----------
+        p_values : np.ndarray
+            Feature vector. Shape (d,).
+
+        Returns
+        -------
+        id
+            Id of the cluster with the nearest centroid. None, if the index is empty.
+        distance : float
+            Euclidean distance to the centroid. None, if the index is empty.
+        """
+
+        if len(self._rows) == 0: return None, None
+
+        if ( self._engine == self.C_ENGINE_RIVER ) and ( len(self._graph) > self._warm_up ):
+            self._query = np.asarray(p_values, dtype=np.float64).tolist()
+            rows, dists = self._graph.search( -1,
+                                              n_neighbors = min(1 + self._num_dead, self._graph_k),
+                                              epsilon = self._epsilon )
+            for row, dist in zip(rows, dists):
+                if self._alive[row]: return self._ids[row], float(dist)
+
+        ids, dists = self.query_many(np.asarray(p_values, dtype=np.float64).reshape(1, -1), p_exhaustive=True)
+        return ids[0], float(dists[0])
+
+
+## -------------------------------------------------------------------------------------------------
+    def query_many(self, p_data : np.ndarray, p_exhaustive : bool = None):
+        """
+        Determines the nearest centroids of several feature vectors.
+
+        Parameters
+        ----------
+        p_data : np.ndarray
+            Feature vectors. Shape (n, d).
+        p_exhaustive : bool
+            If True, the queries are answered by an exhaustive search in one vectorized step. Default:
+            None, i.e. True for engine C_ENGINE_NUMPY and False for engine C_ENGINE_RIVER.
+
+        Returns
+        -------
+        ids : list
+            Ids of the clusters with the nearest centroids. Empty, if the index is empty.
+        distances : np.ndarray
+            Euclidean distances to the centroids. Shape (n,).
+        """
+
+        if len(self._rows) == 0: return [], np.zeros(0)
+
+        if p_exhaustive is None: p_exhaustive = ( self._engine == self.C_ENGINE_NUMPY )
+
+        if not p_exhaustive:
+            results = [ self.query(values) for values in p_data ]
+            return [ x for x, _ in results ], np.array([ dist for _, dist in results ], dtype=np.float64)
+
+        dist = sq_distances(p_data, self._centers[:self._num_rows])
+        if self._num_dead > 0: dist[:, ~self._alive[:self._num_rows]] = np.inf
+
+        rows = np.argmin(dist, axis=1)
+        return [ self._ids[row] for row in rows.tolist() ], np.sqrt(dist[np.arange(p_data.shape[0]), rows])
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_engine(self) -> str:
+        return self._engine
+
+
+## -------------------------------------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._rows)
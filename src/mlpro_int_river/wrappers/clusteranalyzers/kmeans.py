@@ -32,12 +32,23 @@
 ## -- 2025-04-24  1.5.0     DA       Alignment with MLPro 2
 ## -- 2025-07-20  1.5.1     DS       Added attribute C_CLUSTER_PROPERTIES 
 ## -- 2025-07-21  1.5.2     DS       Refactoring
+## -- 2026-10-18  1.6.0     DA       - New class KMeansNumPy
+## --                                - Class WrRiverKMeans2MLPro: new parameters p_engine and
+## --                                  p_batch_size
+## -- 2026-10-18  1.7.0     DA       Class WrRiverKMeans2MLPro: optional k-means++ warm start
+## -- 2026-10-18  1.8.0     DA       Class WrRiverKMeans2MLPro: vectorized renormalization
+## -- 2026-10-18  1.8.1     DA       Class WrRiverKMeans2MLPro: support of a fused River scaler
+## -- 2026-10-18  1.8.2     DA       Class WrRiverKMeans2MLPro: pending mini-batch is part of checkpoints
+## -- 2026-10-18  1.9.0     DA       Class WrRiverKMeans2MLPro: worker process requires engine River
+## -- 2026-10-19  1.9.1     DA       Class WrRiverKMeans2MLPro: warm start is supported explicitly
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.5.2 (2025-07-21)
+Ver. 1.9.1 (2026-10-19)
 
-This module provides a wrapper class for the KMeans algorithm provided by River.
+This module provides a wrapper class for the KMeans algorithm provided by River. Alternatively, the
+wrapper can be operated with a NumPy-native engine that implements the same incremental update rule
+on a centroid matrix and processes mini-batches of instances.
 
 Learn more:
 https://www.riverml.xyz/
@@ -46,6 +57,10 @@ https://riverml.xyz/latest/api/cluster/KMeans/
 """
 
 
+import random
+import numpy as np
+
+from mlpro.bf.exceptions import ParamError
 from mlpro_int_river.wrappers.clusteranalyzers.basics import WrClusterAnalyzerRiver2MLPro
 from mlpro.bf.math.normalizers import Normalizer
 from mlpro.oa.streams.tasks.clusteranalyzers.clusters import Cluster, ClusterCentroid
@@ -59,7 +74,205 @@ from river import cluster
 
 
 # Export list for public API
-__all__ = [ 'WrRiverKMeans2MLPro' ]
+__all__ = [ 'KMeansNumPy',
+            'WrRiverKMeans2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class KMeansNumPy:
+    """
+    NumPy-native implementation of River's incremental k-means. The cluster centers are kept in a 
+    (k x d) matrix and are initialized lazily on the first data point by drawing from a normal 
+    distribution with the same random generator and in the same order as River does. The centers 
+    are then moved towards the assigned data points by the factor halflife.
+
+    Single data points are processed exactly like in River, so that the same sequence of centers
+    is produced. Mini-batches are assigned to the current centers in one vectorized step. Afterwards,
+    each center is moved by the accumulated effect of all its assigned points, which is equivalent 
+    to the sequential update rule for the given assignment.
+
+    The attribute centers provides the cluster centers in River's dictionary format for 
+    compatibility.
+
+    Parameters
+    ----------
+    p_n_clusters : int
+        Number of clusters. Default: 5.
+    p_halflife : float
+        Amount by which to move the cluster centers. Default: 0.5.
+    p_mu : float
+        Mean of the normal distribution used to instantiate cluster positions. Default: 0.
+    p_sigma : float
+        Standard deviation of the normal distribution used to instantiate cluster positions.
+        Default: 1.
+    p_p : int
+        Power parameter for the Minkowski metric. Default: 2.
+    p_seed : int
+        Random seed used for generating initial centroid positions. Default: None.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_n_clusters : int = 5,
+                  p_halflife : float = 0.5,
+                  p_mu : float = 0,
+                  p_sigma : float = 1,
+                  p_p : int = 2,
+                  p_seed : int = None ):
+
+        self.n_clusters = p_n_clusters
+        self.halflife   = p_halflife
+        self.mu         = p_mu
+        self.sigma      = p_sigma
+        self.p          = p_p
+        self.seed       = p_seed
+        self._rng       = random.Random(p_seed)
+        self._centers   = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def _init_centers(self, p_num_dim : int):
+        """
+        Draws the initial centers. River initializes the center components lazily on the first
+        distance computation, which visits the centers one after another and their components in
+        ascending order. The same order is used here.
+        """
+
+        self._centers = np.array( [ self._rng.gauss(self.mu, self.sigma) for i in range(self.n_clusters * p_num_dim) ],
+                                  dtype = np.float64 ).reshape(self.n_clusters, p_num_dim)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_distances(self, p_data : np.ndarray) -> np.ndarray:
+        """
+        Computes the Minkowski distances (without the final root) between data points and centers.
+
+        Parameters
+        ----------
+        p_data : np.ndarray
+            Data points. Shape (n, d).
+
+        Returns
+        -------
+        np.ndarray
+            Distances. Shape (n, k).
+        """
+
+        if self._centers is None: self._init_centers(p_data.shape[1])
+        diff = np.abs(p_data[:, np.newaxis, :] - self._centers[np.newaxis, :, :])
+        return np.sum(diff ** self.p, axis=2)
+
+
+## -------------------------------------------------------------------------------------------------
+    def predict_many(self, p_data : np.ndarray) -> np.ndarray:
+        """
+        Determines the closest center for each data point.
+
+        Parameters
+        ----------
+        p_data : np.ndarray
+            Data points. Shape (n, d).
+
+        Returns
+        -------
+        np.ndarray
+            Indices of the closest centers. Shape (n,).
+        """
+
+        return np.argmin(self._get_distances(p_data), axis=1)
+
+
+## -------------------------------------------------------------------------------------------------
+    def learn_many(self, p_data : np.ndarray) -> np.ndarray:
+        """
+        Assigns a mini-batch of data points to the current centers and moves the centers. For a 
+        center c with assigned points x_1, ..., x_n (in stream order) and h = halflife, the 
+        sequential update c <- c + h * (x_i - c) results in 
+
+            c <- (1-h)^n * c + sum_i h * (1-h)^(n-i) * x_i.
+
+        Parameters
+        ----------
+        p_data : np.ndarray
+            Data points. Shape (n, d).
+
+        Returns
+        -------
+        np.ndarray
+            Indices of the centers the data points have been assigned to. Shape (n,).
+        """
+
+        labels = self.predict_many(p_data)
+
+        if p_data.shape[0] == 1:
+            # Exactly River's update rule
+            c = self._centers[labels[0]]
+            c += self.halflife * (p_data[0] - c)
+            return labels
+
+        decay = 1 - self.halflife
+        for center_id in np.unique(labels):
+            data     = p_data[labels == center_id]
+            num_data = data.shape[0]
+            weights  = self.halflife * decay ** np.arange(num_data - 1, -1, -1)
+            self._centers[center_id] = decay ** num_data * self._centers[center_id] + weights @ data
+
+        return labels
+
+
+## -------------------------------------------------------------------------------------------------
+    def learn_one(self, x : dict):
+        """
+        Processes a single data point in River format.
+        """
+
+        self.learn_many(np.fromiter(x.values(), dtype=np.float64, count=len(x))[np.newaxis, :])
+
+
+## -------------------------------------------------------------------------------------------------
+    def predict_one(self, x : dict) -> int:
+        """
+        Determines the closest center of a single data point in River format.
+        """
+
+        return int(self.predict_many(np.fromiter(x.values(), dtype=np.float64, count=len(x))[np.newaxis, :])[0])
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_centers(self) -> np.ndarray:
+        """
+        Returns the centroid matrix of shape (k, d) or None, if no data have been processed yet.
+        """
+
+        return self._centers
+
+
+## -------------------------------------------------------------------------------------------------
+    def set_centers(self, p_centers : np.ndarray):
+        """
+        Overwrites the centroid matrix.
+
+        Parameters
+        ----------
+        p_centers : np.ndarray
+            New centers. Shape (k, d).
+        """
+
+        self._centers = np.array(p_centers, dtype=np.float64)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_centers_river(self) -> dict:
+        if self._centers is None: return { i : {} for i in range(self.n_clusters) }
+        return { i : dict(enumerate(center.tolist(), 1)) for i, center in enumerate(self._centers) }
+
+
+## -------------------------------------------------------------------------------------------------
+    centers = property( fget = _get_centers_river )
+
 
 
 
@@ -102,6 +315,19 @@ class WrRiverKMeans2MLPro (WrClusterAnalyzerRiver2MLPro):
     p_p : int
         Power parameter for the Minkowski metric. When p=1, this corresponds to the Manhattan
         distance, while p=2 corresponds to the Euclidean distance. Default: 2.
+    p_engine : str
+        Engine to be used. See constants C_ENGINE_*. The engine C_ENGINE_NUMPY is a NumPy-native
+        re-implementation of River's KMeans (see class KMeansNumPy) that produces the same 
+        centers as River for a batch size of 1. Default: C_ENGINE_RIVER.
+    p_batch_size : int
+        Number of instances to be buffered and processed as a mini-batch. Batch sizes greater than
+        1 are supported by engine C_ENGINE_NUMPY only. Default: 1.
+    p_warm_start_size : int
+        Optional number of initial instances used to determine the initial centers by k-means++
+        seeding and Lloyd iterations. Parameters p_mu and p_sigma are not relevant then.
+        Default: 0 (no warm start).
+    p_warm_start_iter : int
+        Maximum number of Lloyd iterations of the warm start. Default: 5.
     p_kwargs : dict
         Further optional named parameters. 
         
@@ -111,6 +337,13 @@ class WrRiverKMeans2MLPro (WrClusterAnalyzerRiver2MLPro):
     C_CLUSTER_PROPERTIES = [cprop_centroid1,
                             cprop_size1,
                             cprop_size_geo1]
+    
+    C_ENGINE_RIVER  = 'River'
+    C_ENGINE_NUMPY  = 'NumPy'
+
+    C_WARM_START_SUPPORTED  = True
+
+    C_CHECKPOINT_ATTRIBUTES = WrClusterAnalyzerRiver2MLPro.C_CHECKPOINT_ATTRIBUTES + [ '_batch', '_batch_len' ]
                             
 
 
@@ -127,14 +360,44 @@ class WrRiverKMeans2MLPro (WrClusterAnalyzerRiver2MLPro):
                  p_sigma:float = 1,
                  p_p:int = 2,
                  p_seed:int = None,
+                 p_engine:str = C_ENGINE_RIVER,
+                 p_batch_size:int = 1,
+                 p_warm_start_size:int = 0,
+                 p_warm_start_iter:int = 5,
                  **p_kwargs):
         
-        alg = cluster.KMeans(n_clusters=p_n_clusters,
-                             halflife=p_halflife,
-                             mu=p_mu,
-                             sigma=p_sigma,
-                             p=p_p,
-                             seed=p_seed)
+        if p_engine == self.C_ENGINE_RIVER:
+            if p_batch_size != 1:
+                raise ParamError('Engine ' + p_engine + ' supports a batch size of 1 only')
+            
+            alg = cluster.KMeans(n_clusters=p_n_clusters,
+                                 halflife=p_halflife,
+                                 mu=p_mu,
+                                 sigma=p_sigma,
+                                 p=p_p,
+                                 seed=p_seed)
+            
+        elif p_engine == self.C_ENGINE_NUMPY:
+            if p_batch_size < 1:
+                raise ParamError('Parameter p_batch_size must be a positive integer')
+            
+            alg = KMeansNumPy(p_n_clusters=p_n_clusters,
+                              p_halflife=p_halflife,
+                              p_mu=p_mu,
+                              p_sigma=p_sigma,
+                              p_p=p_p,
+                              p_seed=p_seed)
+            
+        else:
+            raise ParamError('Unknown engine ' + str(p_engine))
+        
+        if ( p_engine != self.C_ENGINE_RIVER ) and ( p_kwargs.get('p_worker_batch_size', 0) > 0 ):
+            raise ParamError('A worker process is supported by engine ' + self.C_ENGINE_RIVER + ' only')
+
+        self._engine     = p_engine
+        self._batch_size = p_batch_size
+        self._batch      = None
+        self._batch_len  = 0
 
         super().__init__(p_cls_cluster=ClusterCentroid,
                          p_river_algo=alg,
@@ -143,9 +406,73 @@ class WrRiverKMeans2MLPro (WrClusterAnalyzerRiver2MLPro):
                          p_ada=p_ada,
                          p_visualize=p_visualize,
                          p_logging=p_logging,
+                         p_warm_start_size=p_warm_start_size,
+                         p_warm_start_iter=p_warm_start_iter,
                          **p_kwargs)
 
 
+## -------------------------------------------------------------------------------------------------
+    def _adapt(self, p_instance_new : Instance) -> bool:
+        """
+        This method is to adapt the current clusters according to the incoming instances. Using the
+        NumPy engine, instances are buffered and processed as a mini-batch when the batch is full.
+
+        Parameters
+        ----------
+        p_instance_new : Instance
+            New stream instances to be processed.
+
+        Returns
+        -------
+        bool
+            True, if something has been adapted. False otherwise.        
+        """
+
+        if self._engine == self.C_ENGINE_RIVER: return super()._adapt(p_instance_new)
+
+        if self._warm_start_buffer is not None: return self._warm_start(p_instance_new)
+
+        feature_data = self._get_input_values(p_instance_new, p_learn=True)
+
+        if self._batch is None:
+            self._batch = np.empty((self._batch_size, feature_data.shape[0]), dtype=np.float64)
+
+        self._batch[self._batch_len] = feature_data
+        self._batch_len += 1
+
+        if self._batch_len < self._batch_size: return False
+
+        self._learn_batch()
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _learn_batch(self):
+        """
+        Processes the buffered instances by the NumPy engine and updates the MLPro clusters.
+        """
+
+        if self._batch_len == 0: return
+
+        self.log(self.C_LOG_TYPE_I, 'Cluster is adapted by a batch of', self._batch_len, 'instances...')
+        labels = self._river_algo.learn_many(self._batch[:self._batch_len])
+        self._batch_len = 0
+
+        self._get_clusters()
+
+        for x, center in enumerate(self._river_algo.get_centers()):
+            self._clusters[x].centroid.value = center
+
+        for x, num_inst in enumerate(np.bincount(labels, minlength=self._river_algo.n_clusters)):
+            if num_inst == 0: continue
+            related_cluster = self._clusters[x]
+            act_size = related_cluster.size.value
+            if act_size is not None:
+                related_cluster.size.value = act_size + int(num_inst)
+            else:
+                related_cluster.size.value = int(num_inst)
+
+
 ## -------------------------------------------------------------------------------------------------
     def _update_clusters(self, input_data):
         """
@@ -169,6 +496,27 @@ class WrRiverKMeans2MLPro (WrClusterAnalyzerRiver2MLPro):
                     related_cluster.size.value = 1
 
 
+## -------------------------------------------------------------------------------------------------
+    def _inject_centers(self, p_centers : np.ndarray):
+        """
+        Overwrites the cluster centers of the engine.
+
+        Parameters
+        ----------
+        p_centers : np.ndarray
+            New cluster centers. Shape (k, d).
+        """
+
+        if self._engine == self.C_ENGINE_NUMPY:
+            self._river_algo.set_centers(p_centers)
+            return
+        
+        for x, center in enumerate(p_centers):
+            river_center = self._river_algo.centers[x]
+            river_center.clear()
+            river_center.update(enumerate(center.tolist(), 1))
+
+
 ## -------------------------------------------------------------------------------------------------
     def _get_clusters(self):
         """
@@ -181,6 +529,23 @@ class WrRiverKMeans2MLPro (WrClusterAnalyzerRiver2MLPro):
             
         """
 
+        if self._engine == self.C_ENGINE_NUMPY:
+            centers = self._river_algo.get_centers()
+            if ( centers is None ) or ( len(self._clusters) == centers.shape[0] ): return self._clusters
+
+            for x, center in enumerate(centers):
+                if x in self._clusters: continue
+
+                related_cluster = self._cls_cluster(p_id=x, p_properties=self.C_CLUSTER_PROPERTIES, p_visualize=self.get_visualization())  
+
+                if self.get_visualization(): 
+                    related_cluster.init_plot(p_figure = self._figure, p_plot_settings=self._plot_settings)  
+
+                related_cluster.centroid.value = center
+                self._add_cluster( p_cluster = related_cluster )
+
+            return self._clusters
+
         for x in self._river_algo.centers.keys():
             try:
                 related_cluster = self._clusters[x]
@@ -203,20 +568,34 @@ class WrRiverKMeans2MLPro (WrClusterAnalyzerRiver2MLPro):
     def _renormalize(self, p_normalizer:Normalizer):
         """
         Internal renormalization of all clusters. See method OATask.renormalize_on_event() for further
-        information.
+        information. The parameters of the normalizer are determined once and applied to all 
+        centers of the engine in one step.
 
         Parameters
         ----------
         p_normalizer : Normalizer
             Normalizer object to be applied on task-specific 
         """
+
+        factors, offsets = self._get_renormalization_params(p_normalizer)
+        if factors is None: return
         
-        super()._renormalize(p_normalizer)
+        if self._engine == self.C_ENGINE_NUMPY:
+            # Pending instances still belong to the previous normalization
+            self._learn_batch()
+
+            centers = self._river_algo.get_centers()
+            if centers is not None:
+                centers *= factors
+                centers += offsets
 
-        for cluster in self._clusters.values():
-            related_cluster = self._river_algo.centers[cluster.get_id()]
-            for mlpro_idx, river_idx in enumerate(related_cluster):
-                related_cluster[river_idx] = cluster.centroid.value[mlpro_idx]
+        else:
+            self._renormalize_river_data( p_data = self._river_algo.centers,
+                                          p_factors = factors,
+                                          p_offsets = offsets )
+
+        self._renormalize_warm_start( p_factors = factors, p_offsets = offsets )
+        super()._renormalize(p_normalizer)
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -0,0 +1,804 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.clusteranalyzers
+## -- Module  : odac.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module provides a wrapper class for the Online Divisive-Agglomerative Clustering (ODAC) by
+River, which clusters the features (time series) of a stream instead of its instances.
+Alternatively, the wrapper can be operated with a NumPy-native engine that keeps the correlation
+statistics of each cluster as dense matrices.
+
+Learn more:
+https://www.riverml.xyz/
+https://riverml.xyz/latest/api/cluster/ODAC/
+
+"""
+
+
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+from mlpro.bf.exceptions import ParamError
+from mlpro.bf.math.normalizers import Normalizer
+from mlpro.bf.mt import Task as MLTask
+from mlpro.bf.various import Log
+from mlpro.bf.streams import *
+from mlpro.oa.streams.tasks.clusteranalyzers import ClusterAnalyzer
+from mlpro.oa.streams.tasks.clusteranalyzers.clusters import Cluster
+from mlpro.oa.streams.tasks.clusteranalyzers.clusters.properties import cprop_size
+from mlpro_int_river.wrappers.clusteranalyzers.basics import WrClusterAnalyzerRiver2MLPro
+
+from river import cluster
+
+
+
+# Export list for public API
+__all__ = [ 'ODACHierarchy',
+            'ODACNodeNumPy',
+            'ODACNumPy',
+            'WrRiverODAC2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class ODACHierarchy (NamedTuple):
+    """
+    Compact representation of the cluster hierarchy of ODAC. The nodes are listed in pre-order, so
+    that the root is the first node and each parent is listed before its children.
+
+    Attributes
+    ----------
+    ids : np.ndarray
+        Ids of the nodes. Active nodes are represented by MLPro clusters with the same ids.
+        Shape (m,).
+    parents : np.ndarray
+        Position of the parent of each node or -1 for the root. Shape (m,).
+    active : np.ndarray
+        Boolean flags of the active nodes, i.e. of the current clusters. Shape (m,).
+    diameters : np.ndarray
+        Diameters (largest distance d1) of the nodes. NaN, if not calculated yet. Shape (m,).
+    leaves : np.ndarray
+        Position of the active node that contains each feature. Shape (d,).
+    """
+
+    ids : np.ndarray
+    parents : np.ndarray
+    active : np.ndarray
+    diameters : np.ndarray
+    leaves : np.ndarray
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class ODACNodeNumPy:
+    """
+    Node of the cluster hierarchy of class ODACNumPy. An active node keeps the mean vector and the
+    co-moment matrix of its features, from which the Pearson correlations of all pairs of features
+    are derived.
+
+    Parameters
+    ----------
+    p_id : int
+        Unique id of the node.
+    p_features : np.ndarray
+        Sorted feature indices of the node.
+    p_parent : ODACNodeNumPy
+        Parent node or None for the root. Default: None.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_id : int,
+                  p_features : np.ndarray,
+                  p_parent = None ):
+
+        self.id       = p_id
+        self.features = p_features
+        self.parent   = p_parent
+        self.children = None
+        self.active   = True
+
+        self.d0       = None
+        self.d1       = None
+        self.d2       = None
+        self.e        = 0.0
+        self.avg      = None
+        self.pivot    = None
+
+        self.reset_statistics()
+
+
+## -------------------------------------------------------------------------------------------------
+    def reset_statistics(self):
+        num_features   = self.features.shape[0]
+        self.n         = 0
+        self.mean      = np.zeros(num_features)
+        self.comoment  = np.zeros((num_features, num_features))
+
+
+## -------------------------------------------------------------------------------------------------
+    def update_statistics(self, p_data : np.ndarray):
+        """
+        Merges the statistics of a batch of observations of the features of the node into the
+        statistics of the node.
+
+        Parameters
+        ----------
+        p_data : np.ndarray
+            Observations of the features of the node. Shape (b, m).
+        """
+
+        num_new = p_data.shape[0]
+        n       = self.n + num_new
+        mean    = p_data.mean(axis=0)
+        delta   = mean - self.mean
+
+        if num_new > 1:
+            centered       = p_data - mean
+            self.comoment += centered.T @ centered
+
+        self.comoment += np.outer(delta, delta) * ( self.n * num_new / n )
+        self.mean     += delta * ( num_new / n )
+        self.n         = n
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_correlations(self) -> np.ndarray:
+        """
+        Returns the Pearson correlations of all pairs of features of the node. Like in River,
+        the correlation is 0 if one of the variances is 0.
+
+        Returns
+        -------
+        np.ndarray
+            Correlation matrix. Shape (m, m).
+        """
+
+        std = np.sqrt(np.diagonal(self.comoment)) if self.n > 1 else np.zeros(self.features.shape[0])
+        den = np.outer(std, std)
+
+        corr = np.zeros_like(self.comoment)
+        np.divide(self.comoment, den, out=corr, where=den > 0)
+        return corr
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_distances(self) -> np.ndarray:
+        """
+        Returns the distances rnomc(a, b) = sqrt((1 - corr(a, b)) / 2) of all pairs of features of
+        the node.
+
+        Returns
+        -------
+        np.ndarray
+            Distance matrix. Shape (m, m).
+        """
+
+        return np.sqrt(np.abs(( 1 - self.get_correlations() ) / 2))
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class ODACNumPy:
+    """
+    NumPy-native implementation of River's Online Divisive-Agglomerative Clustering (ODAC). Each
+    active node of the hierarchy keeps the mean vector and the co-moment matrix of its features
+    instead of one River object per pair of features. A batch of observations is merged into these
+    statistics in one matrix product per node, and the distances of all pairs of features are
+    derived in one vectorized step.
+
+    River checks for splits and merges every n_min observations. Therefore, batches are split at
+    these points, so that the same hierarchy is produced as River's ODAC learning one observation
+    after another (up to floating point rounding).
+
+    The features are identified by their indices 0 to d-1, which correspond to the keys 1 to d of
+    the River input format.
+
+    Parameters
+    ----------
+    p_confidence_level : float
+        Confidence level of the Hoeffding bound. Default: 0.9.
+    p_n_min : int
+        Number of observations between two checks for splits and merges. Default: 100.
+    p_tau : float
+        Threshold below which a split is forced to break ties. Default: 0.1.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_confidence_level : float = 0.9,
+                  p_n_min : int = 100,
+                  p_tau : float = 0.1 ):
+
+        if not ( 0.0 < p_confidence_level < 1.0 ):
+            raise ParamError('Parameter p_confidence_level must be between 0 and 1')
+        if p_n_min < 1:
+            raise ParamError('Parameter p_n_min must be a positive integer')
+        if p_tau <= 0.0:
+            raise ParamError('Parameter p_tau must be greater than 0')
+
+        self.confidence_level   = p_confidence_level
+        self.n_min              = p_n_min
+        self.tau                = p_tau
+
+        self._update_timer      = p_n_min
+        self._n_observations    = 0
+        self._structure_changed = False
+        self._root              = None
+        self._next_id           = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _new_node(self, p_features : np.ndarray, p_parent : ODACNodeNumPy = None) -> ODACNodeNumPy:
+        node = ODACNodeNumPy( p_id = self._next_id, p_features = p_features, p_parent = p_parent )
+        self._next_id += 1
+        return node
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_nodes(self, p_active : bool = False) -> list:
+        """
+        Returns the nodes of the hierarchy in pre-order.
+
+        Parameters
+        ----------
+        p_active : bool
+            If True, only the active nodes are returned. Default: False.
+        """
+
+        nodes = []
+        stack = [] if self._root is None else [ self._root ]
+
+        while len(stack) > 0:
+            node = stack.pop()
+            if node.active or not p_active: nodes.append(node)
+            if node.children is not None: stack.extend(reversed(node.children))
+
+        return nodes
+
+
+## -------------------------------------------------------------------------------------------------
+    def _calculate_coefficients(self, p_node : ODACNodeNumPy) -> np.ndarray:
+        """
+        Calculates the diameters, the pivot and the Hoeffding bound of the given node.
+
+        Returns
+        -------
+        np.ndarray
+            Distance matrix of the features of the node or None for nodes with a single feature.
+        """
+
+        p_node.e = math.sqrt(math.log(1 / self.confidence_level) / (2 * p_node.n))
+
+        num_features = p_node.features.shape[0]
+
+        if num_features == 1:
+            p_node.d1 = p_node.comoment[0, 0] / ( p_node.n - 1 ) if p_node.n > 1 else 0.0
+            return None
+
+        # Pairs of features in the same order as River, so that ties are resolved identically
+        rows, cols   = np.triu_indices(num_features, 1)
+        distances    = p_node.get_distances()
+        pair_dist    = distances[rows, cols]
+
+        # River divides the sum of the distances by the number of observations
+        p_node.avg   = float(pair_dist.sum()) / p_node.n
+
+        p_node.d0    = float(pair_dist.min())
+        pivot        = int(pair_dist.argmax())
+        p_node.d1    = float(pair_dist[pivot])
+        p_node.pivot = ( int(rows[pivot]), int(cols[pivot]) )
+
+        if pair_dist.shape[0] > 1:
+            pair_dist[pivot] = -np.inf
+            p_node.d2        = float(pair_dist.max())
+        else:
+            p_node.d2        = None
+
+        return distances
+
+
+## -------------------------------------------------------------------------------------------------
+    def _split(self, p_node : ODACNodeNumPy, p_distances : np.ndarray):
+        """
+        Splits the given node into two children. Each feature joins the child of the closer pivot.
+        """
+
+        pivot_1, pivot_2 = p_node.pivot
+
+        first          = p_distances[pivot_1] < p_distances[pivot_2]
+        first[pivot_1] = True
+        first[pivot_2] = False
+
+        p_node.children = ( self._new_node(p_node.features[first], p_parent=p_node),
+                            self._new_node(p_node.features[~first], p_parent=p_node) )
+        p_node.active   = False
+        p_node.avg      = p_node.d0 = p_node.pivot = None
+        p_node.n        = 0
+        p_node.mean     = p_node.comoment = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def _aggregate(self, p_node : ODACNodeNumPy):
+        """
+        Merges the children of the given node, which becomes an active node again.
+        """
+
+        for child in p_node.children: child.parent = None
+        p_node.children = None
+        p_node.active   = True
+        p_node.reset_statistics()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _test_node(self, p_node : ODACNodeNumPy) -> bool:
+        """
+        Tests whether the parent of the given node has to be aggregated or the node has to be
+        split, like River does.
+        """
+
+        distances = self._calculate_coefficients(p_node)
+        parent    = p_node.parent
+
+        if ( parent is not None ) and ( p_node.d1 - parent.d1 > max(parent.e, p_node.e) ):
+            self._aggregate(parent)
+            return True
+
+        if p_node.d2 is None: return False
+
+        if ( ( p_node.d1 - p_node.d2 ) > p_node.e ) or ( self.tau > p_node.e ):
+            if ( p_node.d1 - p_node.d0 ) * abs(p_node.d1 + p_node.d0 - 2 * p_node.avg) > p_node.e:
+                self._split(p_node, distances)
+                return True
+
+        return False
+
+
+## -------------------------------------------------------------------------------------------------
+    def learn_many(self, p_data : np.ndarray):
+        """
+        Processes a batch of observations.
+
+        Parameters
+        ----------
+        p_data : np.ndarray
+            Observations of all features. Shape (n, d).
+        """
+
+        num_data = p_data.shape[0]
+        if ( num_data == 0 ) or ( p_data.shape[1] == 0 ): return
+
+        self._structure_changed = False
+
+        if self._root is None:
+            self._root              = self._new_node(np.arange(p_data.shape[1]))
+            self._structure_changed = True
+
+        start = 0
+
+        while start < num_data:
+            stop   = min(num_data, start + self._update_timer)
+            leaves = self.get_nodes(p_active=True)
+
+            for leaf in leaves: leaf.update_statistics(p_data[start:stop, leaf.features])
+
+            self._n_observations += stop - start
+            self._update_timer   -= stop - start
+            start                 = stop
+
+            if self._update_timer > 0: continue
+
+            for leaf in leaves:
+                # Leaves below an aggregated node are detached and have no effect any more
+                if not self._is_attached(leaf): continue
+                if self._test_node(leaf): self._structure_changed = True
+
+            self._update_timer = self.n_min
+
+
+## -------------------------------------------------------------------------------------------------
+    def _is_attached(self, p_node : ODACNodeNumPy) -> bool:
+        node = p_node
+        while node.parent is not None: node = node.parent
+        return node is self._root
+
+
+## -------------------------------------------------------------------------------------------------
+    def learn_one(self, x : dict):
+        """
+        Processes a single observation in River format.
+        """
+
+        if not x: return
+        self.learn_many(np.fromiter(x.values(), dtype=np.float64, count=len(x))[np.newaxis, :])
+
+
+## -------------------------------------------------------------------------------------------------
+    def predict_one(self, x : dict):
+        """
+        Like River's ODAC, this algorithm does not predict anything.
+        """
+
+        raise NotImplementedError
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_structure_changed(self) -> bool:
+        return self._structure_changed
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_n_active_clusters(self) -> int:
+        return len(self.get_nodes(p_active=True))
+
+
+## -------------------------------------------------------------------------------------------------
+    structure_changed = property( fget = _get_structure_changed )
+    n_active_clusters = property( fget = _get_n_active_clusters )
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrRiverODAC2MLPro (WrClusterAnalyzerRiver2MLPro):
+    """
+    This is the wrapper class for the ODAC clusterer.
+
+    According to https://riverml.xyz/latest/api/cluster/ODAC/ :
+    The Online Divisive-Agglomerative Clustering (ODAC) aims at continuously maintaining a
+    hierarchical cluster structure from evolving time series data streams. The distance between
+    two time series is derived from their Pearson correlation. ODAC monitors the diameters of the
+    leaves of the hierarchy and splits or merges them supported by the Hoeffding bound.
+
+    Unlike the other cluster analyzers, ODAC clusters the features of the stream, i.e. each
+    feature is a time series and each instance provides one value of all time series. Each active
+    node of the hierarchy is represented by an MLPro cluster, whose size is the number of its
+    features. The features of a cluster are provided by method get_cluster_features(). The whole
+    hierarchy is read out by method get_hierarchy() as compact parent arrays and the correlations
+    of the features of a cluster by method get_correlations(). Since instances are not assigned
+    to clusters, method get_cluster_memberships() is not supported.
+
+    River keeps one object per pair of features of each active node, which is updated
+    one pair after another. The engine C_ENGINE_NUMPY (see class ODACNumPy) keeps the same
+    statistics as a dense co-moment matrix per active node and processes mini-batches in one
+    matrix product, which makes it suitable for streams with many features.
+
+    Parameters
+    ----------
+    p_name : str
+        Name of the clusterer. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: MLTask.C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_confidence_level : float
+        Confidence level of the Hoeffding bound. Default: 0.9.
+    p_n_min : int
+        Number of instances between two checks for splits and merges. Default: 100.
+    p_tau : float
+        Threshold below which a split is forced to break ties. Default: 0.1.
+    p_engine : str
+        Engine to be used. See constants C_ENGINE_*. Default: C_ENGINE_RIVER.
+    p_batch_size : int
+        Number of instances to be buffered and processed as a mini-batch. Batch sizes greater than
+        1 are supported by engine C_ENGINE_NUMPY only. Default: 1.
+    p_kwargs : dict
+        Further optional named parameters.
+
+    """
+
+    C_TYPE                  = 'River Cluster Analyzer ODAC'
+
+    C_CLUSTER_PROPERTIES    = [ cprop_size ]
+
+    C_ENGINE_RIVER          = 'River'
+    C_ENGINE_NUMPY          = 'NumPy'
+
+    C_WORKER_SUPPORTED      = False
+
+    C_CHECKPOINT_ATTRIBUTES = WrClusterAnalyzerRiver2MLPro.C_CHECKPOINT_ATTRIBUTES + [ '_batch', '_batch_len', '_node_ids', '_next_node_id' ]
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_name : str = None,
+                  p_range_max = MLTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  p_confidence_level : float = 0.9,
+                  p_n_min : int = 100,
+                  p_tau : float = 0.1,
+                  p_engine : str = C_ENGINE_RIVER,
+                  p_batch_size : int = 1,
+                  **p_kwargs ):
+
+        if p_engine == self.C_ENGINE_RIVER:
+            if p_batch_size != 1:
+                raise ParamError('Engine ' + p_engine + ' supports a batch size of 1 only')
+
+            alg = cluster.ODAC( confidence_level = p_confidence_level,
+                                n_min = p_n_min,
+                                tau = p_tau )
+
+        elif p_engine == self.C_ENGINE_NUMPY:
+            if p_batch_size < 1:
+                raise ParamError('Parameter p_batch_size must be a positive integer')
+
+            alg = ODACNumPy( p_confidence_level = p_confidence_level,
+                             p_n_min = p_n_min,
+                             p_tau = p_tau )
+
+        else:
+            raise ParamError('Unknown engine ' + str(p_engine))
+
+        self._engine       = p_engine
+        self._batch_size   = p_batch_size
+        self._batch        = None
+        self._batch_len    = 0
+        self._node_ids     = {}
+        self._next_node_id = 0
+
+        super().__init__( p_cls_cluster = Cluster,
+                          p_river_algo = alg,
+                          p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = p_ada,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _adapt(self, p_instance_new : Instance) -> bool:
+        """
+        This method is to adapt the hierarchy according to the incoming instances. Using the NumPy
+        engine, instances are buffered and processed as a mini-batch when the batch is full. The
+        MLPro clusters are synchronized whenever the structure of the hierarchy has changed.
+
+        Parameters
+        ----------
+        p_instance_new : Instance
+            New stream instances to be processed.
+
+        Returns
+        -------
+        bool
+            True, if something has been adapted. False otherwise.
+        """
+
+        if self._engine == self.C_ENGINE_RIVER:
+            self._river_algo.learn_one(self._get_river_input(p_instance_new, p_learn=True))
+
+        else:
+            feature_data = self._get_input_values(p_instance_new, p_learn=True)
+
+            if self._batch is None:
+                self._batch = np.empty((self._batch_size, feature_data.shape[0]), dtype=np.float64)
+
+            self._batch[self._batch_len] = feature_data
+            self._batch_len += 1
+
+            if self._batch_len < self._batch_size: return False
+
+            self._river_algo.learn_many(self._batch[:self._batch_len])
+            self._batch_len = 0
+
+        if self._river_algo.structure_changed:
+            self.log(self.C_LOG_TYPE_I, 'Structure of the hierarchy has changed...')
+            self._get_clusters()
+
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_nodes(self) -> list:
+        """
+        Returns all nodes of the hierarchy in pre-order as tuples (node, position of the parent).
+        """
+
+        if self._engine == self.C_ENGINE_NUMPY:
+            nodes = self._river_algo.get_nodes()
+        else:
+            nodes = []
+            if self._river_algo._is_init: stack = [ self._river_algo._root_node ]
+            else: stack = []
+
+            while len(stack) > 0:
+                node = stack.pop()
+                nodes.append(node)
+                if node.children is not None: stack.extend([ node.children.second, node.children.first ])
+
+        positions = { id(node) : x for x, node in enumerate(nodes) }
+        return [ ( node, -1 if node.parent is None else positions[id(node.parent)] ) for node in nodes ]
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_node_id(self, p_node) -> int:
+        """
+        Returns the id of a node. The nodes of the NumPy engine carry their own ids. The nodes of
+        River are assigned consecutive ids on their first appearance.
+        """
+
+        if self._engine == self.C_ENGINE_NUMPY: return p_node.id
+
+        try:
+            return self._node_ids[p_node]
+        except KeyError:
+            node_id               = self._next_node_id
+            self._node_ids[p_node] = node_id
+            self._next_node_id   += 1
+            return node_id
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_node_features(self, p_node) -> np.ndarray:
+        if self._engine == self.C_ENGINE_NUMPY: return p_node.features
+        return np.array(p_node.timeseries_names, dtype=np.int64) - 1
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_clusters(self):
+        """
+        This method synchronizes the MLPro clusters with the active nodes of the hierarchy.
+
+        Returns
+        -------
+        dict_of_clusters : dict[Cluster]
+            Current list of clusters.
+
+        """
+
+        nodes  = [ node for node, _ in self._get_nodes() ]
+        active = { self._get_node_id(node) : node for node in nodes if node.active }
+
+        for cluster_id in [ x for x in self._clusters.keys() if x not in active ]:
+            self._remove_cluster(self._clusters[cluster_id])
+
+        for cluster_id, node in active.items():
+            if cluster_id in self._clusters: continue
+
+            related_cluster = self._cls_cluster( p_id = cluster_id,
+                                                 p_properties = self.C_CLUSTER_PROPERTIES,
+                                                 p_visualize = self.get_visualization() )
+            related_cluster.size.value = len(self._get_node_features(node))
+            self._add_cluster( p_cluster = related_cluster )
+
+        if self._engine == self.C_ENGINE_RIVER:
+            self._node_ids = { node : self._node_ids[node] for node in nodes if node in self._node_ids }
+
+        return self._clusters
+
+
+## -------------------------------------------------------------------------------------------------
+    def _renormalize(self, p_normalizer : Normalizer):
+        """
+        The Pearson correlations are invariant to the affine renormalization of the features, so
+        that nothing needs to be done.
+        """
+
+        pass
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_cluster_features(self, p_cluster_id : int) -> np.ndarray:
+        """
+        Returns the indices of the features of a cluster.
+
+        Parameters
+        ----------
+        p_cluster_id : int
+            Id of the cluster.
+
+        Returns
+        -------
+        np.ndarray
+            Sorted feature indices. Shape (m,).
+        """
+
+        for node, _ in self._get_nodes():
+            if node.active and ( self._get_node_id(node) == p_cluster_id ): return self._get_node_features(node)
+
+        raise ParamError('Unknown cluster id ' + str(p_cluster_id))
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_correlations(self, p_cluster_id : int):
+        """
+        Returns the current Pearson correlations of all pairs of features of a cluster.
+
+        Parameters
+        ----------
+        p_cluster_id : int
+            Id of the cluster.
+
+        Returns
+        -------
+        features : np.ndarray
+            Sorted feature indices of the cluster. Shape (m,).
+        correlations : np.ndarray
+            Correlation matrix with ones on the diagonal. Shape (m, m).
+        """
+
+        for node, _ in self._get_nodes():
+            if node.active and ( self._get_node_id(node) == p_cluster_id ): break
+        else:
+            raise ParamError('Unknown cluster id ' + str(p_cluster_id))
+
+        features = self._get_node_features(node)
+
+        if self._engine == self.C_ENGINE_NUMPY:
+            corr = node.get_correlations()
+        else:
+            corr = np.zeros((features.shape[0], features.shape[0]))
+            if features.shape[0] > 1:
+                names = node.timeseries_names
+                for x, name_1 in enumerate(names):
+                    for y in range(x + 1, len(names)):
+                        corr[x, y] = corr[y, x] = node._statistics[(name_1, names[y])].get()
+
+        np.fill_diagonal(corr, 1.0)
+        return features, corr
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_hierarchy(self) -> ODACHierarchy:
+        """
+        Reads out the current hierarchy as compact parent arrays. See class ODACHierarchy.
+
+        Returns
+        -------
+        ODACHierarchy
+            Current hierarchy. None, if no instance has been processed yet.
+        """
+
+        nodes = self._get_nodes()
+        if len(nodes) == 0: return None
+
+        root_features = self._get_node_features(nodes[0][0])
+        leaves        = np.full(root_features.shape[0], -1, dtype=np.int64)
+
+        for x, ( node, _ ) in enumerate(nodes):
+            if node.active: leaves[self._get_node_features(node)] = x
+
+        return ODACHierarchy( ids = np.array([ self._get_node_id(node) for node, _ in nodes ], dtype=np.int64),
+                              parents = np.array([ parent for _, parent in nodes ], dtype=np.int64),
+                              active = np.array([ node.active for node, _ in nodes ], dtype=bool),
+                              diameters = np.array([ np.nan if node.d1 is None else node.d1 for node, _ in nodes ], dtype=np.float64),
+                              leaves = leaves )
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_cluster_memberships( self,
+                                 p_instance : Instance,
+                                 p_scope : int = ClusterAnalyzer.C_RESULT_SCOPE_MAX ):
+        """
+        ODAC clusters the features of the stream and not its instances. Therefore, cluster
+        memberships of instances are not supported.
+        """
+
+        raise NotImplementedError('ODAC clusters the features of the stream and not its instances')
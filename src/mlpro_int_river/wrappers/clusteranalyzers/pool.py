@@ -0,0 +1,355 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.clusteranalyzers
+## -- Module  : pool.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -- 2026-10-19  1.0.1     DA       Method predict_many() uses the Minkowski p of the template
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.1 (2026-10-19)
+
+This module provides a pool of lightweight clusterers for many small independent streams (tenants),
+e.g. one per sensor. In contrast to the MLPro wrappers, a tenant is represented just by a River
+clusterer and a slot in a few shared NumPy arrays. There is no MLPro task, logging or plotting per
+tenant.
+
+Learn more:
+https://www.riverml.xyz/
+
+"""
+
+
+import copy
+
+import numpy as np
+
+from mlpro_int_river.wrappers.clusteranalyzers.kmeans import KMeansNumPy
+from mlpro.bf.exceptions import ParamError
+from river import base, cluster
+
+
+
+# Export list for public API
+__all__ = [ 'ClustererPool' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class ClustererPool:
+    """
+    Pool of independent clusterers keyed by tenant id. Each tenant gets its own copy of the given
+    template clusterer, which is created on the first data of the tenant. Batches of rows of mixed
+    tenants are routed to the right clusterers in one call of method learn_many().
+
+    The cluster centers and sizes of all tenants are kept in two pooled arrays of shape
+    (capacity, k, d) and (capacity, k). Methods get_centers() and get_sizes() return read-only views
+    on the rows of a tenant, which follow all further learning of the tenant. Unused center rows
+    are NaN. For the NumPy engine of k-means (class KMeansNumPy), the clusterers work directly on
+    the pooled array, so that no copies are made at all. When the capacity of the pool is exceeded,
+    the arrays are reallocated with twice the capacity and previously returned views are no longer
+    updated.
+
+    Parameters
+    ----------
+    p_river_algo
+        Instantiated and untrained clusterer (see C_RIVER_ALGOS) that serves as template for the
+        tenants.
+    p_num_dim : int
+        Number of features.
+    p_capacity : int
+        Initial number of tenant slots. Default: 64.
+    """
+
+    C_RIVER_ALGOS = ( KMeansNumPy,
+                      cluster.KMeans,
+                      cluster.STREAMKMeans,
+                      cluster.CluStream )
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_river_algo : base.Clusterer,
+                  p_num_dim : int,
+                  p_capacity : int = 64 ):
+
+        if not isinstance(p_river_algo, self.C_RIVER_ALGOS):
+            raise ParamError('Clusterer ' + type(p_river_algo).__name__ + ' is not supported')
+
+        if p_capacity < 1:
+            raise ParamError('Parameter p_capacity must be positive')
+
+        self._template     = copy.deepcopy(p_river_algo)
+        self._num_dim      = p_num_dim
+        self._num_clusters = getattr(p_river_algo, 'n_macro_clusters', None) or p_river_algo.n_clusters
+        self._numpy        = isinstance(p_river_algo, KMeansNumPy)
+        self._p            = getattr(p_river_algo, 'p', 2)
+
+        self._slots        = {}
+        self._models       = [ None ] * p_capacity
+        self._free         = list(range(p_capacity - 1, -1, -1))
+        self._centers      = np.full((p_capacity, self._num_clusters, p_num_dim), np.nan)
+        self._num_centers  = np.zeros(p_capacity, dtype=np.int64)
+        self._sizes        = np.zeros((p_capacity, self._num_clusters), dtype=np.int64)
+
+
+## -------------------------------------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._slots)
+
+
+## -------------------------------------------------------------------------------------------------
+    def __contains__(self, p_tenant_id) -> bool:
+        return p_tenant_id in self._slots
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_tenants(self) -> list:
+        """
+        Returns the ids of all tenants of the pool.
+        """
+
+        return list(self._slots.keys())
+
+
+## -------------------------------------------------------------------------------------------------
+    def _grow(self):
+        """
+        Doubles the capacity of the pool. The clusterers of the NumPy engine are bound to the new
+        center array.
+        """
+
+        capacity          = len(self._models)
+        self._models     += [ None ] * capacity
+        self._free        = list(range(2 * capacity - 1, capacity - 1, -1))
+        self._centers     = np.concatenate((self._centers, np.full_like(self._centers, np.nan)))
+        self._num_centers = np.concatenate((self._num_centers, np.zeros_like(self._num_centers)))
+        self._sizes       = np.concatenate((self._sizes, np.zeros_like(self._sizes)))
+
+        if self._numpy:
+            for tenant_slot in self._slots.values():
+                self._models[tenant_slot]._centers = self._centers[tenant_slot]
+
+
+## -------------------------------------------------------------------------------------------------
+    def _add_tenant(self, p_tenant_id) -> int:
+        if len(self._free) == 0: self._grow()
+
+        tenant_slot = self._free.pop()
+        model       = copy.deepcopy(self._template)
+
+        if self._numpy:
+            # The initial centers are drawn right away and the clusterer is bound to the pool
+            model._init_centers(self._num_dim)
+            self._centers[tenant_slot] = model._centers
+            model._centers = self._centers[tenant_slot]
+            self._num_centers[tenant_slot] = self._num_clusters
+
+        self._models[tenant_slot] = model
+        self._slots[p_tenant_id]  = tenant_slot
+        return tenant_slot
+
+
+## -------------------------------------------------------------------------------------------------
+    def remove_tenant(self, p_tenant_id):
+        """
+        Removes a tenant and releases its slot.
+
+        Parameters
+        ----------
+        p_tenant_id
+            Tenant id.
+        """
+
+        tenant_slot = self._slots.pop(p_tenant_id)
+        self._models[tenant_slot]      = None
+        self._centers[tenant_slot]     = np.nan
+        self._num_centers[tenant_slot] = 0
+        self._sizes[tenant_slot]       = 0
+        self._free.append(tenant_slot)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _group_rows(self, p_tenant_ids, p_data):
+        """
+        Groups the rows of a batch by tenant. Yields the tenant id and the row indices of each
+        tenant in stream order.
+        """
+
+        tenant_ids         = np.asarray(p_tenant_ids)
+        if tenant_ids.shape[0] != p_data.shape[0]:
+            raise ParamError('Number of tenant ids and rows do not match')
+
+        tenants, inverse   = np.unique(tenant_ids, return_inverse=True)
+        order              = np.argsort(inverse, kind='stable')
+        bounds             = np.cumsum(np.bincount(inverse, minlength=len(tenants)))
+
+        start = 0
+        for tenant, end in zip(tenants.tolist(), bounds.tolist()):
+            yield tenant, order[start:end]
+            start = end
+
+
+## -------------------------------------------------------------------------------------------------
+    def learn_many(self, p_tenant_ids, p_data : np.ndarray):
+        """
+        Routes a batch of rows to the clusterers of their tenants. Missing tenants are created.
+        The rows of each tenant are learned in stream order.
+
+        Parameters
+        ----------
+        p_tenant_ids
+            Tenant id of each row. Shape (n,).
+        p_data : np.ndarray
+            Feature values. Shape (n, d).
+        """
+
+        data = np.asarray(p_data, dtype=np.float64)
+
+        for tenant, rows in self._group_rows(p_tenant_ids, data):
+            try:
+                tenant_slot = self._slots[tenant]
+            except KeyError:
+                tenant_slot = self._add_tenant(tenant)
+
+            model = self._models[tenant_slot]
+            sizes = self._sizes[tenant_slot]
+
+            if self._numpy:
+                labels = model.learn_many(data[rows])
+                sizes += np.bincount(labels, minlength=self._num_clusters)
+                continue
+
+            for values in data[rows].tolist():
+                x = dict(enumerate(values, 1))
+                model.learn_one(x)
+                if len(model.centers) > 0:
+                    label = model.predict_one(x)
+                    if label < self._num_clusters: sizes[label] += 1
+
+            self._update_centers(tenant_slot, model.centers)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _update_centers(self, p_tenant_slot : int, p_centers : dict):
+        """
+        Copies the centers of a River clusterer into the pooled center array.
+        """
+
+        centers     = self._centers[p_tenant_slot]
+        num_centers = 0
+
+        for key in sorted(p_centers.keys()):
+            center = p_centers[key]
+            if ( len(center) != self._num_dim ) or ( key >= self._num_clusters ): continue
+            centers[key] = list(center.values())
+            num_centers  = max(num_centers, key + 1)
+
+        centers[num_centers:] = np.nan
+        self._num_centers[p_tenant_slot] = num_centers
+
+
+## -------------------------------------------------------------------------------------------------
+    def predict_many(self, p_tenant_ids, p_data : np.ndarray) -> np.ndarray:
+        """
+        Determines the closest center of each row among the centers of its tenant by the Minkowski
+        distance with the power parameter p of the template clusterer (Euclidean distance for
+        clusterers without parameter p). All tenants are processed in one vectorized step on the
+        pooled center array.
+
+        Parameters
+        ----------
+        p_tenant_ids
+            Tenant id of each row. Shape (n,).
+        p_data : np.ndarray
+            Feature values. Shape (n, d).
+
+        Returns
+        -------
+        np.ndarray
+            Index of the closest center of each row or -1, if the tenant is unknown or has no
+            centers yet. Shape (n,).
+        """
+
+        data        = np.asarray(p_data, dtype=np.float64)
+        tenant_ids  = np.asarray(p_tenant_ids)
+        tenants, inverse = np.unique(tenant_ids, return_inverse=True)
+        slots       = np.array([ self._slots.get(t, -1) for t in tenants.tolist() ], dtype=np.int64)[inverse]
+        labels      = np.full(data.shape[0], -1, dtype=np.int64)
+        known       = slots >= 0
+        if not np.any(known): return labels
+
+        diff        = self._centers[slots[known]] - data[known, np.newaxis, :]
+        if self._p == 2: dist = np.einsum('ijk,ijk->ij', diff, diff)
+        else: dist = np.sum(np.abs(diff) ** self._p, axis=2)
+        dist[np.isnan(dist)] = np.inf
+        closest     = np.argmin(dist, axis=1)
+        valid       = np.isfinite(dist[np.arange(dist.shape[0]), closest])
+        labels[np.flatnonzero(known)[valid]] = closest[valid]
+        return labels
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_centers(self, p_tenant_id) -> np.ndarray:
+        """
+        Returns a read-only view on the cluster centers of a tenant.
+
+        Parameters
+        ----------
+        p_tenant_id
+            Tenant id.
+
+        Returns
+        -------
+        np.ndarray
+            Cluster centers. Shape (k, d).
+        """
+
+        view = self._centers[self._slots[p_tenant_id]]
+        view.flags.writeable = False
+        return view
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_sizes(self, p_tenant_id) -> np.ndarray:
+        """
+        Returns a read-only view on the cluster sizes of a tenant.
+
+        Parameters
+        ----------
+        p_tenant_id
+            Tenant id.
+
+        Returns
+        -------
+        np.ndarray
+            Number of instances assigned to each cluster. Shape (k,).
+        """
+
+        view = self._sizes[self._slots[p_tenant_id]]
+        view.flags.writeable = False
+        return view
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_algorithm(self, p_tenant_id) -> base.Clusterer:
+        """
+        Returns the clusterer of a tenant.
+
+        Parameters
+        ----------
+        p_tenant_id
+            Tenant id.
+
+        Returns
+        -------
+        base.Clusterer
+            Clusterer of the tenant.
+        """
+
+        return self._models[self._slots[p_tenant_id]]
@@ -0,0 +1,400 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.clusteranalyzers
+## -- Module  : sharded.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -- 2026-10-19  1.0.1     DA       Bugfix: shards start from clones with individual seeds
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.1 (2026-10-19)
+
+This module provides a sharded cluster analyzer that runs several independent copies of a River
+clusterer in worker processes. Each copy learns a partition of the stream. Periodically, the
+centers of all copies are merged into a global model by weighted k-means.
+
+Learn more:
+https://www.riverml.xyz/
+
+"""
+
+
+import zlib
+
+import numpy as np
+
+from mlpro_int_river.wrappers.clusteranalyzers.basics import WrClusterAnalyzerRiver2MLPro
+from mlpro_int_river.wrappers.clusteranalyzers.helpers import sq_distances, kmeans_plusplus, kmeans_lloyd
+from mlpro_int_river.wrappers.clusteranalyzers.worker import ClusterWorker
+from mlpro.bf.exceptions import Error, ParamError
+from mlpro.oa.streams.tasks.clusteranalyzers import ClusterAnalyzer
+from mlpro.oa.streams.tasks.clusteranalyzers.clusters import ClusterCentroid
+from mlpro.oa.streams.tasks.clusteranalyzers.clusters.properties import *
+from mlpro.bf.mt import Task as MLTask
+from mlpro.bf.various import Log
+from mlpro.bf.streams import *
+from river import base, cluster
+
+
+
+# Export list for public API
+__all__ = [ 'WrRiverShardedClusterer2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrRiverShardedClusterer2MLPro (WrClusterAnalyzerRiver2MLPro):
+    """
+    This is a sharded cluster analyzer that runs several independent copies of a River clusterer
+    in worker processes (see module worker). The instances are partitioned among the copies either
+    round-robin or by a hash of their feature values. After each p_merge_interval instances, the
+    cluster centers published by all copies are merged into a global model by weighted k-means,
+    where the weights are the cluster sizes of the copies. The clusters of this analyzer are the
+    clusters of the global model.
+
+    Parameters
+    ----------
+    p_river_algo : base.Clusterer
+        Instantiated River clusterer (see C_RIVER_ALGOS) that serves as template for the copies.
+    p_num_shards : int
+        Number of copies, each running in its own worker process. Default: 2.
+    p_routing : str
+        Partitioning of the instances. See constants C_ROUTING_*. Default: C_ROUTING_ROUND_ROBIN.
+    p_n_clusters : int
+        Number of clusters of the global model. Default: None (number of clusters of the template).
+    p_merge_interval : int
+        Number of instances after which the global model is updated. Default: 1000.
+    p_batch_size : int
+        Number of instances per batch that is shipped to a worker process. Default: 100.
+    p_seed : int
+        Random seed of the global model. Default: None.
+    p_name : str
+        Name of the clusterer. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: MLTask.C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further optional named parameters.
+
+    """
+
+    C_TYPE                  = 'River Cluster Analyzer Sharded'
+
+    C_RIVER_ALGOS           = ( cluster.KMeans,
+                                cluster.STREAMKMeans,
+                                cluster.CluStream )
+
+    C_ROUTING_ROUND_ROBIN   = 'round-robin'
+    C_ROUTING_HASH          = 'hash'
+
+    C_CHECKPOINT_ATTRIBUTES = WrClusterAnalyzerRiver2MLPro.C_CHECKPOINT_ATTRIBUTES + [ '_shard_algos', '_num_inst' ]
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 p_river_algo : base.Clusterer,
+                 p_num_shards : int = 2,
+                 p_routing : str = C_ROUTING_ROUND_ROBIN,
+                 p_n_clusters : int = None,
+                 p_merge_interval : int = 1000,
+                 p_batch_size : int = 100,
+                 p_seed : int = None,
+                 p_name : str = None,
+                 p_range_max = MLTask.C_RANGE_THREAD,
+                 p_ada : bool = True,
+                 p_visualize : bool = False,
+                 p_logging = Log.C_LOG_ALL,
+                 **p_kwargs):
+
+        if not isinstance(p_river_algo, self.C_RIVER_ALGOS):
+            raise ParamError('River clusterer ' + type(p_river_algo).__name__ + ' is not supported')
+
+        if p_routing not in [ self.C_ROUTING_ROUND_ROBIN, self.C_ROUTING_HASH ]:
+            raise ParamError('Unknown routing ' + str(p_routing))
+
+        if ( p_num_shards < 1 ) or ( p_merge_interval < 1 ) or ( p_batch_size < 1 ):
+            raise ParamError('Parameters p_num_shards, p_merge_interval and p_batch_size must be positive integers')
+
+        if ( p_kwargs.get('p_warm_start_size', 0) > 0 ) or ( p_kwargs.get('p_worker_batch_size', 0) > 0 ):
+            raise ParamError('Warm start and a single worker process are not supported by sharding')
+
+        if p_n_clusters is None:
+            p_n_clusters = getattr(p_river_algo, 'n_clusters', getattr(p_river_algo, 'n_macro_clusters', None))
+
+        self._num_shards     = p_num_shards
+        self._routing        = p_routing
+        self._n_clusters     = p_n_clusters
+        self._merge_interval = p_merge_interval
+        self._batch_size     = p_batch_size
+        self._workers        = None
+        self._shard_clusters = [ None ] * p_num_shards
+        self._shard_algos    = None
+        self._num_inst       = 0
+
+        super().__init__(p_cls_cluster=ClusterCentroid,
+                         p_river_algo=p_river_algo,
+                         p_name=p_name,
+                         p_range_max=p_range_max,
+                         p_ada=p_ada,
+                         p_visualize=p_visualize,
+                         p_logging=p_logging,
+                         **p_kwargs)
+
+        self._seed = p_seed
+
+
+## -------------------------------------------------------------------------------------------------
+    def _adapt(self, p_instance_new : Instance) -> bool:
+        """
+        Passes the incoming instance to the worker process of its shard. The global model is
+        updated after each p_merge_interval instances.
+
+        Parameters
+        ----------
+        p_instance_new : Instance
+            New stream instances to be processed.
+
+        Returns
+        -------
+        bool
+            True, if the global model has been updated. False otherwise.
+        """
+
+        feature_data = self._get_input_values(p_instance_new, p_learn=True)
+
+        if self._workers is None: self._start_workers(feature_data.shape[0])
+
+        if self._routing == self.C_ROUTING_ROUND_ROBIN:
+            shard = self._num_inst % self._num_shards
+        else:
+            shard = zlib.crc32(feature_data.tobytes()) % self._num_shards
+
+        self._workers[shard].add(feature_data)
+        self._num_inst += 1
+
+        if self._num_inst % self._merge_interval != 0: return False
+
+        for shard, worker in enumerate(self._workers):
+            clusters = worker.get_clusters()
+            if clusters is not None: self._shard_clusters[shard] = clusters
+
+        return self._merge()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _start_workers(self, p_num_dim : int):
+        """
+        Starts a worker process with a copy of the River clusterer for each shard. The copies are
+        fresh clones of the template with the individual seeds seed + i of shard i, so that the
+        shards do not start from identical initial centers. Without a seed of the template, each
+        clone draws its own random state.
+
+        Parameters
+        ----------
+        p_num_dim : int
+            Number of features.
+        """
+
+        self.log(self.C_LOG_TYPE_I, 'Starting', self._num_shards, 'worker processes...')
+        if self._shard_algos is None:
+            seed        = self._river_algo._get_params().get('seed')
+            river_algos = [ self._river_algo.clone({ 'seed' : None if seed is None else seed + i })
+                            for i in range(self._num_shards) ]
+        else:
+            river_algos = self._shard_algos
+
+        self._workers = [ ClusterWorker( p_river_algo = river_algo,
+                                         p_num_dim = p_num_dim,
+                                         p_batch_size = self._batch_size,
+                                         p_num_slots = self.C_WORKER_NUM_SLOTS,
+                                         p_max_clusters = self._worker_max_clusters ) for river_algo in river_algos ]
+
+
+## -------------------------------------------------------------------------------------------------
+    def _merge(self) -> bool:
+        """
+        Merges the cluster centers of all shards into the global model by weighted k-means. The new
+        global centers are matched with the previous ones, so that the cluster ids remain stable.
+        Shard clusters without instances are ignored.
+
+        Returns
+        -------
+        bool
+            True, if the global model has been updated. False, if the shards do not provide enough
+            clusters yet.
+        """
+
+        shard_clusters = [ c for c in self._shard_clusters if c is not None ]
+        if len(shard_clusters) == 0: return False
+
+        centers = np.concatenate([ c[1] for c in shard_clusters ])
+        sizes   = np.concatenate([ c[2] for c in shard_clusters ]).astype(np.float64)
+        used    = sizes > 0
+        if np.count_nonzero(used) < self._n_clusters: return False
+
+        centers = centers[used]
+        sizes   = sizes[used]
+
+        self.log(self.C_LOG_TYPE_I, 'Merging', centers.shape[0], 'centers of', len(shard_clusters), 'shards...')
+        centers_global         = kmeans_plusplus( p_data = centers,
+                                                  p_n_clusters = self._n_clusters,
+                                                  p_weights = sizes,
+                                                  p_seed = self._seed )
+        centers_global, labels = kmeans_lloyd( p_data = centers,
+                                               p_centers = centers_global,
+                                               p_weights = sizes )
+        sizes_global           = np.bincount(labels, weights=sizes, minlength=self._n_clusters)
+
+        # Keep the cluster ids stable by matching the new centers with the previous ones
+        ids, centers_prev = self.get_cluster_centers(p_original_units=False)
+        if len(ids) == self._n_clusters:
+            order          = self._match_centers(centers_prev, centers_global)
+            centers_global = centers_global[order]
+            sizes_global   = sizes_global[order]
+
+        for x in range(self._n_clusters):
+            try:
+                related_cluster = self._clusters[x]
+            except KeyError:
+                related_cluster = self._cls_cluster(p_id=x, p_properties=self.C_CLUSTER_PROPERTIES, p_visualize=self.get_visualization())
+                self._add_cluster( p_cluster = related_cluster )
+
+            related_cluster.centroid.value = centers_global[x]
+            related_cluster.size.value     = int(sizes_global[x])
+
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _match_centers(self, p_centers_prev : np.ndarray, p_centers_new : np.ndarray) -> np.ndarray:
+        """
+        Greedily matches new centers with previous centers by ascending distance.
+
+        Parameters
+        ----------
+        p_centers_prev : np.ndarray
+            Previous centers. Shape (k, d).
+        p_centers_new : np.ndarray
+            New centers. Shape (k, d).
+
+        Returns
+        -------
+        np.ndarray
+            Index of the matching new center for each previous center. Shape (k,).
+        """
+
+        num_clusters = p_centers_prev.shape[0]
+        dist         = sq_distances(p_centers_prev, p_centers_new)
+        order        = np.empty(num_clusters, dtype=np.int64)
+        used_prev    = np.zeros(num_clusters, dtype=bool)
+        used_new     = np.zeros(num_clusters, dtype=bool)
+
+        for idx in np.argsort(dist, axis=None):
+            x, y = divmod(int(idx), num_clusters)
+            if used_prev[x] or used_new[y]: continue
+            order[x]     = y
+            used_prev[x] = True
+            used_new[y]  = True
+
+        return order
+
+
+## -------------------------------------------------------------------------------------------------
+    def stop_worker(self):
+        """
+        Stops all worker processes after their pending instances have been processed and updates
+        the global model a last time. The trained copies of the River clusterer are kept (see method
+        get_shard_algorithms()) and are used when the worker processes are restarted on the next
+        adaptation.
+        """
+
+        if self._workers is None: return
+
+        self._shard_algos = []
+        for shard, worker in enumerate(self._workers):
+            river_algo, clusters = worker.stop()
+            self._shard_algos.append(river_algo)
+            if len(clusters[0]) > 0: self._shard_clusters[shard] = clusters
+
+        self._workers = None
+        self._merge()
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_shard_algorithms(self) -> list:
+        """
+        Returns the copies of the River clusterer as trained by the worker processes. They are
+        available after method stop_worker() has been called.
+
+        Returns
+        -------
+        list
+            List of River clusterers or None.
+        """
+
+        return self._shard_algos
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_checkpoint_data(self) -> dict:
+        if self._workers is not None: raise Error('Please stop the worker processes before saving a checkpoint')
+        return super()._get_checkpoint_data()
+
+
+## -------------------------------------------------------------------------------------------------
+    def renormalize_on_event(self, p_event_id: str, p_event_object):
+        raise Error('Renormalization is not supported by sharding')
+
+
+## -------------------------------------------------------------------------------------------------
+    def _update_clusters(self, input_data):
+        pass
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_cluster_memberships( self,
+                                 p_instance: Instance,
+                                 p_scope: int = ClusterAnalyzer.C_RESULT_SCOPE_MAX ):
+        """
+        Public custom method to determine the membership of the given instance to each cluster of
+        the global model. The instance belongs to the cluster with the nearest centroid.
+
+        Parameters
+        ----------
+        p_instance : Instance
+            Instance to be evaluated.
+        p_scope : int
+            Scope of the result list. See class attributes C_RESULT_SCOPE_* for possible values. Default
+            value is C_RESULT_SCOPE_MAX.
+
+        Returns
+        -------
+        membership : List[Tuple[str, float, Cluster]]
+            List of membership tuples for each cluster. A tuple consists of a cluster id, a
+            relative membership value in percent and a reference to the cluster.
+        """
+
+        ids, centers = self.get_cluster_centers(p_original_units=False)
+        if len(ids) == 0: return []
+
+        feature_data = self._get_input_values(p_instance)[np.newaxis, :]
+        nearest      = int(np.argmin(sq_distances(feature_data, centers)[0]))
+
+        memberships_rel = []
+        for x, cluster_id in enumerate(ids):
+            if x == nearest:
+                memberships_rel.append((cluster_id, 1, self._clusters[cluster_id]))
+            elif p_scope == ClusterAnalyzer.C_RESULT_SCOPE_ALL:
+                memberships_rel.append((cluster_id, 0, self._clusters[cluster_id]))
+
+        return memberships_rel
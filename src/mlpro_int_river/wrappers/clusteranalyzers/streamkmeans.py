@@ -31,10 +31,19 @@
 ## -- 2024-05-25  1.4.1     SY       Introduction of size as a property
 ## -- 2025-04-24  1.5.0     DA       Alignment with MLPro 2
 ## -- 2025-07-21  1.5.1     DS       Refactoring
+## -- 2026-10-18  1.6.0     DA       Chunk-aware synchronization of clusters
+## -- 2026-10-18  1.7.0     DA       Optional k-means++ warm start
+## -- 2026-10-18  1.8.0     DA       Vectorized renormalization
+## -- 2026-10-18  1.8.1     DA       Support of a fused River scaler
+## -- 2026-10-18  1.8.2     DA       Pending chunk counter is part of checkpoints
+## -- 2026-10-18  1.9.0     DA       Support of a worker process
+## -- 2026-10-19  1.9.1     DA       Learned input dictionaries are copied; renormalization
+## --                                replaces the data points of the current chunk
+## -- 2026-10-19  1.9.2     DA       Warm start is supported explicitly
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.5.1 (2025-07-21)
+Ver. 1.9.2 (2026-10-19)
 
 This module provides a wrapper class for the STREAMKMeans algorithm provided by River.
 
@@ -45,7 +54,10 @@ https://riverml.xyz/latest/api/cluster/STREAMKMeans/
 """
 
 
+import numpy as np
+
 from mlpro_int_river.wrappers.clusteranalyzers.basics import WrClusterAnalyzerRiver2MLPro
+from mlpro_int_river.wrappers.clusteranalyzers.helpers import sq_distances
 from mlpro.bf.math.normalizers import Normalizer
 from mlpro.oa.streams.tasks.clusteranalyzers.clusters import Cluster, ClusterCentroid
 from mlpro.oa.streams.tasks.clusteranalyzers.clusters.properties import *
@@ -76,6 +88,11 @@ class WrRiverStreamKMeans2MLPro (WrClusterAnalyzerRiver2MLPro):
     the temporary chunk of data points is full, the implementation of this algorithm uses an
     increamental k-means.
 
+    Since STREAMKMeans recomputes its centers only when a chunk of data points is complete, the
+    MLPro clusters are synchronized chunk-wise as well. Between two chunk boundaries only the 
+    number of pending instances is counted. On completion of a chunk, the instances of the chunk
+    are assigned to the new centers in one vectorized step to update the cluster sizes.
+
     Parameters
     ----------
     p_name : str
@@ -105,6 +122,14 @@ class WrRiverStreamKMeans2MLPro (WrClusterAnalyzerRiver2MLPro):
     p_p : int
         Power parameter for the Minkowski metric. When p=1, this corresponds to the Manhattan
         distance, while p=2 corresponds to the Euclidean distance. Default: 2.
+    p_warm_start_size : int
+        Optional number of initial instances used to determine the initial centers by k-means++
+        seeding and Lloyd iterations. The centers are injected into the global incremental k-means
+        of STREAMKMeans. Furthermore, the normal distribution used by River to initialize the 
+        k-means of each chunk is adjusted to the mean and standard deviation of the buffered 
+        instances. Default: 0 (no warm start).
+    p_warm_start_iter : int
+        Maximum number of Lloyd iterations of the warm start. Default: 5.
     p_kwargs : dict
         Further optional named parameters. 
         
@@ -112,6 +137,11 @@ class WrRiverStreamKMeans2MLPro (WrClusterAnalyzerRiver2MLPro):
 
     C_NAME          = 'River Cluster Analyzer STREAMKMeans'
 
+    C_RIVER_INPUT_COPY      = True
+    C_WARM_START_SUPPORTED  = True
+
+    C_CHECKPOINT_ATTRIBUTES = WrClusterAnalyzerRiver2MLPro.C_CHECKPOINT_ATTRIBUTES + [ '_num_inst_pending' ]
+
 
 ## -------------------------------------------------------------------------------------------------
     def __init__(self,
@@ -127,6 +157,8 @@ class WrRiverStreamKMeans2MLPro (WrClusterAnalyzerRiver2MLPro):
                  p_sigma:float = 1,
                  p_p:int = 2,
                  p_seed:int = None,
+                 p_warm_start_size:int = 0,
+                 p_warm_start_iter:int = 5,
                  **p_kwargs):
         
         alg = cluster.STREAMKMeans(chunk_size=p_chunk_size,
@@ -137,6 +169,8 @@ class WrRiverStreamKMeans2MLPro (WrClusterAnalyzerRiver2MLPro):
                                    p=p_p,
                                    seed=p_seed)
 
+        self._num_inst_pending = 0
+
         super().__init__(p_cls_cluster=ClusterCentroid,
                          p_river_algo=alg,
                          p_name=p_name,
@@ -144,35 +178,127 @@ class WrRiverStreamKMeans2MLPro (WrClusterAnalyzerRiver2MLPro):
                          p_ada=p_ada,
                          p_visualize=p_visualize,
                          p_logging=p_logging,
+                         p_warm_start_size=p_warm_start_size,
+                         p_warm_start_iter=p_warm_start_iter,
                          **p_kwargs)
+        
+        self._seed = p_seed
+
+
+## -------------------------------------------------------------------------------------------------
+    def _adapt(self, p_instance_new : Instance) -> bool:
+        """
+        This method is to adapt the current clusters according to the incoming instances. The MLPro
+        clusters are synchronized only if River completed a chunk.
+
+        Parameters
+        ----------
+        p_instance_new : Instance
+            New stream instances to be processed.
+
+        Returns
+        -------
+        bool
+            True, if the clusters have been synchronized on completion of a chunk. False otherwise.
+        """
+
+        if self._worker_batch_size > 0: return super()._adapt(p_instance_new)
+
+        if self._warm_start_buffer is not None: return self._warm_start(p_instance_new)
+
+        # transform features data to River input format
+        input_data = self._get_river_input(p_instance_new, p_learn=True)
+
+        # update the model with a set of features
+        self._river_algo.learn_one(input_data)
+        self._num_inst_pending += 1
+
+        if self._river_algo.time_stamp % self._river_algo.chunk_size != 0: return False
+
+        # update MLPro clusters from river on completion of a chunk
+        self.log(self.C_LOG_TYPE_I, 'Chunk completed, clusters are adapted...')
+        self._get_clusters()
+        self._update_clusters(input_data)
+
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _warm_start(self, p_instance : Instance) -> bool:
+
+        buffer = self._warm_start_buffer
+        if not super()._warm_start(p_instance): return False
+
+        # Adjust River's initialization of the chunk-wise k-means to the buffered data
+        data = np.array(buffer)
+        self._river_algo.kwargs['mu']    = float(np.mean(data))
+        self._river_algo.kwargs['sigma'] = float(np.std(data))
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _inject_centers(self, p_centers : np.ndarray):
+        """
+        Overwrites the centers of the global incremental k-means of STREAMKMeans.
+
+        Parameters
+        ----------
+        p_centers : np.ndarray
+            New cluster centers. Shape (k, d).
+        """
+
+        kmeans = self._river_algo._kmeans
+
+        for x, center in enumerate(p_centers):
+            river_center = kmeans.centers[x]
+            river_center.clear()
+            river_center.update(enumerate(center.tolist(), 1))
+
+        self._river_algo.centers = kmeans.centers
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_center_values(self, p_center : dict) -> list:
+        """
+        Returns the values of a River center in the order of the features.
+        """
+
+        return [ p_center[y+1] for y in range(len(p_center)) ]
 
 
 ## -------------------------------------------------------------------------------------------------
     def _update_clusters(self, input_data):
         """
-        This method is to update the centroids of each introduced cluster.
+        This method is to update the centroids and sizes of each introduced cluster. The instances
+        of the completed chunk are assigned to the updated centers in one step.
         """
+
+        centers     = self._river_algo.centers
+        cluster_ids = [ x for x in centers.keys() if ( x in self._clusters ) and ( len(centers[x]) != 0 ) ]
+        if len(cluster_ids) == 0: return
+
+        center_values = []
+        for x in cluster_ids:
+            list_center = self._get_center_values(centers[x])
+            self._clusters[x].centroid.value = list_center
+            center_values.append(list_center)
+
+        # assign the pending instances of the chunk to the updated centers
+        chunk = list(self._river_algo._temp_chunk.values())[-self._num_inst_pending:]
+        self._num_inst_pending = 0
+
+        labels = np.argmin( sq_distances( p_data = np.array([ list(x.values()) for x in chunk ], dtype=np.float64),
+                                          p_centers = np.array(center_values, dtype=np.float64) ), 
+                            axis = 1 )
         
-        updated_cls = self._river_algo.predict_one(input_data)
-
-        for x in self._river_algo.centers.keys():
-            try:
-                related_cluster = self._clusters[x]
-                list_center = []
-                for y in range(len(self._river_algo.centers[x])):
-                    list_center.append(self._river_algo.centers[x][y+1])
-                if x == updated_cls:
-                    act_size = related_cluster.size.value
-                    if act_size is not None:
-                        related_cluster.size.value = act_size+1
-                    else:
-                        related_cluster.size.value = 1
-                try:
-                    related_cluster.centroid.value = list_center
-                except:
-                    pass
-            except:
-                pass
+        for idx, num_inst in enumerate(np.bincount(labels, minlength=len(cluster_ids))):
+            if num_inst == 0: continue
+            related_cluster = self._clusters[cluster_ids[idx]]
+            act_size = related_cluster.size.value
+            if act_size is not None:
+                related_cluster.size.value = act_size + int(num_inst)
+            else:
+                related_cluster.size.value = int(num_inst)
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -187,26 +313,16 @@ class WrRiverStreamKMeans2MLPro (WrClusterAnalyzerRiver2MLPro):
             
         """
 
-        for x in self._river_algo.centers.keys():
-            try:
-                related_cluster = self._clusters[x]
-            except:
-                if len(self._river_algo.centers[x]) != 0:
-                    related_cluster = self._cls_cluster(p_id=x, p_properties=self.C_CLUSTER_PROPERTIES, p_visualize=self.get_visualization()) 
-                    
-                    if self.get_visualization():  
-                        related_cluster.init_plot(p_figure = self._figure, p_plot_settings=self._plot_settings)  
-                    
-                    list_center = []
-                    for y in range(len(self._river_algo.centers[x])):
-                        list_center.append(self._river_algo.centers[x][y+1])
-                        
-                    try:          
-                        related_cluster.centroid.value = list_center
-                    except:
-                        pass
-                    
-                    self._add_cluster( p_cluster = related_cluster )
+        for x, center in self._river_algo.centers.items():
+            if ( x in self._clusters ) or ( len(center) == 0 ): continue
+
+            related_cluster = self._cls_cluster(p_id=x, p_properties=self.C_CLUSTER_PROPERTIES, p_visualize=self.get_visualization()) 
+            
+            if self.get_visualization():  
+                related_cluster.init_plot(p_figure = self._figure, p_plot_settings=self._plot_settings)  
+            
+            related_cluster.centroid.value = self._get_center_values(center)
+            self._add_cluster( p_cluster = related_cluster )
 
         return self._clusters
 
@@ -215,23 +331,29 @@ class WrRiverStreamKMeans2MLPro (WrClusterAnalyzerRiver2MLPro):
     def _renormalize(self, p_normalizer:Normalizer):
         """
         Internal renormalization of all clusters. See method OATask.renormalize_on_event() for further
-        information.
+        information. The parameters of the normalizer are determined once and applied to the
+        centers of the global incremental k-means and to the data points of the current chunk in
+        one step each.
 
         Parameters
         ----------
         p_normalizer : Normalizer
             Normalizer object to be applied on task-specific 
         """
+
+        factors, offsets = self._get_renormalization_params(p_normalizer)
+        if factors is None: return
+
+        self._renormalize_river_data( p_data = self._river_algo._kmeans.centers,
+                                      p_factors = factors,
+                                      p_offsets = offsets )
         
-        super()._renormalize(p_normalizer)
+        self._renormalize_river_data( p_data = self._river_algo._temp_chunk,
+                                      p_factors = factors,
+                                      p_offsets = offsets )
 
-        for cluster in self._clusters.values():
-            try:
-                related_cluster = self._river_algo.centers[cluster.get_id()]
-                for mlpro_idx, river_idx in enumerate(related_cluster):
-                    related_cluster[river_idx] = cluster.centroid.value[mlpro_idx]
-            except:
-                pass
+        self._renormalize_warm_start( p_factors = factors, p_offsets = offsets )
+        super()._renormalize(p_normalizer)
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -0,0 +1,372 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.clusteranalyzers
+## -- Module  : textclust.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module provides a wrapper class for the text stream clustering algorithm TextClust by River,
+which processes sparse token counts instead of dense feature vectors.
+
+Learn more:
+https://www.riverml.xyz/
+https://riverml.xyz/latest/api/cluster/TextClust/
+
+"""
+
+
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+import numpy as np
+
+from mlpro.bf.mt import Task as MLTask
+from mlpro.bf.various import Log
+from mlpro.bf.streams import *
+from mlpro.oa.streams.tasks.clusteranalyzers import ClusterAnalyzer
+from mlpro.oa.streams.tasks.clusteranalyzers.clusters import Cluster
+from mlpro.oa.streams.tasks.clusteranalyzers.clusters.properties import cprop_size
+from mlpro_int_river.wrappers.clusteranalyzers.basics import WrClusterAnalyzerRiver2MLPro
+
+from river import base, cluster, feature_extraction, preprocessing
+
+
+
+# Export list for public API
+__all__ = [ 'WrRiverTextClust2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrRiverTextClust2MLPro (WrClusterAnalyzerRiver2MLPro):
+    """
+    This is the wrapper class for the TextClust clusterer.
+
+    According to https://riverml.xyz/latest/api/cluster/TextClust/ :
+    textClust is a stream clustering algorithm for textual data that can identify and track topics
+    over time in a stream of texts. The stream is summarised in real-time by many small micro
+    clusters, which maintain enough information to update and efficiently calculate the cosine
+    similarity between them over time, based on the TF-IDF vector of their texts. Micro clusters
+    that are not updated regularly lose relevance and are eventually removed.
+
+    Each micro cluster is represented by an MLPro cluster with the same id, whose size is the
+    number of observations of the micro cluster.
+
+    TextClust processes sparse token counts. The wrapper takes them from the keyword arguments
+    of the instances under key p_text_key, either as a dictionary (token, count) or as a text,
+    which is tokenized by p_vectorizer. The dictionaries are passed to TextClust without
+    densification. Instances without this key are processed by their non-zero feature values.
+    The tokens are mapped to hashed feature ids in the range [0, p_n_features) by River's
+    FeatureHasher, so that the vocabulary of the micro clusters is bounded independently of the
+    number of distinct tokens in the stream. Tokens sharing the same id are counted together.
+
+    Parameters
+    ----------
+    p_name : str
+        Name of the clusterer. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: MLTask.C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_radius : float
+        Distance threshold to merge two micro clusters in (0, 1]. Default: 0.3.
+    p_fading_factor : float
+        Fading factor of the micro clusters. Default: 0.0005.
+    p_tgap : int
+        Time between two cleanups of outdated micro clusters. Default: 100.
+    p_term_fading : bool
+        If True, the tokens of the micro clusters are faded as well. Default: True.
+    p_real_time_fading : bool
+        If True, the time stamps of the instances are used for fading. Otherwise, the number of
+        observations is used. Default: False.
+    p_num_macro : int
+        Number of macro clusters of the reclustering. Default: 3.
+    p_min_weight : float
+        Minimum weight of micro clusters to be used for reclustering and predictions. Default: 0.
+    p_auto_r : bool
+        If True, the radius is adapted automatically. Default: False.
+    p_auto_merge : bool
+        If True, close micro clusters are merged on cleanups. Default: True.
+    p_sigma : float
+        Parameter of the automated adaption of the radius. Default: 1.
+    p_text_key : str
+        Key of the token counts or texts in the keyword arguments of the instances. Default: None
+        (C_TEXT_KEY).
+    p_vectorizer : base.Transformer
+        Instantiated River transformer that converts texts into token counts. Default: None
+        (BagOfWords with default parameters).
+    p_n_features : int
+        Number of hashed feature ids. If None, the tokens are passed to TextClust unchanged.
+        Default: C_N_FEATURES.
+    p_seed : int
+        Seed of the feature hashing. Default: None.
+    p_kwargs : dict
+        Further optional named parameters.
+
+    """
+
+    C_TYPE                  = 'River Cluster Analyzer TextClust'
+
+    C_CLUSTER_PROPERTIES    = [ cprop_size ]
+
+    C_TEXT_KEY              = 'text'
+    C_N_FEATURES            = 2 ** 18
+
+    C_WORKER_SUPPORTED      = False
+
+    C_CHECKPOINT_ATTRIBUTES = WrClusterAnalyzerRiver2MLPro.C_CHECKPOINT_ATTRIBUTES + [ '_hasher', '_vectorizer' ]
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_name : str = None,
+                  p_range_max = MLTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  p_radius : float = 0.3,
+                  p_fading_factor : float = 0.0005,
+                  p_tgap : int = 100,
+                  p_term_fading : bool = True,
+                  p_real_time_fading : bool = False,
+                  p_num_macro : int = 3,
+                  p_min_weight : float = 0,
+                  p_auto_r : bool = False,
+                  p_auto_merge : bool = True,
+                  p_sigma : float = 1,
+                  p_text_key : str = None,
+                  p_vectorizer : base.Transformer = None,
+                  p_n_features : int = C_N_FEATURES,
+                  p_seed : int = None,
+                  **p_kwargs ):
+
+        alg = cluster.TextClust( radius = p_radius,
+                                 fading_factor = p_fading_factor,
+                                 tgap = p_tgap,
+                                 term_fading = p_term_fading,
+                                 real_time_fading = p_real_time_fading,
+                                 num_macro = p_num_macro,
+                                 min_weight = p_min_weight,
+                                 auto_r = p_auto_r,
+                                 auto_merge = p_auto_merge,
+                                 sigma = p_sigma )
+
+        self._real_time_fading = p_real_time_fading
+        self._text_key         = self.C_TEXT_KEY if p_text_key is None else p_text_key
+        self._vectorizer       = feature_extraction.BagOfWords() if p_vectorizer is None else p_vectorizer
+
+        # Token counts must stay positive, since TextClust drops faded tokens with small counts
+        if p_n_features is None:
+            self._hasher = None
+        else:
+            self._hasher = preprocessing.FeatureHasher( n_features = p_n_features,
+                                                        seed = p_seed,
+                                                        alternate_sign = False )
+
+        super().__init__( p_cls_cluster = Cluster,
+                          p_river_algo = alg,
+                          p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = p_ada,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_river_input(self, p_instance : Instance, p_learn : bool = False) -> dict:
+        """
+        Returns the sparse token counts of the given instance with hashed feature ids. See class
+        description.
+
+        Parameters
+        ----------
+        p_instance : Instance
+            Instance to be converted.
+        p_learn : bool
+            Not relevant for TextClust. Default: False.
+
+        Returns
+        -------
+        dict
+            Token counts in River format.
+        """
+
+        tokens = p_instance.kwargs.get(self._text_key)
+
+        if tokens is None:
+            values  = self.C_INPUT_CACHE.get_values(p_instance)
+            nonzero = np.flatnonzero(values)
+            tokens  = dict(zip(( nonzero + 1 ).tolist(), values[nonzero].tolist()))
+        elif isinstance(tokens, str):
+            tokens  = self._vectorizer.transform_one(tokens)
+
+        if self._hasher is None: return tokens
+        return self._hasher.transform_one(tokens)
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _get_time(p_instance : Instance) -> float:
+        """
+        Returns the time stamp of the given instance in seconds for the real-time fading.
+        """
+
+        tstamp = p_instance.tstamp
+        if isinstance(tstamp, datetime): return tstamp.timestamp()
+        if isinstance(tstamp, timedelta): return tstamp.total_seconds()
+        return tstamp
+
+
+## -------------------------------------------------------------------------------------------------
+    def _adapt(self, p_instance_new : Instance) -> bool:
+        """
+        This method is to adapt the micro clusters according to the incoming instances.
+
+        Parameters
+        ----------
+        p_instance_new : Instance
+            New stream instances to be processed.
+
+        Returns
+        -------
+        bool
+            True, if something has been adapted. False otherwise.
+        """
+
+        input_data = self._get_river_input(p_instance_new, p_learn=True)
+
+        self.log(self.C_LOG_TYPE_I, 'Cluster is adapted...')
+        if self._real_time_fading:
+            self._river_algo.learn_one(input_data, t=self._get_time(p_instance_new))
+        else:
+            self._river_algo.learn_one(input_data)
+
+        self._get_clusters()
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_clusters(self):
+        """
+        This method synchronizes the MLPro clusters with the micro clusters of TextClust.
+
+        Returns
+        -------
+        dict_of_clusters : dict[Cluster]
+            Current list of clusters.
+
+        """
+
+        micro_clusters = self._river_algo.micro_clusters
+
+        for cluster_id in [ x for x in self._clusters.keys() if x not in micro_clusters ]:
+            self._remove_cluster(self._clusters[cluster_id])
+
+        for cluster_id, micro_cluster in micro_clusters.items():
+            try:
+                related_cluster = self._clusters[cluster_id]
+            except KeyError:
+                related_cluster = self._cls_cluster( p_id = cluster_id,
+                                                     p_properties = self.C_CLUSTER_PROPERTIES,
+                                                     p_visualize = self.get_visualization() )
+                self._add_cluster( p_cluster = related_cluster )
+
+            if related_cluster.size.value != micro_cluster.n: related_cluster.size.value = micro_cluster.n
+
+        return self._clusters
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_feature_ids(self, p_tokens : list) -> list:
+        """
+        Maps tokens to the feature ids of the micro clusters, e.g. to look up known tokens in the
+        results of method get_top_terms(). Without feature hashing, the tokens are returned
+        unchanged.
+
+        Parameters
+        ----------
+        p_tokens : list
+            Tokens to be mapped.
+
+        Returns
+        -------
+        list
+            Feature ids related to the tokens.
+        """
+
+        if self._hasher is None: return list(p_tokens)
+        return [ next(iter(self._hasher.transform_one({ token : 1 }))) for token in p_tokens ]
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_top_terms(self, p_cluster_id : int, p_num : int = 10) -> list:
+        """
+        Returns the tokens with the highest (faded) counts of a micro cluster. With feature hashing,
+        the tokens are given by their hashed feature ids.
+
+        Parameters
+        ----------
+        p_cluster_id : int
+            Id of the cluster.
+        p_num : int
+            Maximum number of tokens. Default: 10.
+
+        Returns
+        -------
+        list
+            Tuples (token, count) in descending order of the counts.
+        """
+
+        terms = self._river_algo.micro_clusters[p_cluster_id].tf
+        top   = sorted(terms.items(), key=lambda x: x[1]['tf'], reverse=True)[:p_num]
+        return [ ( token, tf['tf'] ) for token, tf in top ]
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_cluster_memberships( self,
+                                 p_instance : Instance,
+                                 p_scope : int = ClusterAnalyzer.C_RESULT_SCOPE_MAX ) -> List[Tuple[str, float, Cluster]]:
+        """
+        Determines the micro cluster of the given instance by the cosine distance of the TF-IDF
+        vectors.
+
+        Parameters
+        ----------
+        p_instance : Instance
+            Instance to be evaluated.
+        p_scope : int
+            Scope of the result list. See class attributes C_RESULT_SCOPE_* for possible values.
+            Default value is C_RESULT_SCOPE_MAX.
+
+        Returns
+        -------
+        membership : List[Tuple[str, float, Cluster]]
+            List of membership tuples for each cluster. A tuple consists of a cluster id, a
+            relative membership value in percent and a reference to the cluster.
+        """
+
+        cluster_id = self._river_algo.predict_one(self._get_river_input(p_instance))
+
+        # Faded micro clusters may have been removed by the prediction
+        self._get_clusters()
+
+        if cluster_id not in self._clusters: return []
+
+        if p_scope != ClusterAnalyzer.C_RESULT_SCOPE_ALL:
+            cluster = self._clusters[cluster_id]
+            return [ ( cluster.id, 1, cluster ) ]
+
+        return [ ( cluster.id, 1 if x == cluster_id else 0, cluster ) for x, cluster in self._clusters.items() ]
@@ -0,0 +1,666 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.clusteranalyzers
+## -- Module  : worker.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -- 2026-10-19  1.0.1     DA       Class ClusterWorker: worker process and shared memory are 
+## --                                released by a finalizer if the handle is abandoned
+## -- 2026-10-19  1.1.0     DA       New mixin class Offloadable separated from module basics
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-19)
+
+This module provides the infrastructure to run a River clusterer in a separate worker process. The
+instances are shipped to the worker in batches through a ring buffer in shared memory. The worker
+publishes the current cluster centers and sizes through a matrix in shared memory. Only small
+control messages are sent through a queue. The mixin class Offloadable runs the River model of a
+cluster analyzer wrapper in such a worker process.
+
+"""
+
+
+import pickle
+import queue
+import weakref
+import multiprocessing as mp
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from mlpro.bf.exceptions import ParamError, Error
+from mlpro.bf.streams import Instance
+from river import base
+
+
+
+# Export list for public API
+__all__ = [ 'SharedRingBuffer',
+            'SharedClusterMatrix',
+            'ClusterWorker',
+            'Offloadable' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class SharedRingBuffer:
+    """
+    Ring buffer of batches of feature vectors in shared memory for a single producer and a single
+    consumer process. The producer blocks if all slots are occupied.
+
+    Parameters
+    ----------
+    p_num_slots : int
+        Number of batch slots.
+    p_batch_size : int
+        Maximum number of feature vectors per batch.
+    p_num_dim : int
+        Number of features.
+    p_context
+        Multiprocessing context. Default: None (default context).
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_num_slots : int,
+                  p_batch_size : int,
+                  p_num_dim : int,
+                  p_context = None ):
+
+        context         = mp.get_context() if p_context is None else p_context
+        self._shape     = (p_num_slots, p_batch_size, p_num_dim)
+        self._shm       = SharedMemory(create=True, size=int(np.prod(self._shape)) * 8)
+        self._data      = np.ndarray(self._shape, dtype=np.float64, buffer=self._shm.buf)
+        self._free      = context.Semaphore(p_num_slots)
+        self._filled    = context.Queue()
+        self._next_slot = 0
+        self._slot      = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_data']
+        return state
+
+
+## -------------------------------------------------------------------------------------------------
+    def __setstate__(self, p_state):
+        self.__dict__.update(p_state)
+        self._data = np.ndarray(self._shape, dtype=np.float64, buffer=self._shm.buf)
+
+
+## -------------------------------------------------------------------------------------------------
+    def put(self, p_batch : np.ndarray, p_timeout : float = None) -> bool:
+        """
+        Producer: copies a batch into the next free slot and passes it to the consumer.
+
+        Parameters
+        ----------
+        p_batch : np.ndarray
+            Batch of feature vectors. Shape (n, d) with n <= p_batch_size.
+        p_timeout : float
+            Optional maximum time in seconds to wait for a free slot. Default: None (no limit).
+
+        Returns
+        -------
+        bool
+            True, if the batch has been passed. False, if the timeout has expired.
+        """
+
+        if not self._free.acquire(timeout=p_timeout): return False
+        slot                            = self._next_slot
+        self._next_slot                 = ( slot + 1 ) % self._shape[0]
+        self._data[slot, :len(p_batch)] = p_batch
+        self._filled.put((slot, len(p_batch)))
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def get(self) -> np.ndarray:
+        """
+        Consumer: waits for the next batch. The returned array is a view on the shared memory that
+        stays valid until method release() is called.
+
+        Returns
+        -------
+        np.ndarray
+            Batch of feature vectors. Shape (n, d). None, if the producer has closed the buffer.
+        """
+
+        msg = self._filled.get()
+        if msg is None: return None
+        self._slot = msg[0]
+        return self._data[msg[0], :msg[1]]
+
+
+## -------------------------------------------------------------------------------------------------
+    def release(self):
+        """
+        Consumer: releases the slot of the last batch.
+        """
+
+        self._slot = None
+        self._free.release()
+
+
+## -------------------------------------------------------------------------------------------------
+    def close(self):
+        """
+        Producer: signals the consumer that no further batches will follow.
+        """
+
+        self._filled.put(None)
+
+
+## -------------------------------------------------------------------------------------------------
+    def unlink(self):
+        """
+        Frees the shared memory. To be called by the creator after the consumer has finished.
+        """
+
+        self._data = None
+        self._shm.close()
+        self._shm.unlink()
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class SharedClusterMatrix:
+    """
+    Cluster keys, sizes and centers in shared memory, published by a worker process and read by
+    the main process. Each publication increments a version number, so that readers can detect
+    changes without locking.
+
+    Parameters
+    ----------
+    p_max_clusters : int
+        Maximum number of clusters.
+    p_num_dim : int
+        Number of features.
+    p_context
+        Multiprocessing context. Default: None (default context).
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_max_clusters : int,
+                  p_num_dim : int,
+                  p_context = None ):
+
+        context          = mp.get_context() if p_context is None else p_context
+        self._max        = p_max_clusters
+        self._num_dim    = p_num_dim
+        self._shm        = SharedMemory(create=True, size=( 2 + p_max_clusters * ( 2 + p_num_dim ) ) * 8)
+        self._lock       = context.Lock()
+        self._setup_views()
+        self._header[:]  = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _setup_views(self):
+        buf           = self._shm.buf
+        k             = self._max
+        self._header  = np.ndarray((2,), dtype=np.int64, buffer=buf)
+        self._keys    = np.ndarray((k,), dtype=np.int64, buffer=buf, offset=16)
+        self._sizes   = np.ndarray((k,), dtype=np.int64, buffer=buf, offset=16 + k * 8)
+        self._centers = np.ndarray((k, self._num_dim), dtype=np.float64, buffer=buf, offset=16 + k * 16)
+
+
+## -------------------------------------------------------------------------------------------------
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for view in [ '_header', '_keys', '_sizes', '_centers' ]: del state[view]
+        return state
+
+
+## -------------------------------------------------------------------------------------------------
+    def __setstate__(self, p_state):
+        self.__dict__.update(p_state)
+        self._setup_views()
+
+
+## -------------------------------------------------------------------------------------------------
+    def publish( self,
+                 p_keys : np.ndarray,
+                 p_centers : np.ndarray,
+                 p_sizes : np.ndarray ):
+        """
+        Writer: publishes new clusters. Clusters beyond the maximum number are ignored.
+
+        Parameters
+        ----------
+        p_keys : np.ndarray
+            Cluster keys. Shape (k,).
+        p_centers : np.ndarray
+            Cluster centers. Shape (k, d).
+        p_sizes : np.ndarray
+            Cluster sizes. Shape (k,).
+        """
+
+        num = min(len(p_keys), self._max)
+
+        with self._lock:
+            self._keys[:num]    = p_keys[:num]
+            self._sizes[:num]   = p_sizes[:num]
+            self._centers[:num] = p_centers[:num]
+            self._header[1]     = num
+            self._header[0]    += 1
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_version(self) -> int:
+        """
+        Returns the version of the latest publication without locking.
+        """
+
+        return int(self._header[0])
+
+
+## -------------------------------------------------------------------------------------------------
+    def read(self):
+        """
+        Reader: copies the latest publication.
+
+        Returns
+        -------
+        version : int
+            Version of the publication.
+        keys : np.ndarray
+            Cluster keys. Shape (k,).
+        centers : np.ndarray
+            Cluster centers. Shape (k, d).
+        sizes : np.ndarray
+            Cluster sizes. Shape (k,).
+        """
+
+        with self._lock:
+            num = int(self._header[1])
+            return int(self._header[0]), self._keys[:num].copy(), self._centers[:num].copy(), self._sizes[:num].copy()
+
+
+## -------------------------------------------------------------------------------------------------
+    def unlink(self):
+        """
+        Frees the shared memory. To be called by the creator after the writer has finished.
+        """
+
+        self._header = self._keys = self._sizes = self._centers = None
+        self._shm.close()
+        self._shm.unlink()
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def _run_cluster_worker( p_model : bytes,
+                         p_sizes : dict,
+                         p_buffer : SharedRingBuffer,
+                         p_matrix : SharedClusterMatrix,
+                         p_results ):
+    """
+    Main function of a worker process. Learns all batches of the ring buffer with the River
+    clusterer, counts the instances per predicted cluster and publishes the clusters after each
+    batch. When the buffer is closed, the River clusterer and the sizes are returned through the
+    result queue. An exception is returned instead, if the learning fails.
+    """
+
+    try:
+        model = pickle.loads(p_model)
+        sizes = dict(p_sizes)
+
+        while True:
+            batch = p_buffer.get()
+            if batch is None: break
+
+            for values in batch.tolist():
+                x = dict(enumerate(values, 1))
+                model.learn_one(x)
+                if len(model.centers) > 0:
+                    label        = model.predict_one(x)
+                    sizes[label] = sizes.get(label, 0) + 1
+
+            p_buffer.release()
+
+            centers = model.centers
+            keys    = list(centers.keys())
+            if len(keys) == 0: continue
+
+            p_matrix.publish( p_keys = np.array(keys, dtype=np.int64),
+                              p_centers = np.array([ list(centers[k].values()) for k in keys ], dtype=np.float64),
+                              p_sizes = np.array([ sizes.get(k, 0) for k in keys ], dtype=np.int64) )
+
+        result = (model, sizes)
+
+    except Exception as e:
+        result = e
+
+    p_results.put(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class ClusterWorker:
+    """
+    Handle of a worker process that runs a River clusterer. The River clusterer is copied into the
+    worker process on start and returned on stop. In between, instances are added in the main
+    process and the clusters published by the worker can be polled without blocking. If the handle
+    is garbage collected or the interpreter exits without a call of method stop(), the worker process
+    is terminated and the shared memory is freed.
+
+    Parameters
+    ----------
+    p_river_algo : base.Clusterer
+        River clusterer to be run in the worker process. The clusterer needs to provide its cluster
+        centers as attribute centers.
+    p_num_dim : int
+        Number of features.
+    p_batch_size : int
+        Number of instances per batch that is shipped to the worker.
+    p_num_slots : int
+        Number of batch slots of the ring buffer. Default: 4.
+    p_max_clusters : int
+        Maximum number of clusters that can be published. Default: 100.
+    p_sizes : dict
+        Optional initial cluster sizes by cluster keys. Default: None.
+    """
+
+    C_TIMEOUT       = 1.0
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_river_algo : base.Clusterer,
+                  p_num_dim : int,
+                  p_batch_size : int,
+                  p_num_slots : int = 4,
+                  p_max_clusters : int = 100,
+                  p_sizes : dict = None ):
+
+        context         = mp.get_context()
+        self._buffer    = SharedRingBuffer( p_num_slots = p_num_slots,
+                                            p_batch_size = p_batch_size,
+                                            p_num_dim = p_num_dim,
+                                            p_context = context )
+        self._matrix    = SharedClusterMatrix( p_max_clusters = p_max_clusters,
+                                               p_num_dim = p_num_dim,
+                                               p_context = context )
+        self._results   = context.Queue()
+        self._batch     = np.empty((p_batch_size, p_num_dim), dtype=np.float64)
+        self._batch_len = 0
+        self._version   = 0
+
+        self._process   = context.Process( target = _run_cluster_worker,
+                                           args = ( pickle.dumps(p_river_algo, protocol=pickle.HIGHEST_PROTOCOL),
+                                                    {} if p_sizes is None else p_sizes,
+                                                    self._buffer,
+                                                    self._matrix,
+                                                    self._results ),
+                                           daemon = True )
+        self._process.start()
+
+        self._finalizer = weakref.finalize( self, 
+                                            _release_cluster_worker, 
+                                            self._process, 
+                                            self._buffer, 
+                                            self._matrix )
+
+
+## -------------------------------------------------------------------------------------------------
+    def add(self, p_values : np.ndarray):
+        """
+        Adds the feature vector of an instance. Full batches are shipped to the worker.
+
+        Parameters
+        ----------
+        p_values : np.ndarray
+            Feature vector. Shape (d,).
+        """
+
+        self._batch[self._batch_len] = p_values
+        self._batch_len += 1
+        if self._batch_len == self._batch.shape[0]: self.flush()
+
+
+## -------------------------------------------------------------------------------------------------
+    def flush(self):
+        """
+        Ships a partially filled batch to the worker.
+        """
+
+        if self._batch_len == 0: return
+
+        while not self._buffer.put(self._batch[:self._batch_len], p_timeout=self.C_TIMEOUT):
+            if not self._process.is_alive(): self._raise_worker_error()
+
+        self._batch_len = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_result(self):
+        """
+        Waits for the result of the worker process. See function _run_cluster_worker().
+        """
+
+        while True:
+            try:
+                result = pickle.loads(self._results.get(timeout=self.C_TIMEOUT))
+                break
+            except queue.Empty:
+                if not self._process.is_alive(): raise Error('Worker process terminated unexpectedly')
+
+        if isinstance(result, Exception): raise Error('Worker process failed: ' + repr(result)) from result
+        return result
+
+
+## -------------------------------------------------------------------------------------------------
+    def _raise_worker_error(self):
+        """
+        Raises an error with the reason why the worker process has stopped.
+        """
+
+        self._get_result()
+        raise Error('Worker process terminated unexpectedly')
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_clusters(self):
+        """
+        Polls the clusters published by the worker.
+
+        Returns
+        -------
+        tuple
+            Tuple of cluster keys, centers and sizes (see SharedClusterMatrix.read()) or None, if
+            nothing has been published since the last call.
+        """
+
+        if self._matrix.get_version() == self._version: return None
+
+        self._version, keys, centers, sizes = self._matrix.read()
+        return keys, centers, sizes
+
+
+## -------------------------------------------------------------------------------------------------
+    def stop(self):
+        """
+        Ships the pending instances, waits until the worker has processed them and stops it. The
+        shared memory is freed.
+
+        Returns
+        -------
+        river_algo : base.Clusterer
+            The River clusterer as trained by the worker.
+        clusters : tuple
+            Final cluster keys, centers and sizes.
+        """
+
+        self.flush()
+        self._buffer.close()
+        river_algo, _ = self._get_result()
+        self._process.join()
+
+        _, keys, centers, sizes = self._matrix.read()
+        self._finalizer.detach()
+        self._buffer.unlink()
+        self._matrix.unlink()
+
+        return river_algo, (keys, centers, sizes)
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def _release_cluster_worker( p_process, 
+                             p_buffer : SharedRingBuffer, 
+                             p_matrix : SharedClusterMatrix ):
+    """
+    Finalizer of an abandoned ClusterWorker. Terminates the worker process, if it is still running,
+    and frees the shared memory.
+    """
+
+    if p_process.is_alive():
+        p_process.terminate()
+        p_process.join(timeout=ClusterWorker.C_TIMEOUT)
+
+    p_buffer.unlink()
+    p_matrix.unlink()
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class Offloadable:
+    """
+    Mixin for the River cluster analyzer wrappers that runs the River model in a worker process
+    (see class ClusterWorker). See class WrClusterAnalyzerRiver2MLPro for the attributes and 
+    methods required by the mixin.
+
+    Parameters
+    ----------
+    p_worker_batch_size : int
+        If greater than 0, the River model is run in a worker process that gets the instances in
+        batches of this size. Default: 0 (River model runs in the calling thread).
+    p_worker_max_clusters : int
+        Maximum number of clusters that a worker process can publish. Default: 100.
+    """
+
+    C_WORKER_SUPPORTED      = True
+    C_WORKER_NUM_SLOTS      = 4
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self, 
+                  p_worker_batch_size : int = 0, 
+                  p_worker_max_clusters : int = 100 ):
+
+        if p_worker_batch_size < 0: raise ParamError('Parameter p_worker_batch_size must not be negative')
+        if ( p_worker_batch_size > 0 ) and not self.C_WORKER_SUPPORTED:
+            raise ParamError(type(self).__name__ + ' can not be run in a worker process')
+        
+        self._worker                = None
+        self._worker_batch_size     = p_worker_batch_size
+        self._worker_max_clusters   = p_worker_max_clusters
+
+
+## -------------------------------------------------------------------------------------------------
+    def _adapt_worker(self, p_instance_new : Instance) -> bool:
+        """
+        Adaptation in a worker process. The instance is passed to the worker, which is started on 
+        the first instance with a copy of the current River model. The MLPro clusters are then 
+        synchronized with the clusters published by the worker, if any.
+
+        Parameters
+        ----------
+        p_instance_new : Instance
+            New stream instances to be processed.
+
+        Returns
+        -------
+        bool
+            True, if the MLPro clusters have been synchronized. False otherwise.
+        """
+
+        feature_data = self._get_input_values(p_instance_new, p_learn=True)
+
+        if self._worker is None:
+            self.log(self.C_LOG_TYPE_I, 'Starting worker process...')
+            sizes        = { x : cluster.size.value for x, cluster in self._clusters.items() if cluster.size.value is not None }
+            self._worker = ClusterWorker( p_river_algo = self._river_algo,
+                                          p_num_dim = feature_data.shape[0],
+                                          p_batch_size = self._worker_batch_size,
+                                          p_num_slots = self.C_WORKER_NUM_SLOTS,
+                                          p_max_clusters = self._worker_max_clusters,
+                                          p_sizes = sizes )
+
+        self._worker.add(feature_data)
+
+        clusters = self._worker.get_clusters()
+        if clusters is None: return False
+
+        self._sync_worker_clusters(*clusters)
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _sync_worker_clusters( self, 
+                               p_keys : np.ndarray, 
+                               p_centers : np.ndarray, 
+                               p_sizes : np.ndarray ):
+        """
+        Takes over the clusters published by the worker process into the MLPro clusters.
+
+        Parameters
+        ----------
+        p_keys : np.ndarray
+            Cluster keys. Shape (k,).
+        p_centers : np.ndarray
+            Cluster centers. Shape (k, d).
+        p_sizes : np.ndarray
+            Cluster sizes. Shape (k,).
+        """
+
+        keys = p_keys.tolist()
+
+        for x, center, size in zip(keys, p_centers, p_sizes.tolist()):
+            try:
+                related_cluster = self._clusters[x]
+            except KeyError:
+                related_cluster = self._cls_cluster(p_id=x, p_properties=self.C_CLUSTER_PROPERTIES, p_visualize=self.get_visualization())
+                self._add_cluster( p_cluster = related_cluster )
+
+            related_cluster.centroid.value = center
+            if size > 0: related_cluster.size.value = size
+
+        for x in set(self._clusters.keys()).difference(keys):
+            self._remove_cluster(self._clusters[x])
+
+
+## -------------------------------------------------------------------------------------------------
+    def stop_worker(self):
+        """
+        Stops the worker process after all pending instances have been processed. The River model 
+        as trained by the worker replaces the River model of this wrapper and the MLPro clusters are
+        synchronized. Afterwards, methods like get_cluster_memberships() or save_checkpoint() refer 
+        to the trained model. A new worker process is started on the next adaptation.
+        """
+
+        if self._worker is None: return
+
+        self._river_algo, clusters = self._worker.stop()
+        self._worker               = None
+        self._sync_worker_clusters(*clusters)
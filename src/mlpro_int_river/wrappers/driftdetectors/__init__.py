@@ -0,0 +1,5 @@
+from .basics import *
+from .adwin import *
+from .ddm import *
+from .kswin import *
+from .pagehinkley import *
@@ -0,0 +1,113 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.driftdetectors
+## -- Module  : adwin.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module provides a wrapper class for the drift detector ADWIN by River.
+
+Learn more:
+https://www.riverml.xyz/
+
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro.oa.streams import OAStreamTask
+from mlpro_int_river.wrappers.driftdetectors.basics import WrDriftDetectorRiver2MLPro
+
+from river import drift
+
+
+
+# Export list for public API
+__all__ = [ 'WrRiverADWIN2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrRiverADWIN2MLPro (WrDriftDetectorRiver2MLPro):
+    """
+    This is the wrapper class for the drift detector ADWIN.
+
+    According to https://riverml.xyz/latest/api/drift/ADWIN/ :
+    ADWIN (ADaptive WINdowing) is a popular drift detection method with mathematical guarantees.
+    ADWIN efficiently keeps a variable-length window of recent items, such that it holds that there
+    has not been any change in the data distribution.
+
+    Parameters
+    ----------
+    p_delta : float
+        Significance value. Default: 0.002.
+    p_clock : int
+        How often ADWIN should check for changes. 1 means every new data point. Default: 32.
+    p_max_buckets : int
+        The maximum number of buckets of each size that ADWIN should keep. Default: 5.
+    p_min_window_length : int
+        The minimum length of each subwindow. Default: 5.
+    p_grace_period : int
+        ADWIN does not perform any change detection until at least this many data points have
+        arrived. Default: 10.
+    p_name : str
+        Name of the drift detector. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default: False.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_drift_buffer_size : int
+        Size of the internal drift buffer self.drifts. Default: 100.
+    p_thrs_inst : int
+        The algorithm is only executed after this number of instances. Default: 0.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE          = 'River Drift Detector ADWIN'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_delta : float = 0.002,
+                  p_clock : int = 32,
+                  p_max_buckets : int = 5,
+                  p_min_window_length : int = 5,
+                  p_grace_period : int = 10,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  p_drift_buffer_size : int = 100,
+                  p_thrs_inst : int = 0,
+                  **p_kwargs ):
+
+        super().__init__( p_river_algo = drift.ADWIN( delta = p_delta,
+                                                      clock = p_clock,
+                                                      max_buckets = p_max_buckets,
+                                                      min_window_length = p_min_window_length,
+                                                      grace_period = p_grace_period ),
+                          p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = p_ada,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          p_drift_buffer_size = p_drift_buffer_size,
+                          p_thrs_inst = p_thrs_inst,
+                          **p_kwargs )
@@ -0,0 +1,204 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.driftdetectors
+## -- Module  : basics.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module provides the wrapper root class from River to MLPro for drift detectors.
+
+Learn more:
+https://www.riverml.xyz/
+
+"""
+
+
+import numpy as np
+
+from mlpro.bf.streams import Instance
+from mlpro.bf.various import Log
+from mlpro.oa.streams import OAStreamTask
+from mlpro.oa.streams.tasks.changedetectors.driftdetectors.instancebased import DriftDetectorIB
+from mlpro.oa.streams.tasks.changedetectors.driftdetectors.drifts.instancebased.basics import DriftIB
+from mlpro_int_river.wrappers import WrapperRiver
+
+from river import base
+
+
+
+# Export list for public API
+__all__ = [ 'WrDriftDetectorRiver2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrDriftDetectorRiver2MLPro (WrapperRiver, DriftDetectorIB):
+    """
+    This is the base wrapper class for each River-based drift detector to MLPro. River's drift
+    detectors monitor a single univariate stream. Therefore, the given River drift detector is
+    cloned for each feature of the incoming instances on the first instance. All feature detectors
+    are updated with the feature vector of an instance in one call (see method update()), and a
+    drift event is raised for each feature with a detected drift. The index of the feature in the
+    feature vector is available in attribute feature of the drift.
+
+    Binary River drift detectors like DDM are fed with the truth value of each feature, i.e. the
+    features are expected to be 0/1 error indicators.
+
+    Parameters
+    ----------
+    p_river_algo : base.DriftDetector | base.BinaryDriftDetector
+        Instantiated River drift detector that serves as template for all features.
+    p_name : str
+        Name of the drift detector. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default: False.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_drift_buffer_size : int
+        Size of the internal drift buffer self.drifts. Default: 100.
+    p_thrs_inst : int
+        The algorithm is only executed after this number of instances. Default: 0.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE          = 'River Drift Detector'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_river_algo,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  p_drift_buffer_size : int = 100,
+                  p_thrs_inst : int = 0,
+                  **p_kwargs ):
+
+        self._river_algo = p_river_algo
+        self._binary     = isinstance(p_river_algo, base.BinaryDriftDetector)
+        self._detectors  = None
+
+        DriftDetectorIB.__init__( self,
+                                  p_name = p_name,
+                                  p_range_max = p_range_max,
+                                  p_ada = p_ada,
+                                  p_duplicate_data = p_duplicate_data,
+                                  p_visualize = p_visualize,
+                                  p_logging = p_logging,
+                                  p_drift_buffer_size = p_drift_buffer_size,
+                                  p_thrs_inst = p_thrs_inst,
+                                  **p_kwargs )
+
+        WrapperRiver.__init__(self, p_logging=p_logging)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _setup_detectors(self, p_num_features : int):
+        """
+        Sets up one drift detector per feature. This default implementation clones the River
+        drift detector. Child classes may replace the detectors by a vectorized implementation.
+
+        Parameters
+        ----------
+        p_num_features : int
+            Number of features.
+        """
+
+        self._detectors = [ self._river_algo.clone() for _ in range(p_num_features) ]
+
+
+## -------------------------------------------------------------------------------------------------
+    def update(self, p_values : np.ndarray) -> np.ndarray:
+        """
+        Updates the drift detectors of all features with a feature vector.
+
+        Parameters
+        ----------
+        p_values : np.ndarray
+            Feature vector. Shape (d,).
+
+        Returns
+        -------
+        np.ndarray
+            Indices of the features with a detected drift.
+        """
+
+        if self._detectors is None: self._setup_detectors(p_values.shape[0])
+
+        if self._binary: values = ( p_values != 0 ).tolist()
+        else: values = p_values.tolist()
+
+        drifts = []
+        for feature, (detector, value) in enumerate(zip(self._detectors, values)):
+            detector.update(value)
+            if detector.drift_detected: drifts.append(feature)
+
+        return np.asarray(drifts, dtype=np.int64)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _detect(self, p_instance : Instance, **p_kwargs):
+        """
+        Updates the drift detectors of all features with the given instance and raises a drift
+        event for each feature with a detected drift.
+
+        Parameters
+        ----------
+        p_instance : Instance
+            Instance that triggered the detection.
+        **p_kwargs
+            Optional keyword arguments (originally provided to the constructor).
+        """
+
+        if not self._adaptivity: return
+
+        for feature in self.update(self.C_INPUT_CACHE.get_values(p_instance)).tolist():
+            drift         = DriftIB( p_instances = [p_instance],
+                                     p_visualize = self.get_visualization(),
+                                     p_raising_object = self,
+                                     p_tstamp = p_instance.tstamp )
+            drift.feature = feature
+            self._raise_drift_event(p_drift=drift, p_instance=p_instance)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_algorithm(self):
+        """
+        This method returns the wrapped River drift detector, which serves as template for all
+        features.
+
+        Returns
+        -------
+        base.DriftDetector | base.BinaryDriftDetector
+            The wrapped River drift detector.
+        """
+
+        return self._river_algo
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_detectors(self):
+        """
+        This method returns the drift detectors of all features. It returns None before the first
+        instance.
+        """
+
+        return self._detectors
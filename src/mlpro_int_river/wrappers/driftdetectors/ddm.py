@@ -0,0 +1,238 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.driftdetectors
+## -- Module  : ddm.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -- 2026-10-19  1.1.0     DA       New class DDMNumPy as NumPy engine of WrRiverDDM2MLPro
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-19)
+
+This module provides a wrapper class for the drift detector DDM by River and a NumPy-native
+implementation of it for many features.
+
+Learn more:
+https://www.riverml.xyz/
+
+"""
+
+
+import numpy as np
+
+from mlpro.bf.exceptions import ParamError
+from mlpro.bf.various import Log
+from mlpro.oa.streams import OAStreamTask
+from mlpro_int_river.wrappers.driftdetectors.basics import WrDriftDetectorRiver2MLPro
+
+from river import drift
+
+
+
+# Export list for public API
+__all__ = [ 'DDMNumPy',
+            'WrRiverDDM2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class DDMNumPy:
+    """
+    NumPy-native implementation of River's DDM for d binary features at once. The state of all
+    features (number of samples, error rate and the minimum error rate and standard deviation) is
+    kept in arrays of shape (d,) and updated with a feature vector in one vectorized step with the
+    same arithmetic as River. Hence, the drifts and warnings are the same as those of d River
+    detectors. Only features with a detected drift need further treatment by the caller.
+
+    Parameters
+    ----------
+    p_num_features : int
+        Number of features.
+    p_warm_start : int
+        The minimum required number of analyzed samples so change can be detected. Default: 30.
+    p_warning_threshold : float
+        Threshold to decide if the detector is in a warning zone. Default: 2.0.
+    p_drift_threshold : float
+        Threshold to decide if a drift was detected. Default: 3.0.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_num_features : int,
+                  p_warm_start : int = 30,
+                  p_warning_threshold : float = 2.0,
+                  p_drift_threshold : float = 3.0 ):
+
+        self.warm_start         = p_warm_start
+        self.warning_threshold  = p_warning_threshold
+        self.drift_threshold    = p_drift_threshold
+
+        self._n                 = np.zeros(p_num_features)
+        self._p                 = np.zeros(p_num_features)
+        self._p_min             = np.zeros(p_num_features)
+        self._s_min             = np.zeros(p_num_features)
+        self._ps_min            = np.full(p_num_features, np.inf)
+        self.drift_detected     = np.zeros(p_num_features, dtype=bool)
+        self.warning_detected   = np.zeros(p_num_features, dtype=bool)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reset(self, p_mask : np.ndarray):
+        self._n[p_mask]                 = 0.0
+        self._p[p_mask]                 = 0.0
+        self._p_min[p_mask]             = 0.0
+        self._s_min[p_mask]             = 0.0
+        self._ps_min[p_mask]            = np.inf
+        self.drift_detected[p_mask]     = False
+        self.warning_detected[p_mask]   = False
+
+
+## -------------------------------------------------------------------------------------------------
+    def update(self, p_values : np.ndarray) -> np.ndarray:
+        """
+        Updates the detectors of all features with a feature vector of 0/1 error indicators. Like
+        in River, the detector of a feature is reset on the update after a detected drift.
+
+        Parameters
+        ----------
+        p_values : np.ndarray
+            Feature vector. Shape (d,). Each non-zero value counts as an error.
+
+        Returns
+        -------
+        np.ndarray
+            Indices of the features with a detected drift.
+        """
+
+        if self.drift_detected.any(): self._reset(self.drift_detected.copy())
+
+        self._n += 1.0
+        self._p += ( 1.0 / self._n ) * ( ( p_values != 0 ) - self._p )
+        s        = np.sqrt( self._p * ( 1 - self._p ) / self._n )
+        ps       = self._p + s
+
+        # Features beyond their warm start
+        active   = self._n > self.warm_start
+
+        new_min  = active & ( ps <= self._ps_min )
+        self._p_min[new_min]  = self._p[new_min]
+        self._s_min[new_min]  = s[new_min]
+        self._ps_min[new_min] = self._p_min[new_min] + self._s_min[new_min]
+
+        np.logical_and(active, ps > self._p_min + self.drift_threshold * self._s_min, out=self.drift_detected)
+        warning  = ( ps > self._p_min + self.warning_threshold * self._s_min ) & ~self.drift_detected
+        self.warning_detected[active] = warning[active]
+
+        return np.flatnonzero(self.drift_detected)
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrRiverDDM2MLPro (WrDriftDetectorRiver2MLPro):
+    """
+    This is the wrapper class for the drift detector DDM.
+
+    According to https://riverml.xyz/latest/api/drift/binary/DDM/ :
+    DDM (Drift Detection Method) is a concept change detection method based on the PAC learning
+    model premise, that the learner's error rate will decrease as the number of analysed samples
+    increase, as long as the data distribution is stationary. The features are expected to be 0/1
+    error indicators, e.g. of an upstream predictor.
+
+    Parameters
+    ----------
+    p_warm_start : int
+        The minimum required number of analyzed samples so change can be detected. Default: 30.
+    p_warning_threshold : float
+        Threshold to decide if the detector is in a warning zone. Default: 2.0.
+    p_drift_threshold : float
+        Threshold to decide if a drift was detected. Default: 3.0.
+    p_engine : str
+        Engine to be used. See constants C_ENGINE_*. The engine C_ENGINE_NUMPY is a NumPy-native
+        re-implementation of River's DDM (see class DDMNumPy) that updates the detectors of all
+        features in one vectorized step with the same drifts as River. Default: C_ENGINE_RIVER.
+    p_name : str
+        Name of the drift detector. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default: False.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_drift_buffer_size : int
+        Size of the internal drift buffer self.drifts. Default: 100.
+    p_thrs_inst : int
+        The algorithm is only executed after this number of instances. Default: 0.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE          = 'River Drift Detector DDM'
+
+    C_ENGINE_RIVER  = 'River'
+    C_ENGINE_NUMPY  = 'NumPy'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_warm_start : int = 30,
+                  p_warning_threshold : float = 2.0,
+                  p_drift_threshold : float = 3.0,
+                  p_engine : str = C_ENGINE_RIVER,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  p_drift_buffer_size : int = 100,
+                  p_thrs_inst : int = 0,
+                  **p_kwargs ):
+
+        if p_engine not in [ self.C_ENGINE_RIVER, self.C_ENGINE_NUMPY ]:
+            raise ParamError('Unknown engine ' + str(p_engine))
+
+        self._engine = p_engine
+
+        super().__init__( p_river_algo = drift.binary.DDM( warm_start = p_warm_start,
+                                                           warning_threshold = p_warning_threshold,
+                                                           drift_threshold = p_drift_threshold ),
+                          p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = p_ada,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          p_drift_buffer_size = p_drift_buffer_size,
+                          p_thrs_inst = p_thrs_inst,
+                          **p_kwargs )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _setup_detectors(self, p_num_features : int):
+
+        if self._engine == self.C_ENGINE_RIVER: return super()._setup_detectors(p_num_features)
+
+        self._detectors = DDMNumPy( p_num_features = p_num_features,
+                                    p_warm_start = self._river_algo.warm_start,
+                                    p_warning_threshold = self._river_algo.warning_threshold,
+                                    p_drift_threshold = self._river_algo.drift_threshold )
+
+
+## -------------------------------------------------------------------------------------------------
+    def update(self, p_values : np.ndarray) -> np.ndarray:
+
+        if self._engine == self.C_ENGINE_RIVER: return super().update(p_values)
+
+        if self._detectors is None: self._setup_detectors(p_values.shape[0])
+        return self._detectors.update(p_values)
@@ -0,0 +1,108 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.driftdetectors
+## -- Module  : kswin.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module provides a wrapper class for the drift detector KSWIN by River.
+
+Learn more:
+https://www.riverml.xyz/
+
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro.oa.streams import OAStreamTask
+from mlpro_int_river.wrappers.driftdetectors.basics import WrDriftDetectorRiver2MLPro
+
+from river import drift
+
+
+
+# Export list for public API
+__all__ = [ 'WrRiverKSWIN2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrRiverKSWIN2MLPro (WrDriftDetectorRiver2MLPro):
+    """
+    This is the wrapper class for the drift detector KSWIN.
+
+    According to https://riverml.xyz/latest/api/drift/KSWIN/ :
+    KSWIN (Kolmogorov-Smirnov Windowing) is a concept change detection method based on the
+    Kolmogorov-Smirnov (KS) statistical test. It keeps a sliding window of fixed size and compares
+    its most recent samples with uniformly drawn samples of the rest of the window.
+
+    Parameters
+    ----------
+    p_alpha : float
+        Probability for the test statistic of the Kolmogorov-Smirnov test. Default: 0.005.
+    p_window_size : int
+        Size of the sliding window. Default: 100.
+    p_stat_size : int
+        Size of the statistic window. Default: 30.
+    p_seed : int
+        Random seed. Default: None.
+    p_name : str
+        Name of the drift detector. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default: False.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_drift_buffer_size : int
+        Size of the internal drift buffer self.drifts. Default: 100.
+    p_thrs_inst : int
+        The algorithm is only executed after this number of instances. Default: 0.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE          = 'River Drift Detector KSWIN'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_alpha : float = 0.005,
+                  p_window_size : int = 100,
+                  p_stat_size : int = 30,
+                  p_seed : int = None,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  p_drift_buffer_size : int = 100,
+                  p_thrs_inst : int = 0,
+                  **p_kwargs ):
+
+        super().__init__( p_river_algo = drift.KSWIN( alpha = p_alpha,
+                                                      window_size = p_window_size,
+                                                      stat_size = p_stat_size,
+                                                      seed = p_seed ),
+                          p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = p_ada,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          p_drift_buffer_size = p_drift_buffer_size,
+                          p_thrs_inst = p_thrs_inst,
+                          **p_kwargs )
@@ -0,0 +1,258 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.driftdetectors
+## -- Module  : pagehinkley.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module provides a wrapper class for the drift detector PageHinkley by River and a NumPy-native
+implementation of it for many features.
+
+Learn more:
+https://www.riverml.xyz/
+
+"""
+
+
+import numpy as np
+
+from mlpro.bf.exceptions import ParamError
+from mlpro.bf.various import Log
+from mlpro.oa.streams import OAStreamTask
+from mlpro_int_river.wrappers.driftdetectors.basics import WrDriftDetectorRiver2MLPro
+
+from river import drift
+
+
+
+# Export list for public API
+__all__ = [ 'PageHinkleyNumPy',
+            'WrRiverPageHinkley2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class PageHinkleyNumPy:
+    """
+    NumPy-native implementation of River's Page-Hinkley test for d features at once. The state of
+    all features is kept in arrays of shape (d,) and updated with a feature vector in one vectorized
+    step with the same arithmetic as River. Hence, the drifts are the same as those of d River
+    detectors. Only features with a detected drift need further treatment by the caller.
+
+    Parameters
+    ----------
+    p_num_features : int
+        Number of features.
+    p_min_instances : int
+        Minimum number of instances before detecting a drift. Default: 30.
+    p_delta : float
+        Delta factor of the Page-Hinkley test. Default: 0.005.
+    p_threshold : float
+        Drift detection threshold (lambda). Default: 50.0.
+    p_alpha : float
+        Forgetting factor. Default: 1 - 0.0001.
+    p_mode : str
+        Whether to consider increases ('up'), decreases ('down') or both ('both'). Default: 'both'.
+    """
+
+    C_MODES     = ( 'up', 'down', 'both' )
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_num_features : int,
+                  p_min_instances : int = 30,
+                  p_delta : float = 0.005,
+                  p_threshold : float = 50.0,
+                  p_alpha : float = 1 - 0.0001,
+                  p_mode : str = 'both' ):
+
+        if p_mode not in self.C_MODES:
+            raise ParamError('Invalid mode ' + str(p_mode) + '. Valid values are ' + str(self.C_MODES))
+
+        self.min_instances  = p_min_instances
+        self.delta          = p_delta
+        self.threshold      = p_threshold
+        self.alpha          = p_alpha
+        self.mode           = p_mode
+
+        self._n             = np.zeros(p_num_features)
+        self._mean          = np.zeros(p_num_features)
+        self._sum_increase  = np.zeros(p_num_features)
+        self._sum_decrease  = np.zeros(p_num_features)
+        self._min_increase  = np.full(p_num_features, np.inf)
+        self._max_decrease  = np.full(p_num_features, -1.0)
+        self.drift_detected = np.zeros(p_num_features, dtype=bool)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reset(self, p_mask : np.ndarray):
+        self._n[p_mask]             = 0.0
+        self._mean[p_mask]          = 0.0
+        self._sum_increase[p_mask]  = 0.0
+        self._sum_decrease[p_mask]  = 0.0
+        self._min_increase[p_mask]  = np.inf
+        self._max_decrease[p_mask]  = -1.0
+        self.drift_detected[p_mask] = False
+
+
+## -------------------------------------------------------------------------------------------------
+    def update(self, p_values : np.ndarray) -> np.ndarray:
+        """
+        Updates the tests of all features with a feature vector. Like in River, the test of a
+        feature is reset on the update after a detected drift.
+
+        Parameters
+        ----------
+        p_values : np.ndarray
+            Feature vector. Shape (d,).
+
+        Returns
+        -------
+        np.ndarray
+            Indices of the features with a detected drift.
+        """
+
+        if self.drift_detected.any(): self._reset(self.drift_detected.copy())
+
+        self._n            += 1.0
+        self._mean         += ( 1.0 / self._n ) * ( p_values - self._mean )
+        dev                 = p_values - self._mean
+        self._sum_increase  = self.alpha * self._sum_increase + dev - self.delta
+        self._sum_decrease  = self.alpha * self._sum_decrease + dev + self.delta
+        np.minimum(self._min_increase, self._sum_increase, out=self._min_increase)
+        np.maximum(self._max_decrease, self._sum_decrease, out=self._max_decrease)
+
+        if self.mode == 'up':
+            test = self._sum_increase - self._min_increase
+        elif self.mode == 'down':
+            test = self._max_decrease - self._sum_decrease
+        else:
+            test = np.maximum(self._sum_increase - self._min_increase, self._max_decrease - self._sum_decrease)
+
+        np.greater(test, self.threshold, out=self.drift_detected)
+        self.drift_detected &= ( self._n >= self.min_instances )
+        return np.flatnonzero(self.drift_detected)
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrRiverPageHinkley2MLPro (WrDriftDetectorRiver2MLPro):
+    """
+    This is the wrapper class for the drift detector PageHinkley.
+
+    According to https://riverml.xyz/latest/api/drift/PageHinkley/ :
+    This change detection method works by computing the observed values and their mean up to the
+    current moment. Page-Hinkley does not signal warning zones, only change detections.
+
+    Parameters
+    ----------
+    p_min_instances : int
+        Minimum number of instances before detecting a drift. Default: 30.
+    p_delta : float
+        Delta factor of the Page-Hinkley test. Default: 0.005.
+    p_threshold : float
+        Drift detection threshold (lambda). Default: 50.0.
+    p_alpha : float
+        Forgetting factor. Default: 1 - 0.0001.
+    p_mode : str
+        Whether to consider increases ('up'), decreases ('down') or both ('both'). Default: 'both'.
+    p_engine : str
+        Engine to be used. See constants C_ENGINE_*. The engine C_ENGINE_NUMPY is a NumPy-native
+        re-implementation of River's PageHinkley (see class PageHinkleyNumPy) that updates the
+        tests of all features in one vectorized step with the same drifts as River.
+        Default: C_ENGINE_RIVER.
+    p_name : str
+        Name of the drift detector. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default: False.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_drift_buffer_size : int
+        Size of the internal drift buffer self.drifts. Default: 100.
+    p_thrs_inst : int
+        The algorithm is only executed after this number of instances. Default: 0.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE          = 'River Drift Detector PageHinkley'
+
+    C_ENGINE_RIVER  = 'River'
+    C_ENGINE_NUMPY  = 'NumPy'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_min_instances : int = 30,
+                  p_delta : float = 0.005,
+                  p_threshold : float = 50.0,
+                  p_alpha : float = 1 - 0.0001,
+                  p_mode : str = 'both',
+                  p_engine : str = C_ENGINE_RIVER,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  p_drift_buffer_size : int = 100,
+                  p_thrs_inst : int = 0,
+                  **p_kwargs ):
+
+        if p_engine not in [ self.C_ENGINE_RIVER, self.C_ENGINE_NUMPY ]:
+            raise ParamError('Unknown engine ' + str(p_engine))
+
+        self._engine = p_engine
+
+        super().__init__( p_river_algo = drift.PageHinkley( min_instances = p_min_instances,
+                                                            delta = p_delta,
+                                                            threshold = p_threshold,
+                                                            alpha = p_alpha,
+                                                            mode = p_mode ),
+                          p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = p_ada,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          p_drift_buffer_size = p_drift_buffer_size,
+                          p_thrs_inst = p_thrs_inst,
+                          **p_kwargs )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _setup_detectors(self, p_num_features : int):
+
+        if self._engine == self.C_ENGINE_RIVER: return super()._setup_detectors(p_num_features)
+
+        self._detectors = PageHinkleyNumPy( p_num_features = p_num_features,
+                                            p_min_instances = self._river_algo.min_instances,
+                                            p_delta = self._river_algo.delta,
+                                            p_threshold = self._river_algo.threshold,
+                                            p_alpha = self._river_algo.alpha,
+                                            p_mode = self._river_algo.mode )
+
+
+## -------------------------------------------------------------------------------------------------
+    def update(self, p_values : np.ndarray) -> np.ndarray:
+
+        if self._engine == self.C_ENGINE_RIVER: return super().update(p_values)
+
+        if self._detectors is None: self._setup_detectors(p_values.shape[0])
+        return self._detectors.update(p_values)
@@ -0,0 +1,5 @@
+from .basics import *
+from .adaptive import *
+from .maxabs import *
+from .minmax import *
+from .standard import *
@@ -0,0 +1,102 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.normalizers
+## -- Module  : adaptive.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module provides a wrapper class for the scaler AdaptiveStandardScaler by River.
+
+Learn more:
+https://www.riverml.xyz/
+
+"""
+
+
+import numpy as np
+
+from mlpro.bf.various import Log
+from mlpro.oa.streams import OAStreamTask
+from mlpro_int_river.wrappers.normalizers.basics import WrNormalizerRiver2MLPro
+
+from river import preprocessing
+
+
+
+# Export list for public API
+__all__ = [ 'WrRiverAdaptiveStandardScaler2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrRiverAdaptiveStandardScaler2MLPro (WrNormalizerRiver2MLPro):
+    """
+    This is the wrapper class for the scaler AdaptiveStandardScaler.
+
+    According to https://riverml.xyz/latest/api/preprocessing/AdaptiveStandardScaler/ :
+    Scales data using exponentially weighted moving average and variance. Under the hood, a
+    exponentially weighted running mean and variance are maintained for each feature. This can
+    potentially provide better results for drifting data in comparison to the StandardScaler.
+
+    Parameters
+    ----------
+    p_fading_factor : float
+        This parameter is passed to stats.EWVar. It is expected to be in [0, 1]. More weight is
+        assigned to recent samples the closer fading_factor is to 1. Default: 0.3.
+    p_name : str
+        Name of the normalizer. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default: False.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE          = 'River Normalizer AdaptiveStandardScaler'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_fading_factor : float = 0.3,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  **p_kwargs ):
+
+        super().__init__( p_river_algo = preprocessing.AdaptiveStandardScaler( fading_factor = p_fading_factor ),
+                          p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = p_ada,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_scaling_params(self):
+
+        scaler = self._river_algo
+        keys   = list(scaler.means.keys())
+        means  = np.array([ scaler.means[k].get() for k in keys ], dtype=np.float64)
+        var    = np.array([ scaler.vars[k].get() for k in keys ], dtype=np.float64)
+
+        return self._get_affine_params( p_locations = means, p_spreads = np.sqrt(np.maximum(var, 0.0)) )
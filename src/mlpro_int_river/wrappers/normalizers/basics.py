@@ -0,0 +1,326 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.normalizers
+## -- Module  : basics.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module provides the wrapper root class from River to MLPro for scalers, which are used as
+online-adaptive stream normalizers.
+
+Learn more:
+https://www.riverml.xyz/
+
+"""
+
+
+import numpy as np
+import pandas as pd
+
+from mlpro.bf.plot import PlotSettings
+from mlpro.bf.streams import Instance, InstDict
+from mlpro.bf.various import Log
+from mlpro.oa.streams import OAStreamTask
+from mlpro.oa.streams.basics import OAStreamAdaptationType
+from mlpro.oa.streams.tasks.normalizers import OAStreamNormalizer
+from mlpro_int_river.wrappers import WrapperRiver
+
+from river import base
+
+
+
+# Export list for public API
+__all__ = [ 'WrNormalizerRiver2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrNormalizerRiver2MLPro (WrapperRiver, OAStreamNormalizer):
+    """
+    This is the base wrapper class for each River-based scaler to MLPro. The River scaler is used
+    as an online-adaptive stream normalizer. The River scalers wrapped by the child classes are
+    affine per feature. Therefore, their current state is expressed by the normalization parameters
+    of MLPro (factors and offsets per feature), which are applied to the instances. An adaptation
+    event is raised whenever these parameters change, so that succeeding tasks can renormalize
+    their internal data by registering their method renormalize_on_event().
+
+    All new instances of a processing cycle are learned at once, i.e. with method learn_many() of
+    the River scaler if it provides one, and are normalized afterwards with the updated parameters.
+    With one new instance per cycle, the normalized values are the same as those of River's
+    learn_one() and transform_one() up to floating point rounding. Features with a spread of zero
+    are only shifted instead of being mapped to 0, so that the parameters stay invertible.
+
+    River scalers can not forget obsolete instances. Obsolete instances are normalized, but not
+    unlearned.
+
+    Parameters
+    ----------
+    p_river_algo : base.Transformer
+        Instantiated River scaler.
+    p_name : str
+        Name of the normalizer. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default: False.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE          = 'River Normalizer'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_river_algo : base.Transformer,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  **p_kwargs ):
+
+        self._river_algo = p_river_algo
+        self._batch      = []
+
+        OAStreamNormalizer.__init__( self,
+                                     p_name = p_name,
+                                     p_range_max = p_range_max,
+                                     p_ada = p_ada,
+                                     p_duplicate_data = p_duplicate_data,
+                                     p_visualize = p_visualize,
+                                     p_logging = p_logging,
+                                     **p_kwargs )
+
+        WrapperRiver.__init__(self, p_logging=p_logging)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_instances : InstDict):
+        """
+        Adapts the River scaler on all new instances and normalizes all instances afterwards.
+
+        Parameters
+        ----------
+        p_instances : InstDict
+            Stream instances to be processed.
+        """
+
+        self.adapt( p_instances = p_instances )
+
+        if self._param_new is None: return
+
+        for (inst_type, inst) in p_instances.values():
+            feature_data = inst.get_feature_data()
+            feature_data.set_values( p_values = self.normalize(feature_data).get_values() )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _adapt(self, p_instance_new : Instance) -> bool:
+        """
+        Buffers the given instance. The River scaler learns all buffered instances at once in
+        method _adapt_post().
+        """
+
+        self._batch.append(p_instance_new)
+        return False
+
+
+## -------------------------------------------------------------------------------------------------
+    def _adapt_post(self) -> OAStreamAdaptationType:
+        """
+        The River scaler learns all instances buffered by method _adapt(). Afterwards, the
+        normalization parameters are updated.
+
+        Returns
+        -------
+        OAStreamAdaptationType
+            FORWARD, if the normalization parameters have changed. NONE otherwise.
+        """
+
+        if len(self._batch) == 0: return OAStreamAdaptationType.NONE
+
+        instances   = self._batch
+        self._batch = []
+
+        if len(instances) == 1:
+            self._river_algo.learn_one( self.C_INPUT_CACHE.get_river_input(instances[0]) )
+        else:
+            self.learn_many( np.stack([ self.C_INPUT_CACHE.get_values(inst) for inst in instances ]) )
+
+        if not self.update_parameters(): return OAStreamAdaptationType.NONE
+
+        self._update_plot_data()
+        return OAStreamAdaptationType.FORWARD
+
+
+## -------------------------------------------------------------------------------------------------
+    def learn_many(self, p_data : np.ndarray):
+        """
+        The River scaler learns a window of feature vectors. River's learn_many() is used, if the
+        River scaler provides it. Otherwise, the feature vectors are learned one by one. The
+        normalization parameters are not updated (see method update_parameters()).
+
+        Parameters
+        ----------
+        p_data : np.ndarray
+            Feature vectors. Shape (n, d).
+        """
+
+        try:
+            learn_many = self._river_algo.learn_many
+        except AttributeError:
+            for values in p_data.tolist(): self._river_algo.learn_one(dict(enumerate(values, 1)))
+            return
+
+        learn_many(pd.DataFrame(p_data, columns=range(1, p_data.shape[1] + 1)))
+
+
+## -------------------------------------------------------------------------------------------------
+    def _update_parameters(self, **p_kwargs) -> bool:
+        """
+        Updates the normalization parameters according to the current state of the River scaler.
+        The previous parameters are kept in self._param_old.
+
+        Returns
+        -------
+        bool
+            True, if the normalization parameters have changed. False otherwise.
+        """
+
+        factors, offsets = self._get_scaling_params()
+
+        if self._param_new is None:
+            self._param_new = np.zeros((2, factors.shape[0]))
+        elif self._param_old is None:
+            self._param_old = self._param_new.copy()
+        else:
+            np.copyto(self._param_old, self._param_new)
+
+        changed = not ( np.array_equal(self._param_new[0], factors) and np.array_equal(self._param_new[1], offsets) )
+        self._param_new[0] = factors
+        self._param_new[1] = offsets
+        self._set_parameters(p_param=self._param_new)
+        return changed
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_scaling_params(self):
+        """
+        Custom method that determines the current parameters y = x * factors + offsets of the River
+        scaler.
+
+        Returns
+        -------
+        factors : np.ndarray
+            Factors per feature. Shape (d,).
+        offsets : np.ndarray
+            Offsets per feature. Shape (d,).
+        """
+
+        raise NotImplementedError
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _get_affine_params(p_locations : np.ndarray, p_spreads : np.ndarray):
+        """
+        Determines the parameters of the mapping y = ( x - locations ) / spreads. Features with a
+        spread of zero are only shifted.
+
+        Returns
+        -------
+        factors : np.ndarray
+            Factors per feature. Shape (d,).
+        offsets : np.ndarray
+            Offsets per feature. Shape (d,).
+        """
+
+        factors = np.divide(1.0, p_spreads, out=np.ones_like(p_spreads), where=p_spreads != 0)
+        return factors, -p_locations * factors
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_algorithm(self) -> base.Transformer:
+        """
+        This method returns the wrapped River scaler.
+
+        Returns
+        -------
+        base.Transformer
+            The wrapped River scaler.
+        """
+
+        return self._river_algo
+
+
+## -------------------------------------------------------------------------------------------------
+    def _update_plot_data_2d(self):
+        """
+        Updates the 2D plot data after parameter changes by renormalizing the existing points.
+        """
+
+        if not self._plot_2d_xdata: return
+
+        self.renormalize( p_data = self._plot_2d_xdata, p_dim = 0 )
+        self.renormalize( p_data = self._plot_2d_ydata, p_dim = 1 )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _update_plot_data_3d(self):
+        """
+        Updates the 3D plot data after parameter changes by renormalizing the existing points.
+        """
+
+        if not self._plot_3d_xdata: return
+
+        self.renormalize( p_data = self._plot_3d_xdata, p_dim = 0 )
+        self.renormalize( p_data = self._plot_3d_ydata, p_dim = 1 )
+        self.renormalize( p_data = self._plot_3d_zdata, p_dim = 2 )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _update_plot_data_nd(self):
+        """
+        Updates the ND plot data after parameter changes by renormalizing the existing points.
+        """
+
+        if not self._plot_nd_plots: return
+
+        for dim, plot_data in enumerate(self._plot_nd_plots):
+            self.renormalize( p_data = plot_data[0], p_dim = dim )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _update_plot_data(self):
+        """
+        Updates the plot data.
+        """
+
+        if not self.get_visualization(): return
+        view = self.get_plot_settings().view
+
+        if view == PlotSettings.C_VIEW_2D:
+            self._update_plot_data_2d()
+        elif view == PlotSettings.C_VIEW_3D:
+            self._update_plot_data_3d()
+        elif view == PlotSettings.C_VIEW_ND:
+            self._update_plot_data_nd()
+
+        self._update_ax_limits = True
+        self._recalc_ax_limits = True
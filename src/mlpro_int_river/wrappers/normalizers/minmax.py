@@ -0,0 +1,100 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.normalizers
+## -- Module  : minmax.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module provides a wrapper class for the scaler MinMaxScaler by River.
+
+Learn more:
+https://www.riverml.xyz/
+
+"""
+
+
+import numpy as np
+
+from mlpro.bf.various import Log
+from mlpro.oa.streams import OAStreamTask
+from mlpro_int_river.wrappers.normalizers.basics import WrNormalizerRiver2MLPro
+
+from river import preprocessing
+
+
+
+# Export list for public API
+__all__ = [ 'WrRiverMinMaxScaler2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrRiverMinMaxScaler2MLPro (WrNormalizerRiver2MLPro):
+    """
+    This is the wrapper class for the scaler MinMaxScaler.
+
+    According to https://riverml.xyz/latest/api/preprocessing/MinMaxScaler/ :
+    Scales the data to a fixed range from 0 to 1. Under the hood a running min and a running peak
+    to peak (max - min) are maintained.
+
+    Parameters
+    ----------
+    p_window_size : int
+        Optional size of a rolling window for the min and the max. Default: None.
+    p_name : str
+        Name of the normalizer. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default: False.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE          = 'River Normalizer MinMaxScaler'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_window_size : int = None,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  **p_kwargs ):
+
+        super().__init__( p_river_algo = preprocessing.MinMaxScaler( window_size = p_window_size ),
+                          p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = p_ada,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_scaling_params(self):
+
+        scaler = self._river_algo
+        keys   = list(scaler.min.keys())
+        mins   = np.array([ scaler.min[k].get() for k in keys ], dtype=np.float64)
+        maxs   = np.array([ scaler.max[k].get() for k in keys ], dtype=np.float64)
+
+        return self._get_affine_params( p_locations = mins, p_spreads = maxs - mins )
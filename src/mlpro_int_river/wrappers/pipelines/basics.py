@@ -0,0 +1,287 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.pipelines
+## -- Module  : basics.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module provides a wrapper class that runs a whole River pipeline as a single MLPro stream task.
+
+Learn more:
+https://www.riverml.xyz/
+
+"""
+
+
+import numpy as np
+
+from mlpro.bf.exceptions import ParamError
+from mlpro.bf.streams import Instance, InstDict, InstTypeNew
+from mlpro.bf.various import Log
+from mlpro.oa.streams import OAStreamTask
+from mlpro_int_river.wrappers import WrapperRiver
+
+from river import base, compose
+
+
+
+# Export list for public API
+__all__ = [ 'WrPipelineRiver2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrPipelineRiver2MLPro (WrapperRiver, OAStreamTask):
+    """
+    This is the wrapper class for River pipelines, e.g. a scaler, a projection and a cluster
+    analyzer or an anomaly detector chained by River's operator |. The whole pipeline runs as one
+    MLPro stream task, so that the stages of the pipeline do not cause any dispatching, logging or
+    event overhead of separate tasks.
+
+    Each new instance is processed by the pipeline first and learned afterwards, if adaptivity is
+    turned on. The output of the pipeline is stored in the keyword arguments of the instance under
+    key p_output_key. It depends on the final step of the pipeline:
+
+        - anomaly detector: anomaly score (score_one())
+        - classifier, regressor or cluster analyzer: prediction or cluster id (predict_one())
+        - transformer: transformed features as dictionary (transform_one())
+
+    Supervised pipelines learn labelled instances only, and an optional River metric is updated
+    prequentially with the label and the prediction of each labelled instance. The feature data of
+    the instances is not modified.
+
+    The intermediate outputs of the stages are available on demand by method get_stage_outputs().
+    With p_stage_outputs=True, they are determined for each new instance and stored as dictionary
+    (stage name, output) in the keyword arguments under key p_stages_key. In this case, the output
+    of the pipeline is derived from the intermediate outputs, so that the stages are not run twice.
+    Steps without method transform_one() in the middle of the pipeline, like River's anomaly
+    filters, are skipped as River does for predictions.
+
+    Parameters
+    ----------
+    p_river_pipeline : compose.Pipeline
+        Instantiated River pipeline. A single River estimator is accepted as a pipeline with one
+        step.
+    p_metric
+        Optional instantiated River metric for supervised pipelines. Default: None.
+    p_stage_outputs : bool
+        If True, the intermediate outputs of all stages are stored in the instances. Default: False.
+    p_output_key : str
+        Key of the output in the keyword arguments of the instances. Default: None
+        (C_OUTPUT_KEY).
+    p_stages_key : str
+        Key of the intermediate outputs in the keyword arguments of the instances. Default: None
+        (C_STAGES_KEY).
+    p_name : str
+        Name of the task. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default: False.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE              = 'River Pipeline'
+
+    C_OUTPUT_KEY        = 'output'
+    C_STAGES_KEY        = 'stages'
+
+    C_OUTPUT_SCORE      = 'score_one'
+    C_OUTPUT_PREDICTION = 'predict_one'
+    C_OUTPUT_TRANSFORM  = 'transform_one'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_river_pipeline : compose.Pipeline,
+                  p_metric = None,
+                  p_stage_outputs : bool = False,
+                  p_output_key : str = None,
+                  p_stages_key : str = None,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  **p_kwargs ):
+
+        if not isinstance(p_river_pipeline, compose.Pipeline):
+            p_river_pipeline = compose.Pipeline(p_river_pipeline)
+
+        final_step = list(p_river_pipeline.steps.values())[-1]
+
+        if isinstance(final_step, base.AnomalyDetector):
+            self._output_method = self.C_OUTPUT_SCORE
+        elif isinstance(final_step, (base.Classifier, base.Regressor, base.Clusterer)):
+            self._output_method = self.C_OUTPUT_PREDICTION
+        elif isinstance(final_step, base.Transformer):
+            self._output_method = self.C_OUTPUT_TRANSFORM
+        else:
+            raise ParamError('Final step ' + type(final_step).__name__ + ' of the pipeline is not supported')
+
+        self._river_pipeline = p_river_pipeline
+        self._final_step     = final_step
+        self._supervised     = isinstance(final_step, (base.Classifier, base.Regressor))
+        self._metric         = p_metric
+        self._stage_outputs  = p_stage_outputs
+        self._output_key     = self.C_OUTPUT_KEY if p_output_key is None else p_output_key
+        self._stages_key     = self.C_STAGES_KEY if p_stages_key is None else p_stages_key
+
+        OAStreamTask.__init__( self,
+                               p_name = p_name,
+                               p_range_max = p_range_max,
+                               p_ada = p_ada,
+                               p_duplicate_data = p_duplicate_data,
+                               p_visualize = p_visualize,
+                               p_logging = p_logging,
+                               **p_kwargs )
+
+        WrapperRiver.__init__(self, p_logging=p_logging)
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _get_target(p_instance : Instance):
+        """
+        Returns the label of the given instance as a Python scalar or None, if the instance does
+        not provide label data.
+        """
+
+        label_data = p_instance.get_label_data()
+        if label_data is None: return None
+        return np.asarray(label_data.get_values()).ravel()[0].item()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_instances : InstDict):
+        """
+        Processes all new instances by the pipeline and adapts the pipeline afterwards.
+
+        Parameters
+        ----------
+        p_instances : InstDict
+            Stream instances to be processed.
+        """
+
+        for (inst_type, inst) in p_instances.values():
+            if inst_type != InstTypeNew: continue
+
+            x = self.C_INPUT_CACHE.get_river_input(inst)
+
+            if self._stage_outputs:
+                stages                        = self._get_stage_outputs(x)
+                output                        = stages[next(reversed(stages))]
+                inst.kwargs[self._stages_key] = stages
+            else:
+                output = getattr(self._river_pipeline, self._output_method)(x)
+
+            inst.kwargs[self._output_key] = output
+
+            if ( self._metric is not None ) and self._supervised:
+                target = self._get_target(inst)
+                if target is not None: self._metric.update(target, output)
+
+        self.adapt( p_instances = p_instances )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _adapt(self, p_instance_new : Instance) -> bool:
+        """
+        The pipeline learns the given instance. Supervised pipelines learn labelled instances
+        only.
+        """
+
+        if not self._supervised:
+            self._river_pipeline.learn_one(self.C_INPUT_CACHE.get_river_input(p_instance_new))
+            return True
+
+        target = self._get_target(p_instance_new)
+        if target is None: return False
+
+        self._river_pipeline.learn_one(self.C_INPUT_CACHE.get_river_input(p_instance_new), target)
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_stage_outputs(self, p_x : dict) -> dict:
+
+        stages = {}
+        x      = p_x
+        steps  = list(self._river_pipeline.steps.items())
+
+        for name, step in steps[:-1]:
+            if not hasattr(step, 'transform_one'): continue
+            x            = step.transform_one(x)
+            stages[name] = x
+
+        stages[steps[-1][0]] = getattr(self._final_step, self._output_method)(x)
+        return stages
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_stage_outputs(self, p_instance : Instance) -> dict:
+        """
+        Determines the intermediate outputs of all stages of the pipeline for the given instance
+        without learning it.
+
+        Parameters
+        ----------
+        p_instance : Instance
+            Instance to be processed.
+
+        Returns
+        -------
+        dict
+            Outputs of the stages as dictionary (stage name, output). The last entry is the output
+            of the pipeline.
+        """
+
+        return self._get_stage_outputs(self.C_INPUT_CACHE.get_river_input(p_instance))
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_stage_names(self) -> list:
+        """
+        This method returns the names of the stages of the pipeline.
+        """
+
+        return list(self._river_pipeline.steps.keys())
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_algorithm(self) -> compose.Pipeline:
+        """
+        This method returns the wrapped River pipeline.
+
+        Returns
+        -------
+        compose.Pipeline
+            The wrapped River pipeline.
+        """
+
+        return self._river_pipeline
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_metric(self):
+        """
+        This method returns the River metric or None, if no metric was specified.
+        """
+
+        return self._metric
@@ -0,0 +1,4 @@
+from .basics import *
+from .forest import *
+from .linear import *
+from .tree import *
@@ -0,0 +1,294 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.predictors
+## -- Module  : basics.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -- 2026-10-18  1.0.1     DA       Bugfix: mini-batches buffer the feature values instead of the
+## --                                instances
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.1 (2026-10-18)
+
+This module provides the wrapper root class from River to MLPro for online regressors and
+classifiers.
+
+Learn more:
+https://www.riverml.xyz/
+
+"""
+
+
+import numpy as np
+import pandas as pd
+
+from mlpro.bf.exceptions import ParamError
+from mlpro.bf.streams import Instance, InstDict, InstTypeNew
+from mlpro.bf.various import Log
+from mlpro.oa.streams import OAStreamTask
+from mlpro.oa.streams.basics import OAStreamAdaptationType
+from mlpro_int_river.wrappers import WrapperRiver
+
+from river import base
+
+
+
+# Export list for public API
+__all__ = [ 'WrPredictorRiver2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrPredictorRiver2MLPro (WrapperRiver, OAStreamTask):
+    """
+    This is the base wrapper class for each River-based online regressor or classifier to MLPro.
+    The new instances of a processing cycle are predicted first and learned afterwards, if they
+    provide label data and adaptivity is turned on (test-then-train). The prediction of an instance
+    is stored in its keyword arguments under key p_prediction_key. Optionally, a River metric is
+    updated with the label and the prediction of each labelled instance.
+
+    The labelled instances are buffered and learned in mini-batches of p_batch_size instances. A
+    mini-batch is passed to River's learn_many() in one call, if the River learner provides it.
+    Otherwise, the instances of the mini-batch are learned one by one. In the same way, all new
+    instances of a processing cycle are predicted with River's predict_many(), if available. The
+    methods learn_many() and predict_many() can also be used directly outside of a stream workflow.
+
+    Parameters
+    ----------
+    p_river_algo : base.Regressor | base.Classifier
+        Instantiated River regressor or classifier.
+    p_batch_size : int
+        Number of labelled instances to be learned in one mini-batch. Default: 1.
+    p_metric
+        Optional instantiated River metric, which is updated prequentially. Default: None.
+    p_prediction_key : str
+        Key of the prediction in the keyword arguments of the instances. Default: None
+        (C_PREDICTION_KEY).
+    p_name : str
+        Name of the predictor. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default: False.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE              = 'River Predictor'
+
+    C_PREDICTION_KEY    = 'prediction'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_river_algo : base.Estimator,
+                  p_batch_size : int = 1,
+                  p_metric = None,
+                  p_prediction_key : str = None,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  **p_kwargs ):
+
+        if p_batch_size < 1:
+            raise ParamError('Parameter p_batch_size must be a positive integer')
+
+        self._river_algo     = p_river_algo
+        self._batch_size     = p_batch_size
+        self._metric         = p_metric
+        self._prediction_key = self.C_PREDICTION_KEY if p_prediction_key is None else p_prediction_key
+        self._batch          = []
+
+        OAStreamTask.__init__( self,
+                               p_name = p_name,
+                               p_range_max = p_range_max,
+                               p_ada = p_ada,
+                               p_duplicate_data = p_duplicate_data,
+                               p_visualize = p_visualize,
+                               p_logging = p_logging,
+                               **p_kwargs )
+
+        WrapperRiver.__init__(self, p_logging=p_logging)
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _get_target(p_instance : Instance):
+        """
+        Returns the label of the given instance as a Python scalar or None, if the instance does
+        not provide label data.
+        """
+
+        label_data = p_instance.get_label_data()
+        if label_data is None: return None
+        return np.asarray(label_data.get_values()).ravel()[0].item()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_instances : InstDict):
+        """
+        Predicts all new instances and adapts the River learner afterwards.
+
+        Parameters
+        ----------
+        p_instances : InstDict
+            Stream instances to be processed.
+        """
+
+        instances = [ inst for (inst_id, (inst_type, inst)) in sorted(p_instances.items()) if inst_type == InstTypeNew ]
+        if len(instances) == 0: return
+
+        if len(instances) == 1:
+            predictions = [ self._river_algo.predict_one(self.C_INPUT_CACHE.get_river_input(instances[0])) ]
+        else:
+            predictions = self.predict_many( np.stack([ self.C_INPUT_CACHE.get_values(inst) for inst in instances ]) )
+
+        for inst, prediction in zip(instances, predictions):
+            inst.kwargs[self._prediction_key] = prediction
+
+            if self._metric is not None:
+                target = self._get_target(inst)
+                if target is not None: self._metric.update(target, prediction)
+
+        self.adapt( p_instances = p_instances )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _adapt(self, p_instance_new : Instance) -> bool:
+        """
+        Buffers the feature values and the label of the given instance, if it provides label data.
+        The values are copied, since succeeding tasks may replace or modify the feature data of the
+        instance before the mini-batch is complete. The River learner learns the buffered values in
+        method _adapt_post() as soon as a mini-batch is complete.
+        """
+
+        target = self._get_target(p_instance_new)
+        if target is not None: self._batch.append((self.C_INPUT_CACHE.get_values(p_instance_new).copy(), target))
+        return False
+
+
+## -------------------------------------------------------------------------------------------------
+    def _adapt_post(self) -> OAStreamAdaptationType:
+        """
+        The River learner learns the buffered instances, if a mini-batch is complete.
+
+        Returns
+        -------
+        OAStreamAdaptationType
+            FORWARD, if a mini-batch was learned. NONE otherwise.
+        """
+
+        if len(self._batch) < self._batch_size: return OAStreamAdaptationType.NONE
+        return OAStreamAdaptationType.FORWARD if self.flush() else OAStreamAdaptationType.NONE
+
+
+## -------------------------------------------------------------------------------------------------
+    def flush(self) -> bool:
+        """
+        The River learner learns all buffered instances, even if the mini-batch is not complete.
+
+        Returns
+        -------
+        bool
+            True, if instances were learned. False otherwise.
+        """
+
+        if len(self._batch) == 0: return False
+
+        batch       = self._batch
+        self._batch = []
+
+        if len(batch) == 1:
+            self._river_algo.learn_one(dict(enumerate(batch[0][0].tolist(), 1)), batch[0][1])
+        else:
+            self.learn_many( np.stack([ values for (values, target) in batch ]),
+                             [ target for (values, target) in batch ] )
+
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def learn_many(self, p_data : np.ndarray, p_targets : list):
+        """
+        The River learner learns a mini-batch of feature vectors and their labels. River's
+        learn_many() is used, if the River learner provides it. Otherwise, the feature vectors are
+        learned one by one.
+
+        Parameters
+        ----------
+        p_data : np.ndarray
+            Feature vectors. Shape (n, d).
+        p_targets : list
+            Labels of the feature vectors.
+        """
+
+        try:
+            learn_many = self._river_algo.learn_many
+        except AttributeError:
+            for values, target in zip(p_data.tolist(), p_targets):
+                self._river_algo.learn_one(dict(enumerate(values, 1)), target)
+            return
+
+        learn_many( pd.DataFrame(p_data, columns=range(1, p_data.shape[1] + 1)), pd.Series(p_targets) )
+
+
+## -------------------------------------------------------------------------------------------------
+    def predict_many(self, p_data : np.ndarray) -> list:
+        """
+        Predicts a window of feature vectors. River's predict_many() is used, if the River learner
+        provides it. Otherwise, the feature vectors are predicted one by one.
+
+        Parameters
+        ----------
+        p_data : np.ndarray
+            Feature vectors. Shape (n, d).
+
+        Returns
+        -------
+        list
+            Predictions of the feature vectors.
+        """
+
+        try:
+            predict_many = self._river_algo.predict_many
+        except AttributeError:
+            return [ self._river_algo.predict_one(dict(enumerate(values, 1))) for values in p_data.tolist() ]
+
+        return predict_many(pd.DataFrame(p_data, columns=range(1, p_data.shape[1] + 1))).tolist()
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_algorithm(self) -> base.Estimator:
+        """
+        This method returns the wrapped River learner.
+
+        Returns
+        -------
+        base.Estimator
+            The wrapped River learner.
+        """
+
+        return self._river_algo
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_metric(self):
+        """
+        This method returns the River metric or None, if no metric was specified.
+        """
+
+        return self._metric
@@ -0,0 +1,219 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.predictors
+## -- Module  : forest.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module provides wrapper classes for the Adaptive Random Forests ARFClassifier and ARFRegressor
+by River. River's forests learn one instance at a time, so that a mini-batch is learned instance by
+instance within one call.
+
+Learn more:
+https://www.riverml.xyz/
+
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro.oa.streams import OAStreamTask
+from mlpro_int_river.wrappers.predictors.basics import WrPredictorRiver2MLPro
+
+from river import forest
+
+
+
+# Export list for public API
+__all__ = [ 'WrRiverARFClassifier2MLPro',
+            'WrRiverARFRegressor2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrRiverARFClassifier2MLPro (WrPredictorRiver2MLPro):
+    """
+    This is the wrapper class for the classifier ARFClassifier.
+
+    According to https://riverml.xyz/latest/api/forest/ARFClassifier/ :
+    Adaptive Random Forest classifier. It is an ensemble of Hoeffding trees trained on resampled
+    data with random feature subsets. Each tree is monitored by a drift detector and replaced by a
+    background tree after a drift.
+
+    Parameters
+    ----------
+    p_n_models : int
+        Number of trees in the ensemble. Default: 10.
+    p_max_features : bool | str | int
+        Maximum number of features per split, e.g. 'sqrt', 'log2', an int or a float. Default:
+        'sqrt'.
+    p_lambda_value : int
+        Lambda value of the Poisson resampling. Default: 6.
+    p_grace_period : int
+        Number of instances a leaf should observe between split attempts. Default: 50.
+    p_max_depth : int
+        Maximum depth of the trees. Default: None (unlimited).
+    p_seed : int
+        Seed for the random number generator. Default: None.
+    p_batch_size : int
+        Number of labelled instances to be learned in one mini-batch. Default: 1.
+    p_metric
+        Optional instantiated River metric, which is updated prequentially. Default: None.
+    p_prediction_key : str
+        Key of the prediction in the keyword arguments of the instances. Default: None
+        (C_PREDICTION_KEY).
+    p_name : str
+        Name of the predictor. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default: False.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE          = 'River Classifier ARFClassifier'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_n_models : int = 10,
+                  p_max_features = 'sqrt',
+                  p_lambda_value : int = 6,
+                  p_grace_period : int = 50,
+                  p_max_depth : int = None,
+                  p_seed : int = None,
+                  p_batch_size : int = 1,
+                  p_metric = None,
+                  p_prediction_key : str = None,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  **p_kwargs ):
+
+        super().__init__( p_river_algo = forest.ARFClassifier( n_models = p_n_models,
+                                                               max_features = p_max_features,
+                                                               lambda_value = p_lambda_value,
+                                                               grace_period = p_grace_period,
+                                                               max_depth = p_max_depth,
+                                                               seed = p_seed ),
+                          p_batch_size = p_batch_size,
+                          p_metric = p_metric,
+                          p_prediction_key = p_prediction_key,
+                          p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = p_ada,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrRiverARFRegressor2MLPro (WrPredictorRiver2MLPro):
+    """
+    This is the wrapper class for the regressor ARFRegressor.
+
+    According to https://riverml.xyz/latest/api/forest/ARFRegressor/ :
+    Adaptive Random Forest regressor. It is an ensemble of Hoeffding tree regressors trained on
+    resampled data with random feature subsets. The predictions of the trees are aggregated by
+    their mean or median.
+
+    Parameters
+    ----------
+    p_n_models : int
+        Number of trees in the ensemble. Default: 10.
+    p_max_features : bool | str | int
+        Maximum number of features per split, e.g. 'sqrt', 'log2', an int or a float. Default:
+        'sqrt'.
+    p_aggregation_method : str
+        Aggregation of the predictions of the trees 'mean' or 'median'. Default: 'median'.
+    p_lambda_value : int
+        Lambda value of the Poisson resampling. Default: 6.
+    p_grace_period : int
+        Number of instances a leaf should observe between split attempts. Default: 50.
+    p_max_depth : int
+        Maximum depth of the trees. Default: None (unlimited).
+    p_seed : int
+        Seed for the random number generator. Default: None.
+    p_batch_size : int
+        Number of labelled instances to be learned in one mini-batch. Default: 1.
+    p_metric
+        Optional instantiated River metric, which is updated prequentially. Default: None.
+    p_prediction_key : str
+        Key of the prediction in the keyword arguments of the instances. Default: None
+        (C_PREDICTION_KEY).
+    p_name : str
+        Name of the predictor. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default: False.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE          = 'River Regressor ARFRegressor'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_n_models : int = 10,
+                  p_max_features = 'sqrt',
+                  p_aggregation_method : str = 'median',
+                  p_lambda_value : int = 6,
+                  p_grace_period : int = 50,
+                  p_max_depth : int = None,
+                  p_seed : int = None,
+                  p_batch_size : int = 1,
+                  p_metric = None,
+                  p_prediction_key : str = None,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  **p_kwargs ):
+
+        super().__init__( p_river_algo = forest.ARFRegressor( n_models = p_n_models,
+                                                              max_features = p_max_features,
+                                                              aggregation_method = p_aggregation_method,
+                                                              lambda_value = p_lambda_value,
+                                                              grace_period = p_grace_period,
+                                                              max_depth = p_max_depth,
+                                                              seed = p_seed ),
+                          p_batch_size = p_batch_size,
+                          p_metric = p_metric,
+                          p_prediction_key = p_prediction_key,
+                          p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = p_ada,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          **p_kwargs )
@@ -0,0 +1,226 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.predictors
+## -- Module  : linear.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module provides wrapper classes for the linear models LinearRegression and LogisticRegression
+by River. Both support the mini-batch path of River's learn_many().
+
+Learn more:
+https://www.riverml.xyz/
+
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro.oa.streams import OAStreamTask
+from mlpro_int_river.wrappers.predictors.basics import WrPredictorRiver2MLPro
+
+from river import linear_model
+
+
+
+# Export list for public API
+__all__ = [ 'WrRiverLinearRegression2MLPro',
+            'WrRiverLogisticRegression2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrRiverLinearRegression2MLPro (WrPredictorRiver2MLPro):
+    """
+    This is the wrapper class for the regressor LinearRegression.
+
+    According to https://riverml.xyz/latest/api/linear-model/LinearRegression/ :
+    Linear regression. This estimator supports learning with mini-batches. It is generally a good
+    idea to scale the data beforehand in order for the optimizer to converge.
+
+    Parameters
+    ----------
+    p_optimizer : optim.base.Optimizer
+        The sequential optimizer used for updating the weights. Default: None (SGD).
+    p_loss : optim.losses.RegressionLoss
+        The loss function to optimize for. Default: None (squared loss).
+    p_l2 : float
+        Amount of L2 regularization. Default: 0.0.
+    p_l1 : float
+        Amount of L1 regularization. Default: 0.0.
+    p_intercept_init : float
+        Initial intercept value. Default: 0.0.
+    p_intercept_lr : float
+        Learning rate of the intercept. Default: 0.01.
+    p_clip_gradient : float
+        Clips the absolute value of each gradient value. Default: 1e12.
+    p_initializer : optim.base.Initializer
+        Weights initialization scheme. Default: None (zeros).
+    p_batch_size : int
+        Number of labelled instances to be learned in one mini-batch. Default: 1.
+    p_metric
+        Optional instantiated River metric, which is updated prequentially. Default: None.
+    p_prediction_key : str
+        Key of the prediction in the keyword arguments of the instances. Default: None
+        (C_PREDICTION_KEY).
+    p_name : str
+        Name of the predictor. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default: False.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE          = 'River Regressor LinearRegression'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_optimizer = None,
+                  p_loss = None,
+                  p_l2 : float = 0.0,
+                  p_l1 : float = 0.0,
+                  p_intercept_init : float = 0.0,
+                  p_intercept_lr : float = 0.01,
+                  p_clip_gradient : float = 1e12,
+                  p_initializer = None,
+                  p_batch_size : int = 1,
+                  p_metric = None,
+                  p_prediction_key : str = None,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  **p_kwargs ):
+
+        super().__init__( p_river_algo = linear_model.LinearRegression( optimizer = p_optimizer,
+                                                                        loss = p_loss,
+                                                                        l2 = p_l2,
+                                                                        l1 = p_l1,
+                                                                        intercept_init = p_intercept_init,
+                                                                        intercept_lr = p_intercept_lr,
+                                                                        clip_gradient = p_clip_gradient,
+                                                                        initializer = p_initializer ),
+                          p_batch_size = p_batch_size,
+                          p_metric = p_metric,
+                          p_prediction_key = p_prediction_key,
+                          p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = p_ada,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrRiverLogisticRegression2MLPro (WrPredictorRiver2MLPro):
+    """
+    This is the wrapper class for the binary classifier LogisticRegression.
+
+    According to https://riverml.xyz/latest/api/linear-model/LogisticRegression/ :
+    Logistic regression. This estimator supports learning with mini-batches. It is generally a good
+    idea to scale the data beforehand in order for the optimizer to converge.
+
+    Parameters
+    ----------
+    p_optimizer : optim.base.Optimizer
+        The sequential optimizer used for updating the weights. Default: None (SGD).
+    p_loss : optim.losses.BinaryLoss
+        The loss function to optimize for. Default: None (log loss).
+    p_l2 : float
+        Amount of L2 regularization. Default: 0.0.
+    p_l1 : float
+        Amount of L1 regularization. Default: 0.0.
+    p_intercept_init : float
+        Initial intercept value. Default: 0.0.
+    p_intercept_lr : float
+        Learning rate of the intercept. Default: 0.01.
+    p_clip_gradient : float
+        Clips the absolute value of each gradient value. Default: 1e12.
+    p_initializer : optim.base.Initializer
+        Weights initialization scheme. Default: None (zeros).
+    p_batch_size : int
+        Number of labelled instances to be learned in one mini-batch. Default: 1.
+    p_metric
+        Optional instantiated River metric, which is updated prequentially. Default: None.
+    p_prediction_key : str
+        Key of the prediction in the keyword arguments of the instances. Default: None
+        (C_PREDICTION_KEY).
+    p_name : str
+        Name of the predictor. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default: False.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE          = 'River Classifier LogisticRegression'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_optimizer = None,
+                  p_loss = None,
+                  p_l2 : float = 0.0,
+                  p_l1 : float = 0.0,
+                  p_intercept_init : float = 0.0,
+                  p_intercept_lr : float = 0.01,
+                  p_clip_gradient : float = 1e12,
+                  p_initializer = None,
+                  p_batch_size : int = 1,
+                  p_metric = None,
+                  p_prediction_key : str = None,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  **p_kwargs ):
+
+        super().__init__( p_river_algo = linear_model.LogisticRegression( optimizer = p_optimizer,
+                                                                          loss = p_loss,
+                                                                          l2 = p_l2,
+                                                                          l1 = p_l1,
+                                                                          intercept_init = p_intercept_init,
+                                                                          intercept_lr = p_intercept_lr,
+                                                                          clip_gradient = p_clip_gradient,
+                                                                          initializer = p_initializer ),
+                          p_batch_size = p_batch_size,
+                          p_metric = p_metric,
+                          p_prediction_key = p_prediction_key,
+                          p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = p_ada,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          **p_kwargs )
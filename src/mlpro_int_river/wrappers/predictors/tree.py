@@ -0,0 +1,211 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.predictors
+## -- Module  : tree.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module provides wrapper classes for the Hoeffding trees HoeffdingTreeClassifier and
+HoeffdingTreeRegressor by River. River's Hoeffding trees learn one instance at a time, so that a
+mini-batch is learned instance by instance within one call.
+
+Learn more:
+https://www.riverml.xyz/
+
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro.oa.streams import OAStreamTask
+from mlpro_int_river.wrappers.predictors.basics import WrPredictorRiver2MLPro
+
+from river import tree
+
+
+
+# Export list for public API
+__all__ = [ 'WrRiverHoeffdingTreeClassifier2MLPro',
+            'WrRiverHoeffdingTreeRegressor2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrRiverHoeffdingTreeClassifier2MLPro (WrPredictorRiver2MLPro):
+    """
+    This is the wrapper class for the classifier HoeffdingTreeClassifier.
+
+    According to https://riverml.xyz/latest/api/tree/HoeffdingTreeClassifier/ :
+    Hoeffding Tree or Very Fast Decision Tree classifier. It uses the Hoeffding bound to decide
+    with a given confidence when enough instances have been observed to split a leaf.
+
+    Parameters
+    ----------
+    p_grace_period : int
+        Number of instances a leaf should observe between split attempts. Default: 200.
+    p_max_depth : int
+        Maximum depth of the tree. Default: None (unlimited).
+    p_split_criterion : str
+        Split criterion 'gini', 'info_gain' or 'hellinger'. Default: 'info_gain'.
+    p_delta : float
+        Significance level of the Hoeffding bound. Default: 1e-7.
+    p_tau : float
+        Threshold below which a split is forced to break ties. Default: 0.05.
+    p_leaf_prediction : str
+        Prediction mechanism of the leaves 'mc', 'nb' or 'nba'. Default: 'nba'.
+    p_batch_size : int
+        Number of labelled instances to be learned in one mini-batch. Default: 1.
+    p_metric
+        Optional instantiated River metric, which is updated prequentially. Default: None.
+    p_prediction_key : str
+        Key of the prediction in the keyword arguments of the instances. Default: None
+        (C_PREDICTION_KEY).
+    p_name : str
+        Name of the predictor. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default: False.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE          = 'River Classifier HoeffdingTreeClassifier'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_grace_period : int = 200,
+                  p_max_depth : int = None,
+                  p_split_criterion : str = 'info_gain',
+                  p_delta : float = 1e-7,
+                  p_tau : float = 0.05,
+                  p_leaf_prediction : str = 'nba',
+                  p_batch_size : int = 1,
+                  p_metric = None,
+                  p_prediction_key : str = None,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  **p_kwargs ):
+
+        super().__init__( p_river_algo = tree.HoeffdingTreeClassifier( grace_period = p_grace_period,
+                                                                       max_depth = p_max_depth,
+                                                                       split_criterion = p_split_criterion,
+                                                                       delta = p_delta,
+                                                                       tau = p_tau,
+                                                                       leaf_prediction = p_leaf_prediction ),
+                          p_batch_size = p_batch_size,
+                          p_metric = p_metric,
+                          p_prediction_key = p_prediction_key,
+                          p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = p_ada,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrRiverHoeffdingTreeRegressor2MLPro (WrPredictorRiver2MLPro):
+    """
+    This is the wrapper class for the regressor HoeffdingTreeRegressor.
+
+    According to https://riverml.xyz/latest/api/tree/HoeffdingTreeRegressor/ :
+    Hoeffding Tree regressor. The leaves predict the mean of the target, a linear model or
+    adaptively the better of both.
+
+    Parameters
+    ----------
+    p_grace_period : int
+        Number of instances a leaf should observe between split attempts. Default: 200.
+    p_max_depth : int
+        Maximum depth of the tree. Default: None (unlimited).
+    p_delta : float
+        Significance level of the Hoeffding bound. Default: 1e-7.
+    p_tau : float
+        Threshold below which a split is forced to break ties. Default: 0.05.
+    p_leaf_prediction : str
+        Prediction mechanism of the leaves 'mean', 'model' or 'adaptive'. Default: 'adaptive'.
+    p_leaf_model : base.Regressor
+        Regression model of the leaves. Default: None (LinearRegression).
+    p_batch_size : int
+        Number of labelled instances to be learned in one mini-batch. Default: 1.
+    p_metric
+        Optional instantiated River metric, which is updated prequentially. Default: None.
+    p_prediction_key : str
+        Key of the prediction in the keyword arguments of the instances. Default: None
+        (C_PREDICTION_KEY).
+    p_name : str
+        Name of the predictor. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default: False.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE          = 'River Regressor HoeffdingTreeRegressor'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_grace_period : int = 200,
+                  p_max_depth : int = None,
+                  p_delta : float = 1e-7,
+                  p_tau : float = 0.05,
+                  p_leaf_prediction : str = 'adaptive',
+                  p_leaf_model = None,
+                  p_batch_size : int = 1,
+                  p_metric = None,
+                  p_prediction_key : str = None,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  **p_kwargs ):
+
+        super().__init__( p_river_algo = tree.HoeffdingTreeRegressor( grace_period = p_grace_period,
+                                                                      max_depth = p_max_depth,
+                                                                      delta = p_delta,
+                                                                      tau = p_tau,
+                                                                      leaf_prediction = p_leaf_prediction,
+                                                                      leaf_model = p_leaf_model ),
+                          p_batch_size = p_batch_size,
+                          p_metric = p_metric,
+                          p_prediction_key = p_prediction_key,
+                          p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = p_ada,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          **p_kwargs )
@@ -0,0 +1 @@
+from .basics import *
@@ -0,0 +1,366 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.projections
+## -- Module  : basics.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module provides a stream task that reduces the dimensionality of the instances by River's
+random projections or feature hashing, e.g. ahead of a cluster analyzer for high-dimensional data.
+
+Learn more:
+https://www.riverml.xyz/
+
+"""
+
+
+import numpy as np
+
+from mlpro.bf.exceptions import ParamError
+from mlpro.bf.math import Element, MSpace
+from mlpro.bf.streams import Feature, InstDict, InstTypeNew
+from mlpro.bf.various import Log
+from mlpro.oa.streams import OAStreamTask
+from mlpro_int_river.wrappers import WrapperRiver
+
+from river import base, preprocessing
+
+
+
+# Export list for public API
+__all__ = [ 'WrProjectionRiver2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrProjectionRiver2MLPro (WrapperRiver, OAStreamTask):
+    """
+    Stream task that maps the feature data of the incoming instances from d to k dimensions by one
+    of the following River transformers:
+
+        - preprocessing.GaussianRandomProjector: dense projection matrix
+        - preprocessing.SparseRandomProjector: sparse projection matrix
+        - preprocessing.FeatureHasher: each feature is added to one of k = n_features buckets with
+          a sign
+
+    All of them are linear mappings y = x P with a fixed projection matrix P of shape (d, k). River
+    draws the entries of P lazily. On the first instance, the task materializes P for the d
+    features of the stream in the same order as River's transform_one() does. With engine
+    C_ENGINE_NUMPY, all instances of a processing cycle are projected at once by a single
+    matrix multiplication. With engine C_ENGINE_RIVER, each instance is projected by River's
+    transform_one(). Both engines produce the same projections up to floating point rounding.
+
+    The feature data of the instances is replaced by new elements of a feature space with k
+    dimensions. Instances that have already been projected, e.g. obsolete instances of a
+    preceding window, are left unchanged. Succeeding tasks like River cluster analyzers thus
+    process k instead of d features.
+
+    Their results, e.g. cluster centroids, can be mapped back to the original feature space for
+    visualization by method back_project(). Since k < d, a projection can not be inverted in
+    general. Two kinds of back projection are provided:
+
+        - C_BACK_PROJECTION_DATA: linear least squares reconstruction of the original features
+          from the projected ones, which is learned from the new instances while adaptivity is
+          turned on. It recovers the structure of the data that is retained by the projection,
+          e.g. the centers of clusters. Obsolete instances are not unlearned.
+        - C_BACK_PROJECTION_PINV: minimum norm reconstruction based on the pseudo-inverse of P.
+          It needs no data but recovers the part of the original data within the row space of P
+          only.
+
+    Before two instances have been learned, the pseudo-inverse is used in either case.
+
+    Please note that the renormalization of succeeding tasks is not supported across the
+    projection. Normalizers should therefore be placed behind the projection.
+
+    Parameters
+    ----------
+    p_river_algo : base.Transformer
+        Instantiated River transformer. See list above.
+    p_engine : str
+        Engine to be used. See constants C_ENGINE_*. Default: C_ENGINE_NUMPY.
+    p_back_projection : str
+        Kind of back projection. See constants C_BACK_PROJECTION_*. Default: C_BACK_PROJECTION_DATA.
+    p_name : str
+        Name of the task. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity, i.e. the learning of the back projection. The projection itself is
+        fixed. Default: True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default: False.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE              = 'River Projection'
+
+    C_ENGINE_RIVER      = 'River'
+    C_ENGINE_NUMPY      = 'NumPy'
+
+    C_BACK_PROJECTION_DATA  = 'data'
+    C_BACK_PROJECTION_PINV  = 'pinv'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_river_algo : base.Transformer,
+                  p_engine : str = C_ENGINE_NUMPY,
+                  p_back_projection : str = C_BACK_PROJECTION_DATA,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  **p_kwargs ):
+
+        if isinstance(p_river_algo, ( preprocessing.GaussianRandomProjector, preprocessing.SparseRandomProjector )):
+            self._num_components = p_river_algo.n_components
+        elif isinstance(p_river_algo, preprocessing.FeatureHasher):
+            self._num_components = p_river_algo.n_features
+        else:
+            raise ParamError('River transformer ' + type(p_river_algo).__name__ + ' is not supported')
+
+        if p_engine not in [ self.C_ENGINE_RIVER, self.C_ENGINE_NUMPY ]:
+            raise ParamError('Unknown engine ' + str(p_engine))
+
+        if p_back_projection not in [ self.C_BACK_PROJECTION_DATA, self.C_BACK_PROJECTION_PINV ]:
+            raise ParamError('Unknown back projection ' + str(p_back_projection))
+
+        self._river_algo    = p_river_algo
+        self._engine        = p_engine
+        self._back_proj     = p_back_projection
+        self._matrix        = None
+        self._pinv          = None
+        self._feature_space = None
+        self._num_learned   = 0
+        self._sum_x         = None
+        self._sum_y         = None
+        self._sum_yy        = None
+        self._sum_yx        = None
+        self._recon         = None
+
+        OAStreamTask.__init__( self,
+                               p_name = p_name,
+                               p_range_max = p_range_max,
+                               p_ada = p_ada,
+                               p_duplicate_data = p_duplicate_data,
+                               p_visualize = p_visualize,
+                               p_logging = p_logging,
+                               **p_kwargs )
+
+        WrapperRiver.__init__(self, p_logging=p_logging)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _setup_projection(self, p_feature_space : MSpace):
+        """
+        Materializes the projection matrix for the features of the given feature space and sets up
+        the feature space of the projected instances.
+
+        Parameters
+        ----------
+        p_feature_space : MSpace
+            Feature space of the incoming instances.
+        """
+
+        num_features = p_feature_space.get_num_dim()
+        features     = range(1, num_features + 1)
+        matrix       = np.zeros((num_features, self._num_components))
+        river_algo   = self._river_algo
+
+        # The entries are drawn in the order of River's transform_one()
+        if isinstance(river_algo, preprocessing.GaussianRandomProjector):
+            for i in range(self._num_components):
+                for j in features: matrix[j - 1, i] = river_algo._projection_matrix[(i, j)]
+        elif isinstance(river_algo, preprocessing.SparseRandomProjector):
+            for j in features:
+                for i, w in river_algo._projection_matrix[j].items(): matrix[j - 1, i] = w
+        else:
+            for j in features:
+                for i, w in river_algo.transform_one({ j : 1.0 }).items(): matrix[j - 1, i] += w
+
+        self._matrix        = matrix
+        self._pinv          = None
+        self._feature_space = type(p_feature_space)()
+
+        for i in range(self._num_components):
+            self._feature_space.add_dim( Feature( p_name_short = 'p' + str(i),
+                                                  p_base_set = Feature.C_BASE_SET_R,
+                                                  p_name_long = 'Projection #' + str(i),
+                                                  p_logging = Log.C_LOG_NOTHING ) )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_instances : InstDict):
+        """
+        Projects the feature data of all instances that have not been projected yet. While
+        adaptivity is turned on, the back projection learns the new instances.
+
+        Parameters
+        ----------
+        p_instances : InstDict
+            Stream instances to be processed.
+        """
+
+        instances = [ ( inst_type, inst ) for (inst_type, inst) in p_instances.values()
+                      if inst.get_feature_data().get_related_set() is not self._feature_space ]
+        if len(instances) == 0: return
+
+        if self._matrix is None: self._setup_projection(instances[0][1].get_feature_data().get_related_set())
+
+        data = np.stack([ self.C_INPUT_CACHE.get_values(inst) for (inst_type, inst) in instances ])
+
+        if self._engine == self.C_ENGINE_NUMPY:
+            outputs = self.project(data)
+        else:
+            outputs = np.zeros((len(instances), self._num_components))
+            for row, (inst_type, inst) in enumerate(instances):
+                for i, value in self._river_algo.transform_one(self.C_INPUT_CACHE.get_river_input(inst)).items():
+                    outputs[row, i] = value
+
+        if self._adaptivity and ( self._back_proj == self.C_BACK_PROJECTION_DATA ):
+            new = np.array([ inst_type == InstTypeNew for (inst_type, inst) in instances ])
+            if new.any(): self._learn_back_projection(data[new], outputs[new])
+
+        for (inst_type, inst), values in zip(instances, outputs):
+            feature_data = Element(self._feature_space)
+            feature_data.set_values(p_values=values)
+            inst.set_feature_data(p_feature_data=feature_data)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _learn_back_projection(self, p_data : np.ndarray, p_outputs : np.ndarray):
+        """
+        Updates the sums of the least squares reconstruction with original and projected feature
+        vectors.
+
+        Parameters
+        ----------
+        p_data : np.ndarray
+            Original feature vectors. Shape (n, d).
+        p_outputs : np.ndarray
+            Projected feature vectors. Shape (n, k).
+        """
+
+        if self._sum_x is None:
+            self._sum_x  = np.zeros(p_data.shape[1])
+            self._sum_y  = np.zeros(self._num_components)
+            self._sum_yy = np.zeros((self._num_components, self._num_components))
+            self._sum_yx = np.zeros((self._num_components, p_data.shape[1]))
+
+        self._sum_x       += p_data.sum(axis=0)
+        self._sum_y       += p_outputs.sum(axis=0)
+        self._sum_yy      += p_outputs.T @ p_outputs
+        self._sum_yx      += p_outputs.T @ p_data
+        self._num_learned += p_data.shape[0]
+        self._recon        = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def project(self, p_data : np.ndarray) -> np.ndarray:
+        """
+        Projects data from the original feature space into the reduced feature space.
+
+        Parameters
+        ----------
+        p_data : np.ndarray
+            Data in the original feature space. Shape (n, d) or (d,).
+
+        Returns
+        -------
+        np.ndarray
+            Data in the reduced feature space. Shape (n, k) or (k,).
+        """
+
+        return np.asarray(p_data, dtype=np.float64) @ self._matrix
+
+
+## -------------------------------------------------------------------------------------------------
+    def back_project(self, p_data : np.ndarray) -> np.ndarray:
+        """
+        Maps data from the reduced feature space back to the original feature space, e.g. the
+        centroids of a succeeding cluster analyzer for visualization. See class description.
+
+        Parameters
+        ----------
+        p_data : np.ndarray
+            Data in the reduced feature space. Shape (n, k) or (k,).
+
+        Returns
+        -------
+        np.ndarray
+            Data in the original feature space. Shape (n, d) or (d,).
+        """
+
+        data = np.asarray(p_data, dtype=np.float64)
+
+        if self._num_learned < 2:
+            if self._pinv is None: self._pinv = np.linalg.pinv(self._matrix)
+            return data @ self._pinv
+
+        if self._recon is None:
+            n      = self._num_learned
+            mean_x = self._sum_x / n
+            mean_y = self._sum_y / n
+            cov_yy = self._sum_yy / n - np.outer(mean_y, mean_y)
+            cov_yx = self._sum_yx / n - np.outer(mean_y, mean_x)
+
+            # Slight ridge regularization for projected features without variance
+            cov_yy[np.diag_indices_from(cov_yy)] += 1e-9 * max(np.trace(cov_yy), 1e-12)
+            self._recon = ( mean_x, mean_y, np.linalg.solve(cov_yy, cov_yx) )
+
+        mean_x, mean_y, coef = self._recon
+        return mean_x + ( data - mean_y ) @ coef
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_projection_matrix(self) -> np.ndarray:
+        """
+        This method returns the projection matrix P of shape (d, k) or None before the first
+        instance.
+        """
+
+        return self._matrix
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_feature_space(self) -> MSpace:
+        """
+        This method returns the feature space of the projected instances or None before the first
+        instance.
+        """
+
+        return self._feature_space
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_algorithm(self) -> base.Transformer:
+        """
+        This method returns the wrapped River transformer.
+
+        Returns
+        -------
+        base.Transformer
+            The wrapped River transformer.
+        """
+
+        return self._river_algo
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_engine(self) -> str:
+        return self._engine
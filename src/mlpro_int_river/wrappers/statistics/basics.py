@@ -0,0 +1,337 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river.wrappers.statistics
+## -- Module  : basics.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -- 2026-10-18  1.0.1     DA       Bugfixes: read-out without scalar statistics, adaptivity
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.1 (2026-10-18)
+
+This module provides a stream task that keeps bounded-memory statistics per feature based on the
+modules stats and sketch of River.
+
+Learn more:
+https://www.riverml.xyz/
+
+"""
+
+
+import numpy as np
+
+from mlpro.bf.exceptions import ParamError
+from mlpro.bf.streams import InstDict, InstTypeNew
+from mlpro.bf.various import Log
+from mlpro.oa.streams import OAStreamTask
+from mlpro_int_river.wrappers import WrapperRiver
+
+from river import sketch, stats, utils
+
+
+
+# Export list for public API
+__all__ = [ 'WrStatisticsRiver2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrStatisticsRiver2MLPro (WrapperRiver, OAStreamTask):
+    """
+    Stream task that keeps configurable statistics of each feature of the incoming new instances by
+    River's univariate statistics and sketches. The instances pass the task unchanged.
+
+    The memory of all statistics is independent of the length of the stream. Without a window, the
+    mean, the variance, the minimum, the maximum and the exponentially weighted mean are kept in
+    constant memory and the quantiles are estimated by the P² algorithm. With p_window_size, the
+    statistics except the exponentially weighted mean refer to the latest p_window_size values of
+    each feature, which are kept by River's rolling statistics. Obsolete instances of preceding
+    tasks are ignored. While adaptivity is turned off, the statistics are not updated.
+
+    The scalar statistics of all features are read out at once as one array of shape (k, d) by
+    method get_values(), where k is the number of scalar statistics and d the number of features.
+    The names of the rows are provided by method get_statistic_names(). Histograms and heavy
+    hitters have a variable size and are read out separately by the methods get_histograms() and
+    get_heavy_hitters(). Heavy hitters are meant for discrete features.
+
+    Parameters
+    ----------
+    p_statistics : list
+        Statistics to be kept. See constants C_STAT_*. Default: [C_STAT_MEAN, C_STAT_VAR].
+    p_window_size : int
+        Optional size of a rolling window. Default: None.
+    p_quantiles : list
+        Quantiles to be estimated for statistic C_STAT_QUANTILE. Default: [0.5].
+    p_fading_factor : float
+        Fading factor of statistic C_STAT_EWMEAN. Default: 0.5.
+    p_max_bins : int
+        Maximum number of bins of statistic C_STAT_HISTOGRAM. Default: 256.
+    p_support : float
+        Minimum relative frequency of the values reported by statistic C_STAT_HEAVY_HITTERS.
+        Default: 0.001.
+    p_name : str
+        Name of the task. Default: None.
+    p_range_max :
+        MLPro machine learning task, either process or thread. Default: C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity, i.e. the update of the statistics. Default: True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default: False.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE                  = 'River Statistics'
+
+    C_STAT_MEAN             = 'mean'
+    C_STAT_VAR              = 'var'
+    C_STAT_MIN              = 'min'
+    C_STAT_MAX              = 'max'
+    C_STAT_EWMEAN           = 'ewmean'
+    C_STAT_QUANTILE         = 'quantile'
+    C_STAT_HISTOGRAM        = 'histogram'
+    C_STAT_HEAVY_HITTERS    = 'heavy_hitters'
+
+    C_STATISTICS            = [ C_STAT_MEAN, C_STAT_VAR, C_STAT_MIN, C_STAT_MAX, C_STAT_EWMEAN,
+                                C_STAT_QUANTILE, C_STAT_HISTOGRAM, C_STAT_HEAVY_HITTERS ]
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_statistics : list = [ C_STAT_MEAN, C_STAT_VAR ],
+                  p_window_size : int = None,
+                  p_quantiles : list = [ 0.5 ],
+                  p_fading_factor : float = 0.5,
+                  p_max_bins : int = 256,
+                  p_support : float = 0.001,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  **p_kwargs ):
+
+        for statistic in p_statistics:
+            if statistic not in self.C_STATISTICS:
+                raise ParamError('Unknown statistic ' + str(statistic) + '. Valid values are ' + str(self.C_STATISTICS))
+
+        if ( p_window_size is not None ) and ( p_window_size < 1 ):
+            raise ParamError('Parameter p_window_size must be a positive integer')
+
+        self._statistics    = list(p_statistics)
+        self._window_size   = p_window_size
+        self._quantiles     = list(p_quantiles)
+        self._fading_factor = p_fading_factor
+        self._max_bins      = p_max_bins
+        self._support       = p_support
+
+        self._stat_names    = []
+        for statistic in self._statistics:
+            if statistic == self.C_STAT_QUANTILE:
+                self._stat_names.extend([ statistic + '_' + str(q) for q in self._quantiles ])
+            elif statistic not in [ self.C_STAT_HISTOGRAM, self.C_STAT_HEAVY_HITTERS ]:
+                self._stat_names.append(statistic)
+
+        self._stats         = None
+        self._histograms    = None
+        self._heavy_hitters = None
+        self._num_features  = 0
+        self._num_inst      = 0
+
+        OAStreamTask.__init__( self,
+                               p_name = p_name,
+                               p_range_max = p_range_max,
+                               p_ada = p_ada,
+                               p_duplicate_data = p_duplicate_data,
+                               p_visualize = p_visualize,
+                               p_logging = p_logging,
+                               **p_kwargs )
+
+        WrapperRiver.__init__(self, p_logging=p_logging)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _create_stats(self, p_statistic : str) -> list:
+        """
+        Creates the River statistics of one row of the read-out array for a single feature.
+        """
+
+        window = self._window_size
+
+        if p_statistic == self.C_STAT_MEAN:
+            return [ stats.Mean() if window is None else utils.Rolling(stats.Mean, window_size=window) ]
+        elif p_statistic == self.C_STAT_VAR:
+            return [ stats.Var() if window is None else utils.Rolling(stats.Var, window_size=window) ]
+        elif p_statistic == self.C_STAT_MIN:
+            return [ stats.Min() if window is None else stats.RollingMin(window_size=window) ]
+        elif p_statistic == self.C_STAT_MAX:
+            return [ stats.Max() if window is None else stats.RollingMax(window_size=window) ]
+        elif p_statistic == self.C_STAT_EWMEAN:
+            return [ stats.EWMean(fading_factor=self._fading_factor) ]
+        elif p_statistic == self.C_STAT_QUANTILE:
+            if window is None: return [ stats.Quantile(q=q) for q in self._quantiles ]
+            return [ stats.RollingQuantile(q=q, window_size=window) for q in self._quantiles ]
+
+        return []
+
+
+## -------------------------------------------------------------------------------------------------
+    def _setup_stats(self, p_num_features : int):
+        """
+        Sets up the statistics of all features on the first instance.
+
+        Parameters
+        ----------
+        p_num_features : int
+            Number of features.
+        """
+
+        self._num_features = p_num_features
+        rows               = [ [] for _ in self._stat_names ]
+
+        for feature in range(p_num_features):
+            row = 0
+            for statistic in self._statistics:
+                for stat in self._create_stats(statistic):
+                    rows[row].append(stat)
+                    row += 1
+
+        self._stats = rows
+
+        if self.C_STAT_HISTOGRAM in self._statistics:
+            self._histograms = [ sketch.Histogram(max_bins=self._max_bins) for _ in range(p_num_features) ]
+
+        if self.C_STAT_HEAVY_HITTERS in self._statistics:
+            self._heavy_hitters = [ sketch.HeavyHitters(support=self._support) for _ in range(p_num_features) ]
+
+
+## -------------------------------------------------------------------------------------------------
+    def update(self, p_values : np.ndarray):
+        """
+        Updates the statistics of all features with a feature vector.
+
+        Parameters
+        ----------
+        p_values : np.ndarray
+            Feature vector. Shape (d,).
+        """
+
+        if self._stats is None: self._setup_stats(p_values.shape[0])
+
+        values = p_values.tolist()
+
+        for row in self._stats:
+            for stat, value in zip(row, values): stat.update(value)
+
+        if self._histograms is not None:
+            for histogram, value in zip(self._histograms, values): histogram.update(value)
+
+        if self._heavy_hitters is not None:
+            for heavy_hitters, value in zip(self._heavy_hitters, values): heavy_hitters.update(value)
+
+        self._num_inst += 1
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_instances : InstDict):
+        """
+        Updates the statistics with all new instances, if adaptivity is turned on.
+
+        Parameters
+        ----------
+        p_instances : InstDict
+            Stream instances to be processed.
+        """
+
+        if not self._adaptivity: return
+
+        for inst_id, (inst_type, inst) in sorted(p_instances.items()):
+            if inst_type == InstTypeNew: self.update(self.C_INPUT_CACHE.get_values(inst))
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_values(self) -> np.ndarray:
+        """
+        Reads out the scalar statistics of all features at once. Statistics without a value are
+        returned as NaN.
+
+        Returns
+        -------
+        np.ndarray
+            Scalar statistics. Shape (k, d) with one row per name of method get_statistic_names().
+            Without scalar statistics, the shape is (0, d). None before the first instance.
+        """
+
+        if self._stats is None: return None
+        if len(self._stats) == 0: return np.empty((0, self._num_features))
+
+        values = [ stat.get() for row in self._stats for stat in row ]
+        return np.array([ np.nan if v is None else v for v in values ], dtype=np.float64).reshape(len(self._stats), -1)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_statistic_names(self) -> list:
+        """
+        This method returns the names of the rows of the read-out array of method get_values().
+        """
+
+        return self._stat_names
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_histograms(self) -> list:
+        """
+        Reads out the histograms of all features.
+
+        Returns
+        -------
+        list
+            One array of shape (b, 3) per feature with the left border, the right border and the
+            count of each bin. None, if statistic C_STAT_HISTOGRAM is not kept.
+        """
+
+        if self._histograms is None: return None
+
+        return [ np.array([ (b.left, b.right, b.count) for b in histogram ], dtype=np.float64).reshape(-1, 3)
+                 for histogram in self._histograms ]
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_heavy_hitters(self, p_num : int = None) -> list:
+        """
+        Reads out the most frequent values of all features.
+
+        Parameters
+        ----------
+        p_num : int
+            Optional maximum number of values per feature. Default: None (all reported values).
+
+        Returns
+        -------
+        list
+            One list of tuples (value, estimated count) per feature. None, if statistic
+            C_STAT_HEAVY_HITTERS is not kept.
+        """
+
+        if self._heavy_hitters is None: return None
+
+        return [ heavy_hitters.most_common(p_num) for heavy_hitters in self._heavy_hitters ]
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_num_instances(self) -> int:
+        """
+        This method returns the number of instances the statistics were updated with.
+        """
+
+        return self._num_inst
@@ -0,0 +1,141 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river
+## -- Module  : howto_oa_ad_001_run_halfspacetrees_point_outliers.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module demonstrates online anomaly detection on a stream with point outliers using the wrapped
+River implementation of HalfSpaceTrees with its two engines. The River engine scores one instance
+after another, while the NumPy engine scores windows of instances in one vectorized step. Both
+engines detect the same anomalies.
+
+In particular you will learn:
+
+1. How to set up a River anomaly detector in a stream workflow
+
+2. How to switch to the NumPy engine and score windows of instances
+
+3. How to register an event handler for point anomalies
+
+"""
+
+
+from datetime import datetime
+
+from mlpro.bf import Log, Mode
+from mlpro.bf.streams.streams import StreamMLProPOutliers
+from mlpro.oa.streams import *
+from mlpro.oa.streams.tasks.changedetectors.anomalydetectors import PointAnomaly
+
+from mlpro_int_river.wrappers.anomalydetectors import WrRiverHalfSpaceTrees2MLPro
+
+
+
+# 1 Prepare a scenario for a stream with point outliers
+class PointOutlierScenario(OAStreamScenario):
+
+    C_NAME = 'PointOutlierScenario'
+
+    def __init__(self, p_engine, p_batch_size, **p_kwargs):
+        self._engine     = p_engine
+        self._batch_size = p_batch_size
+        super().__init__(**p_kwargs)
+
+
+    def _setup(self, p_mode, p_ada: bool, p_visualize: bool, p_logging):
+
+        # 1.1 Get MLPro benchmark stream
+        stream = StreamMLProPOutliers( p_num_instances = 5000,
+                                       p_functions = ['sin', 'cos', 'const'],
+                                       p_outlier_rate = 0.01,
+                                       p_seed = 3,
+                                       p_logging = Log.C_LOG_NOTHING )
+
+        # 1.2 Set up a stream workflow
+
+        # 1.2.1 Creation of a workflow
+        workflow = OAStreamWorkflow( p_name='Anomaly Detection using HalfSpaceTrees@River',
+                                     p_range_max=OAStreamWorkflow.C_RANGE_NONE,
+                                     p_ada=p_ada,
+                                     p_visualize=p_visualize,
+                                     p_logging=p_logging )
+
+
+        # 1.2.2 Creation of tasks and add them to the workflow
+
+        # Anomaly Detector
+        task_detector = WrRiverHalfSpaceTrees2MLPro( p_name='#1: HalfSpaceTrees@River',
+                                                     p_n_trees=10,
+                                                     p_height=8,
+                                                     p_window_size=250,
+                                                     p_limits={ 1 : (-3, 3), 2 : (-3, 3), 3 : (-3, 3) },
+                                                     p_seed=42,
+                                                     p_engine=self._engine,
+                                                     p_batch_size=self._batch_size,
+                                                     p_visualize=p_visualize,
+                                                     p_logging=p_logging )
+
+        workflow.add_task(p_task = task_detector)
+
+        # 1.3 Return stream and workflow
+        return stream, workflow
+
+
+
+# 2 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    cycle_limit = 5000
+    logging     = Log.C_LOG_WE
+else:
+    cycle_limit = 300
+    logging     = Log.C_LOG_NOTHING
+
+
+
+# 3 Run the scenario with both engines
+results = {}
+
+for engine, batch_size in [ ( WrRiverHalfSpaceTrees2MLPro.C_ENGINE_RIVER, 1 ),
+                            ( WrRiverHalfSpaceTrees2MLPro.C_ENGINE_NUMPY, 50 ) ]:
+
+    myscenario = PointOutlierScenario( p_engine=engine,
+                                       p_batch_size=batch_size,
+                                       p_mode=Mode.C_MODE_REAL,
+                                       p_cycle_limit=cycle_limit,
+                                       p_visualize=False,
+                                       p_logging=logging )
+
+    myscenario.reset()
+
+    # 3.1 Register an event handler for point anomalies
+    detector  = myscenario.get_workflow()._tasks[0]
+    anomalies = []
+    detector.register_event_handler( p_event_id = PointAnomaly.get_event_id(p_status=True),
+                                     p_event_handler = lambda p_event_id, p_event_object : anomalies.append(p_event_object) )
+
+    tp_before     = datetime.now()
+    myscenario.run()
+    detector.flush()
+    tp_delta      = datetime.now() - tp_before
+    duraction_sec = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
+    myscenario.log(Log.C_LOG_TYPE_S, 'Engine', engine, ', batch size', batch_size, ', duration [sec]:',
+                   round(duraction_sec,2), ', Cycles/sec:', round(cycle_limit/duraction_sec,2))
+
+    results[engine] = [ ( a.instances[-1].id, round(a.score, 12) ) for a in anomalies ]
+    print('Engine', engine, 'with batch size', batch_size, '- number of anomalies:', len(anomalies))
+
+
+
+# 4 Validating the anomalies of both engines
+if results[WrRiverHalfSpaceTrees2MLPro.C_ENGINE_RIVER] == results[WrRiverHalfSpaceTrees2MLPro.C_ENGINE_NUMPY]:
+    print('The anomalies of the River engine and the NumPy engine match!')
+else:
+    print('The anomalies of the River engine and the NumPy engine do not match!')
@@ -0,0 +1,139 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river
+## -- Module  : howto_oa_dd_001_run_pagehinkley_multi_feature.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module demonstrates online drift detection on a 10-dimensional stream using the wrapped River
+implementation of PageHinkley with its two engines. A single task monitors all features with one
+Page-Hinkley test per feature. The point cloud of the stream starts moving after 1500 instances.
+The River engine updates one River detector per feature, while the NumPy engine updates the tests
+of all features in one vectorized step. Both engines detect the same drifts.
+
+In particular you will learn:
+
+1. How to set up a River drift detector for all features in a stream workflow
+
+2. How to switch to the NumPy engine
+
+3. How to register an event handler for drifts
+
+"""
+
+
+from datetime import datetime
+
+from mlpro.bf import Log, Mode
+from mlpro.bf.streams.streams import StreamMLProClusterGenerator
+from mlpro.oa.streams import *
+from mlpro.oa.streams.tasks.changedetectors.driftdetectors.drifts.instancebased.basics import DriftIB
+
+from mlpro_int_river.wrappers.driftdetectors import WrRiverPageHinkley2MLPro
+
+
+
+# 1 Prepare a scenario for a 10-dimensional stream with a moving point cloud
+class MovingCloudScenario(OAStreamScenario):
+
+    C_NAME = 'MovingCloudScenario'
+
+    def __init__(self, p_engine, **p_kwargs):
+        self._engine = p_engine
+        super().__init__(**p_kwargs)
+
+
+    def _setup(self, p_mode, p_ada: bool, p_visualize: bool, p_logging):
+
+        # 1.1 Get MLPro benchmark stream
+        stream = StreamMLProClusterGenerator( p_num_dim = 10,
+                                              p_num_instances = 3000,
+                                              p_num_clusters = 1,
+                                              p_radii = [10.0],
+                                              p_velocities = [0.0],
+                                              p_change_velocities = True,
+                                              p_points_of_change_velocities = [1500],
+                                              p_num_clusters_for_change_velocities = 1,
+                                              p_changed_velocities = [0.1],
+                                              p_seed = 1,
+                                              p_logging = Log.C_LOG_NOTHING )
+
+        # 1.2 Set up a stream workflow
+
+        # 1.2.1 Creation of a workflow
+        workflow = OAStreamWorkflow( p_name='Drift Detection using PageHinkley@River',
+                                     p_range_max=OAStreamWorkflow.C_RANGE_NONE,
+                                     p_ada=p_ada,
+                                     p_visualize=p_visualize,
+                                     p_logging=p_logging )
+
+
+        # 1.2.2 Creation of tasks and add them to the workflow
+
+        # Drift Detector
+        task_detector = WrRiverPageHinkley2MLPro( p_name='#1: PageHinkley@River',
+                                                  p_threshold=500.0,
+                                                  p_engine=self._engine,
+                                                  p_visualize=p_visualize,
+                                                  p_logging=p_logging )
+
+        workflow.add_task(p_task = task_detector)
+
+        # 1.3 Return stream and workflow
+        return stream, workflow
+
+
+
+# 2 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    cycle_limit = 3000
+    logging     = Log.C_LOG_WE
+else:
+    cycle_limit = 300
+    logging     = Log.C_LOG_NOTHING
+
+
+
+# 3 Run the scenario with both engines
+results = {}
+
+for engine in [ WrRiverPageHinkley2MLPro.C_ENGINE_RIVER, WrRiverPageHinkley2MLPro.C_ENGINE_NUMPY ]:
+
+    myscenario = MovingCloudScenario( p_engine=engine,
+                                      p_mode=Mode.C_MODE_REAL,
+                                      p_cycle_limit=cycle_limit,
+                                      p_visualize=False,
+                                      p_logging=logging )
+
+    myscenario.reset()
+
+    # 3.1 Register an event handler for drifts
+    detector = myscenario.get_workflow()._tasks[0]
+    drifts   = []
+    detector.register_event_handler( p_event_id = DriftIB.get_event_id(p_status=True),
+                                     p_event_handler = lambda p_event_id, p_event_object : drifts.append(p_event_object) )
+
+    tp_before     = datetime.now()
+    myscenario.run()
+    tp_delta      = datetime.now() - tp_before
+    duraction_sec = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
+    myscenario.log(Log.C_LOG_TYPE_S, 'Engine', engine, ', duration [sec]:', round(duraction_sec,2),
+                   ', Cycles/sec:', round(cycle_limit/duraction_sec,2))
+
+    results[engine] = [ ( d.instances[-1].id, d.feature ) for d in drifts ]
+    print('Engine', engine, '- number of drifts:', len(drifts), ', first drifts (instance id, feature):', results[engine][:5])
+
+
+
+# 4 Validating the drifts of both engines
+if results[WrRiverPageHinkley2MLPro.C_ENGINE_RIVER] == results[WrRiverPageHinkley2MLPro.C_ENGINE_NUMPY]:
+    print('The drifts of the River engine and the NumPy engine match!')
+else:
+    print('The drifts of the River engine and the NumPy engine do not match!')
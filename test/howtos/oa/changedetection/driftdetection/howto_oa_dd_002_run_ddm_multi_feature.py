@@ -0,0 +1,169 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river
+## -- Module  : howto_oa_dd_002_run_ddm_multi_feature.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     DA       Creation
+## -- 2026-10-19  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This module demonstrates online drift detection on a 10-dimensional stream of error indicators
+using the wrapped River implementation of DDM with its two engines. A custom stream task turns
+each feature into a 0/1 error indicator, that is 1 if the feature exceeds its first value. The
+point cloud of the stream starts moving after 500 instances, so that the error rates of several
+features rise. A single task monitors all features with one DDM detector per feature. The River
+engine updates one River detector per feature, while the NumPy engine updates the detectors of all
+features in one vectorized step. Both engines detect the same drifts.
+
+In particular you will learn:
+
+1. How to set up a binary River drift detector for all features in a stream workflow
+
+2. How to switch to the NumPy engine
+
+3. How to register an event handler for drifts
+
+"""
+
+
+from datetime import datetime
+
+import numpy as np
+
+from mlpro.bf import Log, Mode
+from mlpro.bf.streams import InstDict, StreamTask
+from mlpro.bf.streams.streams import StreamMLProClusterGenerator
+from mlpro.oa.streams import *
+from mlpro.oa.streams.tasks.changedetectors.driftdetectors.drifts.instancebased.basics import DriftIB
+
+from mlpro_int_river.wrappers.driftdetectors import WrRiverDDM2MLPro
+
+
+
+# 1 Prepare a custom stream task that turns the features into 0/1 error indicators
+class ErrorIndicator(StreamTask):
+
+    C_NAME = 'Error Indicator'
+
+    def __init__(self, **p_kwargs):
+        super().__init__(**p_kwargs)
+        self._reference = None
+
+
+    def _run(self, p_instances : InstDict):
+        for (inst_type, inst) in p_instances.values():
+            feature_data = inst.get_feature_data()
+            values       = np.asarray(feature_data.get_values(), dtype=float)
+            if self._reference is None: self._reference = values.copy()
+            feature_data.set_values( ( values > self._reference ).astype(float) )
+
+
+
+# 2 Prepare a scenario for a 10-dimensional stream with a moving point cloud
+class MovingCloudScenario(OAStreamScenario):
+
+    C_NAME = 'MovingCloudScenario'
+
+    def __init__(self, p_engine, **p_kwargs):
+        self._engine = p_engine
+        super().__init__(**p_kwargs)
+
+
+    def _setup(self, p_mode, p_ada: bool, p_visualize: bool, p_logging):
+
+        # 2.1 Get MLPro benchmark stream
+        stream = StreamMLProClusterGenerator( p_num_dim = 10,
+                                              p_num_instances = 3000,
+                                              p_num_clusters = 1,
+                                              p_radii = [10.0],
+                                              p_velocities = [0.0],
+                                              p_change_velocities = True,
+                                              p_points_of_change_velocities = [500],
+                                              p_num_clusters_for_change_velocities = 1,
+                                              p_changed_velocities = [0.1],
+                                              p_seed = 1,
+                                              p_logging = Log.C_LOG_NOTHING )
+
+        # 2.2 Set up a stream workflow
+
+        # 2.2.1 Creation of a workflow
+        workflow = OAStreamWorkflow( p_name='Drift Detection using DDM@River',
+                                     p_range_max=OAStreamWorkflow.C_RANGE_NONE,
+                                     p_ada=p_ada,
+                                     p_visualize=p_visualize,
+                                     p_logging=p_logging )
+
+
+        # 2.2.2 Creation of tasks and add them to the workflow
+
+        # Error indicator
+        task_errors = ErrorIndicator( p_name='#1: Error Indicator',
+                                      p_visualize=p_visualize,
+                                      p_logging=p_logging )
+
+        workflow.add_task(p_task = task_errors)
+
+        # Drift Detector
+        task_detector = WrRiverDDM2MLPro( p_name='#2: DDM@River',
+                                          p_engine=self._engine,
+                                          p_visualize=p_visualize,
+                                          p_logging=p_logging )
+
+        workflow.add_task(p_task = task_detector, p_pred_tasks=[task_errors])
+
+        # 2.3 Return stream and workflow
+        return stream, workflow
+
+
+
+# 3 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    cycle_limit = 3000
+    logging     = Log.C_LOG_WE
+else:
+    cycle_limit = 1000
+    logging     = Log.C_LOG_NOTHING
+
+
+
+# 4 Run the scenario with both engines
+results = {}
+
+for engine in [ WrRiverDDM2MLPro.C_ENGINE_RIVER, WrRiverDDM2MLPro.C_ENGINE_NUMPY ]:
+
+    myscenario = MovingCloudScenario( p_engine=engine,
+                                      p_mode=Mode.C_MODE_REAL,
+                                      p_cycle_limit=cycle_limit,
+                                      p_visualize=False,
+                                      p_logging=logging )
+
+    myscenario.reset()
+
+    # 4.1 Register an event handler for drifts
+    detector = myscenario.get_workflow()._tasks[1]
+    drifts   = []
+    detector.register_event_handler( p_event_id = DriftIB.get_event_id(p_status=True),
+                                     p_event_handler = lambda p_event_id, p_event_object : drifts.append(p_event_object) )
+
+    tp_before     = datetime.now()
+    myscenario.run()
+    tp_delta      = datetime.now() - tp_before
+    duraction_sec = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
+    myscenario.log(Log.C_LOG_TYPE_S, 'Engine', engine, ', duration [sec]:', round(duraction_sec,2),
+                   ', Cycles/sec:', round(cycle_limit/duraction_sec,2))
+
+    results[engine] = [ ( d.instances[-1].id, d.feature ) for d in drifts ]
+    print('Engine', engine, '- number of drifts:', len(drifts), ', first drifts (instance id, feature):', results[engine][:5])
+
+
+
+# 5 Validating the drifts of both engines
+if results[WrRiverDDM2MLPro.C_ENGINE_RIVER] == results[WrRiverDDM2MLPro.C_ENGINE_NUMPY]:
+    print('The drifts of the River engine and the NumPy engine match!')
+else:
+    print('The drifts of the River engine and the NumPy engine do not match!')
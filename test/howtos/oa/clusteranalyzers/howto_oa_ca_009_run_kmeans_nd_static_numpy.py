@@ -0,0 +1,141 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river
+## -- Module  : howto_oa_ca_009_run_kmeans_nd_static_numpy.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module demonstrates online cluster analysis of static high-dimensional random point clouds
+using the wrapped River implementation of stream algorithm KMeans with its two engines. The original
+River engine and the NumPy engine are run on the same stream and their results are compared.
+Afterwards, the NumPy engine is run with mini-batches.
+
+In particular you will learn:
+
+1. How to switch the wrapper of River's KMeans to the NumPy engine
+
+2. That the NumPy engine reproduces the centers of River for a batch size of 1
+
+3. How to process instances in mini-batches
+
+"""
+
+
+from datetime import datetime
+
+import numpy as np
+
+from mlpro.bf import *
+from mlpro.bf.streams.streams import *
+from mlpro.bf.streams.streams.clouds import *
+from mlpro.oa.streams import *
+from mlpro_int_river.wrappers.clusteranalyzers import WrRiverKMeans2MLPro
+
+
+
+# 1 Prepare a scenario for static nD point clouds
+class StaticNDScenario(OAStreamScenario):
+
+    C_NAME = 'StaticNDScenario'
+
+    def __init__(self, p_engine, p_batch_size, **p_kwargs):
+        self._engine     = p_engine
+        self._batch_size = p_batch_size
+        super().__init__(**p_kwargs)
+
+
+    def _setup(self, p_mode, p_ada: bool, p_visualize: bool, p_logging):
+
+        # 1.1 Get MLPro benchmark stream
+        stream = StreamMLProClouds( p_num_dim = 16,
+                                    p_num_instances = 2000,
+                                    p_num_clouds = 5,
+                                    p_seed = 1,
+                                    p_radii=[100],
+                                    p_logging=Log.C_LOG_NOTHING )
+
+
+        # 1.2 Set up a stream workflow
+
+        # 1.2.1 Creation of a workflow
+        workflow = OAStreamWorkflow( p_name='Cluster Analysis using KMeans@River',
+                                     p_range_max=OAStreamWorkflow.C_RANGE_NONE,
+                                     p_ada=p_ada,
+                                     p_visualize=p_visualize,
+                                     p_logging=p_logging )
+
+
+        # 1.2.2 Creation of tasks and add them to the workflow
+
+        # Cluster Analyzer
+        task_clusterer = WrRiverKMeans2MLPro( p_name='#1: KMeans@River',
+                                              p_n_clusters=5,
+                                              p_halflife=0.1,
+                                              p_sigma=3,
+                                              p_seed=42,
+                                              p_engine=self._engine,
+                                              p_batch_size=self._batch_size,
+                                              p_visualize=p_visualize,
+                                              p_logging=p_logging )
+
+        workflow.add_task(p_task = task_clusterer)
+
+        # 1.3 Return stream and workflow
+        return stream, workflow
+
+
+
+# 2 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    cycle_limit = 2000
+    logging     = Log.C_LOG_WE
+else:
+    cycle_limit = 100
+    logging     = Log.C_LOG_NOTHING
+
+
+
+# 3 Run the scenario with both engines and with mini-batches of the NumPy engine
+results = {}
+
+for engine, batch_size in [ ( WrRiverKMeans2MLPro.C_ENGINE_RIVER, 1 ),
+                            ( WrRiverKMeans2MLPro.C_ENGINE_NUMPY, 1 ),
+                            ( WrRiverKMeans2MLPro.C_ENGINE_NUMPY, 20 ) ]:
+
+    myscenario = StaticNDScenario( p_engine=engine,
+                                   p_batch_size=batch_size,
+                                   p_mode=Mode.C_MODE_REAL,
+                                   p_cycle_limit=cycle_limit,
+                                   p_visualize=False,
+                                   p_logging=logging )
+
+    myscenario.reset()
+
+    tp_before     = datetime.now()
+    myscenario.run()
+    tp_delta      = datetime.now() - tp_before
+    duraction_sec = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
+    myscenario.log(Log.C_LOG_TYPE_S, 'Engine', engine, ', batch size', batch_size, ', duration [sec]:',
+                   round(duraction_sec,2), ', Cycles/sec:', round(cycle_limit/duraction_sec,2))
+
+    clusters = myscenario.get_workflow()._tasks[0].clusters
+    results[(engine, batch_size)] = np.array([ clusters[x].centroid.value for x in range(len(clusters)) ])
+    print('Engine', engine, 'with batch size', batch_size, '- sizes of clusters:', [ clusters[x].size.value for x in range(len(clusters)) ])
+
+
+
+# 4 Validating the centers of both engines
+centers_river = results[(WrRiverKMeans2MLPro.C_ENGINE_RIVER, 1)]
+centers_numpy = results[(WrRiverKMeans2MLPro.C_ENGINE_NUMPY, 1)]
+
+if np.array_equal(centers_river, centers_numpy):
+    print('The centers of the River engine and the NumPy engine match!')
+else:
+    print('The centers of the River engine and the NumPy engine do not match!')
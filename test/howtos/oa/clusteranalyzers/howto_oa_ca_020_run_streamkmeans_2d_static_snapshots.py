@@ -0,0 +1,136 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river
+## -- Module  : howto_oa_ca_020_run_streamkmeans_2d_static_snapshots.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module demonstrates online cluster analysis of static 2D random point clouds using the wrapped
+River implementation of stream algorithm STREAMKMeans, while a separate reader thread observes the 
+clusters. The cluster analyzer publishes immutable, versioned snapshots of its clusters at a 
+configurable cadence. The reader thread consumes them without locking out the adaptation.
+
+In particular you will learn:
+
+1. How to turn on the publication of cluster snapshots
+
+2. How to read consistent cluster snapshots from another thread
+
+"""
+
+
+import threading
+from datetime import datetime
+
+from mlpro.bf import Log, Mode
+from mlpro.bf.streams.streams.clouds import *
+from mlpro.oa.streams import *
+
+from mlpro_int_river.wrappers.clusteranalyzers import WrRiverStreamKMeans2MLPro
+
+
+
+# 1 Prepare a scenario for Static 2D Point Clouds
+class Static2DScenario(OAStreamScenario):
+
+    C_NAME = 'Static2DScenario'
+
+    def _setup(self, p_mode, p_ada: bool, p_visualize: bool, p_logging):
+
+        # 1.1 Get MLPro benchmark stream
+        stream = StreamMLProClouds( p_num_dim = 2,
+                                    p_num_instances = 2000,
+                                    p_num_clouds = 5,
+                                    p_seed = 1,
+                                    p_radii=[100],
+                                    p_logging=Log.C_LOG_NOTHING )
+
+        # 1.2 Set up a stream workflow
+
+        # 1.2.1 Creation of a workflow
+        workflow = OAStreamWorkflow( p_name='Cluster Analysis using STREAMKMeans@River',
+                                     p_range_max=OAStreamWorkflow.C_RANGE_NONE,
+                                     p_ada=p_ada,
+                                     p_visualize=p_visualize,
+                                     p_logging=p_logging )
+
+
+        # 1.2.2 Creation of tasks and add them to the workflow
+
+        # Cluster Analyzer
+        task_clusterer = WrRiverStreamKMeans2MLPro( p_name='#1: STREAMKMeans@River',
+                                                    p_chunk_size=10,
+                                                    p_n_clusters=5,
+                                                    p_halflife=1.0, 
+                                                    p_sigma=3,
+                                                    p_seed=42,
+                                                    p_snapshot_cadence=50,
+                                                    p_visualize=p_visualize,
+                                                    p_logging=p_logging )
+        
+        workflow.add_task(p_task = task_clusterer)
+
+        # 1.3 Return stream and workflow
+        return stream, workflow
+
+
+
+# 2 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    cycle_limit = 2000
+    logging     = Log.C_LOG_WE
+else:
+    cycle_limit = 100
+    logging     = Log.C_LOG_NOTHING
+
+
+
+# 3 Instantiate the stream scenario
+myscenario = Static2DScenario( p_mode=Mode.C_MODE_REAL,
+                               p_cycle_limit=cycle_limit,
+                               p_visualize=False,
+                               p_logging=logging )
+
+myscenario.reset()
+clusterer = myscenario.get_workflow()._tasks[0]
+
+
+
+# 4 Reader thread that observes the published snapshots without locking out the adaptation
+versions_read = []
+stop_reader   = threading.Event()
+
+def read_snapshots():
+    while not stop_reader.wait(0.001):
+        snapshot = clusterer.get_snapshot()
+        if ( snapshot is None ) or ( versions_read and versions_read[-1] == snapshot.version ): continue
+        versions_read.append(snapshot.version)
+        myscenario.log(Log.C_LOG_TYPE_W, 'Snapshot version', snapshot.version, 'with', len(snapshot.ids), 
+                       'clusters, total size', int(snapshot.sizes[snapshot.sizes > 0].sum()))
+
+reader = threading.Thread(target=read_snapshots, daemon=True)
+reader.start()
+
+
+
+# 5 Run the stream scenario
+tp_before     = datetime.now()
+myscenario.run()
+tp_delta      = datetime.now() - tp_before
+stop_reader.set()
+reader.join()
+
+duraction_sec = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
+myscenario.log(Log.C_LOG_TYPE_S, 'Duration [sec]:', round(duraction_sec,2), ', Cycles/sec:', round(cycle_limit/duraction_sec,2))
+
+snapshot = clusterer.get_snapshot()
+myscenario.log(Log.C_LOG_TYPE_W, 'Latest snapshot version', snapshot.version, ',', len(versions_read), 'versions observed by the reader thread')
+for x, center, size in zip(snapshot.ids, snapshot.centers, snapshot.sizes):
+    myscenario.log(Log.C_LOG_TYPE_W, 'Center of Cluster ', str(x+1), ': ', list(center), ', Size: ', size)
@@ -0,0 +1,167 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river
+## -- Module  : howto_oa_ca_023_run_clustream_2d_static_micro_clusters.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -- 2026-10-19  1.0.1     DA       Mean time stamp instead of time stamp of the last update
+## -- 2026-10-19  1.0.2     DA       Time stamp of the last update restored
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.2 (2026-10-19)
+
+This module demonstrates online cluster analysis of static 2D random point clouds using the wrapped
+River implementation of stream algorithm CluStream. Additionally, the micro-clusters maintained by
+CluStream are accessed as compact NumPy arrays (weights, linear sums, squared sums, radii, sums
+of time stamps and time stamps of the last update).
+
+In particular you will learn:
+
+1. How to set up, run and visualize an online adaptive custom stream processing scenario 
+
+2. How to reuse wrapped River algorithms in own custom stream processing workflows
+
+3. How to access the micro-clusters of CluStream as structure-of-arrays view
+
+"""
+
+
+from datetime import datetime
+
+import numpy as np
+
+from mlpro.bf import Log, Mode, PlotSettings
+from mlpro.bf.streams.streams.clouds import *
+from mlpro.oa.streams import *
+
+from mlpro_int_river.wrappers.clusteranalyzers import WrRiverCluStream2MLPro
+
+
+
+# 1 Prepare a scenario for Static 2D Point Clouds
+class Static2DScenario(OAStreamScenario):
+
+    C_NAME = 'Static2DScenario'
+
+    def _setup(self, p_mode, p_ada: bool, p_visualize: bool, p_logging):
+
+        # 1.1 Get MLPro benchmark stream
+        stream = StreamMLProClouds( p_num_dim = 2,
+                                    p_num_instances = 2000,
+                                    p_num_clouds = 5,
+                                    p_seed = 1,
+                                    p_radii=[100],
+                                    p_logging=Log.C_LOG_NOTHING )
+
+        # 1.2 Set up a stream workflow
+
+        # 1.2.1 Creation of a workflow
+        workflow = OAStreamWorkflow( p_name='Cluster Analysis using CluStream@River',
+                                     p_range_max=OAStreamWorkflow.C_RANGE_NONE,
+                                     p_ada=p_ada,
+                                     p_visualize=p_visualize,
+                                     p_logging=p_logging )
+
+
+        # 1.2.2 Creation of tasks and add them to the workflow
+
+        # Cluster Analyzer
+        task_clusterer = WrRiverCluStream2MLPro( p_name='#1: CluStream@River',
+                                                 p_n_macro_clusters = 5,
+                                                 p_max_micro_clusters = 20,
+                                                 p_micro_cluster_r_factor = 2,
+                                                 p_time_window = 100,
+                                                 p_time_gap = 10,
+                                                 p_seed = 41,
+                                                 p_halflife = 1.0,
+                                                 p_mu = 1,
+                                                 p_sigma = 1,
+                                                 p_p = 2,
+                                                 p_micro_cluster_view = True,
+                                                 p_visualize=p_visualize,
+                                                 p_logging=p_logging )
+        
+        workflow.add_task(p_task = task_clusterer)
+
+        # 1.3 Return stream and workflow
+        return stream, workflow
+
+
+
+# 2 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    cycle_limit = 1000
+    logging     = Log.C_LOG_ALL
+    visualize   = True
+    step_rate   = 2
+else:
+    cycle_limit = 100
+    logging     = Log.C_LOG_NOTHING
+    visualize   = False
+    step_rate   = 1
+
+
+
+# 3 Instantiate the stream scenario
+myscenario = Static2DScenario(
+    p_mode=Mode.C_MODE_REAL,
+    p_cycle_limit=cycle_limit,
+    p_visualize=visualize,
+    p_logging=logging)
+
+
+
+# 4 Reset and run own stream scenario
+myscenario.reset()
+
+if __name__ == '__main__':
+    myscenario.init_plot( p_plot_settings=PlotSettings( p_view = PlotSettings.C_VIEW_ND,
+                                                        p_step_rate = step_rate ) )
+    input('\nPlease arrange all windows and press ENTER to start stream processing...')
+
+tp_before           = datetime.now()
+myscenario.run()
+tp_after            = datetime.now()
+tp_delta            = tp_after - tp_before
+duraction_sec       = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
+myscenario.log(Log.C_LOG_TYPE_S, 'Duration [sec]:', round(duraction_sec,2), ', Cycles/sec:', round(cycle_limit/duraction_sec,2))
+
+
+
+# 5 Recap of the micro-clusters
+task_clusterer      = myscenario.get_workflow()._tasks[0]
+micro_clusters      = task_clusterer.get_micro_clusters()
+num_mc              = micro_clusters.num_micro_clusters
+
+myscenario.log(Log.C_LOG_TYPE_I, '-------------------------------------------------------')
+myscenario.log(Log.C_LOG_TYPE_I, '-------------------------------------------------------')
+myscenario.log(Log.C_LOG_TYPE_I, 'Here is the recap of the micro-clusters')
+myscenario.log(Log.C_LOG_TYPE_I, 'Number of micro-clusters: ', num_mc)
+for x in range(num_mc):
+    myscenario.log(Log.C_LOG_TYPE_I, 'Micro-cluster', str(x), 
+                   ': N =', micro_clusters.weights[x], 
+                   ', LS =', list(micro_clusters.ls[x]), 
+                   ', radius =', round(micro_clusters.radii[x],2),
+                   ', mean time stamp =', round(micro_clusters.lst[x] / micro_clusters.weights[x],2),
+                   ', last update =', micro_clusters.t_last[x])
+myscenario.log(Log.C_LOG_TYPE_I, '-------------------------------------------------------')
+myscenario.log(Log.C_LOG_TYPE_I, '-------------------------------------------------------')
+
+
+
+# 6 Validating the centers of the micro-clusters between original algorithm and wrapper
+river_mcs           = task_clusterer.get_algorithm().micro_clusters
+mc_centers          = micro_clusters.get_centers()
+
+for x in range(num_mc):
+    if np.allclose(mc_centers[x], list(river_mcs[x].center.values())):
+        print("The center of micro-cluster %s from river and mlpro matches!"%(x))
+    else:
+        print("The center of micro-cluster %s from river and mlpro does not match!"%(x))
+
+if __name__ == '__main__':
+    input('Press ENTER to exit...')
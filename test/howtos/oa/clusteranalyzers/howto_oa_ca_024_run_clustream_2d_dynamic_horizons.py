@@ -0,0 +1,151 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river
+## -- Module  : howto_oa_ca_024_run_clustream_2d_dynamic_horizons.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module demonstrates online cluster analysis of dynamic 2D random point clouds using the wrapped
+River implementation of stream algorithm CluStream. The micro-clusters are stored in a pyramidal 
+time frame which enables an offline macro clustering over arbitrary time horizons.
+
+In particular you will learn:
+
+1. How to set up, run and visualize an online adaptive custom stream processing scenario 
+
+2. How to reuse wrapped River algorithms in own custom stream processing workflows
+
+3. How to determine macro clusters of CluStream over different time horizons
+
+"""
+
+
+from datetime import datetime
+
+import numpy as np
+
+from mlpro.bf import Log, Mode, PlotSettings
+from mlpro.bf.streams.streams.clouds import *
+from mlpro.oa.streams import *
+
+from mlpro_int_river.wrappers.clusteranalyzers import WrRiverCluStream2MLPro
+
+
+
+# 1 Prepare a scenario for Dynamic 2D Point Clouds
+class Dynamic2DScenario(OAStreamScenario):
+
+    C_NAME = 'Dynamic2DScenario'
+
+    def _setup(self, p_mode, p_ada: bool, p_visualize: bool, p_logging):
+
+        # 1.1 Get MLPro benchmark stream
+        stream = StreamMLProClouds( p_num_dim = 2,
+                                    p_num_instances = 2000,
+                                    p_num_clouds = 5,
+                                    p_seed = 1,
+                                    p_radii=[100],
+                                    p_velocity=1,
+                                    p_logging=Log.C_LOG_NOTHING )
+
+        # 1.2 Set up a stream workflow
+
+        # 1.2.1 Creation of a workflow
+        workflow = OAStreamWorkflow( p_name='Cluster Analysis using CluStream@River',
+                                     p_range_max=OAStreamWorkflow.C_RANGE_NONE,
+                                     p_ada=p_ada,
+                                     p_visualize=p_visualize,
+                                     p_logging=p_logging )
+
+
+        # 1.2.2 Creation of tasks and add them to the workflow
+
+        # Cluster Analyzer
+        task_clusterer = WrRiverCluStream2MLPro( p_name='#1: CluStream@River',
+                                                 p_n_macro_clusters = 5,
+                                                 p_max_micro_clusters = 20,
+                                                 p_micro_cluster_r_factor = 2,
+                                                 p_time_window = 100,
+                                                 p_time_gap = 10,
+                                                 p_seed = 41,
+                                                 p_halflife = 1.0,
+                                                 p_mu = 1,
+                                                 p_sigma = 1,
+                                                 p_p = 2,
+                                                 p_snapshot_store = True,
+                                                 p_visualize=p_visualize,
+                                                 p_logging=p_logging )
+        
+        workflow.add_task(p_task = task_clusterer)
+
+        # 1.3 Return stream and workflow
+        return stream, workflow
+
+
+
+# 2 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    cycle_limit = 1000
+    logging     = Log.C_LOG_ALL
+    visualize   = True
+    step_rate   = 2
+else:
+    cycle_limit = 300
+    logging     = Log.C_LOG_NOTHING
+    visualize   = False
+    step_rate   = 1
+
+
+
+# 3 Instantiate the stream scenario
+myscenario = Dynamic2DScenario(
+    p_mode=Mode.C_MODE_REAL,
+    p_cycle_limit=cycle_limit,
+    p_visualize=visualize,
+    p_logging=logging)
+
+
+
+# 4 Reset and run own stream scenario
+myscenario.reset()
+
+if __name__ == '__main__':
+    myscenario.init_plot( p_plot_settings=PlotSettings( p_view = PlotSettings.C_VIEW_ND,
+                                                        p_step_rate = step_rate ) )
+    input('\nPlease arrange all windows and press ENTER to start stream processing...')
+
+tp_before           = datetime.now()
+myscenario.run()
+tp_after            = datetime.now()
+tp_delta            = tp_after - tp_before
+duraction_sec       = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
+myscenario.log(Log.C_LOG_TYPE_S, 'Duration [sec]:', round(duraction_sec,2), ', Cycles/sec:', round(cycle_limit/duraction_sec,2))
+
+
+
+# 5 Macro clusters over different time horizons
+task_clusterer      = myscenario.get_workflow()._tasks[0]
+
+myscenario.log(Log.C_LOG_TYPE_I, '-------------------------------------------------------')
+myscenario.log(Log.C_LOG_TYPE_I, '-------------------------------------------------------')
+myscenario.log(Log.C_LOG_TYPE_I, 'Number of stored snapshots: ', task_clusterer.get_snapshot_store().get_num_snapshots())
+
+for horizon in [ 50, 200, cycle_limit ]:
+    centers, weights = task_clusterer.get_macro_clusters( p_horizon = horizon )
+    myscenario.log(Log.C_LOG_TYPE_I, 'Macro clusters over the last', horizon, 'time units')
+    if centers is None: continue
+    for x in range(centers.shape[0]):
+        myscenario.log(Log.C_LOG_TYPE_I, 'Center of Cluster ', str(x+1), ': ', list(centers[x]), ', weight: ', weights[x])
+
+myscenario.log(Log.C_LOG_TYPE_I, '-------------------------------------------------------')
+myscenario.log(Log.C_LOG_TYPE_I, '-------------------------------------------------------')
+
+if __name__ == '__main__':
+    input('Press ENTER to exit...')
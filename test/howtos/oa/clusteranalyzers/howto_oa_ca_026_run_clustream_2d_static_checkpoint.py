@@ -0,0 +1,153 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river
+## -- Module  : howto_oa_ca_026_run_clustream_2d_static_checkpoint.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module demonstrates checkpoints of the wrapped River implementation of stream algorithm 
+CluStream. A first scenario runs on static 2D random point clouds while checkpoints are saved 
+periodically in a background thread. A second scenario restores the cluster analyzer from the last 
+checkpoint instead of learning from scratch and continues the stream processing.
+
+In particular you will learn:
+
+1. How to save checkpoints of a wrapped River cluster analyzer periodically in the background
+
+2. How to restore a wrapped River cluster analyzer from a checkpoint
+
+"""
+
+
+import os
+import tempfile
+from datetime import datetime
+
+import numpy as np
+
+from mlpro.bf import Log, Mode
+from mlpro.bf.streams.streams.clouds import *
+from mlpro.oa.streams import *
+
+from mlpro_int_river.wrappers.clusteranalyzers import WrRiverCluStream2MLPro
+
+
+
+# 1 Prepare a scenario for Static 2D Point Clouds
+class Static2DScenario(OAStreamScenario):
+
+    C_NAME = 'Static2DScenario'
+
+    def _setup(self, p_mode, p_ada: bool, p_visualize: bool, p_logging):
+
+        # 1.1 Get MLPro benchmark stream
+        stream = StreamMLProClouds( p_num_dim = 2,
+                                    p_num_instances = 2000,
+                                    p_num_clouds = 5,
+                                    p_seed = 1,
+                                    p_radii=[100],
+                                    p_logging=Log.C_LOG_NOTHING )
+
+        # 1.2 Set up a stream workflow
+
+        # 1.2.1 Creation of a workflow
+        workflow = OAStreamWorkflow( p_name='Cluster Analysis using CluStream@River',
+                                     p_range_max=OAStreamWorkflow.C_RANGE_NONE,
+                                     p_ada=p_ada,
+                                     p_visualize=p_visualize,
+                                     p_logging=p_logging )
+
+
+        # 1.2.2 Creation of tasks and add them to the workflow
+
+        # Cluster Analyzer
+        task_clusterer = WrRiverCluStream2MLPro( p_name='#1: CluStream@River',
+                                                 p_n_macro_clusters = 5,
+                                                 p_max_micro_clusters = 20,
+                                                 p_micro_cluster_r_factor = 2,
+                                                 p_time_window = 100,
+                                                 p_time_gap = 10,
+                                                 p_seed = 41,
+                                                 p_halflife = 1.0,
+                                                 p_mu = 1,
+                                                 p_sigma = 1,
+                                                 p_p = 2,
+                                                 p_micro_cluster_view = True,
+                                                 p_visualize=p_visualize,
+                                                 p_logging=p_logging )
+        
+        workflow.add_task(p_task = task_clusterer)
+
+        # 1.3 Return stream and workflow
+        return stream, workflow
+
+
+
+# 2 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    cycle_limit = 1000
+    logging     = Log.C_LOG_WE
+else:
+    cycle_limit = 20
+    logging     = Log.C_LOG_NOTHING
+
+path_checkpoint = os.path.join(tempfile.gettempdir(), 'howto_oa_ca_026_clustream.npz')
+
+
+
+# 3 Run the first scenario with periodic checkpoints in the background
+myscenario = Static2DScenario( p_mode=Mode.C_MODE_REAL,
+                               p_cycle_limit=cycle_limit,
+                               p_visualize=False,
+                               p_logging=logging )
+myscenario.reset()
+
+clusterer  = myscenario.get_workflow()._tasks[0]
+clusterer.start_checkpointing( p_path = path_checkpoint, p_interval = 0.5 )
+myscenario.run()
+clusterer.stop_checkpointing()
+
+ids_1, centers_1 = clusterer.get_cluster_centers()
+
+
+
+# 4 Restore the cluster analyzer of a second scenario from the last checkpoint
+myscenario2 = Static2DScenario( p_mode=Mode.C_MODE_REAL,
+                                p_cycle_limit=cycle_limit,
+                                p_visualize=False,
+                                p_logging=logging )
+myscenario2.reset()
+
+clusterer2 = myscenario2.get_workflow()._tasks[0]
+
+tp_before     = datetime.now()
+clusterer2.load_checkpoint( p_path = path_checkpoint )
+tp_delta      = datetime.now() - tp_before
+duraction_sec = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
+myscenario2.log(Log.C_LOG_TYPE_S, 'Checkpoint of', os.path.getsize(path_checkpoint), 'bytes loaded in [sec]:', round(duraction_sec,4))
+
+ids_2, centers_2 = clusterer2.get_cluster_centers()
+
+if ( ids_1 == ids_2 ) and np.array_equal(centers_1, centers_2):
+    print('The restored clusters match the clusters of the first scenario!')
+else:
+    print('The restored clusters do not match the clusters of the first scenario!')
+
+
+
+# 5 Continue the stream processing with the restored cluster analyzer
+myscenario2.run()
+
+clusters = clusterer2.clusters
+myscenario2.log(Log.C_LOG_TYPE_W, 'Number of clusters after continuation: ', len(clusters))
+for x in clusters.keys():
+    myscenario2.log(Log.C_LOG_TYPE_W, 'Center of Cluster ', str(x+1), ': ', list(clusters[x].centroid.value), ', Size: ', clusters[x].size.value)
+
+os.remove(path_checkpoint)
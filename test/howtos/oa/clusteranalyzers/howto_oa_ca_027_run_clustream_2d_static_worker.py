@@ -0,0 +1,139 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river
+## -- Module  : howto_oa_ca_027_run_clustream_2d_static_worker.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module demonstrates online cluster analysis of static 2D random point clouds using the wrapped
+River implementation of stream algorithm CluStream in a separate worker process. The instances are 
+shipped to the worker in batches through shared memory, while the clusters published by the worker
+are taken over by the cluster analyzer of the workflow. The results are compared with a cluster 
+analyzer that runs CluStream in the workflow itself.
+
+In particular you will learn:
+
+1. How to run a wrapped River cluster analyzer in a worker process
+
+2. How to stop the worker process and take over the trained River model
+
+"""
+
+
+from datetime import datetime
+
+import numpy as np
+
+from mlpro.bf import Log, Mode
+from mlpro.bf.streams.streams.clouds import *
+from mlpro.oa.streams import *
+
+from mlpro_int_river.wrappers.clusteranalyzers import WrRiverCluStream2MLPro
+
+
+
+# 1 Prepare a scenario for Static 2D Point Clouds
+class Static2DScenario(OAStreamScenario):
+
+    C_NAME = 'Static2DScenario'
+
+    def __init__(self, p_worker_batch_size, **p_kwargs):
+        self._worker_batch_size = p_worker_batch_size
+        super().__init__(**p_kwargs)
+
+
+    def _setup(self, p_mode, p_ada: bool, p_visualize: bool, p_logging):
+
+        # 1.1 Get MLPro benchmark stream
+        stream = StreamMLProClouds( p_num_dim = 2,
+                                    p_num_instances = 2000,
+                                    p_num_clouds = 5,
+                                    p_seed = 1,
+                                    p_radii=[100],
+                                    p_logging=Log.C_LOG_NOTHING )
+
+        # 1.2 Set up a stream workflow
+
+        # 1.2.1 Creation of a workflow
+        workflow = OAStreamWorkflow( p_name='Cluster Analysis using CluStream@River',
+                                     p_range_max=OAStreamWorkflow.C_RANGE_NONE,
+                                     p_ada=p_ada,
+                                     p_visualize=p_visualize,
+                                     p_logging=p_logging )
+
+
+        # 1.2.2 Creation of tasks and add them to the workflow
+
+        # Cluster Analyzer
+        task_clusterer = WrRiverCluStream2MLPro( p_name='#1: CluStream@River',
+                                                 p_n_macro_clusters = 5,
+                                                 p_max_micro_clusters = 20,
+                                                 p_micro_cluster_r_factor = 2,
+                                                 p_time_window = 100,
+                                                 p_time_gap = 10,
+                                                 p_seed = 41,
+                                                 p_halflife = 1.0,
+                                                 p_mu = 1,
+                                                 p_sigma = 1,
+                                                 p_p = 2,
+                                                 p_worker_batch_size = self._worker_batch_size,
+                                                 p_visualize=p_visualize,
+                                                 p_logging=p_logging )
+        
+        workflow.add_task(p_task = task_clusterer)
+
+        # 1.3 Return stream and workflow
+        return stream, workflow
+
+
+
+# 2 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    cycle_limit = 2000
+    logging     = Log.C_LOG_WE
+else:
+    cycle_limit = 100
+    logging     = Log.C_LOG_NOTHING
+
+
+
+# 3 Run the scenario with CluStream in the workflow and in a worker process
+results = {}
+
+for worker_batch_size in [ 0, 50 ]:
+
+    myscenario = Static2DScenario( p_worker_batch_size=worker_batch_size,
+                                   p_mode=Mode.C_MODE_REAL,
+                                   p_cycle_limit=cycle_limit,
+                                   p_visualize=False,
+                                   p_logging=logging )
+    myscenario.reset()
+
+    clusterer     = myscenario.get_workflow()._tasks[0]
+    tp_before     = datetime.now()
+    myscenario.run()
+    clusterer.stop_worker()
+    tp_delta      = datetime.now() - tp_before
+    duraction_sec = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
+    myscenario.log(Log.C_LOG_TYPE_W, 'Worker batch size', worker_batch_size, ', duration [sec]:',
+                   round(duraction_sec,2), ', Cycles/sec:', round(cycle_limit/duraction_sec,2))
+
+    results[worker_batch_size] = clusterer.get_cluster_centers()
+
+
+
+# 4 Validating the clusters of both runs
+ids_workflow, centers_workflow = results[0]
+ids_worker, centers_worker     = results[50]
+
+if ( ids_workflow == ids_worker ) and np.allclose(centers_workflow, centers_worker):
+    print('The clusters computed in the workflow and in the worker process match!')
+else:
+    print('The clusters computed in the workflow and in the worker process do not match!')
@@ -0,0 +1,192 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river
+## -- Module  : howto_oa_ca_032_run_dbstream_2d_static_normalized.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     DA       Creation
+## -- 2026-10-19  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This module demonstrates online cluster analysis of normalized static 2D random point clouds using the wrapped
+River implementation of stream algorithm DBSTREAM. To this regard, the systematics of sub-framework
+MLPro-OA-Streams for online adaptive stream processing is used to implement a scenario consisting of
+a custom workflow and a native benchmark stream. On each change of the normalization parameters, the
+micro-clusters and the shared density graph of DBSTREAM are renormalized.
+Finally, the clusters are checked against the stream data normalized with the final parameters.
+
+In particular you will learn:
+
+1. How to set up, run and visualize an online adaptive custom stream processing scenario
+
+2. How to reuse wrapped River algorithms in own custom stream processing workflows
+
+3. How to reuse native MLPro benchmark streams
+
+4. How to reuse native MLPro online adaptive min-max normalization for data preprocessing
+
+"""
+
+
+from datetime import datetime
+
+import numpy as np
+
+from mlpro.bf import *
+from mlpro.bf.streams.streams import StreamMLProClouds
+from mlpro.oa.streams import *
+from mlpro.oa.streams.tasks import BoundaryDetector, NormalizerMinMax
+
+from mlpro_int_river.wrappers.clusteranalyzers import WrRiverDBStream2MLPro
+
+
+
+# 1 Prepare a scenario for Static 2D Point Clouds
+class Static2DScenario(OAStreamScenario):
+
+    C_NAME = 'Static2DScenario'
+
+    def _setup(self, p_mode, p_ada: bool, p_visualize: bool, p_logging):
+
+        # 1.1 Get stream from StreamMLProClouds
+        stream = StreamMLProClouds( p_num_dim = 2,
+                                    p_num_instances = 2000,
+                                    p_num_clouds = 5,
+                                    p_seed = 1,
+                                    p_radii=[100],
+                                    p_logging=Log.C_LOG_NOTHING )
+
+        # 1.2 Set up a stream workflow based on a custom stream task
+
+        # 1.2.1 Creation of a workflow
+        workflow = OAStreamWorkflow( p_name='Cluster Analysis using DBSTREAM@River',
+                                     p_range_max=OAStreamWorkflow.C_RANGE_NONE,
+                                     p_ada=p_ada,
+                                     p_visualize=p_visualize,
+                                     p_logging=p_logging )
+
+
+        # 1.2.2 Creation of tasks and add them to the workflow
+
+        # Boundary detector
+        task_bd = BoundaryDetector( p_name='#1: Boundary Detector',
+                                    p_ada=True,
+                                    p_visualize=p_visualize,
+                                    p_logging=p_logging)
+
+        workflow.add_task(p_task = task_bd)
+
+        # MinMax-Normalizer
+        task_norm_minmax = NormalizerMinMax( p_name='#2: Normalizer MinMax',
+                                             p_ada=True,
+                                             p_visualize=p_visualize,
+                                             p_logging=p_logging )
+
+        task_bd.register_event_handler(
+            p_event_id=BoundaryDetector.C_EVENT_ADAPTED,
+            p_event_handler=task_norm_minmax.adapt_on_event
+            )
+
+        workflow.add_task(p_task = task_norm_minmax, p_pred_tasks=[task_bd])
+
+        # Cluster Analyzer
+        task_clusterer = WrRiverDBStream2MLPro( p_name='#3: DBSTREAM@River',
+                                                p_clustering_threshold = 0.1,
+                                                p_fading_factor = 0.005,
+                                                p_cleanup_interval = 4,
+                                                p_intersection_factor = 0.5,
+                                                p_minimum_weight = 1,
+                                                p_visualize=p_visualize,
+                                                p_logging=p_logging )
+
+        task_norm_minmax.register_event_handler( p_event_id=NormalizerMinMax.C_EVENT_ADAPTED,
+                                                 p_event_handler=task_clusterer.renormalize_on_event )
+
+        workflow.add_task(p_task = task_clusterer, p_pred_tasks=[task_norm_minmax])
+
+        # 1.3 Return stream and workflow
+        return stream, workflow
+
+
+
+# 2 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    cycle_limit = 1000
+    logging     = Log.C_LOG_ALL
+    visualize   = True
+    step_rate   = 2
+else:
+    cycle_limit = 200
+    logging     = Log.C_LOG_NOTHING
+    visualize   = False
+    step_rate   = 1
+
+
+
+# 3 Instantiate the stream scenario
+myscenario = Static2DScenario(
+    p_mode=Mode.C_MODE_REAL,
+    p_cycle_limit=cycle_limit,
+    p_visualize=visualize,
+    p_logging=logging)
+
+
+
+# 4 Reset and run own stream scenario
+myscenario.reset()
+
+if __name__ == '__main__':
+    myscenario.init_plot( p_plot_settings=PlotSettings( p_view = PlotSettings.C_VIEW_ND,
+                                                        p_step_rate = step_rate ) )
+    input('\nPlease arrange all windows and press ENTER to start stream processing...')
+
+tp_before           = datetime.now()
+myscenario.run()
+tp_after            = datetime.now()
+tp_delta            = tp_after - tp_before
+duraction_sec       = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
+myscenario.log(Log.C_LOG_TYPE_S, 'Duration [sec]:', round(duraction_sec,2), ', Cycles/sec:', round(cycle_limit/duraction_sec,2))
+
+task_norm_minmax    = myscenario.get_workflow()._tasks[1]
+task_clusterer      = myscenario.get_workflow()._tasks[2]
+clusters            = task_clusterer.clusters
+number_of_clusters  = len(clusters)
+
+myscenario.log(Log.C_LOG_TYPE_I, '-------------------------------------------------------')
+myscenario.log(Log.C_LOG_TYPE_I, '-------------------------------------------------------')
+myscenario.log(Log.C_LOG_TYPE_I, 'Here is the recap of the cluster analyzer')
+myscenario.log(Log.C_LOG_TYPE_I, 'Number of clusters: ', number_of_clusters)
+for x, cluster in enumerate(clusters.values()):
+    myscenario.log(Log.C_LOG_TYPE_I, 'Center of Cluster ', str(x+1), ': ', list(cluster.centroid.value))
+    myscenario.log(Log.C_LOG_TYPE_I, 'Size of Cluster ', str(x+1), ': ', cluster.size.value)
+myscenario.log(Log.C_LOG_TYPE_I, '-------------------------------------------------------')
+myscenario.log(Log.C_LOG_TYPE_I, '-------------------------------------------------------')
+
+
+
+# 5 Check that the clusters line up with the data normalized by the final parameters
+stream    = StreamMLProClouds( p_num_dim = 2,
+                               p_num_instances = 2000,
+                               p_num_clouds = 5,
+                               p_seed = 1,
+                               p_radii=[100],
+                               p_logging=Log.C_LOG_NOTHING )
+data      = np.array([ inst.get_feature_data().get_values() for _, inst in zip(range(cycle_limit), stream) ])
+data_norm = np.array([ task_norm_minmax.normalize(p_data=values) for values in data ])
+
+centers    = np.array([ cluster.centroid.value for cluster in clusters.values() ])
+threshold  = task_clusterer.get_algorithm().clustering_threshold
+dist_min   = np.sqrt( ( ( centers[:, np.newaxis, :] - data_norm[np.newaxis, :, :] ) ** 2 ).sum(axis=2) ).min(axis=1)
+
+myscenario.log(Log.C_LOG_TYPE_I, 'Clustering threshold:', round(threshold,4),
+               ', max. distance of a cluster to the data:', round(dist_min.max(),4))
+
+if dist_min.max() > threshold:
+    raise Error('Clusters do not line up with the renormalized data')
+
+if __name__ == '__main__':
+    input('Press ENTER to exit...')
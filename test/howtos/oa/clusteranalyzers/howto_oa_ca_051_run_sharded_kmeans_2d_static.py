@@ -0,0 +1,121 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river
+## -- Module  : howto_oa_ca_051_run_sharded_kmeans_2d_static.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module demonstrates online cluster analysis of static 2D random point clouds using several
+copies of River's KMeans in worker processes. Each copy learns a round-robin partition of the 
+stream. Periodically, the centers of all copies are merged into a global model by weighted k-means.
+
+In particular you will learn:
+
+1. How to set up a sharded cluster analyzer for a River clusterer
+
+2. How to stop the worker processes and access the trained copies of the River clusterer
+
+"""
+
+
+from datetime import datetime
+
+from mlpro.bf import Log, Mode
+from mlpro.bf.streams.streams.clouds import *
+from mlpro.oa.streams import *
+
+from river import cluster
+from mlpro_int_river.wrappers.clusteranalyzers import WrRiverShardedClusterer2MLPro
+
+
+
+# 1 Prepare a scenario for Static 2D Point Clouds
+class Static2DScenario(OAStreamScenario):
+
+    C_NAME = 'Static2DScenario'
+
+    def _setup(self, p_mode, p_ada: bool, p_visualize: bool, p_logging):
+
+        # 1.1 Get MLPro benchmark stream
+        stream = StreamMLProClouds( p_num_dim = 2,
+                                    p_num_instances = 2000,
+                                    p_num_clouds = 5,
+                                    p_seed = 1,
+                                    p_radii=[100],
+                                    p_logging=Log.C_LOG_NOTHING )
+
+        # 1.2 Set up a stream workflow
+
+        # 1.2.1 Creation of a workflow
+        workflow = OAStreamWorkflow( p_name='Cluster Analysis using sharded KMeans@River',
+                                     p_range_max=OAStreamWorkflow.C_RANGE_NONE,
+                                     p_ada=p_ada,
+                                     p_visualize=p_visualize,
+                                     p_logging=p_logging )
+
+
+        # 1.2.2 Creation of tasks and add them to the workflow
+
+        # Cluster Analyzer
+        task_clusterer = WrRiverShardedClusterer2MLPro( p_name='#1: Sharded KMeans@River',
+                                                        p_river_algo=cluster.KMeans( n_clusters=5,
+                                                                                     halflife=0.1,
+                                                                                     sigma=3,
+                                                                                     seed=42 ),
+                                                        p_num_shards=2,
+                                                        p_routing=WrRiverShardedClusterer2MLPro.C_ROUTING_ROUND_ROBIN,
+                                                        p_merge_interval=50,
+                                                        p_batch_size=10,
+                                                        p_seed=42,
+                                                        p_visualize=p_visualize,
+                                                        p_logging=p_logging )
+
+        workflow.add_task(p_task = task_clusterer)
+
+        # 1.3 Return stream and workflow
+        return stream, workflow
+
+
+
+# 2 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    cycle_limit = 2000
+    logging     = Log.C_LOG_WE
+else:
+    cycle_limit = 100
+    logging     = Log.C_LOG_NOTHING
+
+
+
+# 3 Instantiate and run the stream scenario
+myscenario = Static2DScenario( p_mode=Mode.C_MODE_REAL,
+                               p_cycle_limit=cycle_limit,
+                               p_visualize=False,
+                               p_logging=logging )
+myscenario.reset()
+
+clusterer     = myscenario.get_workflow()._tasks[0]
+tp_before     = datetime.now()
+myscenario.run()
+clusterer.stop_worker()
+tp_delta      = datetime.now() - tp_before
+duraction_sec = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
+myscenario.log(Log.C_LOG_TYPE_W, 'Duration [sec]:', round(duraction_sec,2), ', Cycles/sec:', round(cycle_limit/duraction_sec,2))
+
+
+
+# 4 Recap of the global model and the shards
+clusters = clusterer.clusters
+myscenario.log(Log.C_LOG_TYPE_W, 'Number of clusters of the global model: ', len(clusters))
+for x in clusters.keys():
+    myscenario.log(Log.C_LOG_TYPE_W, 'Center of Cluster ', str(x+1), ': ', list(clusters[x].centroid.value), ', Size: ', clusters[x].size.value)
+
+for x, river_algo in enumerate(clusterer.get_shard_algorithms()):
+    myscenario.log(Log.C_LOG_TYPE_W, 'Shard', x + 1, 'has', len(river_algo.centers), 'centers')
@@ -0,0 +1,92 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river
+## -- Module  : howto_oa_ca_052_run_kmeans_pool_multi_tenant.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -- 2026-10-19  1.0.1     DA       Pool with Manhattan distance and check of predict_many()
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.1 (2026-10-19)
+
+This module demonstrates online cluster analysis of many small independent 2D streams, e.g. one
+per sensor, with a pool of lightweight k-means clusterers. The rows of all sensors arrive mixed in
+batches and are routed to the clusterers of their sensors in one call. Finally, the closest
+centers determined by the pool are checked against those of the clusterers of the sensors.
+
+In particular you will learn:
+
+1. How to set up a pool of clusterers from a template clusterer
+
+2. How to learn batches of rows of many sensors in one call
+
+3. How to access the cluster centers of a sensor as an array view
+
+4. How to determine the closest centers of rows of many sensors in one call
+
+"""
+
+
+from datetime import datetime
+
+import numpy as np
+
+from mlpro.bf.exceptions import Error
+from river import cluster
+from mlpro_int_river.wrappers.clusteranalyzers import ClustererPool, KMeansNumPy
+
+
+
+# 1 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    num_sensors = 1000
+    num_rows    = 200000
+else:
+    num_sensors = 20
+    num_rows    = 2000
+
+batch_size = 1000
+
+
+
+# 2 Generate a mixed stream of rows of all sensors with three point clouds per sensor
+rng        = np.random.default_rng(1)
+clouds     = rng.uniform(-10, 10, size=(num_sensors, 3, 2))
+sensor_ids = rng.integers(0, num_sensors, size=num_rows)
+data       = clouds[sensor_ids, rng.integers(0, 3, size=num_rows)] + rng.normal(0, 0.5, size=(num_rows, 2))
+
+
+
+# 3 Learn the stream with pools of River's KMeans and of its NumPy engine, also with Manhattan distance
+for template in [ cluster.KMeans(n_clusters=3, halflife=0.1, sigma=3, seed=42),
+                  KMeansNumPy(p_n_clusters=3, p_halflife=0.1, p_sigma=3, p_seed=42),
+                  cluster.KMeans(n_clusters=3, halflife=0.1, sigma=3, p=1, seed=42) ]:
+
+    # The capacity is reserved for all sensors, so that the pool never needs to grow
+    pool       = ClustererPool(p_river_algo=template, p_num_dim=2, p_capacity=num_sensors)
+    centers    = None
+
+    tp_before  = datetime.now()
+    for start in range(0, num_rows, batch_size):
+        pool.learn_many(sensor_ids[start:start+batch_size], data[start:start+batch_size])
+
+        # The view on the centers of sensor 0 follows the learning
+        if ( centers is None ) and ( 0 in pool ): centers = pool.get_centers(0)
+
+    tp_delta      = datetime.now() - tp_before
+    duraction_sec = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
+
+    print(type(template).__name__, '- sensors:', len(pool), ', duration [sec]:', round(duraction_sec,2),
+          ', rows/sec:', round(num_rows/duraction_sec,2))
+    print('Centers of sensor 0:', centers.round(2).tolist(), ', sizes:', pool.get_sizes(0).tolist())
+    print('Closest centers of the first rows:', pool.predict_many(sensor_ids[:10], data[:10]).tolist())
+
+    # The closest centers of the pool match those of the clusterers of the sensors
+    labels = pool.predict_many(sensor_ids, data)
+    for sensor_id, values, label in zip(sensor_ids.tolist(), data.tolist(), labels.tolist()):
+        if pool.get_algorithm(sensor_id).predict_one(dict(enumerate(values, 1))) != label:
+            raise Error('Closest centers of the pool and of sensor ' + str(sensor_id) + ' do not match')
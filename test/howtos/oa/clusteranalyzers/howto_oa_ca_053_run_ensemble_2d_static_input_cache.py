@@ -0,0 +1,152 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river
+## -- Module  : howto_oa_ca_053_run_ensemble_2d_static_input_cache.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module demonstrates online cluster analysis of static 2D random point clouds using an ensemble
+of five wrapped River cluster analyzers in one workflow. All River wrappers share a cache for the
+conversion of the instances into the input format of River, so that each instance is converted
+only once.
+
+In particular you will learn:
+
+1. How to set up several River cluster analyzers on the same stream
+
+2. How to inspect the shared input conversion cache
+
+"""
+
+
+from datetime import datetime
+
+from mlpro.bf import Log, Mode
+from mlpro.bf.streams.streams.clouds import *
+from mlpro.oa.streams import *
+
+from mlpro_int_river.wrappers import WrapperRiver
+from mlpro_int_river.wrappers.clusteranalyzers import *
+
+
+
+# 1 Prepare a scenario for Static 2D Point Clouds
+class Static2DScenario(OAStreamScenario):
+
+    C_NAME = 'Static2DScenario'
+
+    def _setup(self, p_mode, p_ada: bool, p_visualize: bool, p_logging):
+
+        # 1.1 Get MLPro benchmark stream
+        stream = StreamMLProClouds( p_num_dim = 2,
+                                    p_num_instances = 2000,
+                                    p_num_clouds = 5,
+                                    p_seed = 1,
+                                    p_radii=[100],
+                                    p_logging=Log.C_LOG_NOTHING )
+
+        # 1.2 Set up a stream workflow
+
+        # 1.2.1 Creation of a workflow
+        workflow = OAStreamWorkflow( p_name='Cluster Analysis using an ensemble of River clusterers',
+                                     p_range_max=OAStreamWorkflow.C_RANGE_NONE,
+                                     p_ada=p_ada,
+                                     p_visualize=p_visualize,
+                                     p_logging=p_logging )
+
+
+        # 1.2.2 Creation of tasks and add them to the workflow
+
+        # Cluster Analyzers
+        tasks = [ WrRiverKMeans2MLPro( p_name='#1: KMeans@River',
+                                       p_n_clusters=5,
+                                       p_halflife=0.1,
+                                       p_sigma=3,
+                                       p_seed=42,
+                                       p_visualize=p_visualize,
+                                       p_logging=p_logging ),
+                  WrRiverKMeans2MLPro( p_name='#2: KMeans@River (NumPy engine)',
+                                       p_n_clusters=5,
+                                       p_halflife=0.1,
+                                       p_sigma=3,
+                                       p_seed=42,
+                                       p_engine=WrRiverKMeans2MLPro.C_ENGINE_NUMPY,
+                                       p_visualize=p_visualize,
+                                       p_logging=p_logging ),
+                  WrRiverKMeans2MLPro( p_name='#3: KMeans@River (slow)',
+                                       p_n_clusters=5,
+                                       p_halflife=0.01,
+                                       p_sigma=3,
+                                       p_seed=42,
+                                       p_visualize=p_visualize,
+                                       p_logging=p_logging ),
+                  WrRiverStreamKMeans2MLPro( p_name='#4: STREAMKMeans@River',
+                                             p_chunk_size=10,
+                                             p_n_clusters=5,
+                                             p_halflife=0.5,
+                                             p_sigma=3,
+                                             p_seed=42,
+                                             p_visualize=p_visualize,
+                                             p_logging=p_logging ),
+                  WrRiverCluStream2MLPro( p_name='#5: CluStream@River',
+                                          p_n_macro_clusters = 5,
+                                          p_max_micro_clusters = 20,
+                                          p_micro_cluster_r_factor = 2,
+                                          p_time_window = 100,
+                                          p_time_gap = 10,
+                                          p_seed = 41,
+                                          p_halflife = 1.0,
+                                          p_mu = 1,
+                                          p_sigma = 1,
+                                          p_p = 2,
+                                          p_visualize=p_visualize,
+                                          p_logging=p_logging ) ]
+
+        for task in tasks:
+            workflow.add_task(p_task = task)
+
+        # 1.3 Return stream and workflow
+        return stream, workflow
+
+
+
+# 2 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    cycle_limit = 2000
+    logging     = Log.C_LOG_WE
+else:
+    cycle_limit = 100
+    logging     = Log.C_LOG_NOTHING
+
+
+
+# 3 Instantiate and run the stream scenario
+myscenario = Static2DScenario( p_mode=Mode.C_MODE_REAL,
+                               p_cycle_limit=cycle_limit,
+                               p_visualize=False,
+                               p_logging=logging )
+myscenario.reset()
+
+input_cache   = WrapperRiver.C_INPUT_CACHE
+input_cache.clear()
+
+tp_before     = datetime.now()
+myscenario.run()
+tp_delta      = datetime.now() - tp_before
+duraction_sec = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
+myscenario.log(Log.C_LOG_TYPE_W, 'Duration [sec]:', round(duraction_sec,2), ', Cycles/sec:', round(cycle_limit/duraction_sec,2))
+
+
+
+# 4 Recap of the ensemble and the input conversion cache
+for task in myscenario.get_workflow()._tasks:
+    myscenario.log(Log.C_LOG_TYPE_W, task.get_name(), 'has', len(task.clusters), 'clusters')
+
+myscenario.log(Log.C_LOG_TYPE_W, 'Input conversions:', input_cache.num_misses, ', reused conversions:', input_cache.num_hits)
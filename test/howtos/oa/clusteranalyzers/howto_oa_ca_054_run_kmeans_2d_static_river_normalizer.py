@@ -0,0 +1,132 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river
+## -- Module  : howto_oa_ca_054_run_kmeans_2d_static_river_normalizer.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module demonstrates online cluster analysis of normalized static 2D random point clouds using the
+wrapped River implementation of stream algorithm KMeans. Instead of the pair of MLPro's boundary
+detector and min-max normalizer, a single task with River's MinMaxScaler normalizes the instances.
+The cluster analyzer renormalizes its clusters on the adaptation events of the normalizer.
+
+In particular you will learn:
+
+1. How to use a River scaler as online adaptive normalizer in a stream workflow
+
+2. How to renormalize a River cluster analyzer on adaptations of the River normalizer
+
+"""
+
+
+from datetime import datetime
+
+import numpy as np
+
+from mlpro.bf import Log, Mode
+from mlpro.bf.streams.streams import StreamMLProClouds
+from mlpro.oa.streams import *
+
+from mlpro_int_river.wrappers.clusteranalyzers import WrRiverKMeans2MLPro
+from mlpro_int_river.wrappers.normalizers import WrRiverMinMaxScaler2MLPro
+
+
+
+# 1 Prepare a scenario for Static 2D Point Clouds
+class Static2DScenario(OAStreamScenario):
+
+    C_NAME = 'Static2DScenario'
+
+    def _setup(self, p_mode, p_ada: bool, p_visualize: bool, p_logging):
+
+        # 1.1 Get stream from StreamMLProClouds
+        stream = StreamMLProClouds( p_num_dim = 2,
+                                    p_num_instances = 2000,
+                                    p_num_clouds = 5,
+                                    p_seed = 1,
+                                    p_radii=[100],
+                                    p_logging=Log.C_LOG_NOTHING )
+
+        # 1.2 Set up a stream workflow
+
+        # 1.2.1 Creation of a workflow
+        workflow = OAStreamWorkflow( p_name='Cluster Analysis using KMeans@River',
+                                     p_range_max=OAStreamWorkflow.C_RANGE_NONE,
+                                     p_ada=p_ada,
+                                     p_visualize=p_visualize,
+                                     p_logging=p_logging )
+
+
+        # 1.2.2 Creation of tasks and add them to the workflow
+
+        # MinMax-Normalizer
+        task_norm = WrRiverMinMaxScaler2MLPro( p_name='#1: MinMaxScaler@River',
+                                               p_ada=True,
+                                               p_visualize=p_visualize,
+                                               p_logging=p_logging )
+
+        workflow.add_task(p_task = task_norm)
+
+        # Cluster Analyzer
+        task_clusterer = WrRiverKMeans2MLPro( p_name='#2: KMeans@River',
+                                              p_n_clusters=5,
+                                              p_halflife=0.05,
+                                              p_sigma=-1.0,
+                                              p_seed=62,
+                                              p_visualize=p_visualize,
+                                              p_logging=p_logging )
+
+        task_norm.register_event_handler( p_event_id=WrRiverMinMaxScaler2MLPro.C_EVENT_ADAPTED,
+                                          p_event_handler=task_clusterer.renormalize_on_event )
+
+        workflow.add_task(p_task = task_clusterer, p_pred_tasks=[task_norm])
+
+        # 1.3 Return stream and workflow
+        return stream, workflow
+
+
+
+# 2 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    cycle_limit = 2000
+    logging     = Log.C_LOG_WE
+else:
+    cycle_limit = 100
+    logging     = Log.C_LOG_NOTHING
+
+
+
+# 3 Instantiate and run the stream scenario
+myscenario = Static2DScenario( p_mode=Mode.C_MODE_REAL,
+                               p_cycle_limit=cycle_limit,
+                               p_visualize=False,
+                               p_logging=logging )
+myscenario.reset()
+
+adaptations = []
+task_norm   = myscenario.get_workflow()._tasks[0]
+task_norm.register_event_handler( p_event_id=WrRiverMinMaxScaler2MLPro.C_EVENT_ADAPTED,
+                                  p_event_handler=lambda p_event_id, p_event_object : adaptations.append(p_event_object) )
+
+tp_before     = datetime.now()
+myscenario.run()
+tp_delta      = datetime.now() - tp_before
+duraction_sec = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
+myscenario.log(Log.C_LOG_TYPE_W, 'Duration [sec]:', round(duraction_sec,2), ', Cycles/sec:', round(cycle_limit/duraction_sec,2))
+
+
+
+# 4 Recap of the normalizer and the cluster analyzer
+clusters = myscenario.get_workflow()._tasks[1].clusters
+
+myscenario.log(Log.C_LOG_TYPE_W, 'Number of adaptations of the normalizer:', len(adaptations))
+myscenario.log(Log.C_LOG_TYPE_W, 'Number of clusters:', len(clusters))
+for cluster in clusters.values():
+    myscenario.log(Log.C_LOG_TYPE_W, 'Center of cluster', cluster.id, ':', np.asarray(cluster.centroid.value).round(4).tolist(), ', size:', cluster.size.value)
@@ -0,0 +1,146 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river
+## -- Module  : howto_oa_ca_055_run_kmeans_2d_static_centroid_index.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module demonstrates cluster membership queries by a nearest-neighbor index of the centroids.
+The wrapped River implementation of stream algorithm KMeans learns a large number of clusters from
+static 2D random point clouds. Afterwards, the cluster memberships of new instances are determined
+by the River model and by a centroid index with both engines NumPy and River (SWINN).
+
+In particular you will learn:
+
+1. How to set up a centroid index for a River cluster analyzer
+
+2. How to compare the results and the run times of the engines of the centroid index
+
+"""
+
+
+from datetime import datetime
+
+from mlpro.bf import Log, Mode
+from mlpro.bf.streams.streams import StreamMLProClouds
+from mlpro.oa.streams import *
+
+from mlpro_int_river.wrappers.clusteranalyzers import WrRiverKMeans2MLPro, CentroidIndex
+
+
+
+# 1 Prepare a scenario for Static 2D Point Clouds
+class Static2DScenario(OAStreamScenario):
+
+    C_NAME = 'Static2DScenario'
+
+    def _setup(self, p_mode, p_ada: bool, p_visualize: bool, p_logging):
+
+        # 1.1 Get stream from StreamMLProClouds
+        stream = StreamMLProClouds( p_num_dim = 2,
+                                    p_num_instances = 2000,
+                                    p_num_clouds = 5,
+                                    p_seed = 1,
+                                    p_radii=[100],
+                                    p_logging=Log.C_LOG_NOTHING )
+
+        # 1.2 Set up a stream workflow
+
+        # 1.2.1 Creation of a workflow
+        workflow = OAStreamWorkflow( p_name='Cluster Analysis using KMeans@River',
+                                     p_range_max=OAStreamWorkflow.C_RANGE_NONE,
+                                     p_ada=p_ada,
+                                     p_visualize=p_visualize,
+                                     p_logging=p_logging )
+
+
+        # 1.2.2 Creation of tasks and add them to the workflow
+
+        # Cluster Analyzer
+        task_clusterer = WrRiverKMeans2MLPro( p_name='#1: KMeans@River',
+                                              p_n_clusters=50,
+                                              p_halflife=0.1,
+                                              p_sigma=3,
+                                              p_seed=42,
+                                              p_visualize=p_visualize,
+                                              p_logging=p_logging )
+
+        workflow.add_task(p_task = task_clusterer)
+
+        # 1.3 Return stream and workflow
+        return stream, workflow
+
+
+
+# 2 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    cycle_limit = 2000
+    num_queries = 1000
+    logging     = Log.C_LOG_WE
+else:
+    cycle_limit = 100
+    num_queries = 50
+    logging     = Log.C_LOG_NOTHING
+
+
+
+# 3 Instantiate and run the stream scenario
+myscenario = Static2DScenario( p_mode=Mode.C_MODE_REAL,
+                               p_cycle_limit=cycle_limit,
+                               p_visualize=False,
+                               p_logging=logging )
+myscenario.reset()
+
+tp_before     = datetime.now()
+myscenario.run()
+tp_delta      = datetime.now() - tp_before
+duraction_sec = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
+myscenario.log(Log.C_LOG_TYPE_W, 'Duration [sec]:', round(duraction_sec,2), ', Cycles/sec:', round(cycle_limit/duraction_sec,2))
+
+
+
+# 4 Query the cluster memberships of new instances
+task_clusterer = myscenario.get_workflow()._tasks[0]
+queries        = list(StreamMLProClouds( p_num_dim = 2,
+                                         p_num_instances = num_queries,
+                                         p_num_clouds = 5,
+                                         p_seed = 2,
+                                         p_radii=[100],
+                                         p_logging=Log.C_LOG_NOTHING ))
+
+indices = [ ( 'River model', None ),
+            ( 'Centroid index (NumPy)', CentroidIndex( p_engine=CentroidIndex.C_ENGINE_NUMPY ) ),
+            ( 'Centroid index (River)', CentroidIndex( p_engine=CentroidIndex.C_ENGINE_RIVER,
+                                                       p_graph_k=10,
+                                                       p_warm_up=20,
+                                                       p_seed=1 ) ) ]
+
+results = {}
+
+for name, index in indices:
+    task_clusterer.set_centroid_index(p_index=index)
+
+    tp_before     = datetime.now()
+    results[name] = [ task_clusterer.get_cluster_memberships(p_instance=inst)[0][0] for inst in queries ]
+    tp_delta      = datetime.now() - tp_before
+    duraction_sec = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
+
+    myscenario.log(Log.C_LOG_TYPE_W, name, ': duration [sec]:', round(duraction_sec,4), ', Queries/sec:', round(num_queries/duraction_sec,2))
+
+task_clusterer.set_centroid_index(p_index=None)
+
+
+
+# 5 Agreement of the centroid indices with the exact search
+exact = results['Centroid index (NumPy)']
+
+for name, result in results.items():
+    agreement = sum([ x == y for x, y in zip(result, exact) ]) / num_queries
+    myscenario.log(Log.C_LOG_TYPE_W, name, ': agreement with exact nearest centroid:', round(agreement * 100, 2), '%')
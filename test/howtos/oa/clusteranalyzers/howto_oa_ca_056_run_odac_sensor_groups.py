@@ -0,0 +1,159 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river
+## -- Module  : howto_oa_ca_056_run_odac_sensor_groups.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module demonstrates the clustering of the features of a stream using the wrapped River
+implementation of the Online Divisive-Agglomerative Clustering (ODAC). The stream provides the
+readings of 30 sensors, which are driven by three hidden signals, so that the sensors form three
+groups of correlated time series. ODAC is run with River's engine and with the NumPy engine on
+mini-batches side by side.
+
+In particular you will learn:
+
+1. How to cluster the features of a stream with ODAC
+
+2. How to read out the hierarchy as parent arrays and the correlations of a cluster
+
+3. How to speed up ODAC for many features with the NumPy engine
+
+"""
+
+
+from datetime import datetime
+
+import numpy as np
+
+from mlpro.bf import Log, Mode
+from mlpro.bf.math import ESpace, MSpace
+from mlpro.bf.streams import *
+from mlpro.bf.streams.streams import StreamMLProBase
+from mlpro.oa.streams import *
+
+from mlpro_int_river.wrappers.clusteranalyzers import WrRiverODAC2MLPro
+
+
+
+# 1 Prepare a stream of sensors driven by three hidden signals
+class StreamSensorGroups (StreamMLProBase):
+
+    C_ID                = 'SensorGroups30Dx2000'
+    C_NAME              = 'Sensor Groups 30D x 2000'
+    C_VERSION           = '1.0.0'
+    C_NUM_INSTANCES     = 2000
+    C_NUM_SENSORS       = 30
+    C_NUM_GROUPS        = 3
+
+    def _setup_feature_space(self) -> MSpace:
+        feature_space : MSpace = ESpace()
+
+        for i in range(self.C_NUM_SENSORS):
+            feature_space.add_dim( Feature( p_name_short = 's' + str(i),
+                                            p_base_set = Feature.C_BASE_SET_R,
+                                            p_name_long = 'Sensor #' + str(i),
+                                            p_logging=Log.C_LOG_NOTHING ) )
+
+        return feature_space
+
+
+    def _setup_label_space(self) -> MSpace:
+        return ESpace()
+
+
+    def _init_dataset(self):
+        rng           = np.random.default_rng(1)
+        signals       = rng.standard_normal((self.C_NUM_INSTANCES, self.C_NUM_GROUPS)).cumsum(axis=0)
+        self.groups   = np.arange(self.C_NUM_SENSORS) % self.C_NUM_GROUPS
+        self._dataset = signals[:, self.groups] + rng.standard_normal((self.C_NUM_INSTANCES, self.C_NUM_SENSORS))
+
+
+
+# 2 Prepare a scenario for the sensor stream
+class SensorScenario(OAStreamScenario):
+
+    C_NAME = 'SensorScenario'
+
+    def _setup(self, p_mode, p_ada: bool, p_visualize: bool, p_logging):
+
+        # 2.1 Get the sensor stream
+        stream = StreamSensorGroups(p_logging=Log.C_LOG_NOTHING)
+
+        # 2.2 Set up a stream workflow
+
+        # 2.2.1 Creation of a workflow
+        workflow = OAStreamWorkflow( p_name='Clustering of sensors using ODAC@River',
+                                     p_range_max=OAStreamWorkflow.C_RANGE_NONE,
+                                     p_ada=p_ada,
+                                     p_visualize=p_visualize,
+                                     p_logging=p_logging )
+
+
+        # 2.2.2 Creation of tasks and add them to the workflow
+
+        # ODAC with River's engine
+        task_river = WrRiverODAC2MLPro( p_name='#1: ODAC@River',
+                                        p_n_min=100,
+                                        p_logging=p_logging )
+
+        workflow.add_task(p_task = task_river)
+
+        # ODAC with the NumPy engine on mini-batches
+        task_numpy = WrRiverODAC2MLPro( p_name='#2: ODAC@River (NumPy engine)',
+                                        p_n_min=100,
+                                        p_engine=WrRiverODAC2MLPro.C_ENGINE_NUMPY,
+                                        p_batch_size=50,
+                                        p_logging=p_logging )
+
+        workflow.add_task(p_task = task_numpy)
+
+        # 2.3 Return stream and workflow
+        return stream, workflow
+
+
+
+# 3 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    cycle_limit = 2000
+    logging     = Log.C_LOG_WE
+else:
+    cycle_limit = 300
+    logging     = Log.C_LOG_NOTHING
+
+
+
+# 4 Instantiate and run the stream scenario
+myscenario = SensorScenario( p_mode=Mode.C_MODE_REAL,
+                             p_cycle_limit=cycle_limit,
+                             p_visualize=False,
+                             p_logging=logging )
+myscenario.reset()
+
+tp_before     = datetime.now()
+myscenario.run()
+tp_delta      = datetime.now() - tp_before
+duraction_sec = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
+myscenario.log(Log.C_LOG_TYPE_W, 'Duration [sec]:', round(duraction_sec,2), ', Cycles/sec:', round(cycle_limit/duraction_sec,2))
+
+
+
+# 5 Recap of the clusters of sensors
+for task in myscenario.get_workflow()._tasks:
+    hierarchy = task.get_hierarchy()
+
+    myscenario.log(Log.C_LOG_TYPE_W, task.get_name(), ': number of clusters:', len(task.clusters))
+    myscenario.log(Log.C_LOG_TYPE_W, 'Parents of the nodes:', hierarchy.parents.tolist())
+    myscenario.log(Log.C_LOG_TYPE_W, 'Nodes of the sensors:', hierarchy.leaves.tolist())
+
+    for cluster_id in task.clusters.keys():
+        features, corr = task.get_correlations(cluster_id)
+        myscenario.log( Log.C_LOG_TYPE_W, 'Cluster', cluster_id, ': sensors', features.tolist(),
+                        ', minimum correlation:', round(float(corr.min()), 2) )
@@ -0,0 +1,173 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river
+## -- Module  : howto_oa_ca_057_run_textclust_topics.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module demonstrates the clustering of a text stream using the wrapped River implementation of
+TextClust. The stream provides short texts about three topics, which are attached to the
+instances as keyword arguments. Its only feature is the id of the topic, which is used for the
+evaluation but not for the clustering. TextClust is run on hashed tokens and on the original
+tokens side by side.
+
+In particular you will learn:
+
+1. How to attach texts to stream instances and cluster them with TextClust
+
+2. How to bound the vocabulary of the micro clusters by feature hashing
+
+3. How to read out the top terms of the micro clusters
+
+"""
+
+
+from datetime import datetime
+
+import numpy as np
+
+from mlpro.bf import Log, Mode
+from mlpro.bf.math import ESpace, MSpace
+from mlpro.bf.streams import *
+from mlpro.bf.streams.streams import StreamMLProBase
+from mlpro.oa.streams import *
+
+from mlpro_int_river.wrappers.clusteranalyzers import WrRiverTextClust2MLPro
+
+
+
+# 1 Prepare a stream of texts about three topics
+class StreamTextTopics (StreamMLProBase):
+
+    C_ID                = 'TextTopics3x1500'
+    C_NAME              = 'Text Topics 3 x 1500'
+    C_VERSION           = '1.0.0'
+    C_NUM_INSTANCES     = 1500
+    C_NUM_WORDS         = 8
+
+    C_TOPICS            = [ [ 'river', 'stream', 'online', 'learning', 'drift', 'model', 'data' ],
+                            [ 'football', 'goal', 'team', 'match', 'league', 'season', 'coach' ],
+                            [ 'cooking', 'recipe', 'pasta', 'sauce', 'oven', 'garlic', 'dinner' ] ]
+
+    C_FILLERS           = [ 'today', 'new', 'great', 'really', 'about', 'some' ]
+
+    def _setup_feature_space(self) -> MSpace:
+        feature_space : MSpace = ESpace()
+        feature_space.add_dim( Feature( p_name_short = 'topic',
+                                        p_base_set = Feature.C_BASE_SET_Z,
+                                        p_name_long = 'Topic id',
+                                        p_logging=Log.C_LOG_NOTHING ) )
+        return feature_space
+
+
+    def _setup_label_space(self) -> MSpace:
+        return ESpace()
+
+
+    def _init_dataset(self):
+        rng           = np.random.default_rng(1)
+        self._dataset = rng.integers(len(self.C_TOPICS), size=(self.C_NUM_INSTANCES, 1))
+        self._texts   = []
+
+        for topic in self._dataset[:, 0]:
+            words = rng.choice(self.C_TOPICS[topic] + self.C_FILLERS, size=self.C_NUM_WORDS)
+            self._texts.append(' '.join(words))
+
+
+    def _get_next(self) -> Instance:
+        instance      = super()._get_next()
+        instance.kwargs[WrRiverTextClust2MLPro.C_TEXT_KEY] = self._texts[self._index - 1]
+        return instance
+
+
+
+# 2 Prepare a scenario for the text stream
+class TextScenario(OAStreamScenario):
+
+    C_NAME = 'TextScenario'
+
+    def _setup(self, p_mode, p_ada: bool, p_visualize: bool, p_logging):
+
+        # 2.1 Get the text stream
+        stream = StreamTextTopics(p_logging=Log.C_LOG_NOTHING)
+
+        # 2.2 Set up a stream workflow
+
+        # 2.2.1 Creation of a workflow
+        workflow = OAStreamWorkflow( p_name='Clustering of texts using TextClust@River',
+                                     p_range_max=OAStreamWorkflow.C_RANGE_NONE,
+                                     p_ada=p_ada,
+                                     p_visualize=p_visualize,
+                                     p_logging=p_logging )
+
+
+        # 2.2.2 Creation of tasks and add them to the workflow
+
+        # TextClust on hashed tokens
+        task_hashed = WrRiverTextClust2MLPro( p_name='#1: TextClust@River (hashed tokens)',
+                                              p_n_features=2**12,
+                                              p_seed=1,
+                                              p_logging=p_logging )
+
+        workflow.add_task(p_task = task_hashed)
+
+        # TextClust on the original tokens
+        task_tokens = WrRiverTextClust2MLPro( p_name='#2: TextClust@River (original tokens)',
+                                              p_n_features=None,
+                                              p_logging=p_logging )
+
+        workflow.add_task(p_task = task_tokens)
+
+        # 2.3 Return stream and workflow
+        return stream, workflow
+
+
+
+# 3 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    cycle_limit = 1500
+    logging     = Log.C_LOG_WE
+else:
+    cycle_limit = 300
+    logging     = Log.C_LOG_NOTHING
+
+
+
+# 4 Instantiate and run the stream scenario
+myscenario = TextScenario( p_mode=Mode.C_MODE_REAL,
+                           p_cycle_limit=cycle_limit,
+                           p_visualize=False,
+                           p_logging=logging )
+myscenario.reset()
+
+tp_before     = datetime.now()
+myscenario.run()
+tp_delta      = datetime.now() - tp_before
+duraction_sec = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
+myscenario.log(Log.C_LOG_TYPE_W, 'Duration [sec]:', round(duraction_sec,2), ', Cycles/sec:', round(cycle_limit/duraction_sec,2))
+
+
+
+# 5 Recap of the micro clusters of the topics
+vocabulary = sorted(set(sum(StreamTextTopics.C_TOPICS, StreamTextTopics.C_FILLERS)))
+
+for task in myscenario.get_workflow()._tasks:
+    tokens = dict(zip(task.get_feature_ids(vocabulary), vocabulary))
+
+    myscenario.log(Log.C_LOG_TYPE_W, task.get_name(), ': number of micro clusters:', len(task.clusters))
+
+    for topic, words in enumerate(StreamTextTopics.C_TOPICS):
+        query      = Instance( p_feature_data = None, text = ' '.join(words) )
+        membership = task.get_cluster_memberships(query)
+        if len(membership) == 0: continue
+
+        cluster_id = membership[0][0]
+        top_terms  = [ tokens.get(token, token) for token, _ in task.get_top_terms(cluster_id, p_num=5) ]
+        myscenario.log(Log.C_LOG_TYPE_W, 'Topic', topic, ': micro cluster', cluster_id, ', top terms:', top_terms)
@@ -0,0 +1,148 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river
+## -- Module  : howto_oa_pl_001_run_scaler_logistic_regression_pipeline.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module demonstrates online classification of the River data set Phishing using a River
+pipeline of StandardScaler and LogisticRegression. In the first run, the whole pipeline is executed
+as one MLPro task. In the second run, the same model is set up with two separate MLPro tasks, i.e.
+the wrapped River scaler as normalizer and the wrapped River classifier. Finally, the intermediate
+outputs of the pipeline are determined on demand for the last instance.
+
+In particular you will learn:
+
+1. How to run a River pipeline as a single task in a stream workflow
+
+2. How to access the output of the pipeline and the prequential metric
+
+3. How to determine the intermediate outputs of the stages of the pipeline
+
+"""
+
+
+from datetime import datetime
+
+from mlpro.bf import Log, Mode
+from mlpro.oa.streams import *
+
+from mlpro_int_river.wrappers import WrStreamProviderRiver
+from mlpro_int_river.wrappers.normalizers import WrRiverStandardScaler2MLPro
+from mlpro_int_river.wrappers.pipelines import WrPipelineRiver2MLPro
+from mlpro_int_river.wrappers.predictors import WrRiverLogisticRegression2MLPro
+
+from river import linear_model, metrics, preprocessing
+
+
+
+# 1 Prepare a scenario for the River data set Phishing
+class PhishingScenario(OAStreamScenario):
+
+    C_NAME = 'PhishingScenario'
+
+    def __init__(self, p_fused : bool, **p_kwargs):
+        self._fused = p_fused
+        super().__init__(**p_kwargs)
+
+
+    def _setup(self, p_mode, p_ada: bool, p_visualize: bool, p_logging):
+
+        # 1.1 Get the River data set Phishing
+        provider = WrStreamProviderRiver(p_logging=Log.C_LOG_NOTHING)
+        provider.get_stream_list(p_logging=Log.C_LOG_NOTHING)
+        stream   = provider.get_stream(p_name='Phishing', p_mode=p_mode, p_logging=Log.C_LOG_NOTHING)
+
+        # 1.2 Set up a stream workflow
+
+        # 1.2.1 Creation of a workflow
+        workflow = OAStreamWorkflow( p_name='Classification using River',
+                                     p_range_max=OAStreamWorkflow.C_RANGE_NONE,
+                                     p_ada=p_ada,
+                                     p_visualize=p_visualize,
+                                     p_logging=p_logging )
+
+
+        # 1.2.2 Creation of tasks and add them to the workflow
+        if self._fused:
+
+            # River pipeline as a single task
+            task_pipeline = WrPipelineRiver2MLPro( p_river_pipeline=preprocessing.StandardScaler() | linear_model.LogisticRegression(),
+                                                   p_metric=metrics.Accuracy(),
+                                                   p_name='#1: Pipeline@River',
+                                                   p_visualize=p_visualize,
+                                                   p_logging=p_logging )
+
+            workflow.add_task(p_task = task_pipeline)
+
+        else:
+
+            # Standard Scaler
+            task_norm = WrRiverStandardScaler2MLPro( p_name='#1: StandardScaler@River',
+                                                     p_visualize=p_visualize,
+                                                     p_logging=p_logging )
+
+            workflow.add_task(p_task = task_norm)
+
+            # Logistic Regression
+            task_logreg = WrRiverLogisticRegression2MLPro( p_name='#2: LogisticRegression@River',
+                                                           p_metric=metrics.Accuracy(),
+                                                           p_visualize=p_visualize,
+                                                           p_logging=p_logging )
+
+            workflow.add_task(p_task = task_logreg, p_pred_tasks=[task_norm])
+
+        # 1.3 Return stream and workflow
+        return stream, workflow
+
+
+
+# 2 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    cycle_limit = 1250
+    logging     = Log.C_LOG_WE
+else:
+    cycle_limit = 100
+    logging     = Log.C_LOG_NOTHING
+
+
+
+# 3 Run the scenario with the fused pipeline and with separate tasks
+for fused in [ True, False ]:
+
+    myscenario = PhishingScenario( p_fused=fused,
+                                   p_mode=Mode.C_MODE_SIM,
+                                   p_cycle_limit=cycle_limit,
+                                   p_visualize=False,
+                                   p_logging=logging )
+
+    myscenario.reset()
+
+    tp_before     = datetime.now()
+    myscenario.run()
+    tp_delta      = datetime.now() - tp_before
+    duraction_sec = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
+    myscenario.log(Log.C_LOG_TYPE_W, 'Fused pipeline', fused, ', duration [sec]:', round(duraction_sec,2),
+                   ', Cycles/sec:', round(cycle_limit/duraction_sec,2))
+
+    task = myscenario.get_workflow()._tasks[-1]
+    print('Fused pipeline', fused, '-', task.get_name(), ':', task.get_metric())
+
+    if fused: task_pipeline = task
+
+
+
+# 4 Intermediate outputs of the pipeline for the first instance of the data set
+provider = WrStreamProviderRiver(p_logging=Log.C_LOG_NOTHING)
+provider.get_stream_list(p_logging=Log.C_LOG_NOTHING)
+inst     = next(iter(provider.get_stream(p_name='Phishing', p_logging=Log.C_LOG_NOTHING)))
+
+for stage, output in task_pipeline.get_stage_outputs(inst).items():
+    print('Output of stage', stage, ':', output)
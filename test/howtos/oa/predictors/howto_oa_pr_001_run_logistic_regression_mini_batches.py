@@ -0,0 +1,132 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river
+## -- Module  : howto_oa_pr_001_run_logistic_regression_mini_batches.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module demonstrates online classification of the River data set Phishing using the wrapped
+River implementations of LogisticRegression and HoeffdingTreeClassifier. Each instance is predicted
+first and learned afterwards. The prediction is stored in the keyword arguments of the instance and
+the accuracy is updated prequentially. In the second run, the labelled instances are learned in
+mini-batches of 32 instances. LogisticRegression learns a mini-batch in one step with River's
+learn_many(), which averages the gradients of the mini-batch. Therefore, its learning rate is
+increased with the size of the mini-batches.
+
+In particular you will learn:
+
+1. How to set up a River classifier as online adaptive task in a stream workflow
+
+2. How to learn in mini-batches
+
+3. How to access the predictions and the prequential metric
+
+"""
+
+
+from datetime import datetime
+
+from mlpro.bf import Log, Mode
+from mlpro.oa.streams import *
+
+from mlpro_int_river.wrappers import WrStreamProviderRiver
+from mlpro_int_river.wrappers.predictors import WrRiverLogisticRegression2MLPro, WrRiverHoeffdingTreeClassifier2MLPro
+
+from river import metrics, optim
+
+
+
+# 1 Prepare a scenario for the River data set Phishing
+class PhishingScenario(OAStreamScenario):
+
+    C_NAME = 'PhishingScenario'
+
+    def __init__(self, p_batch_size, **p_kwargs):
+        self._batch_size = p_batch_size
+        super().__init__(**p_kwargs)
+
+
+    def _setup(self, p_mode, p_ada: bool, p_visualize: bool, p_logging):
+
+        # 1.1 Get the River data set Phishing
+        provider = WrStreamProviderRiver(p_logging=Log.C_LOG_NOTHING)
+        provider.get_stream_list(p_logging=Log.C_LOG_NOTHING)
+        stream   = provider.get_stream(p_name='Phishing', p_mode=p_mode, p_logging=Log.C_LOG_NOTHING)
+
+        # 1.2 Set up a stream workflow
+
+        # 1.2.1 Creation of a workflow
+        workflow = OAStreamWorkflow( p_name='Classification using River',
+                                     p_range_max=OAStreamWorkflow.C_RANGE_NONE,
+                                     p_ada=p_ada,
+                                     p_visualize=p_visualize,
+                                     p_logging=p_logging )
+
+
+        # 1.2.2 Creation of tasks and add them to the workflow
+
+        # Logistic Regression with a learning rate that grows with the size of the mini-batches
+        task_logreg = WrRiverLogisticRegression2MLPro( p_name='#1: LogisticRegression@River',
+                                                       p_optimizer=optim.SGD(0.01 * self._batch_size),
+                                                       p_batch_size=self._batch_size,
+                                                       p_metric=metrics.Accuracy(),
+                                                       p_prediction_key='logreg',
+                                                       p_visualize=p_visualize,
+                                                       p_logging=p_logging )
+
+        workflow.add_task(p_task = task_logreg)
+
+        # Hoeffding Tree
+        task_tree = WrRiverHoeffdingTreeClassifier2MLPro( p_name='#2: HoeffdingTreeClassifier@River',
+                                                          p_grace_period=50,
+                                                          p_batch_size=self._batch_size,
+                                                          p_metric=metrics.Accuracy(),
+                                                          p_prediction_key='tree',
+                                                          p_visualize=p_visualize,
+                                                          p_logging=p_logging )
+
+        workflow.add_task(p_task = task_tree)
+
+        # 1.3 Return stream and workflow
+        return stream, workflow
+
+
+
+# 2 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    cycle_limit = 1250
+    logging     = Log.C_LOG_WE
+else:
+    cycle_limit = 100
+    logging     = Log.C_LOG_NOTHING
+
+
+
+# 3 Run the scenario with single instances and with mini-batches
+for batch_size in [ 1, 32 ]:
+
+    myscenario = PhishingScenario( p_batch_size=batch_size,
+                                   p_mode=Mode.C_MODE_SIM,
+                                   p_cycle_limit=cycle_limit,
+                                   p_visualize=False,
+                                   p_logging=logging )
+
+    myscenario.reset()
+
+    tp_before     = datetime.now()
+    myscenario.run()
+    tp_delta      = datetime.now() - tp_before
+    duraction_sec = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
+    myscenario.log(Log.C_LOG_TYPE_W, 'Batch size', batch_size, ', duration [sec]:', round(duraction_sec,2),
+                   ', Cycles/sec:', round(cycle_limit/duraction_sec,2))
+
+    # 3.1 Recap of the prequential metrics
+    for task in myscenario.get_workflow()._tasks:
+        print('Batch size', batch_size, '-', task.get_name(), ':', task.get_metric())
@@ -0,0 +1,156 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river
+## -- Module  : howto_oa_pj_001_run_random_projection_kmeans_nd.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module demonstrates the cluster analysis of high-dimensional point clouds with a random
+projection ahead of the wrapped River implementation of KMeans. The 256-dimensional instances are
+projected onto 16 dimensions by River's Gaussian random projector, so that KMeans processes 16
+instead of 256 features. The scenario is run with and without the projection and the centroids of
+the projected clusters are mapped back to the original feature space.
+
+In particular you will learn:
+
+1. How to reduce the dimensionality of a stream ahead of a River cluster analyzer
+
+2. How much faster the cluster analysis becomes by the projection
+
+3. How to map the centroids back to the original feature space
+
+"""
+
+
+from datetime import datetime
+
+import numpy as np
+
+from mlpro.bf import Log, Mode
+from mlpro.bf.streams.streams import StreamMLProClouds
+from mlpro.oa.streams import *
+
+from mlpro_int_river.wrappers.clusteranalyzers import WrRiverKMeans2MLPro
+from mlpro_int_river.wrappers.projections import WrProjectionRiver2MLPro
+
+from river import preprocessing
+
+
+
+# 1 Prepare a scenario for static nD point clouds
+class StaticNDScenario(OAStreamScenario):
+
+    C_NAME = 'StaticNDScenario'
+
+    def __init__(self, p_projection : bool, **p_kwargs):
+        self._projection = p_projection
+        super().__init__(**p_kwargs)
+
+
+    def _setup(self, p_mode, p_ada: bool, p_visualize: bool, p_logging):
+
+        # 1.1 Get MLPro benchmark stream
+        stream = StreamMLProClouds( p_num_dim = 256,
+                                    p_num_instances = 2000,
+                                    p_num_clouds = 4,
+                                    p_seed = 1,
+                                    p_radii=[100],
+                                    p_logging=Log.C_LOG_NOTHING )
+
+
+        # 1.2 Set up a stream workflow
+
+        # 1.2.1 Creation of a workflow
+        workflow = OAStreamWorkflow( p_name='Cluster Analysis using KMeans@River',
+                                     p_range_max=OAStreamWorkflow.C_RANGE_NONE,
+                                     p_ada=p_ada,
+                                     p_visualize=p_visualize,
+                                     p_logging=p_logging )
+
+
+        # 1.2.2 Creation of tasks and add them to the workflow
+
+        # Random projection onto 16 dimensions
+        pred_tasks = None
+
+        if self._projection:
+            task_projection = WrProjectionRiver2MLPro( p_river_algo=preprocessing.GaussianRandomProjector( n_components=16,
+                                                                                                            seed=42 ),
+                                                       p_name='#1: Random Projection@River',
+                                                       p_logging=p_logging )
+
+            workflow.add_task(p_task = task_projection)
+            pred_tasks = [ task_projection ]
+
+        # Cluster Analyzer
+        task_clusterer = WrRiverKMeans2MLPro( p_name='#2: KMeans@River',
+                                              p_n_clusters=4,
+                                              p_halflife=0.1,
+                                              p_sigma=3,
+                                              p_seed=42,
+                                              p_visualize=p_visualize,
+                                              p_logging=p_logging )
+
+        workflow.add_task(p_task = task_clusterer, p_pred_tasks = pred_tasks)
+
+        # 1.3 Return stream and workflow
+        return stream, workflow
+
+
+
+# 2 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    cycle_limit = 2000
+    logging     = Log.C_LOG_WE
+else:
+    cycle_limit = 100
+    logging     = Log.C_LOG_NOTHING
+
+
+
+# 3 Run the scenario without and with the random projection
+durations = {}
+workflows = {}
+
+for projection in [ False, True ]:
+    myscenario = StaticNDScenario( p_projection=projection,
+                                   p_mode=Mode.C_MODE_REAL,
+                                   p_cycle_limit=cycle_limit,
+                                   p_visualize=False,
+                                   p_logging=logging )
+
+    myscenario.reset()
+
+    tp_before     = datetime.now()
+    myscenario.run()
+    tp_delta      = datetime.now() - tp_before
+    duraction_sec = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
+    myscenario.log(Log.C_LOG_TYPE_W, 'Projection', projection, ', duration [sec]:', round(duraction_sec,2),
+                   ', Cycles/sec:', round(cycle_limit/duraction_sec,2))
+
+    durations[projection] = duraction_sec
+    workflows[projection] = myscenario.get_workflow()
+
+myscenario.log(Log.C_LOG_TYPE_W, 'Speed-up by the projection:', round(durations[False]/durations[True],1))
+
+
+
+# 4 Map the centroids of the projected clusters back and compare them with the original centroids
+task_projection, task_clusterer = workflows[True]._tasks
+ids, centers_original           = workflows[False]._tasks[0].get_cluster_centers()
+ids, centers_projected          = task_clusterer.get_cluster_centers()
+
+centers_back = task_projection.back_project(centers_projected)
+spread       = np.linalg.norm(centers_original - centers_original.mean(axis=0), axis=1).mean()
+
+for center in centers_back:
+    distance = np.linalg.norm(centers_original - center, axis=1).min()
+    myscenario.log(Log.C_LOG_TYPE_W, 'Distance of a back-projected centroid to the nearest original centroid:',
+                   round(distance, 2), '( spread of the original centroids:', round(spread, 2), ')')
@@ -0,0 +1,135 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_river
+## -- Module  : howto_oa_st_001_run_river_statistics_3d_dynamic.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-18  0.0.0     DA       Creation
+## -- 2026-10-18  1.0.0     DA       First version release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-18)
+
+This module demonstrates bounded-memory statistics of a dynamic 3D point cloud stream using River's
+statistics and sketches. One task keeps the statistics of all features over the whole stream and
+another task keeps them over a rolling window of the latest 200 instances. All scalar statistics
+of a task are read out at once as one array.
+
+In particular you will learn:
+
+1. How to keep River statistics of all features in a stream workflow
+
+2. How to keep the statistics over a rolling window
+
+3. How to read out all statistics as one array
+
+"""
+
+
+from datetime import datetime
+
+import numpy as np
+
+from mlpro.bf import Log, Mode
+from mlpro.bf.streams.streams import StreamMLProClouds
+from mlpro.oa.streams import *
+
+from mlpro_int_river.wrappers.statistics import WrStatisticsRiver2MLPro
+
+
+
+# 1 Prepare a scenario for Dynamic 3D Point Clouds
+class Dynamic3DScenario(OAStreamScenario):
+
+    C_NAME = 'Dynamic3DScenario'
+
+    def _setup(self, p_mode, p_ada: bool, p_visualize: bool, p_logging):
+
+        # 1.1 Get stream from StreamMLProClouds
+        stream = StreamMLProClouds( p_num_dim = 3,
+                                    p_num_instances = 2000,
+                                    p_num_clouds = 4,
+                                    p_seed = 1,
+                                    p_radii = [100],
+                                    p_velocity = 0.1,
+                                    p_logging = Log.C_LOG_NOTHING )
+
+        # 1.2 Set up a stream workflow
+
+        # 1.2.1 Creation of a workflow
+        workflow = OAStreamWorkflow( p_name='Statistics using River',
+                                     p_range_max=OAStreamWorkflow.C_RANGE_NONE,
+                                     p_ada=p_ada,
+                                     p_visualize=p_visualize,
+                                     p_logging=p_logging )
+
+
+        # 1.2.2 Creation of tasks and add them to the workflow
+        statistics = [ WrStatisticsRiver2MLPro.C_STAT_MEAN,
+                       WrStatisticsRiver2MLPro.C_STAT_VAR,
+                       WrStatisticsRiver2MLPro.C_STAT_MIN,
+                       WrStatisticsRiver2MLPro.C_STAT_MAX,
+                       WrStatisticsRiver2MLPro.C_STAT_QUANTILE ]
+
+        # Statistics over the whole stream
+        task_total = WrStatisticsRiver2MLPro( p_name='#1: Statistics@River',
+                                              p_statistics=statistics + [ WrStatisticsRiver2MLPro.C_STAT_EWMEAN,
+                                                                          WrStatisticsRiver2MLPro.C_STAT_HISTOGRAM ],
+                                              p_quantiles=[ 0.25, 0.5, 0.75 ],
+                                              p_fading_factor=0.1,
+                                              p_max_bins=8,
+                                              p_visualize=p_visualize,
+                                              p_logging=p_logging )
+
+        workflow.add_task(p_task = task_total)
+
+        # Statistics over a rolling window
+        task_window = WrStatisticsRiver2MLPro( p_name='#2: Rolling Statistics@River',
+                                               p_statistics=statistics,
+                                               p_window_size=200,
+                                               p_quantiles=[ 0.25, 0.5, 0.75 ],
+                                               p_visualize=p_visualize,
+                                               p_logging=p_logging )
+
+        workflow.add_task(p_task = task_window)
+
+        # 1.3 Return stream and workflow
+        return stream, workflow
+
+
+
+# 2 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    cycle_limit = 2000
+    logging     = Log.C_LOG_WE
+else:
+    cycle_limit = 100
+    logging     = Log.C_LOG_NOTHING
+
+
+
+# 3 Instantiate and run the stream scenario
+myscenario = Dynamic3DScenario( p_mode=Mode.C_MODE_REAL,
+                                p_cycle_limit=cycle_limit,
+                                p_visualize=False,
+                                p_logging=logging )
+myscenario.reset()
+
+tp_before     = datetime.now()
+myscenario.run()
+tp_delta      = datetime.now() - tp_before
+duraction_sec = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
+myscenario.log(Log.C_LOG_TYPE_W, 'Duration [sec]:', round(duraction_sec,2), ', Cycles/sec:', round(cycle_limit/duraction_sec,2))
+
+
+
+# 4 Read out the statistics of both tasks
+for task in myscenario.get_workflow()._tasks:
+    values = task.get_values()
+    print('\n' + task.get_name(), '- statistics of', task.get_num_instances(), 'instances, array of shape', values.shape)
+    for name, row in zip(task.get_statistic_names(), values):
+        print('   ', name.ljust(14), np.round(row, 3).tolist())
+
+print('\nHistogram of feature 0 [left, right, count]:\n', myscenario.get_workflow()._tasks[0].get_histograms()[0].round(3))